@@ -0,0 +1,536 @@
+"""End-to-end benchmark suite with baseline regression gates.
+
+Runs seeded, reproducible workloads over the storage, simulation, catalog,
+detection and API hot paths, writes the timings together with environment
+metadata as JSON, and compares them against a stored baseline::
+
+    python scripts/benchmark_suite.py --output benchmarks/latest.json
+    python scripts/benchmark_suite.py --update-baseline
+    python scripts/benchmark_suite.py --tolerance 0.25 --only encode decode
+
+The process exits with status 1 when any workload is slower than its baseline
+median by more than the configured tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from polylog6.storage.encoder import EncodedPolygon, PolyformDecoder, PolyformEncoder  # noqa: E402
+
+BENCHMARK_DIR = PROJECT_ROOT / "benchmarks"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "latest.json"
+DEFAULT_TOLERANCE = 0.20
+RESULT_SCHEMA_VERSION = 1
+TRACKED_PACKAGES = ("numpy", "fastapi", "starlette", "pydantic", "pillow", "scikit-image", "scipy")
+
+
+class WorkloadUnavailable(RuntimeError):
+    """Raised by a workload setup when an optional dependency is missing."""
+
+
+RunFn = Callable[[], None]
+
+
+@dataclass(slots=True)
+class Workload:
+    """A named benchmark: ``setup`` builds state and returns the timed callable."""
+
+    name: str
+    description: str
+    setup: Callable[["WorkloadContext"], RunFn]
+    ops: Callable[["WorkloadContext"], int] = lambda context: 1
+
+
+@dataclass(slots=True)
+class WorkloadContext:
+    """Shared parameters handed to every workload setup."""
+
+    seed: int
+    scale: float
+    workdir: Path
+
+    def size(self, full: int, *, minimum: int = 1) -> int:
+        return max(minimum, int(full * self.scale))
+
+    def rng(self, salt: str) -> random.Random:
+        return random.Random(f"{self.seed}:{salt}")
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timing summary for a single workload."""
+
+    name: str
+    status: str
+    ops: int = 0
+    repeat: int = 0
+    samples: List[float] = field(default_factory=list)
+    median: float = 0.0
+    p95: float = 0.0
+    minimum: float = 0.0
+    ops_per_second: float = 0.0
+    reason: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Regression:
+    """A workload whose median exceeded the baseline beyond tolerance."""
+
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    tolerance: float
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+def seeded_polygons(rng: random.Random, count: int) -> List[EncodedPolygon]:
+    """Deterministic polygon stream with a realistic spread of sides and offsets."""
+
+    return [
+        EncodedPolygon(
+            sides=rng.randint(3, 12),
+            orientation_index=rng.randrange(24),
+            rotation_count=rng.randrange(12),
+            delta=(rng.randint(-64, 64), rng.randint(-64, 64), rng.randint(-8, 8)),
+        )
+        for _ in range(count)
+    ]
+
+
+def _polygon_count(context: WorkloadContext) -> int:
+    return context.size(50_000, minimum=256)
+
+
+def _setup_encode(context: WorkloadContext) -> RunFn:
+    polygons = seeded_polygons(context.rng("polygons"), _polygon_count(context))
+    encoder = PolyformEncoder()
+
+    def run() -> None:
+        encoder.encode_polygons(polygons)
+
+    return run
+
+
+def _setup_decode(context: WorkloadContext) -> RunFn:
+    polygons = seeded_polygons(context.rng("polygons"), _polygon_count(context))
+    encoder = PolyformEncoder()
+    payload = encoder.encode_polygons(polygons)
+    decoder = PolyformDecoder(registry=encoder.registry)
+
+    def run() -> None:
+        decoder.decode(payload)
+
+    return run
+
+
+def _seeded_workspace(context: WorkloadContext):
+    from polylog6.simulation.engines.checkpointing.workspace import PolyformWorkspace
+
+    workspace = PolyformWorkspace()
+    workspace.extend(seeded_polygons(context.rng("polygons"), _polygon_count(context)))
+    return workspace
+
+
+def _setup_save_workspace(context: WorkloadContext) -> RunFn:
+    from polylog6.storage.manager import PolyformStorageManager
+
+    manager = PolyformStorageManager(context.workdir / "save_workspace")
+    workspace = _seeded_workspace(context)
+
+    def run() -> None:
+        manager.save_workspace("bench", workspace)
+
+    return run
+
+
+def _setup_load_stream(context: WorkloadContext) -> RunFn:
+    from polylog6.storage.manager import PolyformStorageManager
+
+    manager = PolyformStorageManager(context.workdir / "load_stream")
+    path = manager.save_workspace("bench", _seeded_workspace(context))
+
+    def run() -> None:
+        for _ in manager.load_stream(path):
+            pass
+
+    return run
+
+
+def _setup_engine_checkpoint(context: WorkloadContext) -> RunFn:
+    from polylog6.simulation.engines.checkpointing.polyform_engine import PolyformEngine
+
+    engine = PolyformEngine(workspace=_seeded_workspace(context), chunk_dir=context.workdir / "engine")
+    counter = iter(range(1 << 30))
+
+    def run() -> None:
+        engine.checkpoint(f"bench-{next(counter)}")
+
+    return run
+
+
+def _setup_tier0_build(context: WorkloadContext) -> RunFn:
+    from polylog6.storage.tier0_index import build_tier0_index_bytes
+
+    def run() -> None:
+        build_tier0_index_bytes()
+
+    return run
+
+
+def _detection_image_count(context: WorkloadContext) -> int:
+    return context.size(8, minimum=2)
+
+
+def synthetic_images(context: WorkloadContext, count: int, *, size: int = 128) -> List[Path]:
+    """Write ``count`` seeded PNGs of coloured rectangles on a flat background."""
+
+    try:
+        import numpy as np
+        from PIL import Image
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise WorkloadUnavailable(f"synthetic images need numpy and Pillow: {exc}") from exc
+
+    rng = np.random.default_rng(context.seed)
+    target = context.workdir / "images"
+    target.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    for index in range(count):
+        image = np.full((size, size, 3), 235, dtype=np.uint8)
+        for _ in range(int(rng.integers(2, 6))):
+            x0, y0 = (int(value) for value in rng.integers(0, size - 24, size=2))
+            width, height = (int(value) for value in rng.integers(12, 48, size=2))
+            image[y0 : y0 + height, x0 : x0 + width] = rng.integers(0, 200, size=3, dtype=np.uint8)
+        path = target / f"synthetic-{index:03d}.png"
+        Image.fromarray(image).save(path)
+        paths.append(path)
+    return paths
+
+
+def _setup_detection(context: WorkloadContext) -> RunFn:
+    paths = synthetic_images(context, _detection_image_count(context))
+    try:
+        from polylog6.detection.service import DetectionTask, ImageDetectionService
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise WorkloadUnavailable(f"detection stack unavailable: {exc}") from exc
+
+    service = ImageDetectionService()
+    tasks = [DetectionTask(image_path=str(path), request_id=f"bench-{index}") for index, path in enumerate(paths)]
+
+    def run() -> None:
+        for task in tasks:
+            service.analyze(task)
+
+    return run
+
+
+API_REQUESTS: Sequence[tuple[str, str, Optional[dict]]] = (
+    ("GET", "/health", None),
+    ("GET", "/tier1/polyhedra", None),
+    ("GET", "/tier1/stats", None),
+    ("GET", "/tier1/attachments/matrix", None),
+    ("GET", "/tier0/symbols/A11", None),
+    ("GET", "/geometry/primitive/4", None),
+    ("GET", "/storage/symbols", None),
+    ("GET", "/storage/stats", None),
+    ("POST", "/api/polyform/decode", {"encoding": "B"}),
+)
+
+
+def _setup_api(context: WorkloadContext) -> RunFn:
+    try:
+        from fastapi.testclient import TestClient
+
+        from polylog6.api.main import app
+    except ImportError as exc:
+        raise WorkloadUnavailable(f"API stack unavailable: {exc}") from exc
+
+    client = TestClient(app)
+    for method, path, body in API_REQUESTS:
+        response = client.request(method, path, json=body)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} returned {response.status_code}")
+
+    def run() -> None:
+        for method, path, body in API_REQUESTS:
+            client.request(method, path, json=body)
+
+    return run
+
+
+WORKLOADS: Dict[str, Workload] = {
+    workload.name: workload
+    for workload in (
+        Workload("encode", "PolyformEncoder.encode_polygons", _setup_encode, _polygon_count),
+        Workload("decode", "PolyformDecoder.decode", _setup_decode, _polygon_count),
+        Workload("save_workspace", "PolyformStorageManager.save_workspace", _setup_save_workspace, _polygon_count),
+        Workload("load_stream", "PolyformStorageManager.load_stream", _setup_load_stream, _polygon_count),
+        Workload("engine_checkpoint", "PolyformEngine.checkpoint (full)", _setup_engine_checkpoint, _polygon_count),
+        Workload("tier0_build", "Tier 0 catalog index build", _setup_tier0_build),
+        Workload("detection_analyze", "ImageDetectionService.analyze", _setup_detection, _detection_image_count),
+        Workload("api_endpoints", "FastAPI endpoints via TestClient", _setup_api, lambda context: len(API_REQUESTS)),
+    )
+}
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+def _percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def measure(run: RunFn, *, repeat: int, warmup: int) -> List[float]:
+    """Return ``repeat`` wall-clock samples after ``warmup`` untimed calls."""
+
+    for _ in range(warmup):
+        run()
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def run_workload(workload: Workload, context: WorkloadContext, *, repeat: int, warmup: int) -> BenchmarkResult:
+    try:
+        run = workload.setup(context)
+    except WorkloadUnavailable as exc:
+        return BenchmarkResult(name=workload.name, status="skipped", reason=str(exc))
+
+    samples = measure(run, repeat=repeat, warmup=warmup)
+    ops = workload.ops(context)
+    median = statistics.median(samples)
+    return BenchmarkResult(
+        name=workload.name,
+        status="ok",
+        ops=ops,
+        repeat=repeat,
+        samples=[round(sample, 6) for sample in samples],
+        median=median,
+        p95=_percentile(samples, 0.95),
+        minimum=min(samples),
+        ops_per_second=ops / median if median > 0 else 0.0,
+    )
+
+
+def run_suite(
+    names: Optional[Iterable[str]] = None,
+    *,
+    seed: int = 0,
+    scale: float = 1.0,
+    repeat: int = 5,
+    warmup: int = 1,
+    workdir: Optional[Path] = None,
+) -> List[BenchmarkResult]:
+    """Run the selected workloads (all by default) and return their results."""
+
+    selected = list(names) if names else list(WORKLOADS)
+    unknown = [name for name in selected if name not in WORKLOADS]
+    if unknown:
+        raise ValueError(f"Unknown workloads: {unknown}; choose from {sorted(WORKLOADS)}")
+    if repeat <= 0:
+        raise ValueError("repeat must be positive")
+
+    with tempfile.TemporaryDirectory(prefix="polylog-bench-", dir=workdir) as scratch:
+        results = []
+        for name in selected:
+            context = WorkloadContext(seed=seed, scale=scale, workdir=Path(scratch) / name)
+            context.workdir.mkdir(parents=True, exist_ok=True)
+            results.append(run_workload(WORKLOADS[name], context, repeat=repeat, warmup=warmup))
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Reporting and baseline comparison
+# ---------------------------------------------------------------------------
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def environment_metadata() -> Dict[str, Any]:
+    """Describe the interpreter, host and dependency versions of this run."""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "git_revision": _git_revision(),
+        "packages": {name: _package_version(name) for name in TRACKED_PACKAGES},
+    }
+
+
+def build_report(results: Sequence[BenchmarkResult], *, seed: int, scale: float) -> Dict[str, Any]:
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "seed": seed,
+        "scale": scale,
+        "environment": environment_metadata(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """Return workloads whose median is slower than baseline by more than ``tolerance``.
+
+    A baseline may carry a ``tolerances`` mapping that overrides the global
+    tolerance for individual (typically noisier) workloads. Workloads that are
+    skipped or missing on either side are not compared.
+    """
+
+    if tolerance < 0:
+        raise ValueError("tolerance must be non-negative")
+    overrides = baseline.get("tolerances", {})
+    regressions: List[Regression] = []
+    for name, current in report.get("results", {}).items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None or previous.get("status") != "ok" or current.get("status") != "ok":
+            continue
+        if previous["median"] <= 0:
+            continue
+        limit = float(overrides.get(name, tolerance))
+        ratio = current["median"] / previous["median"]
+        if ratio > 1.0 + limit:
+            regressions.append(
+                Regression(
+                    name=name,
+                    baseline=previous["median"],
+                    current=current["median"],
+                    ratio=ratio,
+                    tolerance=limit,
+                )
+            )
+    return regressions
+
+
+def _comparable(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """List run parameters that differ from the baseline and skew comparisons."""
+
+    mismatches = [key for key in ("seed", "scale") if report.get(key) != baseline.get(key)]
+    for key in ("python", "machine", "cpu_count"):
+        if report["environment"].get(key) != baseline.get("environment", {}).get(key):
+            mismatches.append(f"environment.{key}")
+    return mismatches
+
+
+def _write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _print_results(results: Sequence[BenchmarkResult]) -> None:
+    for result in results:
+        if result.status != "ok":
+            print(f"  {result.name:<18} skipped: {result.reason}")
+            continue
+        print(
+            f"  {result.name:<18} median {result.median * 1000:9.2f} ms  "
+            f"p95 {result.p95 * 1000:9.2f} ms  {result.ops_per_second:12.1f} ops/s"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Polylog benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=sorted(WORKLOADS), help="Run only these workloads")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated workloads")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed iterations per workload")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed iterations per workload")
+    parser.add_argument("--quick", action="store_true", help="Shrink workloads tenfold for smoke runs")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the results JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline results JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown of the median as a fraction of the baseline (0.2 = 20%%)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    args = parser.parse_args(argv)
+
+    scale = 0.1 if args.quick else 1.0
+    results = run_suite(args.only, seed=args.seed, scale=scale, repeat=args.repeat, warmup=args.warmup)
+    report = build_report(results, seed=args.seed, scale=scale)
+    _write_json(args.output, report)
+    print(f"Benchmark results written to {args.output}")
+    _print_results(results)
+
+    if args.update_baseline:
+        _write_json(args.baseline, report)
+        print(f"[ok] baseline updated: {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    mismatches = _comparable(report, baseline)
+    if mismatches:
+        print(f"warning: run differs from baseline in {', '.join(mismatches)}", file=sys.stderr)
+    regressions = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+    for regression in regressions:
+        print(
+            f"✗ {regression.name}: {regression.current * 1000:.2f} ms vs "
+            f"{regression.baseline * 1000:.2f} ms baseline "
+            f"(x{regression.ratio:.2f}, tolerance {regression.tolerance:.0%})",
+            file=sys.stderr,
+        )
+    if regressions:
+        return 1
+    print(f"[ok] no regressions beyond {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - convenience script
+    raise SystemExit(main())
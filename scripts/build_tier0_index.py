@@ -0,0 +1,31 @@
+"""Prebuild the memory-mapped Tier 0 index shared by every SymbolRegistry."""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from polylog6.storage.tier0_index import (  # noqa: E402
+    DEFAULT_TIER0_INDEX_PATH,
+    MappedTier0Index,
+    build_tier0_index,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=DEFAULT_TIER0_INDEX_PATH, help="Index file to write")
+    args = parser.parse_args(argv)
+
+    path = build_tier0_index(args.output)
+    index = MappedTier0Index.open(path)
+    print(f"Wrote {index.record_count} Tier 0 records to {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
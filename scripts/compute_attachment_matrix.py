@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
-"""Compute full attachment matrix (~47,000 valid pairs with fold angles)."""
+"""Compute full attachment matrix (~47,000 valid pairs with fold angles).
 
+The upper-triangular pair space is split into row-range shards that are
+computed on a process pool. Finished shards are checkpointed next to the
+output so an interrupted run resumes where it stopped, and shards are merged
+in row order so the output is byte-identical to a serial run.
+
+``--incremental`` reuses the previous matrix and recomputes only pairs that
+involve polyhedra whose catalog record changed since the last build (tracked
+in ``attachment_matrix_full.manifest.json``).
+"""
+
+import argparse
+import hashlib
 import json
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import itertools
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
@@ -18,6 +32,10 @@ except ImportError:
     PlacementRuntime = None
     StabilityCalculator = None
 
+SHARD_FORMAT_VERSION = 1
+
+PairEntry = Tuple[str, Dict[str, Any]]
+
 def get_sides_from_symbol(symbol: str) -> int:
     """Convert symbol to sides count."""
     symbol_map = {
@@ -43,24 +61,28 @@ def calculate_stability_fallback(sides_a: int, sides_b: int, fold_angle: float)
     ideal_angle = 90.0
     angle_diff = abs(fold_angle - ideal_angle)
     stability = max(0.0, 1.0 - (angle_diff / 90.0))
-    
+
     # Adjust for polygon complexity
     complexity_factor = 1.0 - ((sides_a + sides_b - 6) * 0.02)
     stability *= max(0.5, complexity_factor)
-    
+
     return min(1.0, max(0.0, stability))
 
-def compute_attachment_matrix():
-    """Compute full attachment matrix for all polygon pairs."""
-    
-    # Load polygon symbols
+
+# ---------------------------------------------------------------------------
+# Catalog loading
+# ---------------------------------------------------------------------------
+def default_polyhedra_file() -> Path:
     polyhedra_file = PROJECT_ROOT / "data" / "catalogs" / "tier1" / "polyhedra.jsonl"
     if not polyhedra_file.exists():
         polyhedra_file = PROJECT_ROOT / "lib" / "catalogs" / "tier1" / "polyhedra.jsonl"
-    
+    return polyhedra_file
+
+def load_polygon_symbols(polyhedra_file: Path) -> Tuple[List[str], Dict[str, str]]:
+    """Return catalog symbols in file order and a digest of each record."""
     polygon_symbols = []
-    polygon_data = {}
-    
+    digests = {}
+
     if polyhedra_file.exists():
         with open(polyhedra_file, 'r', encoding='utf-8') as f:
             for line in f:
@@ -70,17 +92,29 @@ def compute_attachment_matrix():
                         symbol = poly.get('symbol', '')
                         if symbol:
                             polygon_symbols.append(symbol)
-                            polygon_data[symbol] = poly
+                            digests[symbol] = hashlib.sha256(line.strip().encode('utf-8')).hexdigest()
                     except:
                         continue
-    
+
     # Fallback symbols
     if not polygon_symbols:
         polygon_symbols = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R']
-    
-    print(f"Computing attachment matrix for {len(polygon_symbols)} polygons...")
-    
-    # Initialize runtime if available
+        digests = {symbol: "" for symbol in polygon_symbols}
+
+    return polygon_symbols, digests
+
+def catalog_fingerprint(polygon_symbols: Sequence[str], digests: Dict[str, str]) -> str:
+    payload = json.dumps([[symbol, digests.get(symbol, "")] for symbol in polygon_symbols])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Pair computation
+# ---------------------------------------------------------------------------
+_RUNTIME: Dict[str, Any] = {}
+
+def _init_runtime(verbose: bool = False) -> None:
+    """Initialise the placement runtime once per process."""
     placement_runtime = None
     stability_calc = None
     if PlacementRuntime:
@@ -88,75 +122,289 @@ def compute_attachment_matrix():
             placement_runtime = PlacementRuntime()
             stability_calc = StabilityCalculator() if StabilityCalculator else None
         except:
-            print("Warning: Could not initialize placement runtime, using fallback")
-    
-    matrix = {}
+            if verbose:
+                print("Warning: Could not initialize placement runtime, using fallback")
+    _RUNTIME["placement"] = placement_runtime
+    _RUNTIME["stability"] = stability_calc
+
+def compute_pair(symbol_a: str, symbol_b: str) -> Optional[Dict[str, Any]]:
+    """Return the matrix record for a pair, or ``None`` if it is not valid."""
+    if "placement" not in _RUNTIME:
+        _init_runtime()
+    placement_runtime = _RUNTIME["placement"]
+    sides_a = get_sides_from_symbol(symbol_a)
+    sides_b = get_sides_from_symbol(symbol_b)
+
+    # Calculate fold angle
+    fold_angle = None
+    stability = None
+
+    if placement_runtime:
+        try:
+            attachment_option = placement_runtime.resolve_attachment_schema(
+                source_sides=sides_a,
+                target_sides=sides_b,
+                dimension="3d"
+            )
+            if attachment_option:
+                fold_angle = 0  # Would extract from attachment_option
+                stability = attachment_option.score
+        except:
+            pass
+
+    # Fallback calculations
+    if fold_angle is None:
+        fold_angle = calculate_fold_angle_fallback(sides_a, sides_b)
+
+    if stability is None:
+        stability = calculate_stability_fallback(sides_a, sides_b, fold_angle)
+
+    # Only include valid pairs (stability >= 0.5)
+    if stability < 0.5:
+        return None
+    return {
+        'polygon_a': symbol_a,
+        'polygon_b': symbol_b,
+        'sides_a': sides_a,
+        'sides_b': sides_b,
+        'fold_angle': round(fold_angle, 2),
+        'stability': round(stability, 3),
+        'valid': True
+    }
+
+def pair_key(symbol_a: str, symbol_b: str) -> str:
+    return f"{symbol_a}_{symbol_b}" if symbol_a <= symbol_b else f"{symbol_b}_{symbol_a}"
+
+def plan_shards(symbol_count: int, shard_count: int) -> List[Tuple[int, int]]:
+    """Split rows ``[0, n)`` into contiguous ranges with similar pair counts."""
+    total_pairs = symbol_count * (symbol_count + 1) // 2
+    shard_count = max(1, min(shard_count, symbol_count))
+    target = total_pairs / shard_count
+    shards: List[Tuple[int, int]] = []
+    start = 0
+    accumulated = 0
+    for row in range(symbol_count):
+        accumulated += symbol_count - row
+        if accumulated >= target * (len(shards) + 1) and len(shards) < shard_count - 1:
+            shards.append((start, row + 1))
+            start = row + 1
+    if start < symbol_count:
+        shards.append((start, symbol_count))
+    return shards
+
+def compute_rows(
+    polygon_symbols: Sequence[str],
+    start: int,
+    stop: int,
+    reuse: Optional[Dict[str, Dict[str, Any]]] = None,
+    changed: Optional[set] = None,
+) -> List[PairEntry]:
+    """Compute valid pairs for rows ``[start, stop)`` in serial order.
+
+    With ``reuse``/``changed`` only pairs that involve a changed symbol (or
+    whose previous record does not match the current orientation) are
+    recomputed; other pairs take their record from ``reuse``.
+    """
+    entries: List[PairEntry] = []
+    for i in range(start, stop):
+        symbol_a = polygon_symbols[i]
+        for symbol_b in polygon_symbols[i:]:  # Only compute upper triangle
+            key = pair_key(symbol_a, symbol_b)
+            if reuse is not None and symbol_a not in changed and symbol_b not in changed:
+                previous = reuse.get(key)
+                if previous is None:
+                    continue  # pair was invalid and neither side changed
+                if previous.get('polygon_a') == symbol_a and previous.get('polygon_b') == symbol_b:
+                    entries.append((key, previous))
+                    continue
+            record = compute_pair(symbol_a, symbol_b)
+            if record is not None:
+                entries.append((key, record))
+    return entries
+
+
+# ---------------------------------------------------------------------------
+# Shard checkpoints
+# ---------------------------------------------------------------------------
+def _shard_path(checkpoint_dir: Path, index: int) -> Path:
+    return checkpoint_dir / f"shard-{index:05d}.json"
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as stream:
+            stream.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+def load_shard(path: Path, fingerprint: str, rows: Tuple[int, int]) -> Optional[List[PairEntry]]:
+    """Return checkpointed entries if ``path`` matches this run."""
+    try:
+        payload = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if payload.get('version') != SHARD_FORMAT_VERSION or payload.get('fingerprint') != fingerprint:
+        return None
+    if tuple(payload.get('rows', ())) != tuple(rows):
+        return None
+    return [(key, record) for key, record in payload['entries']]
+
+def _init_shard_worker(
+    polygon_symbols: Sequence[str],
+    checkpoint_dir: str,
+    fingerprint: str,
+    reuse: Optional[Dict[str, Dict[str, Any]]],
+    changed: Optional[List[str]],
+    verbose: bool = False,
+) -> None:
+    """Install the build inputs shared by every shard, once per process.
+
+    Passed as pool ``initargs`` so the symbol list and any reused matrix are
+    pickled once per worker rather than once per shard task.
+    """
+    _init_runtime(verbose)
+    _RUNTIME["build"] = (
+        polygon_symbols,
+        Path(checkpoint_dir),
+        fingerprint,
+        reuse,
+        set(changed) if changed is not None else None,
+    )
+
+def _run_shard(task: Tuple[int, int, int]) -> int:
+    index, start, stop = task
+    polygon_symbols, checkpoint_dir, fingerprint, reuse, changed = _RUNTIME["build"]
+    entries = compute_rows(polygon_symbols, start, stop, reuse, changed)
+    payload = {
+        'version': SHARD_FORMAT_VERSION,
+        'fingerprint': fingerprint,
+        'rows': [start, stop],
+        'entries': entries,
+    }
+    _atomic_write_text(_shard_path(checkpoint_dir, index), json.dumps(payload, ensure_ascii=False))
+    return index
+
+def merge_shards(shard_entries: Sequence[List[PairEntry]]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """Merge shard outputs in row order, mirroring the serial insertion order."""
+    matrix: Dict[str, Dict[str, Any]] = {}
     valid_pairs = 0
+    for entries in shard_entries:
+        for key, record in entries:
+            matrix[key] = record
+            valid_pairs += 1
+    return matrix, valid_pairs
+
+
+# ---------------------------------------------------------------------------
+# Build driver
+# ---------------------------------------------------------------------------
+def _manifest_path(output_file: Path) -> Path:
+    return output_file.with_name(output_file.stem + ".manifest.json")
+
+def _incremental_inputs(
+    output_file: Path, polygon_symbols: Sequence[str], digests: Dict[str, str]
+) -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[List[str]]]:
+    manifest_file = _manifest_path(output_file)
+    if not output_file.exists() or not manifest_file.exists():
+        print("No previous matrix/manifest found; running a full build")
+        return None, None
+    previous_digests = json.loads(manifest_file.read_text(encoding='utf-8')).get('digests', {})
+    previous_matrix = json.loads(output_file.read_text(encoding='utf-8')).get('matrix', {})
+    changed = sorted(symbol for symbol in polygon_symbols if previous_digests.get(symbol) != digests.get(symbol))
+    print(f"Incremental build: {len(changed)} changed polyhedra")
+    return previous_matrix, changed
+
+def compute_attachment_matrix(
+    *,
+    polyhedra_file: Optional[Path] = None,
+    output_file: Optional[Path] = None,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    checkpoint_dir: Optional[Path] = None,
+    incremental: bool = False,
+    keep_checkpoints: bool = False,
+):
+    """Compute full attachment matrix for all polygon pairs."""
+
+    polyhedra_file = polyhedra_file or default_polyhedra_file()
+    output_file = output_file or (polyhedra_file.parent / "attachment_matrix_full.json")
+    workers = workers or os.cpu_count() or 1
+    shards = shards or workers * 4
+    checkpoint_dir = checkpoint_dir or output_file.with_name(f".{output_file.stem}.shards")
+
+    polygon_symbols, digests = load_polygon_symbols(polyhedra_file)
+    fingerprint = catalog_fingerprint(polygon_symbols, digests)
+
+    print(f"Computing attachment matrix for {len(polygon_symbols)} polygons...")
+
+    reuse, changed = (None, None)
+    if incremental:
+        reuse, changed = _incremental_inputs(output_file, polygon_symbols, digests)
+        if changed is not None:
+            # Shard checkpoints from a full build cannot be mixed with reuse.
+            fingerprint = hashlib.sha256(f"{fingerprint}:incremental".encode('utf-8')).hexdigest()
+
     total_pairs = len(polygon_symbols) * (len(polygon_symbols) + 1) // 2
-    
     print(f"Total pairs to compute: {total_pairs}")
-    
-    for i, symbol_a in enumerate(polygon_symbols):
-        if i % 10 == 0:
-            print(f"  Processing polygon {i+1}/{len(polygon_symbols)}... ({valid_pairs} valid pairs so far)")
-        
-        sides_a = get_sides_from_symbol(symbol_a)
-        
-        for symbol_b in polygon_symbols[i:]:  # Only compute upper triangle
-            sides_b = get_sides_from_symbol(symbol_b)
-            
-            # Calculate fold angle
-            fold_angle = None
-            stability = None
-            
-            if placement_runtime:
-                try:
-                    attachment_option = placement_runtime.resolve_attachment_schema(
-                        source_sides=sides_a,
-                        target_sides=sides_b,
-                        dimension="3d"
-                    )
-                    if attachment_option:
-                        fold_angle = 0  # Would extract from attachment_option
-                        stability = attachment_option.score
-                except:
-                    pass
-            
-            # Fallback calculations
-            if fold_angle is None:
-                fold_angle = calculate_fold_angle_fallback(sides_a, sides_b)
-            
-            if stability is None:
-                stability = calculate_stability_fallback(sides_a, sides_b, fold_angle)
-            
-            # Only include valid pairs (stability >= 0.5)
-            if stability >= 0.5:
-                pair_key = f"{symbol_a}_{symbol_b}" if symbol_a <= symbol_b else f"{symbol_b}_{symbol_a}"
-                
-                matrix[pair_key] = {
-                    'polygon_a': symbol_a,
-                    'polygon_b': symbol_b,
-                    'sides_a': sides_a,
-                    'sides_b': sides_b,
-                    'fold_angle': round(fold_angle, 2),
-                    'stability': round(stability, 3),
-                    'valid': True
-                }
-                valid_pairs += 1
-    
+
+    plan = plan_shards(len(polygon_symbols), shards)
+    results: Dict[int, List[PairEntry]] = {}
+    pending = []
+    for index, rows in enumerate(plan):
+        cached = load_shard(_shard_path(checkpoint_dir, index), fingerprint, rows)
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending.append((index, rows[0], rows[1]))
+    if results:
+        print(f"  Resuming: {len(results)}/{len(plan)} shards already checkpointed")
+
+    build_inputs = (polygon_symbols, str(checkpoint_dir), fingerprint, reuse, changed)
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_shard_worker, initargs=build_inputs
+        ) as pool:
+            for done, index in enumerate(pool.map(_run_shard, pending), start=1):
+                print(f"  Shard {index + 1}/{len(plan)} complete ({done}/{len(pending)} this run)")
+    else:
+        _init_shard_worker(*build_inputs, verbose=True)
+        for done, task in enumerate(pending, start=1):
+            index = _run_shard(task)
+            print(f"  Shard {index + 1}/{len(plan)} complete ({done}/{len(pending)} this run)")
+    for task in pending:
+        index = task[0]
+        results[index] = load_shard(_shard_path(checkpoint_dir, index), fingerprint, plan[index]) or []
+
+    matrix, valid_pairs = merge_shards([results[index] for index in range(len(plan))])
+
     print(f"\n[OK] Computed attachment matrix: {valid_pairs} valid pairs")
-    
+
     # Write matrix
-    output_file = polyhedra_file.parent / "attachment_matrix_full.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
     with open(output_file, 'w', encoding='utf-8') as f_out:
         json.dump({
             'total_pairs': valid_pairs,
             'polygon_count': len(polygon_symbols),
             'matrix': matrix
         }, f_out, indent=2, ensure_ascii=False)
-    
+    _atomic_write_text(
+        _manifest_path(output_file),
+        json.dumps({'fingerprint': catalog_fingerprint(polygon_symbols, digests), 'digests': digests}, ensure_ascii=False, indent=2),
+    )
+
+    if not keep_checkpoints:
+        for index in range(len(plan)):
+            _shard_path(checkpoint_dir, index).unlink(missing_ok=True)
+        try:
+            checkpoint_dir.rmdir()
+        except OSError:
+            pass
+
     print(f"  Output: {output_file}")
-    
+
     # Statistics
     stability_ranges = {'high': 0, 'medium': 0, 'low': 0}
     for pair_data in matrix.values():
@@ -167,15 +415,35 @@ def compute_attachment_matrix():
             stability_ranges['medium'] += 1
         else:
             stability_ranges['low'] += 1
-    
+
     print("\nStability distribution:")
     print(f"  High (≥0.85): {stability_ranges['high']}")
     print(f"  Medium (0.70-0.85): {stability_ranges['medium']}")
     print(f"  Low (0.50-0.70): {stability_ranges['low']}")
-    
+
     return valid_pairs
 
-if __name__ == '__main__':
-    count = compute_attachment_matrix()
-    sys.exit(0 if count > 0 else 1)
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compute the polygon pair attachment matrix")
+    parser.add_argument("--catalog", type=Path, help="Polyhedra JSONL catalog (default: data/catalogs/tier1)")
+    parser.add_argument("--output", type=Path, help="Output matrix path")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, help="Number of row shards (default: 4 per worker)")
+    parser.add_argument("--checkpoint-dir", type=Path, help="Directory for shard checkpoints")
+    parser.add_argument("--incremental", action="store_true", help="Recompute only pairs touching changed polyhedra")
+    parser.add_argument("--keep-checkpoints", action="store_true", help="Keep shard checkpoints after merging")
+    args = parser.parse_args(argv)
 
+    count = compute_attachment_matrix(
+        polyhedra_file=args.catalog,
+        output_file=args.output,
+        workers=args.workers,
+        shards=args.shards,
+        checkpoint_dir=args.checkpoint_dir,
+        incremental=args.incremental,
+        keep_checkpoints=args.keep_checkpoints,
+    )
+    return 0 if count > 0 else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
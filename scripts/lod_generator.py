@@ -7,15 +7,26 @@ face count, vertex count, and geometric complexity.
 
 Outputs:
 - catalogs/tier1/lod_metadata.json (LOD breakpoints for all 110 polyhedra)
+- catalogs/tier1/lod_meshes.json (quadric-error decimated meshes per LOD level,
+  with per-level error metrics, served by /tier1/polyhedra/{symbol}/lod/{level})
 """
 
+import hashlib
 import json
+import sys
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional
 from dataclasses import dataclass
 import logging
 import math
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = PROJECT_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from polylog6.geometry.decimation import DEFAULT_LOD_BUDGETS, build_lod_levels  # noqa: E402
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -45,6 +56,7 @@ class LODGenerator:
         self.polyhedra_file = polyhedra_file
         self.polyhedra: Dict[str, Dict[str, Any]] = {}
         self.lod_metadata: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.lod_meshes: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
     def load_polyhedra(self) -> bool:
         """Load polyhedra from JSONL file."""
@@ -106,6 +118,44 @@ class LODGenerator:
 
         logger.info(f"Generated LOD metadata for {len(self.lod_metadata)} polyhedra")
 
+    def generate_lod_meshes(self, budgets: Optional[Mapping[str, float]] = None) -> None:
+        """Decimate every polyhedron to the LOD triangle budgets."""
+        budgets = dict(budgets or DEFAULT_LOD_BUDGETS)
+        logger.info(f"Decimating LOD meshes with budgets {budgets}...")
+
+        for symbol, poly in self.polyhedra.items():
+            if not poly.get('faces') or not poly.get('vertices'):
+                logger.warning(f"Skipping {symbol}: no faces or vertices")
+                continue
+            try:
+                levels = build_lod_levels(poly['vertices'], poly['faces'], budgets)
+            except ValueError as e:
+                logger.warning(f"Skipping {symbol}: {e}")
+                continue
+            self.lod_meshes[symbol] = {name: mesh.to_dict() for name, mesh in levels.items()}
+
+        logger.info(f"Decimated LOD meshes for {len(self.lod_meshes)} polyhedra")
+
+    def save_meshes(
+        self,
+        output_file: Path = Path("catalogs/tier1/lod_meshes.json"),
+        budgets: Optional[Mapping[str, float]] = None,
+    ) -> Path:
+        """Save decimated meshes keyed to the polyhedra catalog they came from."""
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": 1,
+            "source_fingerprint": hashlib.sha256(self.polyhedra_file.read_bytes()).hexdigest(),
+            "budgets": dict(budgets or DEFAULT_LOD_BUDGETS),
+            "meshes": self.lod_meshes,
+        }
+
+        with open(output_file, 'w') as f:
+            json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+
+        logger.info(f"Saved LOD meshes to {output_file}")
+        return output_file
+
     def _estimate_edges(self, face_count: int) -> int:
         """Estimate edge count from face count using Euler's formula."""
         # V - E + F = 2
@@ -203,6 +253,10 @@ def main():
     # Save metadata
     generator.save_metadata()
 
+    # Decimate and save LOD meshes
+    generator.generate_lod_meshes()
+    generator.save_meshes()
+
     # Print statistics
     stats = generator.get_statistics()
     logger.info(f"LOD statistics: {stats}")
@@ -19,6 +19,10 @@ export interface paths {
           page?: number;
           /** @description Page size (default 100) */
           limit?: number;
+          /** @description Opaque next_cursor from a previous page; overrides page */
+          cursor?: string;
+          /** @description Comma-separated subset of symbol, tier, composition, frequency and metadata to return (symbol is always included) */
+          fields?: string;
         };
       };
       responses: {
@@ -74,6 +78,16 @@ export interface paths {
   "/api/storage/tier3-tier4/candidates": {
     /** Fetch promotion candidates for Tier 3 and Tier 4 */
     get: {
+      parameters: {
+        query?: {
+          /** @description Page size per tier (all candidates when omitted) */
+          limit?: number;
+          /** @description Opaque next_cursor from a previous page */
+          cursor?: string;
+          /** @description Comma-separated subset of candidate fields to return */
+          fields?: string;
+        };
+      };
       responses: {
         /** @description Candidate list grouped by tier */
         200: {
@@ -84,6 +98,27 @@ export interface paths {
       };
     };
   };
+  "/api/storage/tier3-tier4/candidates/stream": {
+    /** Stream promotion candidates as NDJSON */
+    get: {
+      parameters: {
+        query?: {
+          /** @description Only stream this tier (both tiers, Tier 3 first, when omitted) */
+          tier?: 3 | 4;
+          /** @description Comma-separated subset of candidate fields to return */
+          fields?: string;
+        };
+      };
+      responses: {
+        /** @description One TierCandidate JSON object per line */
+        200: {
+          content: {
+            "application/x-ndjson": components["schemas"]["TierCandidate"];
+          };
+        };
+      };
+    };
+  };
   "/api/storage/stats": {
     /** Fetch storage and compression statistics */
     get: {
@@ -155,6 +190,8 @@ export interface components {
       limit: number;
       /** @description Total number of pages */
       pages: number;
+      /** @description Cursor for the following page, null on the last page */
+      next_cursor?: string | null;
     };
     SymbolSummary: {
       symbol: string;
@@ -195,6 +232,8 @@ export interface components {
     TierCandidateResponse: {
       tier3: components["schemas"]["TierCandidate"][];
       tier4: components["schemas"]["TierCandidate"][];
+      /** @description Cursor resuming both tiers, null once both are exhausted */
+      next_cursor?: string | null;
     };
     TierCandidate: {
       symbol?: string;
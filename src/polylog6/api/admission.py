@@ -0,0 +1,272 @@
+"""Bounded executors and admission control for CPU-heavy endpoints.
+
+Each endpoint class (generation, decomposition, detection) gets its own
+:class:`AdmissionPool`: a small thread pool plus a bounded queue. A request
+that would exceed ``max_workers + max_queue`` outstanding calls is refused
+immediately with ``429`` and a ``Retry-After`` hint instead of waiting, and
+admitted calls that do not finish within ``timeout`` seconds answer ``504``.
+Because the work leaves the event loop, heavy requests no longer stall the
+cheap catalog reads served alongside them.
+
+Queue time (submit to start) and run time are exported as histograms on
+``GET /metrics``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, TypeVar
+
+from fastapi import HTTPException
+
+from polylog6.api.metrics import Histogram, format_labels, metric_family, register_collector
+from polylog6.api.request_metrics import profile_section
+
+T = TypeVar("T")
+
+OUTCOMES = ("completed", "failed", "rejected", "timeout")
+
+
+@dataclass(frozen=True, slots=True)
+class PoolLimits:
+    """Concurrency, queue depth and timeout for one endpoint class."""
+
+    max_workers: int = 2
+    max_queue: int = 8
+    timeout: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if self.max_queue < 0:
+            raise ValueError("max_queue must be non-negative")
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+    @classmethod
+    def from_env(cls, name: str, default: "PoolLimits") -> "PoolLimits":
+        """Override fields from ``POLYLOG_<NAME>_{WORKERS,QUEUE,TIMEOUT}``."""
+
+        prefix = f"POLYLOG_{name.upper()}_"
+        return cls(
+            max_workers=int(os.environ.get(prefix + "WORKERS", default.max_workers)),
+            max_queue=int(os.environ.get(prefix + "QUEUE", default.max_queue)),
+            timeout=float(os.environ.get(prefix + "TIMEOUT", default.timeout)),
+        )
+
+
+class AdmissionPool:
+    """Run blocking callables on a bounded executor with load shedding."""
+
+    def __init__(self, name: str, limits: PoolLimits = PoolLimits()) -> None:
+        self.name = name
+        self.limits = limits
+        self._executor = ThreadPoolExecutor(max_workers=limits.max_workers, thread_name_prefix=f"polylog-{name}")
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self._running = 0
+        self._outcomes: Dict[str, int] = {outcome: 0 for outcome in OUTCOMES}
+        self.queue_seconds = Histogram()
+        self.run_seconds = Histogram()
+
+    @property
+    def capacity(self) -> int:
+        return self.limits.max_workers + self.limits.max_queue
+
+    @property
+    def outstanding(self) -> int:
+        return self._outstanding
+
+    @property
+    def queued(self) -> int:
+        return max(self._outstanding - self._running, 0)
+
+    def retry_after(self) -> int:
+        """Seconds a refused client should wait: the time to drain the queue."""
+
+        per_call = self.run_seconds.sum / self.run_seconds.count if self.run_seconds.count else 1.0
+        waves = math.ceil(self.capacity / self.limits.max_workers)
+        return max(1, math.ceil(per_call * waves))
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._outcomes[outcome] += 1
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._outstanding -= 1
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Admit ``fn`` or raise ``HTTPException(429)`` when the pool is full."""
+
+        with self._lock:
+            if self._outstanding >= self.capacity:
+                self._outcomes["rejected"] += 1
+                admitted = False
+            else:
+                self._outstanding += 1
+                admitted = True
+        if not admitted:
+            raise HTTPException(
+                status_code=429,
+                detail=f"{self.name} is at capacity ({self.capacity} requests outstanding); retry later",
+                headers={"Retry-After": str(self.retry_after())},
+            )
+
+        submitted = time.perf_counter()
+
+        def call() -> T:
+            started = time.perf_counter()
+            self.queue_seconds.observe(started - submitted)
+            with self._lock:
+                self._running += 1
+            try:
+                with profile_section():
+                    return fn(*args, **kwargs)
+            finally:
+                self.run_seconds.observe(time.perf_counter() - started)
+                with self._lock:
+                    self._running -= 1
+
+        # Carry the request context (and any profile capture) into the worker.
+        future = self._executor.submit(contextvars.copy_context().run, call)
+        # Released when the work really ends, even if the caller timed out.
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await ``fn(*args, **kwargs)`` on the pool, honouring the timeout."""
+
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.limits.timeout)
+        except asyncio.TimeoutError:
+            # Cancels calls still queued; a running call finishes in the background.
+            future.cancel()
+            self._count("timeout")
+            raise HTTPException(
+                status_code=504,
+                detail=f"{self.name} request exceeded {self.limits.timeout:g}s",
+            ) from None
+        except Exception:
+            self._count("failed")
+            raise
+        self._count("completed")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_workers": self.limits.max_workers,
+            "max_queue": self.limits.max_queue,
+            "timeout": self.limits.timeout,
+            "outstanding": self._outstanding,
+            "running": self._running,
+            "queued": self.queued,
+            **self._outcomes,
+        }
+
+    def shutdown(self, wait: bool = False, *, cancel_queued: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_queued)
+
+
+# One pool per endpoint class; heavy classes cannot starve each other.
+DEFAULT_LIMITS: Dict[str, PoolLimits] = {
+    "generate": PoolLimits(max_workers=2, max_queue=16, timeout=30.0),
+    "decompose": PoolLimits(max_workers=1, max_queue=4, timeout=60.0),
+    "detect": PoolLimits(max_workers=2, max_queue=8, timeout=15.0),
+}
+
+_pools: Dict[str, AdmissionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name: str) -> AdmissionPool:
+    """Process-wide pool for endpoint class ``name`` (created on first use)."""
+
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                limits = PoolLimits.from_env(name, DEFAULT_LIMITS.get(name, PoolLimits()))
+                pool = _pools[name] = AdmissionPool(name, limits)
+    return pool
+
+
+def configure_pool(name: str, limits: PoolLimits) -> AdmissionPool:
+    """Replace the pool for ``name`` (existing calls finish on the old one)."""
+
+    with _pools_lock:
+        previous = _pools.get(name)
+        pool = _pools[name] = AdmissionPool(name, limits)
+    if previous is not None:
+        previous.shutdown(wait=False, cancel_queued=False)
+    return pool
+
+
+async def run_admitted(name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Shorthand for ``await get_pool(name).run(fn, *args, **kwargs)``."""
+
+    return await get_pool(name).run(fn, *args, **kwargs)
+
+
+def _collect() -> Iterable[str]:
+    with _pools_lock:
+        pools = sorted(_pools.values(), key=lambda pool: pool.name)
+    lines: List[str] = []
+    lines += metric_family(
+        "polylog_admission_queue_seconds",
+        "histogram",
+        "Time admitted requests waited for a worker.",
+        (line for pool in pools for line in pool.queue_seconds.render("polylog_admission_queue_seconds", (("pool", pool.name),))),
+    )
+    lines += metric_family(
+        "polylog_admission_run_seconds",
+        "histogram",
+        "Time requests spent running on a worker.",
+        (line for pool in pools for line in pool.run_seconds.render("polylog_admission_run_seconds", (("pool", pool.name),))),
+    )
+    lines += metric_family(
+        "polylog_admission_requests_total",
+        "counter",
+        "Requests by admission outcome.",
+        (
+            f"polylog_admission_requests_total{format_labels({'pool': pool.name, 'outcome': outcome})} {count}"
+            for pool in pools
+            for outcome, count in pool.stats().items()
+            if outcome in OUTCOMES
+        ),
+    )
+    lines += metric_family(
+        "polylog_admission_queued",
+        "gauge",
+        "Admitted requests waiting for a worker.",
+        (f"polylog_admission_queued{format_labels({'pool': pool.name})} {pool.queued}" for pool in pools),
+    )
+    lines += metric_family(
+        "polylog_admission_running",
+        "gauge",
+        "Requests currently running on a worker.",
+        (f"polylog_admission_running{format_labels({'pool': pool.name})} {pool.stats()['running']}" for pool in pools),
+    )
+    return lines
+
+
+register_collector("admission", _collect)
+
+
+__all__ = [
+    "AdmissionPool",
+    "DEFAULT_LIMITS",
+    "PoolLimits",
+    "configure_pool",
+    "get_pool",
+    "run_admitted",
+]
@@ -5,18 +5,17 @@ Polyform Generator API endpoints
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-import json
-from pathlib import Path
 import math
 
+from polylog6.api.admission import run_admitted
+from polylog6.api.geometry_catalog import get_geometry_catalog
 from polylog6.storage.encoder import TieredUnicodeEncoder
-from polylog6.storage.polyform_storage import PolyformStorage
+from polylog6.storage.polyform_storage import shared_polyform_storage
 
 router = APIRouter(prefix="/api/polyform", tags=["generator"])
 
 # Initialize encoders and calculators
 _encoder = TieredUnicodeEncoder()
-_storage = PolyformStorage()
 
 # Symbol to sides mapping
 SYMBOL_TO_SIDES = {
@@ -45,32 +44,18 @@ class GenerateResponse(BaseModel):
     error: Optional[str] = None
 
 
-def _load_geometry_catalog():
-    """Load geometry catalog"""
-    catalog_path = Path(__file__).parent.parent.parent.parent / "catalogs" / "geometry_catalog.json"
-    if not catalog_path.exists():
-        # Try alternative path
-        catalog_path = Path(__file__).parent.parent.parent.parent.parent / "catalogs" / "geometry_catalog.json"
-    
-    if catalog_path.exists():
-        with open(catalog_path, "r") as f:
-            return json.load(f)
-    return {}
-
-
-def _get_primitive_geometry(symbol: str, catalog: Dict) -> Optional[Dict]:
+def _get_primitive_geometry(symbol: str) -> Optional[Dict]:
     """Get geometry for a primitive polygon symbol"""
-    if "primitives" not in catalog:
+    match = get_geometry_catalog().primitive_by_symbol(symbol)
+    if match is None:
         return None
     
-    for name, data in catalog["primitives"].items():
-        if data.get("symbol") == symbol.upper():
-            return {
-                "vertices": data.get("vertices", []),
-                "sides": data.get("sides", 0),
-                "bounding_box": data.get("bounding_box", {})
-            }
-    return None
+    _, data = match
+    return {
+        "vertices": data.get("vertices", []),
+        "sides": data.get("sides", 0),
+        "bounding_box": data.get("bounding_box", {})
+    }
 
 
 def _generate_regular_polygon_vertices(sides: int, radius: float = 1.0) -> List[List[float]]:
@@ -176,13 +161,14 @@ def _calculate_stability(geometry: Dict, attachment: Dict) -> float:
 @router.post("/generate", response_model=GenerateResponse)
 async def generate_polyform(request: GenerateRequest):
     """Generate a new polyform from two polygons"""
+    return await run_admitted("generate", _generate, request)
+
+
+def _generate(request: GenerateRequest) -> GenerateResponse:
     try:
-        # Load geometry catalog
-        catalog = _load_geometry_catalog()
-        
-        # Get polygon geometries
-        polyA = _get_primitive_geometry(request.polygonA, catalog)
-        polyB = _get_primitive_geometry(request.polygonB, catalog)
+        # Get polygon geometries from the shared in-memory catalog
+        polyA = _get_primitive_geometry(request.polygonA)
+        polyB = _get_primitive_geometry(request.polygonB)
         
         if not polyA or not polyB:
             # Generate default geometries if not found in catalog
@@ -275,7 +261,7 @@ async def generate_polyform(request: GenerateRequest):
             "unicode": unicode_symbol,
             "compression_ratio": compression_ratio
         }
-        _storage.add(composition, storage_data, frequency)
+        shared_polyform_storage().add(composition, storage_data, frequency)
         
         return GenerateResponse(
             success=True,
@@ -298,7 +284,7 @@ async def generate_polyform(request: GenerateRequest):
 async def list_generated_polyforms():
     """List all generated polyforms"""
     try:
-        polyforms = _storage.list_all()
+        polyforms = shared_polyform_storage().list_all()
         return {
             "polyforms": polyforms,
             "total": len(polyforms)
@@ -315,7 +301,7 @@ async def list_generated_polyforms():
 async def get_generated_polyform(composition: str):
     """Get a specific generated polyform by composition"""
     try:
-        polyform = _storage.get_by_composition(composition)
+        polyform = shared_polyform_storage().get_by_composition(composition)
         if polyform:
             return {
                 "success": True,
@@ -337,7 +323,7 @@ async def get_generated_polyform(composition: str):
 async def get_storage_stats():
     """Get storage statistics"""
     try:
-        stats = _storage.get_stats()
+        stats = shared_polyform_storage().get_stats()
         return {
             "success": True,
             "stats": stats
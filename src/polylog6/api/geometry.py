@@ -4,18 +4,31 @@ Geometry API Endpoints
 Exposes unified backend geometry system for frontend and other services.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import Optional
 
+from polylog6.api.response_cache import prefers_media_type
 from polylog6.geometry import get_unified_backend_geometry
+from polylog6.geometry.binary_format import GEOMETRY_MEDIA_TYPE
 
 router = APIRouter(prefix="/geometry", tags=["geometry"])
 
 
 @router.get("/polyhedron/{symbol}")
-async def get_polyhedron_geometry(symbol: str):
-    """Get geometry data for polyhedron from Netlib."""
+async def get_polyhedron_geometry(symbol: str, request: Request):
+    """Get geometry data for polyhedron from Netlib.
+    
+    Clients sending ``Accept: application/vnd.polylog.geometry`` receive the
+    packed binary form instead of JSON.
+    """
     backend = get_unified_backend_geometry()
+    
+    if prefers_media_type(request.headers.get("accept"), GEOMETRY_MEDIA_TYPE):
+        payload = backend.get_polyhedron_binary(symbol)
+        if payload is None:
+            raise HTTPException(status_code=404, detail=f"Polyhedron {symbol} not found")
+        return Response(content=payload, media_type=GEOMETRY_MEDIA_TYPE, headers={"Vary": "Accept"})
+    
     geometry = backend.get_polyhedron_geometry(symbol)
     
     if not geometry:
@@ -0,0 +1,188 @@
+"""Process-wide, hot-reloading geometry catalog for the polyform endpoints.
+
+``geometry_catalog.json`` is parsed once and indexed by primitive key and by
+symbol. The backing file is re-stat'ed at most every ``check_interval`` seconds
+and reparsed only when its ``(mtime, size)`` changes, so request handlers get
+dictionary lookups instead of a JSON parse and a linear scan.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_ROOT = Path(__file__).resolve().parents[3]
+CATALOG_FILENAME = "geometry_catalog.json"
+DEFAULT_CATALOG_PATHS: Tuple[Path, ...] = (
+    _ROOT / "catalogs" / CATALOG_FILENAME,
+    _ROOT / "data" / "catalogs" / CATALOG_FILENAME,
+    _ROOT / "lib" / "catalogs" / CATALOG_FILENAME,
+    Path("data") / "catalogs" / CATALOG_FILENAME,
+    Path("lib") / "catalogs" / CATALOG_FILENAME,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class GeometryCatalogSnapshot:
+    """Immutable parsed catalog plus its lookup indexes."""
+
+    path: Optional[Path]
+    stamp: Optional[Tuple[int, int]]
+    raw: Mapping[str, Any] = field(default_factory=dict)
+    primitives: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    by_symbol: Mapping[str, str] = field(default_factory=dict)
+    polyhedra: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, path: Optional[Path], stamp: Optional[Tuple[int, int]], payload: Mapping[str, Any]):
+        primitives = payload.get("primitives") or {}
+        by_symbol: Dict[str, str] = {}
+        for name, data in primitives.items():
+            symbol = data.get("symbol")
+            if isinstance(symbol, str):
+                # First entry wins, matching the linear scans this replaces.
+                by_symbol.setdefault(symbol.upper(), name)
+        return cls(
+            path=path,
+            stamp=stamp,
+            raw=payload,
+            primitives=primitives,
+            by_symbol=by_symbol,
+            polyhedra=payload.get("polyhedra") or {},
+        )
+
+
+class GeometryCatalogService:
+    """Shared geometry catalog with primitive/symbol indexes and hot reload."""
+
+    def __init__(self, paths: Optional[Sequence[Path | str]] = None, *, check_interval: float = 1.0) -> None:
+        if check_interval < 0:
+            raise ValueError("check_interval must be non-negative")
+        self.paths = tuple(Path(path) for path in (paths if paths is not None else DEFAULT_CATALOG_PATHS))
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot = GeometryCatalogSnapshot(path=None, stamp=None)
+        self._checked_at = float("-inf")
+        self._loaded = False
+        self._stats = {"loads": 0, "load_errors": 0, "checks": 0}
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def _resolve(self) -> Tuple[Optional[Path], Optional[Tuple[int, int]]]:
+        for path in self.paths:
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            return path, (info.st_mtime_ns, info.st_size)
+        return None, None
+
+    def snapshot(self) -> GeometryCatalogSnapshot:
+        """Return the current catalog, reloading it if the file changed."""
+
+        now = time.monotonic()
+        if self._loaded and now - self._checked_at < self.check_interval:
+            return self._snapshot
+        with self._lock:
+            if self._loaded and now - self._checked_at < self.check_interval:
+                return self._snapshot
+            self._checked_at = now
+            self._stats["checks"] += 1
+            path, stamp = self._resolve()
+            current = self._snapshot
+            if self._loaded and path == current.path and stamp == current.stamp:
+                return current
+            self._snapshot = self._load(path, stamp, current)
+            self._loaded = True
+            return self._snapshot
+
+    def _load(
+        self,
+        path: Optional[Path],
+        stamp: Optional[Tuple[int, int]],
+        previous: GeometryCatalogSnapshot,
+    ) -> GeometryCatalogSnapshot:
+        if path is None:
+            return GeometryCatalogSnapshot(path=None, stamp=None)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError) as exc:
+            # A half-written file during a deploy: keep serving the last good copy.
+            self._stats["load_errors"] += 1
+            logger.warning("Failed to load geometry catalog %s: %s", path, exc)
+            return previous
+        self._stats["loads"] += 1
+        return GeometryCatalogSnapshot.from_payload(path, stamp, payload)
+
+    def reload(self) -> GeometryCatalogSnapshot:
+        """Force a re-check of the backing file."""
+
+        self._checked_at = float("-inf")
+        return self.snapshot()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    @property
+    def available(self) -> bool:
+        return self.snapshot().path is not None
+
+    def catalog(self) -> Mapping[str, Any]:
+        """The parsed catalog document (treat as read-only)."""
+
+        return self.snapshot().raw
+
+    def primitive(self, name: str) -> Optional[Mapping[str, Any]]:
+        return self.snapshot().primitives.get(name)
+
+    def primitive_by_symbol(self, symbol: str) -> Optional[Tuple[str, Mapping[str, Any]]]:
+        """Return ``(primitive_name, data)`` for a letter symbol such as ``"B"``."""
+
+        snapshot = self.snapshot()
+        name = snapshot.by_symbol.get(symbol.upper())
+        if name is None:
+            return None
+        return name, snapshot.primitives[name]
+
+    def polyhedron(self, name: str) -> Optional[Mapping[str, Any]]:
+        return self.snapshot().polyhedra.get(name)
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "path": str(snapshot.path) if snapshot.path else None,
+            "primitives": len(snapshot.primitives),
+            "polyhedra": len(snapshot.polyhedra),
+        }
+
+
+_geometry_catalog_singleton: Optional[GeometryCatalogService] = None
+_singleton_lock = threading.Lock()
+
+
+def get_geometry_catalog() -> GeometryCatalogService:
+    """Return the process-wide geometry catalog service.
+
+    ``POLYLOG_GEOMETRY_CATALOG`` pins the catalog to a specific file.
+    """
+
+    global _geometry_catalog_singleton
+    if _geometry_catalog_singleton is None:
+        with _singleton_lock:
+            if _geometry_catalog_singleton is None:
+                override = os.environ.get("POLYLOG_GEOMETRY_CATALOG")
+                _geometry_catalog_singleton = GeometryCatalogService([override] if override else None)
+    return _geometry_catalog_singleton
+
+
+__all__ = ["GeometryCatalogService", "GeometryCatalogSnapshot", "get_geometry_catalog"]
@@ -2,23 +2,43 @@
 FastAPI entry point for Tauri sidecar
 """
 import json
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from polylog6.api.attachment import router as attachment_router
 from polylog6.api.attachment_patterns import router as patterns_router
 from polylog6.api.generator import router as generator_router
 from polylog6.api.geometry import router as geometry_router
+from polylog6.api.geometry_catalog import get_geometry_catalog
+from polylog6.api.metrics import router as metrics_router
 from polylog6.api.multi_generator import router as multi_generator_router
+from polylog6.api.request_metrics import RequestMetricsMiddleware, get_request_metrics
+from polylog6.api.request_metrics import router as request_metrics_router
 from polylog6.api.scalar_variants import router as scalar_router
 from polylog6.api.storage import router as storage_router
 from polylog6.api.tier0 import router as tier0_router
 from polylog6.api.tier1_polyhedra import router as tier1_router
+from polylog6.api.tier1_polyhedra import warm_response_cache
 
-app = FastAPI(title="Polyform Backend")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Parse catalogs and build the serialized/compressed responses before taking traffic.
+    get_geometry_catalog().snapshot()
+    warm_response_cache()
+    yield
+    # Optional per-route summary for the monitoring tooling on shutdown.
+    metrics_log = os.environ.get("POLYLOG_REQUEST_METRICS_JSONL")
+    if metrics_log:
+        get_request_metrics().dump_jsonl(metrics_log)
+
+
+app = FastAPI(title="Polyform Backend", lifespan=_lifespan)
 
 # CORS for Tauri frontend and dev server
 app.add_middleware(
@@ -28,6 +48,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so latency includes CORS handling and streamed bodies.
+app.add_middleware(RequestMetricsMiddleware)
 
 # Register routers
 app.include_router(tier1_router)
@@ -39,6 +61,8 @@ app.include_router(patterns_router)
 app.include_router(multi_generator_router)
 app.include_router(geometry_router)
 app.include_router(tier0_router)
+app.include_router(metrics_router)
+app.include_router(request_metrics_router)
 
 @app.get("/health")
 async def health_check():
@@ -84,6 +108,30 @@ POLYGON_ID_TO_SYMBOL = {
     18: "R",  # 20-gon
 }
 
+def _primitive_decode_response(primitive_name: str, primitive_data: dict, **metadata) -> dict:
+    """Decode payload for a single catalog primitive."""
+    return {
+        "lod": {
+            "full": {
+                "vertices": primitive_data["vertices"],
+                "indices": [],  # Will be triangulated on frontend
+                "normals": [[0, 0, 1] for _ in primitive_data["vertices"]]
+            },
+            "medium": {"vertices": [], "indices": []},
+            "bbox": primitive_data["bounding_box"]
+        },
+        "folds": [],
+        "metadata": {
+            "polygon_count": 1,
+            "edge_count": primitive_data["sides"],
+            "compression_ratio": 1.0,
+            "primitive_name": primitive_name,
+            "symbol": primitive_data["symbol"],
+            **metadata
+        }
+    }
+
+
 @app.post("/api/polyform/decode")
 async def decode_polyform(request: dict):
     """
@@ -91,12 +139,9 @@ async def decode_polyform(request: dict):
     """
     encoding = request.get("encoding")
     
-    # Load geometry catalog
-    catalog_path = Path(__file__).parent.parent.parent.parent.parent / "lib" / "catalogs" / "geometry_catalog.json"
-    try:
-        with open(catalog_path, "r") as f:
-            geometry_catalog = json.load(f)
-    except FileNotFoundError:
+    # Shared in-memory catalog (parsed once, hot-reloaded on file change)
+    geometry_catalog = get_geometry_catalog()
+    if not geometry_catalog.available:
         # Fallback to basic triangle if catalog not found
         return {
             "lod": {
@@ -118,78 +163,23 @@ async def decode_polyform(request: dict):
     
     # For single character symbols (A, B, C, D...), return the corresponding primitive
     if encoding and len(encoding) == 1 and encoding.isalpha():
-        symbol = encoding.upper()
-        for primitive_name, primitive_data in geometry_catalog["primitives"].items():
-            if primitive_data["symbol"] == symbol:
-                return {
-                    "lod": {
-                        "full": {
-                            "vertices": primitive_data["vertices"],
-                            "indices": [],  # Will be triangulated on frontend
-                            "normals": [[0, 0, 1] for _ in primitive_data["vertices"]]
-                        },
-                        "medium": {"vertices": [], "indices": []},
-                        "bbox": primitive_data["bounding_box"]
-                    },
-                    "folds": [],
-                    "metadata": {
-                        "polygon_count": 1,
-                        "edge_count": primitive_data["sides"],
-                        "compression_ratio": 1.0,
-                        "primitive_name": primitive_name,
-                        "symbol": symbol
-                    }
-                }
+        match = geometry_catalog.primitive_by_symbol(encoding)
+        if match is not None:
+            return _primitive_decode_response(*match)
     
     # For numeric IDs (from tier structure), convert to symbol then return primitive
     if encoding and encoding.isdigit():
         polygon_id = int(encoding)
         if polygon_id in POLYGON_ID_TO_SYMBOL:
-            symbol = POLYGON_ID_TO_SYMBOL[polygon_id]
-            for primitive_name, primitive_data in geometry_catalog["primitives"].items():
-                if primitive_data["symbol"] == symbol:
-                    return {
-                        "lod": {
-                            "full": {
-                                "vertices": primitive_data["vertices"],
-                                "indices": [],  # Will be triangulated on frontend
-                                "normals": [[0, 0, 1] for _ in primitive_data["vertices"]]
-                            },
-                            "medium": {"vertices": [], "indices": []},
-                            "bbox": primitive_data["bounding_box"]
-                        },
-                        "folds": [],
-                        "metadata": {
-                            "polygon_count": 1,
-                            "edge_count": primitive_data["sides"],
-                            "compression_ratio": 1.0,
-                            "primitive_name": primitive_name,
-                            "symbol": symbol,
-                            "polygon_id": polygon_id
-                        }
-                    }
+            match = geometry_catalog.primitive_by_symbol(POLYGON_ID_TO_SYMBOL[polygon_id])
+            if match is not None:
+                return _primitive_decode_response(*match, polygon_id=polygon_id)
     
     # Fallback to triangle
-    triangle_data = geometry_catalog["primitives"]["triangle"]
-    return {
-        "lod": {
-            "full": {
-                "vertices": triangle_data["vertices"],
-                "indices": [],  # Will be triangulated on frontend
-                "normals": [[0, 0, 1] for _ in triangle_data["vertices"]]
-            },
-            "medium": {"vertices": [], "indices": []},
-            "bbox": triangle_data["bounding_box"]
-        },
-        "folds": [],
-        "metadata": {
-            "polygon_count": 1,
-            "edge_count": 3,
-            "compression_ratio": 1.0,
-            "primitive_name": "triangle",
-            "symbol": "A"
-        }
-    }
+    triangle_data = geometry_catalog.primitive("triangle")
+    if triangle_data is None:
+        raise HTTPException(status_code=500, detail="Geometry catalog has no triangle primitive")
+    return _primitive_decode_response("triangle", {**triangle_data, "sides": 3, "symbol": "A"})
 
 if __name__ == "__main__":
     uvicorn.run(app, host="127.0.0.1", port=8008)
@@ -0,0 +1,152 @@
+"""Prometheus-style text metrics for the API process.
+
+Modules register a collector returning exposition lines; ``GET /metrics``
+concatenates them. Histograms use fixed cumulative buckets so observations
+are O(buckets) and the exposition needs no sorting.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans cheap catalog reads through multi-second generation runs.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Iterable[str]]
+
+router = APIRouter(tags=["metrics"])
+
+
+def format_labels(labels: Mapping[str, str] | Labels) -> str:
+    """``{a="x",b="y"}`` with Prometheus escaping, or ``""`` for no labels."""
+
+    items = labels.items() if isinstance(labels, Mapping) else labels
+    parts = []
+    for key, value in items:
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram with fixed upper bounds."""
+
+    __slots__ = ("buckets", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(upper_bound, cumulative_count)`` pairs ending with ``+Inf``."""
+
+        with self._lock:
+            counts = list(self._counts)
+        pairs: List[Tuple[float, int]] = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing the ``q`` quantile (0 when empty)."""
+
+        pairs = self.cumulative()
+        total = pairs[-1][1]
+        if total == 0:
+            return 0.0
+        target = q * total
+        for bound, running in pairs:
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def render(self, name: str, labels: Labels = ()) -> List[str]:
+        lines = []
+        for bound, running in self.cumulative():
+            bucket_labels = labels + (("le", _format_value(bound)),)
+            lines.append(f"{name}_bucket{format_labels(bucket_labels)} {running}")
+        lines.append(f"{name}_sum{format_labels(labels)} {_format_value(self._sum)}")
+        lines.append(f"{name}_count{format_labels(labels)} {self._count}")
+        return lines
+
+
+def metric_family(name: str, kind: str, help_text: str, samples: Iterable[str]) -> List[str]:
+    """HELP/TYPE header followed by ``samples`` (already formatted lines)."""
+
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples]
+
+
+_collectors: Dict[str, Collector] = {}
+_collectors_lock = threading.Lock()
+
+
+def register_collector(name: str, collector: Collector) -> None:
+    """Add (or replace) a named source of exposition lines."""
+
+    with _collectors_lock:
+        _collectors[name] = collector
+
+
+def render_metrics() -> str:
+    with _collectors_lock:
+        collectors = list(_collectors.values())
+    lines: List[str] = []
+    for collector in collectors:
+        lines.extend(collector())
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Prometheus text exposition of every registered collector."""
+
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "PROMETHEUS_MEDIA_TYPE",
+    "format_labels",
+    "metric_family",
+    "register_collector",
+    "render_metrics",
+    "router",
+]
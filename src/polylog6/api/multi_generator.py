@@ -2,14 +2,16 @@
 Multi-polygon generation API (3+ polygons)
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-import json
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, AsyncIterator, Optional
 from pathlib import Path
 
+from polylog6.api.admission import run_admitted
+from polylog6.api.geometry_catalog import get_geometry_catalog
+from polylog6.api.streaming import ndjson_response
 from polylog6.storage.encoder import TieredUnicodeEncoder
-from polylog6.storage.polyform_storage import PolyformStorage
+from polylog6.storage.polyform_storage import shared_polyform_storage
 from polylog6.simulation.placement.runtime import PlacementRuntime
 from polylog6.storage.manager import PolyformStorageManager
 from pathlib import Path
@@ -18,7 +20,6 @@ from polylog6.simulation.stability.calculator import StabilityCalculator
 router = APIRouter(prefix="/api/polyform", tags=["multi_generator"])
 
 _encoder = TieredUnicodeEncoder()
-_storage = PolyformStorage()
 # Initialize storage manager and catalog for PlacementRuntime
 _storage_base_path = Path(__file__).parent.parent.parent.parent.parent / "storage" / "caches"
 _storage_manager = PolyformStorageManager(base_path=_storage_base_path)
@@ -41,6 +42,9 @@ class MultiGenerateRequest(BaseModel):
     pattern_type: Optional[str] = None  # For pattern mode
     max_steps: int = 10
 
+class MultiGenerateBatchRequest(BaseModel):
+    requests: List[MultiGenerateRequest] = Field(..., max_length=10000)
+
 class MultiGenerateResponse(BaseModel):
     success: bool
     symbol: Optional[str] = None
@@ -51,31 +55,17 @@ class MultiGenerateResponse(BaseModel):
     compressionRatio: Optional[float] = None
     error: Optional[str] = None
 
-def _load_geometry_catalog():
-    """Load geometry catalog"""
-    possible_paths = [
-        Path("data/catalogs/geometry_catalog.json"),
-        Path("lib/catalogs/geometry_catalog.json"),
-        Path(__file__).parent.parent.parent.parent / "data" / "catalogs" / "geometry_catalog.json"
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            with open(path, 'r') as f:
-                return json.load(f)
-    
-    return {"primitives": {}}
-
-def _get_primitive_geometry(symbol: str, catalog: Dict) -> Optional[Dict[str, Any]]:
+def _get_primitive_geometry(symbol: str) -> Optional[Dict[str, Any]]:
     """Get primitive geometry from catalog"""
-    for name, data in catalog.get("primitives", {}).items():
-        if data.get("symbol") == symbol.upper():
-            return {
-                "vertices": data.get("vertices", []),
-                "indices": [],
-                "sides": data.get("sides", 3)
-            }
-    return None
+    match = get_geometry_catalog().primitive_by_symbol(symbol)
+    if match is None:
+        return None
+    _, data = match
+    return {
+        "vertices": data.get("vertices", []),
+        "indices": [],
+        "sides": data.get("sides", 3)
+    }
 
 def _generate_regular_polygon_vertices(sides: int, radius: float = 1.0) -> List[List[float]]:
     """Generate regular polygon vertices"""
@@ -130,6 +120,28 @@ def _combine_geometries(geometries: List[Dict[str, Any]], attachment_sequence: L
 @router.post("/generate-multi", response_model=MultiGenerateResponse)
 async def generate_multi_polyform(request: MultiGenerateRequest):
     """Generate a polyform from 3+ polygons"""
+    return await run_admitted("generate", _generate_multi, request)
+
+@router.post("/generate-multi/stream")
+async def stream_generate_multi_polyforms(batch: MultiGenerateBatchRequest, request: Request):
+    """Generate many polyforms, streaming one NDJSON record per polyform.
+    
+    Each line is a ``MultiGenerateResponse`` plus the ``index`` of its entry
+    in ``requests``. Entries are admitted to the ``generate`` pool one at a
+    time; one refused or timed out there is reported as a failed record.
+    Generation stops as soon as the client disconnects.
+    """
+    async def records() -> AsyncIterator[Dict[str, Any]]:
+        for index, item in enumerate(batch.requests):
+            try:
+                result = await run_admitted("generate", _generate_multi, item)
+            except HTTPException as exc:
+                result = MultiGenerateResponse(success=False, error=str(exc.detail))
+            yield {"index": index, **result.model_dump()}
+    
+    return ndjson_response(records(), request)
+
+def _generate_multi(request: MultiGenerateRequest) -> MultiGenerateResponse:
     try:
         if len(request.polygons) < 3:
             return MultiGenerateResponse(
@@ -137,12 +149,10 @@ async def generate_multi_polyform(request: MultiGenerateRequest):
                 error="Multi-polygon generation requires at least 3 polygons"
             )
         
-        catalog = _load_geometry_catalog()
-        
         # Load geometries for all polygons
         geometries = []
         for symbol in request.polygons:
-            geom = _get_primitive_geometry(symbol, catalog)
+            geom = _get_primitive_geometry(symbol)
             if not geom:
                 # Generate default
                 sides = SYMBOL_TO_SIDES.get(symbol.upper(), 3)
@@ -211,7 +221,7 @@ async def generate_multi_polyform(request: MultiGenerateRequest):
             "unicode": unicode_symbol,
             "compression_ratio": compression_ratio
         }
-        _storage.add(composition, storage_data, frequency)
+        shared_polyform_storage().add(composition, storage_data, frequency)
         
         return MultiGenerateResponse(
             success=True,
@@ -0,0 +1,198 @@
+"""Cursor pagination and field projection for catalog list endpoints.
+
+List endpoints page over a :class:`KeysetIndex` that is built once per
+catalog version (see :class:`IndexCache`) instead of re-materialising the
+catalog on every request. Cursors are opaque, URL-safe encodings of the sort
+key of the last row served, so a page boundary stays put when rows are added
+elsewhere in the listing.
+"""
+from __future__ import annotations
+
+import base64
+import bisect
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Key = Tuple[Any, ...]
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor."""
+
+    raw = json.dumps(list(key), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Key:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` for foreign input."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii") + b"=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except ValueError as exc:
+        raise ValueError(f"Malformed cursor {cursor!r}") from exc
+    if not isinstance(key, list) or not key:
+        raise ValueError(f"Malformed cursor {cursor!r}")
+    return tuple(key)
+
+
+def parse_fields(
+    spec: Optional[str],
+    allowed: Optional[Iterable[str]] = None,
+    *,
+    required: Sequence[str] = ("symbol",),
+) -> Optional[Tuple[str, ...]]:
+    """Parse a ``fields=a,b`` projection; ``None`` keeps every field.
+
+    ``required`` fields are always included so rows stay identifiable. When
+    ``allowed`` is given, unknown names raise ``ValueError``.
+    """
+
+    if spec is None or not spec.strip():
+        return None
+    allowed_names = None if allowed is None else frozenset(allowed)
+    fields: List[str] = [name for name in required]
+    for name in spec.split(","):
+        name = name.strip()
+        if not name or name in fields:
+            continue
+        if allowed_names is not None and name not in allowed_names:
+            raise ValueError(f"Unknown field {name!r}; expected any of {sorted(allowed_names)}")
+        fields.append(name)
+    return tuple(fields)
+
+
+def project(row: Mapping[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Copy of ``row`` restricted to ``fields`` (all fields when ``None``)."""
+
+    if fields is None:
+        return dict(row)
+    return {name: row[name] for name in fields if name in row}
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """One page of an index: rows plus where they sit in the listing."""
+
+    rows: List[T]
+    offset: int
+    total: int
+    next_cursor: Optional[str]
+
+
+class KeysetIndex(Generic[T]):
+    """Rows sorted by a unique tuple key, paged by offset or by cursor.
+
+    Keys sharing a leading ``prefix`` form a contiguous span, so filters on
+    leading key columns (e.g. the tier) are two bisections, not a scan.
+    """
+
+    __slots__ = ("keys", "rows")
+
+    def __init__(self, pairs: Iterable[Tuple[Key, T]]) -> None:
+        ordered = sorted(pairs, key=lambda pair: pair[0])
+        self.keys: List[Key] = [key for key, _ in ordered]
+        self.rows: List[T] = [row for _, row in ordered]
+        for previous, current in zip(self.keys, self.keys[1:]):
+            if previous == current:
+                raise ValueError(f"Duplicate index key {current!r}")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def span(self, prefix: Key = ()) -> Tuple[int, int]:
+        """Positions ``[lo, hi)`` of the rows whose key starts with ``prefix``."""
+
+        if not prefix:
+            return 0, len(self.keys)
+        width = len(prefix)
+        lo = bisect.bisect_left(self.keys, prefix, key=lambda key: key[:width])
+        hi = bisect.bisect_right(self.keys, prefix, lo=lo, key=lambda key: key[:width])
+        return lo, hi
+
+    def page(
+        self,
+        limit: int,
+        *,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        prefix: Key = (),
+    ) -> Page[T]:
+        """Rows after ``cursor`` (or from ``offset``) within the ``prefix`` span."""
+
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        lo, hi = self.span(prefix)
+        if cursor is not None:
+            after = decode_cursor(cursor)
+            try:
+                start = bisect.bisect_right(self.keys, after, lo=lo, hi=hi)
+            except TypeError as exc:
+                raise ValueError(f"Cursor {cursor!r} does not belong to this listing") from exc
+        else:
+            start = min(lo + max(offset, 0), hi)
+        stop = min(start + limit, hi)
+        next_cursor = encode_cursor(self.keys[stop - 1]) if stop < hi else None
+        return Page(rows=self.rows[start:stop], offset=start - lo, total=hi - lo, next_cursor=next_cursor)
+
+
+class IndexCache(Generic[T]):
+    """Build a value once per version stamp.
+
+    ``version_source`` (e.g. :func:`polylog6.api.response_cache.file_fingerprint`
+    over the backing files) is polled at most every ``check_interval``
+    seconds; a changed stamp rebuilds the value on the next :meth:`get`.
+    """
+
+    def __init__(
+        self,
+        builder: Callable[[], T],
+        version_source: Callable[[], Hashable],
+        *,
+        check_interval: float = 1.0,
+    ) -> None:
+        if check_interval < 0:
+            raise ValueError("check_interval must be non-negative")
+        self._builder = builder
+        self._version_source = version_source
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._version: Optional[Hashable] = None
+        self._checked_at = float("-inf")
+        self.builds = 0
+
+    def get(self) -> T:
+        with self._lock:
+            now = time.monotonic()
+            if self._value is not None and now - self._checked_at < self.check_interval:
+                return self._value
+            self._checked_at = now
+            version = self._version_source()
+            if self._value is None or version != self._version:
+                self._value = self._builder()
+                self._version = version
+                self.builds += 1
+            return self._value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._value = None
+            self._version = None
+            self._checked_at = float("-inf")
+
+
+__all__ = [
+    "IndexCache",
+    "KeysetIndex",
+    "Page",
+    "decode_cursor",
+    "encode_cursor",
+    "parse_fields",
+    "project",
+]
@@ -0,0 +1,404 @@
+"""Per-route request instrumentation for the FastAPI app.
+
+:class:`RequestMetricsMiddleware` is a plain ASGI middleware (so streaming
+responses are timed to their last byte) that records, per
+``(method, route template)``:
+
+* a latency histogram and response-size histogram,
+* status-class counters and catalog cache outcomes read from the
+  ``X-Cache`` header set by :mod:`polylog6.api.response_cache`,
+* a bounded sample of slow requests.
+
+A request slower than ``profile_threshold`` arms its route: the next request
+to that route (or a ``profile_sample_rate`` fraction of all requests) runs
+under ``cProfile``, and if it is slow too its top functions are attached to
+its slow sample. Work that a request hands to an
+:class:`~polylog6.api.admission.AdmissionPool` thread is profiled in that
+thread via :func:`profile_section`. Event-loop captures may include
+interleaved work from concurrent requests.
+
+Everything is exported on ``GET /metrics`` (Prometheus text) and
+``GET /metrics/requests`` (JSON); :meth:`RequestMetrics.dump_jsonl` appends
+the same summaries through :class:`~polylog6.simulation.metrics.MetricsEmitter`
+so the monitoring tooling can tail them.
+"""
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import io
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from fastapi import APIRouter
+
+from polylog6.api.metrics import Histogram, format_labels, metric_family, register_collector
+from polylog6.api.response_cache import CACHE_STATUS_HEADER
+
+SIZE_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+CACHE_OUTCOMES = ("HIT", "MISS", "REVALIDATED")
+_CACHE_HEADER = CACHE_STATUS_HEADER.lower().encode("latin-1")
+_PROFILE_LINES = 25
+
+RouteKey = Tuple[str, str]
+
+
+@dataclass(slots=True)
+class _Capture:
+    """Profilers collected for one request across the threads it ran on."""
+
+    profiles: List[cProfile.Profile] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, profile: cProfile.Profile) -> None:
+        with self.lock:
+            self.profiles.append(profile)
+
+    def render(self, limit: int = _PROFILE_LINES) -> str:
+        with self.lock:
+            profiles = list(self.profiles)
+        if not profiles:
+            return ""
+        stream = io.StringIO()
+        stats = pstats.Stats(profiles[0], stream=stream)
+        for extra in profiles[1:]:
+            stats.add(extra)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+
+_active_capture: contextvars.ContextVar[Optional[_Capture]] = contextvars.ContextVar("polylog_profile_capture", default=None)
+
+
+@contextmanager
+def profile_section() -> Iterator[None]:
+    """Profile this thread while the current request is being captured.
+
+    A no-op unless the request that scheduled this work was selected for
+    profiling; the context must have been copied into the worker thread.
+    """
+
+    capture = _active_capture.get()
+    if capture is None:
+        yield
+        return
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:  # another profiler already owns this thread
+        yield
+        return
+    try:
+        yield
+    finally:
+        profile.disable()
+        capture.add(profile)
+
+
+@dataclass(slots=True)
+class _RouteStats:
+    latency: Histogram = field(default_factory=Histogram)
+    size: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    statuses: Dict[str, int] = field(default_factory=dict)
+    cache: Dict[str, int] = field(default_factory=dict)
+
+
+class RequestMetrics:
+    """Thread-safe store behind :class:`RequestMetricsMiddleware`."""
+
+    def __init__(
+        self,
+        *,
+        slow_threshold: float = 0.5,
+        profile_threshold: Optional[float] = None,
+        profile_sample_rate: float = 0.0,
+        max_slow_samples: int = 100,
+    ) -> None:
+        if slow_threshold <= 0:
+            raise ValueError("slow_threshold must be positive")
+        if not 0.0 <= profile_sample_rate <= 1.0:
+            raise ValueError("profile_sample_rate must be within [0, 1]")
+        self.slow_threshold = slow_threshold
+        self.profile_threshold = slow_threshold if profile_threshold is None else profile_threshold
+        self.profile_sample_rate = profile_sample_rate
+        self._routes: Dict[RouteKey, _RouteStats] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=max_slow_samples)
+        self._armed: Set[RouteKey] = set()
+        self._profiling = False
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    @property
+    def has_armed_routes(self) -> bool:
+        return bool(self._armed)
+
+    def should_profile(self, key: Tuple[str, Optional[str]]) -> bool:
+        """Claim the (single) event-loop profiler for a request to ``key``."""
+
+        with self._lock:
+            if self._profiling:
+                return False
+            wanted = key in self._armed or (
+                self.profile_sample_rate > 0 and random.random() < self.profile_sample_rate
+            )
+            if not wanted:
+                return False
+            self._armed.discard(key)
+            self._profiling = True
+            return True
+
+    def release_profiler(self) -> None:
+        with self._lock:
+            self._profiling = False
+
+    def record(
+        self,
+        key: RouteKey,
+        *,
+        path: str,
+        status: int,
+        duration: float,
+        size: int,
+        cache: Optional[str] = None,
+        profile: Optional[str] = None,
+        profiled: bool = False,
+    ) -> None:
+        status_class = f"{status // 100}xx"
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _RouteStats()
+            stats.statuses[status_class] = stats.statuses.get(status_class, 0) + 1
+            if cache in CACHE_OUTCOMES:
+                stats.cache[cache] = stats.cache.get(cache, 0) + 1
+            if duration >= self.slow_threshold:
+                sample = {
+                    "timestamp": time.time(),
+                    "method": key[0],
+                    "route": key[1],
+                    "path": path,
+                    "status": status,
+                    "duration_ms": duration * 1000.0,
+                    "bytes": size,
+                }
+                if profile:
+                    sample["profile"] = profile
+                self._slow.append(sample)
+            if duration >= self.profile_threshold and not profiled:
+                self._armed.add(key)
+        stats.latency.observe(duration)
+        stats.size.observe(size)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = list(self._routes.items())
+            slow = list(self._slow)
+        summary_routes = []
+        for (method, route), stats in sorted(routes):
+            count = stats.latency.count
+            lookups = sum(stats.cache.values())
+            summary_routes.append(
+                {
+                    "method": method,
+                    "route": route,
+                    "count": count,
+                    "mean_ms": stats.latency.sum / count * 1000.0 if count else 0.0,
+                    "p50_ms": stats.latency.quantile(0.5) * 1000.0,
+                    "p95_ms": stats.latency.quantile(0.95) * 1000.0,
+                    "p99_ms": stats.latency.quantile(0.99) * 1000.0,
+                    "bytes_total": int(stats.size.sum),
+                    "statuses": dict(stats.statuses),
+                    "cache": dict(stats.cache),
+                    "cache_hit_rate": stats.cache.get("HIT", 0) / lookups if lookups else None,
+                }
+            )
+        return {
+            "slow_threshold_ms": self.slow_threshold * 1000.0,
+            "routes": summary_routes,
+            "slow_requests": slow,
+        }
+
+    def collect(self) -> Iterable[str]:
+        """Prometheus exposition lines."""
+
+        with self._lock:
+            routes = sorted(self._routes.items())
+        labelled = [((("method", method), ("route", route)), stats) for (method, route), stats in routes]
+        lines: List[str] = []
+        lines += metric_family(
+            "polylog_http_request_duration_seconds",
+            "histogram",
+            "Request latency by route template.",
+            (line for labels, stats in labelled for line in stats.latency.render("polylog_http_request_duration_seconds", labels)),
+        )
+        lines += metric_family(
+            "polylog_http_response_size_bytes",
+            "histogram",
+            "Response body size by route template.",
+            (line for labels, stats in labelled for line in stats.size.render("polylog_http_response_size_bytes", labels)),
+        )
+        lines += metric_family(
+            "polylog_http_responses_total",
+            "counter",
+            "Responses by route template and status class.",
+            (
+                f"polylog_http_responses_total{format_labels(labels + (('status', status),))} {count}"
+                for labels, stats in labelled
+                for status, count in sorted(stats.statuses.items())
+            ),
+        )
+        lines += metric_family(
+            "polylog_http_cache_total",
+            "counter",
+            "Catalog response cache outcomes by route template.",
+            (
+                f"polylog_http_cache_total{format_labels(labels + (('outcome', outcome.lower()),))} {count}"
+                for labels, stats in labelled
+                for outcome, count in sorted(stats.cache.items())
+            ),
+        )
+        return lines
+
+    def dump_jsonl(self, path: Path | str) -> int:
+        """Append one record per route plus the slow samples; returns the count."""
+
+        from polylog6.simulation.metrics import MetricsEmitter
+
+        summary = self.summary()
+        emitter = MetricsEmitter(str(path))
+        now = time.time()
+        records = [{"event": "http_route_summary", "timestamp": now, **route} for route in summary["routes"]]
+        records += [{"event": "http_slow_request", **sample} for sample in summary["slow_requests"]]
+        for record in records:
+            emitter.emit(record)
+        return len(records)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._slow.clear()
+            self._armed.clear()
+
+
+def _route_template(scope: Dict[str, Any]) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None) or getattr(route, "path_format", None)
+    if path:
+        return path
+    app = scope.get("app")
+    # Older Starlette does not record the matched route in the scope.
+    from starlette.routing import Match
+
+    for candidate in getattr(app, "routes", ()):
+        match, _ = candidate.matches(scope)
+        if match == Match.FULL:
+            return getattr(candidate, "path", "<unmatched>")
+    return "<unmatched>"
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware feeding a :class:`RequestMetrics` store."""
+
+    def __init__(self, app, metrics: Optional["RequestMetrics"] = None) -> None:
+        self.app = app
+        self.metrics = metrics or get_request_metrics()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+        cache: Optional[str] = None
+
+        async def send_wrapper(message) -> None:
+            nonlocal status, size, cache
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name.lower() == _CACHE_HEADER:
+                        cache = value.decode("latin-1").upper()
+                        break
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        method = scope.get("method", "GET")
+        # Routing has not run yet, so the template is only resolved up front
+        # while some route is armed for profiling.
+        template = _route_template(scope) if self.metrics.has_armed_routes else None
+        capture = _Capture() if self.metrics.should_profile((method, template)) else None
+        token = _active_capture.set(capture) if capture is not None else None
+        started = time.perf_counter()
+        try:
+            if capture is None:
+                await self.app(scope, receive, send_wrapper)
+            else:
+                with profile_section():
+                    await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            if token is not None:
+                _active_capture.reset(token)
+                self.metrics.release_profiler()
+            profile = capture.render() if capture is not None and duration >= self.metrics.profile_threshold else None
+            self.metrics.record(
+                (method, template or _route_template(scope)),
+                path=scope.get("path", ""),
+                status=status,
+                duration=duration,
+                size=size,
+                cache=cache,
+                profile=profile,
+                profiled=capture is not None,
+            )
+
+
+_request_metrics: Optional[RequestMetrics] = None
+_request_metrics_lock = threading.Lock()
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Process-wide store used by the app middleware and metrics routes."""
+
+    global _request_metrics
+    if _request_metrics is None:
+        with _request_metrics_lock:
+            if _request_metrics is None:
+                _request_metrics = RequestMetrics()
+    return _request_metrics
+
+
+register_collector("http", lambda: get_request_metrics().collect())
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics/requests")
+def get_request_summary() -> Dict[str, Any]:
+    """Per-route latency percentiles, sizes, cache outcomes and slow samples."""
+
+    return get_request_metrics().summary()
+
+
+__all__ = [
+    "RequestMetrics",
+    "RequestMetricsMiddleware",
+    "get_request_metrics",
+    "profile_section",
+    "router",
+]
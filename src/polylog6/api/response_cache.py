@@ -0,0 +1,355 @@
+"""Precompressed response cache for read-mostly catalog endpoints.
+
+Catalog payloads only change when the files behind them change, so the JSON
+body, its strong ETag and its ``gzip``/``deflate`` variants are built once per
+catalog version and served as bytes afterwards. Requests carrying a matching
+``If-None-Match`` get a ``304`` without a body.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Optional, Sequence, Tuple
+
+from fastapi import Response
+
+ENCODINGS = ("gzip", "deflate")
+JSON_MEDIA_TYPE = "application/json"
+# Response header reporting how the cache served a request (HIT, MISS or
+# REVALIDATED for 304s); request metrics count catalog hit rates from it.
+CACHE_STATUS_HEADER = "X-Cache"
+_MIN_COMPRESS_BYTES = 512
+
+Serializer = Callable[[Any], bytes]
+
+
+def _json_bytes(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+@dataclass(slots=True)
+class CachedPayload:
+    """Serialized body with its ETag and precompressed variants."""
+
+    body: bytes
+    digest: str
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    media_type: str = JSON_MEDIA_TYPE
+
+    @classmethod
+    def build(
+        cls,
+        payload: Any,
+        *,
+        compress_level: int = 6,
+        serializer: Optional[Serializer] = None,
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> "CachedPayload":
+        body = (serializer or _json_bytes)(payload)
+        digest = hashlib.md5(body).hexdigest()
+        variants: Dict[str, bytes] = {}
+        if len(body) >= _MIN_COMPRESS_BYTES:
+            variants["gzip"] = gzip.compress(body, compresslevel=compress_level, mtime=0)
+            variants["deflate"] = zlib.compress(body, compress_level)
+        return cls(body=body, digest=digest, variants=variants, media_type=media_type)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.variants.values())
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Return ``{coding: qvalue}`` for an ``Accept-Encoding`` (or ``Accept``) header."""
+
+    accepted: Dict[str, float] = {}
+    if not header:
+        return accepted
+    for part in header.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def prefers_media_type(accept: Optional[str], media_type: str, *, default: str = JSON_MEDIA_TYPE) -> bool:
+    """Whether ``Accept`` names ``media_type`` explicitly, at least as strongly as ``default``.
+
+    Wildcards never select ``media_type``: clients must opt in by name.
+    """
+
+    accepted = parse_accept_encoding(accept)
+    wanted = accepted.get(media_type.lower(), 0.0)
+    if wanted <= 0.0:
+        return False
+    major = default.split("/", 1)[0]
+    fallback = accepted.get(default, accepted.get(f"{major}/*", accepted.get("*/*", 0.0)))
+    return wanted >= fallback
+
+
+def negotiate_encoding(header: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Pick the preferred available coding, or ``None`` for identity."""
+
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best: Optional[str] = None
+    best_quality = 0.0
+    for coding in available:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def etag_matches(header: Optional[str], digest: str) -> bool:
+    """Whether an ``If-None-Match`` header matches any variant of ``digest``."""
+
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        tag = candidate.strip('"')
+        if tag == digest or tag.partition("-")[0] == digest:
+            return True
+    return False
+
+
+def file_fingerprint(paths: Sequence[Path]) -> Tuple[Tuple[str, int, int], ...]:
+    """Cheap version stamp for a set of files: ``(name, mtime_ns, size)``."""
+
+    stamp = []
+    for path in paths:
+        try:
+            info = os.stat(path)
+        except OSError:
+            stamp.append((str(path), -1, -1))
+            continue
+        stamp.append((str(path), info.st_mtime_ns, info.st_size))
+    return tuple(stamp)
+
+
+class ResponseCache:
+    """Version-aware cache of :class:`CachedPayload` objects.
+
+    ``version_source`` returns an opaque stamp (see :func:`file_fingerprint`).
+    It is polled at most every ``check_interval`` seconds; when the stamp
+    changes every entry is discarded and ``on_invalidate`` runs so callers can
+    drop their parsed catalogs too.
+
+    Misses are built and compressed outside the cache lock, so a slow build
+    never blocks hits on other keys. Concurrent misses on one key share a
+    single build (single-flight); a build that straddles an invalidation is
+    returned to its waiters but not stored.
+    """
+
+    def __init__(
+        self,
+        version_source: Callable[[], Hashable],
+        *,
+        max_entries: int = 256,
+        check_interval: float = 1.0,
+        compress_level: int = 6,
+        on_invalidate: Optional[Callable[[], None]] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if check_interval < 0:
+            raise ValueError("check_interval must be non-negative")
+        self._version_source = version_source
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        self.compress_level = compress_level
+        self._on_invalidate = on_invalidate
+        self._entries: "OrderedDict[Hashable, CachedPayload]" = OrderedDict()
+        self._building: Dict[Hashable, "Future[CachedPayload]"] = {}
+        # Bumped whenever entries are dropped so in-flight builds of an old
+        # catalog version are not inserted.
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._version: Optional[Hashable] = None
+        self._checked_at = float("-inf")
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "not_modified": 0,
+            "invalidations": 0,
+            "evictions": 0,
+            "bytes_served": 0,
+        }
+        self._encoded: Dict[str, int] = {"identity": 0, **{coding: 0 for coding in ENCODINGS}}
+
+    # ------------------------------------------------------------------
+    # Cache maintenance
+    # ------------------------------------------------------------------
+    def check_version(self, *, force: bool = False) -> bool:
+        """Invalidate when the catalog changed; return ``True`` if it did."""
+
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._checked_at < self.check_interval:
+                return False
+            self._checked_at = now
+            version = self._version_source()
+            if version == self._version:
+                return False
+            changed = self._version is not None
+            self._version = version
+            self._entries.clear()
+            self._generation += 1
+            if changed:
+                self._counters["invalidations"] += 1
+            if self._on_invalidate is not None:
+                self._on_invalidate()
+            return changed
+
+    def invalidate(self) -> None:
+        """Drop every cached payload and force a version re-check."""
+
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._version = None
+            self._checked_at = float("-inf")
+            self._counters["invalidations"] += 1
+            if self._on_invalidate is not None:
+                self._on_invalidate()
+
+    def get(
+        self,
+        key: Hashable,
+        builder: Callable[[], Any],
+        *,
+        serializer: Optional[Serializer] = None,
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> CachedPayload:
+        """Return the cached payload for ``key``, building it on a miss.
+
+        ``serializer`` turns the built object into bytes (compact JSON by
+        default); keys must differ between serializers of the same payload.
+        """
+
+        return self._lookup(key, builder, serializer=serializer, media_type=media_type)[0]
+
+    def _lookup(
+        self,
+        key: Hashable,
+        builder: Callable[[], Any],
+        *,
+        serializer: Optional[Serializer],
+        media_type: str,
+    ) -> Tuple[CachedPayload, bool]:
+        self.check_version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry, True
+            self._counters["misses"] += 1
+            pending = self._building.get(key)
+            if pending is None:
+                pending = self._building[key] = Future()
+                generation = self._generation
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return pending.result(), False
+
+        try:
+            entry = CachedPayload.build(
+                builder(),
+                compress_level=self.compress_level,
+                serializer=serializer,
+                media_type=media_type,
+            )
+        except BaseException as exc:
+            with self._lock:
+                self._building.pop(key, None)
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._building.pop(key, None)
+            if generation == self._generation:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._counters["evictions"] += 1
+        pending.set_result(entry)
+        return entry, False
+
+    def warm(self, builders: Mapping[Hashable, Callable[[], Any]]) -> None:
+        """Prebuild payloads, e.g. at application startup."""
+
+        self.check_version(force=True)
+        for key, builder in builders.items():
+            self.get(key, builder)
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    def respond(
+        self,
+        key: Hashable,
+        builder: Callable[[], Any],
+        *,
+        if_none_match: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+        serializer: Optional[Serializer] = None,
+        media_type: str = JSON_MEDIA_TYPE,
+        vary: str = "Accept-Encoding",
+    ) -> Response:
+        """Serve ``key`` honouring ``If-None-Match`` and ``Accept-Encoding``."""
+
+        entry, hit = self._lookup(key, builder, serializer=serializer, media_type=media_type)
+        coding = negotiate_encoding(accept_encoding, entry.variants)
+        headers = {"ETag": entry.etag(coding), "Vary": vary, CACHE_STATUS_HEADER: "HIT" if hit else "MISS"}
+        if etag_matches(if_none_match, entry.digest):
+            with self._lock:
+                self._counters["not_modified"] += 1
+            headers[CACHE_STATUS_HEADER] = "REVALIDATED"
+            return Response(status_code=304, headers=headers)
+
+        body = entry.variants[coding] if coding else entry.body
+        if coding:
+            headers["Content-Encoding"] = coding
+        with self._lock:
+            self._counters["bytes_served"] += len(body)
+            self._encoded[coding or "identity"] += 1
+        return Response(content=body, media_type=entry.media_type, headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "cached_bytes": sum(entry.size for entry in self._entries.values()),
+                "hit_rate": self._counters["hits"] / lookups if lookups else 0.0,
+                "encodings": dict(self._encoded),
+            }
@@ -4,11 +4,19 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from polylog6.api.pagination import IndexCache, KeysetIndex, decode_cursor, encode_cursor, parse_fields, project
+from polylog6.api.response_cache import file_fingerprint
+from polylog6.api.streaming import ndjson_response
+from polylog6.storage.polyform_storage import shared_polyform_storage
 from polylog6.storage.symbol_registry import (
     PAIR_BY_SYMBOL,
     PRIMITIVE_BY_SYMBOL,
@@ -24,20 +32,11 @@ _CANDIDATE_LOG = _ROOT / "storage" / "caches" / "tier_candidates.jsonl"
 
 _registry = SymbolRegistry()
 
-
-def _paginate(items: List[Dict[str, Any]], page: int, limit: int) -> Dict[str, Any]:
-    total = len(items)
-    start = page * limit
-    end = start + limit
-    page_items = items[start:end]
-    pages = (total + limit - 1) // limit if limit else 1
-    return {
-        "symbols": page_items,
-        "total": total,
-        "page": page,
-        "limit": limit,
-        "pages": pages,
-    }
+_SYMBOL_TIERS = (0, 1, 3, 4)
+_LIBRARY_FILES = {3: "tier3_library.json", 4: "tier4_library.json"}
+SYMBOL_FIELDS = ("symbol", "tier", "composition", "frequency", "metadata")
+# Candidate records encoded per threadpool hop by the NDJSON export.
+CANDIDATE_STREAM_BATCH = 256
 
 
 def _etag_response(payload: Dict[str, Any]) -> Response:
@@ -93,7 +92,7 @@ def _load_catalog(filename: str) -> List[Dict[str, Any]]:
 
 
 def _tier_catalog_entries(tier: int) -> List[Dict[str, Any]]:
-    filename = {3: "tier3_library.json", 4: "tier4_library.json"}.get(tier)
+    filename = _LIBRARY_FILES.get(tier)
     if not filename:
         return []
     entries = _load_catalog(filename)
@@ -113,19 +112,121 @@ def _tier_catalog_entries(tier: int) -> List[Dict[str, Any]]:
     return normalized
 
 
-def _load_candidates() -> Dict[int, List[Dict[str, Any]]]:
-    result: Dict[int, List[Dict[str, Any]]] = {3: [], 4: []}
-    if not _CANDIDATE_LOG.exists():
-        return result
-    for line in _CANDIDATE_LOG.read_text(encoding="utf-8").splitlines():
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
+@dataclass(slots=True)
+class _SymbolIndex:
+    """Every tier's symbol rows plus a library lookup.
+
+    Tier 0/1 rows come from the static registry and are keyed by
+    ``(tier, position)``. Tier 3/4 library rows are keyed by ``(tier, symbol)``
+    so that cursors stay put when the library files gain entries.
+    """
+
+    rows: KeysetIndex[Dict[str, Any]]
+    library: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _library_files() -> List[Path]:
+    return [_CATALOG_ROOT / filename for filename in _LIBRARY_FILES.values()]
+
+
+def _build_symbol_index() -> _SymbolIndex:
+    pairs: List[Tuple[Tuple[int, Any], Dict[str, Any]]] = []
+    library: Dict[str, Dict[str, Any]] = {}
+    for tier in _SYMBOL_TIERS:
+        if tier == 0:
+            rows = _tier0_payload()
+        elif tier == 1:
+            rows = _pair_payload()
+        else:
+            for row in _tier_catalog_entries(tier):
+                symbol = row["symbol"]
+                # The first entry for a symbol wins, matching the library lookup.
+                if isinstance(symbol, str) and symbol not in library:
+                    library[symbol] = row
+                    pairs.append(((tier, symbol), row))
             continue
-        tier = record.get("tier")
-        if tier in result:
-            result[tier].append(record)
-    return result
+        pairs.extend(((tier, position), row) for position, row in enumerate(rows))
+    return _SymbolIndex(rows=KeysetIndex(pairs), library=library)
+
+
+# Rebuilt only when a Tier 3/4 library file changes on disk.
+_symbol_index = IndexCache(_build_symbol_index, lambda: file_fingerprint(_library_files()))
+
+
+class _CandidateLog:
+    """Per-tier index over the append-only candidate log.
+
+    Each refresh parses only the bytes appended since the previous one; a
+    rotated or truncated log is re-read from the start. Positions in the
+    per-tier lists are therefore stable cursors while the log only grows.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset(None, None)
+
+    def _reset(self, path: Optional[Path], inode: Optional[int]) -> None:
+        self._path = path
+        self._inode = inode
+        self._offset = 0
+        self._records: Dict[int, List[Dict[str, Any]]] = {3: [], 4: []}
+        self._tail: Dict[int, List[Dict[str, Any]]] = {3: [], 4: []}
+        # What refresh() hands out: the committed lists themselves, or a merged
+        # copy rebuilt only when new bytes arrive while a line is unterminated.
+        self._view: Dict[int, List[Dict[str, Any]]] = self._records
+
+    def _ingest(self, lines: List[bytes], into: Dict[int, List[Dict[str, Any]]]) -> None:
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            tier = record.get("tier") if isinstance(record, dict) else None
+            if tier in into:
+                into[tier].append(record)
+
+    def refresh(self, path: Path) -> Dict[int, List[Dict[str, Any]]]:
+        """Per-tier records currently in ``path`` (shared lists; do not mutate)."""
+
+        with self._lock:
+            try:
+                info = os.stat(path)
+            except OSError:
+                self._reset(path, None)
+                return self._view
+            if path != self._path or info.st_ino != self._inode or info.st_size < self._offset:
+                self._reset(path, info.st_ino)
+            if info.st_size > self._offset:
+                with open(path, "rb") as stream:
+                    stream.seek(self._offset)
+                    chunk = stream.read(info.st_size - self._offset)
+                complete, newline, partial = chunk.rpartition(b"\n")
+                if newline:
+                    self._ingest(complete.splitlines(), self._records)
+                    self._offset += len(complete) + 1
+                # An unterminated last line is parsed but not committed: the
+                # writer may still be appending to it.
+                self._tail = {3: [], 4: []}
+                self._ingest([partial], self._tail)
+                if any(self._tail.values()):
+                    self._view = {tier: self._records[tier] + self._tail[tier] for tier in self._records}
+                else:
+                    self._view = self._records
+            return self._view
+
+
+_candidate_log = _CandidateLog()
+
+
+def _load_candidates() -> Dict[int, List[Dict[str, Any]]]:
+    return _candidate_log.refresh(_CANDIDATE_LOG)
+
+
+def _fields_or_400(spec: Optional[str], allowed: Optional[Tuple[str, ...]] = None) -> Optional[Tuple[str, ...]]:
+    try:
+        return parse_fields(spec, allowed)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @router.get("/symbols")
@@ -133,24 +234,29 @@ def get_symbols(
     tier: Optional[int] = Query(None, description="Filter by tier (0,1,3,4)"),
     page: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of symbol fields to return"),
 ) -> Response:
     """Return a paginated list of Tier-aware symbols."""
 
-    tiers = [tier] if tier is not None else [0, 1, 3, 4]
-    invalid = set(tiers) - {0, 1, 3, 4}
-    if invalid:
+    if tier is not None and tier not in _SYMBOL_TIERS:
         raise HTTPException(status_code=400, detail="Unsupported tier")
+    projection = _fields_or_400(fields, SYMBOL_FIELDS)
 
-    payload: List[Dict[str, Any]] = []
-    for t in tiers:
-        if t == 0:
-            payload.extend(_tier0_payload())
-        elif t == 1:
-            payload.extend(_pair_payload())
-        else:
-            payload.extend(_tier_catalog_entries(t))
-
-    paginated = _paginate(payload, page, limit)
+    index = _symbol_index.get().rows
+    try:
+        result = index.page(limit, cursor=cursor, offset=page * limit, prefix=() if tier is None else (tier,))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    paginated = {
+        "symbols": [project(row, projection) for row in result.rows],
+        "total": result.total,
+        "page": result.offset // limit,
+        "limit": limit,
+        "pages": (result.total + limit - 1) // limit,
+        "next_cursor": result.next_cursor,
+    }
     return _etag_response(paginated)
 
 
@@ -179,22 +285,45 @@ def expand_polyform(symbol: str) -> Dict[str, Any]:
             "metrics": {},
         }
 
-    for tier in (3, 4):
-        for entry in _tier_catalog_entries(tier):
-            if entry.get("symbol") == symbol:
-                metadata = entry.get("metadata", {})
-                return {
-                    "symbol": symbol,
-                    "tier": tier,
-                    "composition": entry.get("composition"),
-                    "geometry": metadata.get("geometry", {}),
-                    "metrics": metadata.get("metrics", {}),
-                    "metadata": metadata,
-                }
+    generated = _generated_polyform(symbol)
+    if generated is not None:
+        return generated
+
+    entry = _symbol_index.get().library.get(symbol)
+    if entry is not None:
+        metadata = entry.get("metadata", {})
+        return {
+            "symbol": symbol,
+            "tier": entry["tier"],
+            "composition": entry.get("composition"),
+            "geometry": metadata.get("geometry", {}),
+            "metrics": metadata.get("metrics", {}),
+            "metadata": metadata,
+        }
 
     raise HTTPException(status_code=404, detail="Symbol not found")
 
 
+def _generated_polyform(symbol: str) -> Optional[Dict[str, Any]]:
+    """Resolve generator output by storage symbol or composition (indexed lookups)."""
+
+    store = shared_polyform_storage()
+    data = store.get(symbol)
+    if data is None:
+        data = store.get_by_composition(symbol)
+    if data is None:
+        return None
+    metadata = data.get("metadata", {})
+    return {
+        "symbol": symbol,
+        "tier": 2,
+        "composition": data.get("composition"),
+        "geometry": data.get("geometry", {}),
+        "metrics": {"stability": metadata.get("stability")} if "stability" in metadata else {},
+        "metadata": metadata,
+    }
+
+
 def _to_subscript(value: int) -> str:
     table = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
     return str(value).translate(table)
@@ -218,26 +347,79 @@ def create_polyform(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @router.get("/tier3-tier4/candidates")
-def get_promotion_candidates() -> Dict[str, List[Dict[str, Any]]]:
-    """Return live Tier 3/4 promotion candidates."""
-
+def get_promotion_candidates(
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size per tier (all records when omitted)"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of candidate fields to return"),
+) -> Dict[str, Any]:
+    """Return live Tier 3/4 promotion candidates.
+
+    With ``limit`` each tier is paged independently; ``next_cursor`` resumes
+    both tiers where this page stopped and is ``null`` once both are drained.
+    """
+
+    projection = _fields_or_400(fields)
     candidates = _load_candidates()
-    return {
-        "tier3": candidates.get(3, []),
-        "tier4": candidates.get(4, []),
-    }
+    starts = (0, 0)
+    if cursor is not None:
+        try:
+            starts = decode_cursor(cursor)
+            if len(starts) != 2 or not all(isinstance(start, int) and start >= 0 for start in starts):
+                raise ValueError(f"Cursor {cursor!r} does not belong to this listing")
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    response: Dict[str, Any] = {}
+    stops = []
+    for tier, start in zip((3, 4), starts):
+        records = candidates.get(tier, [])
+        stop = len(records) if limit is None else min(start + limit, len(records))
+        response[f"tier{tier}"] = [project(record, projection) for record in records[start:stop]]
+        stops.append((stop, len(records)))
+    more = any(stop < total for stop, total in stops)
+    response["next_cursor"] = encode_cursor([stop for stop, _ in stops]) if more else None
+    return response
+
+
+@router.get("/tier3-tier4/candidates/stream")
+def stream_promotion_candidates(
+    request: Request,
+    tier: Optional[int] = Query(None, description="Only stream this tier (3 or 4)"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of candidate fields to return"),
+) -> StreamingResponse:
+    """Stream Tier 3/4 promotion candidates as NDJSON, Tier 3 first.
+
+    Records appended to the log while the stream is open are not included;
+    the stream stops early if the client disconnects.
+    """
+
+    if tier is not None and tier not in (3, 4):
+        raise HTTPException(status_code=400, detail="Unsupported tier")
+    projection = _fields_or_400(fields)
+    candidates = _load_candidates()
+    tiers = (3, 4) if tier is None else (tier,)
+    # Bound each tier now: the shared lists keep growing as the log is appended to.
+    spans = [(candidates.get(t, []), len(candidates.get(t, []))) for t in tiers]
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for entries, count in spans:
+            for position in range(count):
+                yield project(entries[position], projection)
+
+    # Projection is cheap: hand the threadpool whole batches rather than paying
+    # a hop per record, and poll the connection once per batch.
+    return ndjson_response(records(), request, check_every=CANDIDATE_STREAM_BATCH)
 
 
 @router.get("/stats")
 def get_storage_stats() -> Dict[str, Any]:
     """Return aggregate counts for each tier."""
 
-    tier_counts = {
-        "0": len(_tier0_payload()),
-        "1": len(_pair_payload()),
-        "3": len(_tier_catalog_entries(3)),
-        "4": len(_tier_catalog_entries(4)),
-    }
+    index = _symbol_index.get().rows
+    tier_counts = {}
+    for tier in _SYMBOL_TIERS:
+        lo, hi = index.span((tier,))
+        tier_counts[str(tier)] = hi - lo
     totals = {
         "symbols": sum(tier_counts.values()),
         "bytes_raw": 0,
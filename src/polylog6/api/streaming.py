@@ -0,0 +1,140 @@
+"""NDJSON streaming responses for bulk endpoints.
+
+Records are serialised and sent as soon as the producing iterator yields
+them, so the client receives its first byte after the first record rather
+than after the whole result set. Between records the client connection is
+polled; once it is gone the producer is closed, which runs its ``finally``
+blocks and stops any remaining work.
+
+Producers may be async iterables (which should hand heavy work to an
+executor themselves, e.g. through :func:`polylog6.api.admission.run_admitted`)
+or plain iterables, which are advanced and encoded on the threadpool so a
+slow record never blocks the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+Records = Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]]
+
+
+def encode_record(record: Mapping[str, Any]) -> bytes:
+    """One compact JSON line, newline-terminated."""
+
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _encode_next(iterator: Iterator[Mapping[str, Any]], count: int) -> Tuple[bytes, bool]:
+    """Produce and encode up to ``count`` records; flag whether ``iterator`` ran dry."""
+
+    lines = []
+    for _ in range(count):
+        try:
+            record = next(iterator)
+        except StopIteration:
+            return b"".join(lines), True
+        lines.append(encode_record(record))
+    return b"".join(lines), False
+
+
+def iter_ndjson(
+    records: Records,
+    request: Optional[Request] = None,
+    *,
+    check_every: int = 1,
+) -> AsyncIterator[bytes]:
+    """Encode ``records`` lazily, stopping early if ``request`` disconnects.
+
+    The connection is checked every ``check_every`` records (before the
+    next one is produced), so at most that many records are computed for a
+    client that has already gone away. A plain iterable is advanced on the
+    threadpool, ``check_every`` records per hop.
+    """
+
+    if check_every <= 0:
+        raise ValueError("check_every must be positive")
+    if isinstance(records, AsyncIterable):
+        return _iter_async(records.__aiter__(), request, check_every)
+    return _iter_sync(iter(records), request, check_every)
+
+
+async def _iter_sync(
+    iterator: Iterator[Mapping[str, Any]],
+    request: Optional[Request],
+    check_every: int,
+) -> AsyncIterator[bytes]:
+    hop: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if request is not None and await request.is_disconnected():
+                return
+            hop = asyncio.ensure_future(run_in_threadpool(_encode_next, iterator, check_every))
+            # Shielded so a cancelled stream leaves the hop to finish in its thread.
+            chunk, exhausted = await asyncio.shield(hop)
+            if chunk:
+                yield chunk
+            if exhausted:
+                return
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            if hop is not None and not hop.done():
+                # Cancelled mid-hop: the worker thread is still inside next(),
+                # so the producer can only be closed once that call returns.
+                hop.add_done_callback(lambda done: _close_after(done, close))
+            else:
+                close()
+
+
+def _close_after(hop: asyncio.Future, close: Callable[[], None]) -> None:
+    if not hop.cancelled():
+        hop.exception()  # retrieved: nobody awaits an abandoned hop
+    close()
+
+
+async def _iter_async(
+    iterator: AsyncIterator[Mapping[str, Any]],
+    request: Optional[Request],
+    check_every: int,
+) -> AsyncIterator[bytes]:
+    try:
+        produced = 0
+        while True:
+            if request is not None and produced % check_every == 0 and await request.is_disconnected():
+                return
+            try:
+                record = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            produced += 1
+            yield encode_record(record)
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def ndjson_response(
+    records: Records,
+    request: Optional[Request] = None,
+    *,
+    check_every: int = 1,
+) -> StreamingResponse:
+    """Stream ``records`` as ``application/x-ndjson``."""
+
+    return StreamingResponse(
+        iter_ndjson(records, request, check_every=check_every),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Cache-Control": "no-store", "X-Content-Type-Options": "nosniff"},
+    )
+
+
+__all__ = ["NDJSON_MEDIA_TYPE", "encode_record", "iter_ndjson", "ndjson_response"]
@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 
+from polylog6.api.admission import run_admitted
 from polylog6.storage.tier0_generator import decode_tier0_symbol, ConnectivityChain
 from polylog6.storage.atomic_chains import (
     get_atomic_chain_library,
@@ -99,6 +100,10 @@ async def get_tier0_symbol(symbol: str):
 @router.post("/atomic-chains/detect", response_model=AtomicChainDetectResponse)
 async def detect_atomic_chain(request: AtomicChainDetectRequest):
     """Detect atomic chain pattern in Tier 0 symbol."""
+    return await run_admitted("detect", _detect_atomic_chain, request)
+
+
+def _detect_atomic_chain(request: AtomicChainDetectRequest) -> AtomicChainDetectResponse:
     detector = AtomicChainDetector()
     atomic_chain = detector.detect_chain(request.symbol)
     
@@ -161,6 +166,10 @@ async def get_atomic_chain_library():
 @router.post("/scaffolds/create", response_model=ScaffoldCreateResponse)
 async def create_scaffold(request: ScaffoldCreateRequest):
     """Create scaffold from atomic chains."""
+    return await run_admitted("detect", _create_scaffold, request)
+
+
+def _create_scaffold(request: ScaffoldCreateRequest) -> ScaffoldCreateResponse:
     library = get_atomic_chain_library()
     
     # Get atomic chains
@@ -5,12 +5,16 @@ Exposes extracted polyhedra from Netlib, attachment matrix, and LOD metadata
 for frontend rendering and testing.
 """
 
+import hashlib
 import json
+import threading
 from pathlib import Path as PathLib
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Response, Path
-import hashlib
+from fastapi import APIRouter, HTTPException, Query, Request, Response, Path
+
+from polylog6.api.pagination import KeysetIndex, parse_fields, project
+from polylog6.api.response_cache import ResponseCache, file_fingerprint, prefers_media_type
 
 router = APIRouter(prefix="/tier1", tags=["tier1-polyhedra"])
 
@@ -24,6 +28,12 @@ _polyhedra_cache: Optional[Dict[str, Dict[str, Any]]] = None
 _decompositions_cache: Optional[Dict[str, Any]] = None
 _attachment_matrix_cache: Optional[Dict[str, Any]] = None
 _lod_metadata_cache: Optional[Dict[str, Any]] = None
+_lod_mesh_cache: Optional[Dict[str, Dict[str, Any]]] = None
+# Guards _lod_mesh_cache, which request threads fill with on-demand decimations.
+_lod_mesh_lock = threading.Lock()
+_polyhedra_index_cache: Optional[KeysetIndex] = None
+
+POLYHEDRON_SUMMARY_FIELDS = ("symbol", "name", "classification", "composition", "face_count", "vertex_count")
 
 
 def _load_polyhedra() -> Dict[str, Dict[str, Any]]:
@@ -111,59 +121,209 @@ def _load_lod_metadata() -> Dict[str, Any]:
     return _lod_metadata_cache
 
 
-def _etag_response(payload: Dict[str, Any]) -> Response:
-    """Generate ETag response."""
-    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
-    digest = hashlib.md5(raw).hexdigest()
-    return Response(content=raw, media_type="application/json", headers={"ETag": f'"{digest}"'})
+def _polyhedra_index() -> KeysetIndex:
+    """Summary rows for every polyhedron, sorted by symbol (built once per catalog load)."""
+    global _polyhedra_index_cache
+    
+    if _polyhedra_index_cache is not None:
+        return _polyhedra_index_cache
+    
+    _polyhedra_index_cache = KeysetIndex(
+        ((sym,), {
+            "symbol": sym,
+            "name": poly.get("name"),
+            "classification": poly.get("classification"),
+            "composition": poly.get("composition"),
+            "face_count": len(poly.get("faces", [])),
+            "vertex_count": len(poly.get("vertices", [])),
+        })
+        for sym, poly in _load_polyhedra().items()
+    )
+    return _polyhedra_index_cache
+
+
+def _polyhedra_fingerprint() -> str:
+    """Content hash of polyhedra.jsonl, used to detect stale precomputed LODs."""
+    polyhedra_file = _TIER1_DIR / "polyhedra.jsonl"
+    if not polyhedra_file.exists():
+        return ""
+    return hashlib.sha256(polyhedra_file.read_bytes()).hexdigest()
+
+
+def _load_lod_meshes() -> Dict[str, Dict[str, Any]]:
+    """Load decimated LOD meshes precomputed by ``scripts/lod_generator.py``.
+
+    The cache is ignored when it was built from a different polyhedra catalog;
+    meshes are then decimated on demand and memoised here. Raises
+    ``ValueError`` when the cache file cannot be parsed.
+    """
+    global _lod_mesh_cache
+    
+    with _lod_mesh_lock:
+        if _lod_mesh_cache is not None:
+            return _lod_mesh_cache
+        
+        meshes: Dict[str, Dict[str, Any]] = {}
+        mesh_file = _TIER1_DIR / "lod_meshes.json"
+        
+        if mesh_file.exists():
+            try:
+                payload = json.loads(mesh_file.read_text())
+            except Exception as e:
+                raise ValueError(f"Error loading LOD meshes: {e}") from e
+            
+            if payload.get("source_fingerprint") == _polyhedra_fingerprint():
+                meshes.update(payload.get("meshes", {}))
+        _lod_mesh_cache = meshes
+        return meshes
+
+
+def _lod_mesh(symbol: str, poly: Dict[str, Any], level: str) -> Dict[str, Any]:
+    """Decimated mesh for ``symbol`` at ``level`` (precomputed or built on demand)."""
+    meshes = _load_lod_meshes()
+    with _lod_mesh_lock:
+        cached = meshes.get(symbol)
+    if cached is None:
+        # Imported lazily: polylog6.geometry imports this module.
+        from polylog6.geometry.decimation import build_lod_levels
+        
+        # Decimate outside the lock; a concurrent duplicate build is discarded.
+        levels = build_lod_levels(poly.get("vertices", []), poly.get("faces", []))
+        built = {name: mesh.to_dict() for name, mesh in levels.items()}
+        with _lod_mesh_lock:
+            cached = meshes.setdefault(symbol, built)
+    return cached[level]
+
+
+def _catalog_files() -> List[PathLib]:
+    """Files whose contents back the cached Tier 1 responses."""
+    return [
+        _TIER1_DIR / "polyhedra.jsonl",
+        _TIER1_DIR / "decompositions.json",
+        _TIER1_DIR / "lod_metadata.json",
+        _TIER1_DIR / "lod_meshes.json",
+        _ATTACHMENTS_DIR / "attachment_matrix.json",
+    ]
+
+
+def _reset_catalogs() -> None:
+    """Drop parsed catalogs so the next request reloads them from disk."""
+    global _polyhedra_cache, _decompositions_cache, _attachment_matrix_cache, _lod_metadata_cache, _lod_mesh_cache
+    global _polyhedra_index_cache
+    _polyhedra_cache = None
+    _polyhedra_index_cache = None
+    _decompositions_cache = None
+    _attachment_matrix_cache = None
+    _lod_metadata_cache = None
+    with _lod_mesh_lock:
+        _lod_mesh_cache = None
+
+
+# Serialized + precompressed payloads, rebuilt whenever a catalog file changes.
+_response_cache = ResponseCache(
+    lambda: file_fingerprint(_catalog_files()),
+    max_entries=1024,
+    on_invalidate=_reset_catalogs,
+)
+
+
+def _cached_response(request: Request, key: Any, builder, *, geometry: bool = False) -> Response:
+    """Serve a cached payload honouring If-None-Match and Accept-Encoding.
+    
+    ``geometry`` payloads are additionally offered in the packed binary
+    transport to clients that ask for it in their Accept header.
+    """
+    options: Dict[str, Any] = {}
+    if geometry:
+        # Imported lazily: polylog6.geometry imports this module.
+        from polylog6.geometry.binary_format import GEOMETRY_MEDIA_TYPE, encode_geometry_payload
+        
+        options["vary"] = "Accept, Accept-Encoding"
+        if prefers_media_type(request.headers.get("accept"), GEOMETRY_MEDIA_TYPE):
+            key = (key, GEOMETRY_MEDIA_TYPE)
+            options.update(serializer=encode_geometry_payload, media_type=GEOMETRY_MEDIA_TYPE)
+    return _response_cache.respond(
+        key,
+        builder,
+        if_none_match=request.headers.get("if-none-match"),
+        accept_encoding=request.headers.get("accept-encoding"),
+        **options,
+    )
+
+
+def warm_response_cache() -> None:
+    """Prebuild the polled Tier 1 responses (called at application startup)."""
+    _response_cache.warm(
+        {
+            ("polyhedra", 0, 20, None, None): lambda: _polyhedra_page_payload(0, 20),
+            "matrix": _attachment_matrix_payload,
+            "stats": _stats_payload,
+        }
+    )
+
+
+def response_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the Tier 1 response cache."""
+    return _response_cache.stats()
 
 
 @router.get("/polyhedra")
 def list_polyhedra(
+    request: Request,
     page: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of summary fields to return"),
 ) -> Response:
     """List all extracted Tier 1 polyhedra with pagination."""
-    polyhedra = _load_polyhedra()
+    try:
+        projection = parse_fields(fields, POLYHEDRON_SUMMARY_FIELDS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    symbols = sorted(polyhedra.keys())
-    total = len(symbols)
-    start = page * limit
-    end = start + limit
-    page_symbols = symbols[start:end]
+    def build() -> Dict[str, Any]:
+        try:
+            return _polyhedra_page_payload(page, limit, cursor=cursor, fields=projection)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     
-    items = [
-        {
-            "symbol": sym,
-            "name": polyhedra[sym].get("name"),
-            "classification": polyhedra[sym].get("classification"),
-            "composition": polyhedra[sym].get("composition"),
-            "face_count": len(polyhedra[sym].get("faces", [])),
-            "vertex_count": len(polyhedra[sym].get("vertices", [])),
-        }
-        for sym in page_symbols
-    ]
+    return _cached_response(request, ("polyhedra", page, limit, cursor, projection), build)
+
+
+def _polyhedra_page_payload(
+    page: int,
+    limit: int,
+    *,
+    cursor: Optional[str] = None,
+    fields: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    result = _polyhedra_index().page(limit, cursor=cursor, offset=page * limit)
     
     payload = {
-        "polyhedra": items,
-        "total": total,
-        "page": page,
+        "polyhedra": [project(row, fields) for row in result.rows],
+        "total": result.total,
+        "page": result.offset // limit,
         "limit": limit,
-        "pages": (total + limit - 1) // limit,
+        "pages": (result.total + limit - 1) // limit,
+        "next_cursor": result.next_cursor,
     }
     
-    return _etag_response(payload)
+    return payload
 
 
 @router.get("/polyhedra/{symbol}")
-def get_polyhedron(symbol: str) -> Dict[str, Any]:
+def get_polyhedron(request: Request, symbol: str) -> Response:
     """Get full polyhedron data by symbol."""
     polyhedra = _load_polyhedra()
     
     if symbol not in polyhedra:
         raise HTTPException(status_code=404, detail=f"Polyhedron {symbol} not found")
     
-    poly = polyhedra[symbol]
+    return _cached_response(request, ("polyhedron", symbol), lambda: _polyhedron_payload(symbol), geometry=True)
+
+
+def _polyhedron_payload(symbol: str) -> Dict[str, Any]:
+    poly = _load_polyhedra()[symbol]
     lod_data = _load_lod_metadata().get(symbol, {})
     
     return {
@@ -182,40 +342,50 @@ def get_polyhedron(symbol: str) -> Dict[str, Any]:
 
 
 @router.get("/polyhedra/{symbol}/lod/{level}", response_model=dict)
-def get_polyhedron_lod(symbol: str, level: str = Path(..., regex="^(full|medium|low|thumbnail)$")) -> Dict[str, Any]:
-    """Get polyhedron geometry at specific LOD level."""
+def get_polyhedron_lod(
+    request: Request,
+    symbol: str,
+    level: str = Path(..., regex="^(full|medium|low|thumbnail)$"),
+) -> Response:
+    """Get polyhedron geometry at specific LOD level.
+    
+    Levels are quadric-error decimated triangle meshes with per-level error
+    metrics; ``full`` is the triangulated source mesh.
+    """
     polyhedra = _load_polyhedra()
     
     if symbol not in polyhedra:
         raise HTTPException(status_code=404, detail=f"Polyhedron {symbol} not found")
     
-    poly = polyhedra[symbol]
-    lod_data = _load_lod_metadata().get(symbol, {}).get(level)
-    
-    if not lod_data:
-        raise HTTPException(status_code=404, detail=f"LOD level {level} not found for {symbol}")
-    
-    # For LOD, return reduced geometry based on level
-    faces = poly.get("faces", [])
-    vertices = poly.get("vertices", [])
-    
-    # Calculate reduction based on LOD level
-    face_ratio = {
-        "full": 1.0,
-        "medium": 0.6,
-        "low": 0.2,
-        "thumbnail": 0.05,
-    }.get(level, 1.0)
-    
-    reduced_face_count = max(1, int(len(faces) * face_ratio))
-    reduced_faces = faces[:reduced_face_count]
+    try:
+        return _cached_response(request, ("lod", symbol, level), lambda: _lod_payload(symbol, level), geometry=True)
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _lod_payload(symbol: str, level: str) -> Dict[str, Any]:
+    poly = _load_polyhedra()[symbol]
+    mesh = _lod_mesh(symbol, poly, level)
+    triangles = mesh["triangles"]
     
     return {
         "symbol": symbol,
         "level": level,
-        "faces": reduced_faces,
-        "vertices": vertices,
-        "metadata": lod_data,
+        "faces": [
+            {"id": index, "vertices": triangle, "edges": 3, "type": "triangle"}
+            for index, triangle in enumerate(triangles)
+        ],
+        "vertices": mesh["vertices"],
+        "indices": [index for triangle in triangles for index in triangle],
+        "metadata": _load_lod_metadata().get(symbol, {}).get(level, {}),
+        "decimation": {
+            "triangles": len(triangles),
+            "target_triangles": mesh["target_triangles"],
+            "vertices": len(mesh["vertices"]),
+            "max_error": mesh["max_error"],
+            "mean_error": mesh["mean_error"],
+            "relative_error": mesh["relative_error"],
+        },
     }
 
 
@@ -241,8 +411,12 @@ def get_attachment_options(polygon_a: str, polygon_b: str) -> Dict[str, Any]:
 
 
 @router.get("/attachments/matrix")
-def get_attachment_matrix() -> Response:
+def get_attachment_matrix(request: Request) -> Response:
     """Get full 18×18 attachment matrix."""
+    return _cached_response(request, "matrix", _attachment_matrix_payload)
+
+
+def _attachment_matrix_payload() -> Dict[str, Any]:
     matrix = _load_attachment_matrix()
     
     # Calculate statistics
@@ -271,12 +445,22 @@ def get_attachment_matrix() -> Response:
         },
     }
     
-    return _etag_response(payload)
+    return payload
 
 
 @router.get("/stats")
-def get_tier1_stats() -> Dict[str, Any]:
+def get_tier1_stats(request: Request) -> Response:
     """Get statistics about Tier 1 polyhedra."""
+    return _cached_response(request, "stats", _stats_payload)
+
+
+@router.get("/cache/stats")
+def get_response_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss metrics for the precompressed response cache."""
+    return response_cache_stats()
+
+
+def _stats_payload() -> Dict[str, Any]:
     polyhedra = _load_polyhedra()
     matrix = _load_attachment_matrix()
     lod_data = _load_lod_metadata()
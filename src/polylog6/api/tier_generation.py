@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Any
 from fastapi import APIRouter, HTTPException, Query, Body
 from pydantic import BaseModel
 
+from polylog6.api.admission import run_admitted
 from polylog6.generation.tier1_symmetry_generator import (
     get_tier1_generator,
     Tier1Solid
@@ -41,6 +42,10 @@ class DecomposeTier2Request(BaseModel):
 @router.post("/tier1/generate")
 async def generate_tier1_solid(request: GenerateTier1Request) -> Dict[str, Any]:
     """Generate Tier 1 solid using symmetry operations."""
+    return await run_admitted("generate", _generate_tier1_solid, request)
+
+
+def _generate_tier1_solid(request: GenerateTier1Request) -> Dict[str, Any]:
     generator = get_tier1_generator()
     
     try:
@@ -116,6 +121,13 @@ async def analyze_tier2_polyform(
     workspace_context: Optional[Dict[str, Any]] = Body(None)
 ) -> Dict[str, Any]:
     """Analyze Tier 2 polyform and suggest decompositions."""
+    return await run_admitted("decompose", _analyze_tier2_polyform, polyform, workspace_context)
+
+
+def _analyze_tier2_polyform(
+    polyform: RecursivePolyform,
+    workspace_context: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     decomposition_engine = get_tier2_decomposition()
     
     try:
@@ -144,6 +156,10 @@ async def analyze_tier2_polyform(
 @router.post("/tier2/decompose")
 async def decompose_tier2_polyform(request: DecomposeTier2Request) -> Dict[str, Any]:
     """Decompose Tier 2 polyform into stable subforms."""
+    return await run_admitted("decompose", _decompose_tier2_polyform, request)
+
+
+def _decompose_tier2_polyform(request: DecomposeTier2Request) -> Dict[str, Any]:
     decomposition_engine = get_tier2_decomposition()
     
     try:
@@ -5,6 +5,7 @@ Uses Netlib's precomputed polyhedra data as single source of truth.
 Integrates with all geometry engines (workspace, GPU, interaction, generation).
 """
 
+from polylog6.geometry.decimation import DecimatedMesh, build_lod_levels, decimate
 from polylog6.geometry.unified_backend import (
     GeometryData,
     AttachmentGeometry,
@@ -13,6 +14,9 @@ from polylog6.geometry.unified_backend import (
 )
 
 __all__ = [
+    "DecimatedMesh",
+    "build_lod_levels",
+    "decimate",
     "GeometryData",
     "AttachmentGeometry",
     "UnifiedBackendGeometry",
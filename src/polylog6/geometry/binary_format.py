@@ -0,0 +1,253 @@
+"""Compact binary transport for polyhedron geometry.
+
+Layout (little-endian, every section starts on a 4-byte boundary so browsers
+can view the buffers as ``Float32Array``/``Uint16Array``/``Uint32Array``
+without copying)::
+
+    header      <4sHHIIII  magic, version, flags, vertex_count, face_count,
+                           index_count, metadata_bytes
+    metadata    UTF-8 JSON object (everything that is not a buffer)
+    vertices    float32[vertex_count * 3]
+    indices     uint16 | uint32 [index_count]   (uint32 if FLAG_INDEX_U32)
+    face sizes  uint16[face_count]              (omitted if FLAG_TRIANGLES)
+"""
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+GEOMETRY_MEDIA_TYPE = "application/vnd.polylog.geometry"
+GEOMETRY_MAGIC = b"PLGB"
+GEOMETRY_VERSION = 1
+
+FLAG_INDEX_U32 = 0x1
+FLAG_TRIANGLES = 0x2
+
+_HEADER = struct.Struct("<4sHHIIII")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+@dataclass(slots=True)
+class BinaryGeometry:
+    """Decoded geometry buffers plus the JSON metadata that travelled with them."""
+
+    vertices: array
+    indices: array
+    face_sizes: Optional[array]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices) // 3
+
+    def vertex_list(self) -> List[Tuple[float, float, float]]:
+        data = self.vertices
+        return [(data[offset], data[offset + 1], data[offset + 2]) for offset in range(0, len(data), 3)]
+
+    def face_list(self) -> List[List[int]]:
+        indices = self.indices.tolist()
+        if self.face_sizes is None:
+            return [indices[offset : offset + 3] for offset in range(0, len(indices), 3)]
+        faces: List[List[int]] = []
+        cursor = 0
+        for size in self.face_sizes:
+            faces.append(indices[cursor : cursor + size])
+            cursor += size
+        return faces
+
+
+def _pad(length: int) -> bytes:
+    return b"\x00" * (-length % 4)
+
+
+def _le_bytes(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:  # pragma: no cover - big-endian hosts only
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode: str, payload: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(payload)
+    if not _LITTLE_ENDIAN:  # pragma: no cover - big-endian hosts only
+        values.byteswap()
+    return values
+
+
+def encode_geometry(
+    vertices: Sequence[Sequence[float]],
+    faces: Sequence[Sequence[int]],
+    metadata: Optional[Mapping[str, Any]] = None,
+) -> bytes:
+    """Pack vertices/faces into the binary geometry format."""
+
+    flat_vertices = array("f")
+    for vertex in vertices:
+        if len(vertex) != 3:
+            raise ValueError(f"Vertices must have 3 components, got {len(vertex)}")
+        flat_vertices.extend(float(component) for component in vertex)
+
+    flat_indices: List[int] = []
+    sizes: List[int] = []
+    for face in faces:
+        flat_indices.extend(int(index) for index in face)
+        sizes.append(len(face))
+    if flat_indices and min(flat_indices) < 0:
+        raise ValueError("Face indices must be non-negative")
+
+    flags = 0
+    triangles = all(size == 3 for size in sizes)
+    if triangles:
+        flags |= FLAG_TRIANGLES
+    elif sizes and max(sizes) > 0xFFFF:
+        raise ValueError("Faces with more than 65535 corners are not supported")
+    wide = bool(flat_indices) and max(flat_indices) > 0xFFFF
+    if wide:
+        flags |= FLAG_INDEX_U32
+    index_buffer = array("I" if wide else "H", flat_indices)
+
+    meta = json.dumps(dict(metadata or {}), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    parts = [
+        _HEADER.pack(
+            GEOMETRY_MAGIC,
+            GEOMETRY_VERSION,
+            flags,
+            len(flat_vertices) // 3,
+            len(sizes),
+            len(flat_indices),
+            len(meta),
+        ),
+        meta,
+        _pad(len(meta)),
+        _le_bytes(flat_vertices),
+    ]
+    index_bytes = _le_bytes(index_buffer)
+    parts += [index_bytes, _pad(len(index_bytes))]
+    if not triangles:
+        size_bytes = _le_bytes(array("H", sizes))
+        parts += [size_bytes, _pad(len(size_bytes))]
+    return b"".join(parts)
+
+
+def decode_geometry(payload: bytes) -> BinaryGeometry:
+    """Parse a payload produced by :func:`encode_geometry`."""
+
+    if len(payload) < _HEADER.size:
+        raise ValueError("Geometry payload is shorter than its header")
+    magic, version, flags, vertex_count, face_count, index_count, meta_len = _HEADER.unpack_from(payload)
+    if magic != GEOMETRY_MAGIC:
+        raise ValueError(f"Not a geometry payload (magic {magic!r})")
+    if version != GEOMETRY_VERSION:
+        raise ValueError(f"Unsupported geometry payload version {version}")
+
+    view = memoryview(payload)
+    offset = _HEADER.size
+    metadata = json.loads(bytes(view[offset : offset + meta_len]).decode("utf-8")) if meta_len else {}
+    offset += meta_len + (-meta_len % 4)
+
+    vertex_bytes = vertex_count * 3 * 4
+    index_width = 4 if flags & FLAG_INDEX_U32 else 2
+    index_bytes = index_count * index_width
+    triangles = bool(flags & FLAG_TRIANGLES)
+    size_bytes = 0 if triangles else face_count * 2
+    expected = offset + vertex_bytes + index_bytes + (-index_bytes % 4) + size_bytes + (-size_bytes % 4)
+    if len(payload) < expected:
+        raise ValueError(f"Geometry payload truncated: {len(payload)} < {expected} bytes")
+
+    vertices = _from_le("f", view[offset : offset + vertex_bytes])
+    offset += vertex_bytes
+    indices = _from_le("I" if index_width == 4 else "H", view[offset : offset + index_bytes])
+    offset += index_bytes + (-index_bytes % 4)
+    face_sizes = None
+    if not triangles:
+        face_sizes = _from_le("H", view[offset : offset + size_bytes])
+        if sum(face_sizes) != index_count:
+            raise ValueError("Face sizes do not cover the index buffer")
+    elif index_count != face_count * 3:
+        raise ValueError("Triangle payload index count does not match face count")
+    return BinaryGeometry(vertices=vertices, indices=indices, face_sizes=face_sizes, metadata=metadata)
+
+
+_RESERVED = "_geometry"
+
+
+def encode_geometry_payload(payload: Mapping[str, Any]) -> bytes:
+    """Pack a JSON geometry response (``vertices`` + ``faces``).
+
+    Apart from vertices being narrowed to float32 the response can be rebuilt
+    exactly by :func:`decode_geometry_payload`.
+
+    Faces may be index lists or catalog dicts (``{"id", "vertices", "edges",
+    "type"}``); dict fields other than the indices travel as per-face columns,
+    omitting ``id``/``edges`` when they are just the position and corner
+    count. A flat ``indices`` list equal to the concatenated faces is dropped
+    and rebuilt on decode. All other keys travel verbatim in the metadata.
+    """
+
+    faces = list(payload.get("faces", []))
+    face_indices = [face["vertices"] if isinstance(face, Mapping) else face for face in faces]
+    layout: Dict[str, Any] = {}
+    if faces and all(isinstance(face, Mapping) for face in faces):
+        columns: Dict[str, List[Any]] = {}
+        for key in sorted({key for face in faces for key in face} - {"vertices"}):
+            columns[key] = [face.get(key) for face in faces]
+        if columns.get("id") == list(range(len(faces))):
+            del columns["id"]
+            layout["face_ids"] = True
+        if columns.get("edges") == [len(indices) for indices in face_indices]:
+            del columns["edges"]
+            layout["face_edges"] = True
+        layout["face_fields"] = columns
+
+    metadata = {key: value for key, value in payload.items() if key not in ("vertices", "faces")}
+    if "indices" in metadata and metadata["indices"] == [index for face in face_indices for index in face]:
+        del metadata["indices"]
+        layout["indices"] = True
+    if _RESERVED in metadata:
+        raise ValueError(f"Payload key {_RESERVED!r} is reserved")
+    if layout:
+        metadata[_RESERVED] = layout
+    return encode_geometry(payload.get("vertices", []), face_indices, metadata)
+
+
+def decode_geometry_payload(data: bytes) -> Dict[str, Any]:
+    """Inverse of :func:`encode_geometry_payload` (vertices come back as float32)."""
+
+    geometry = decode_geometry(data)
+    payload = dict(geometry.metadata)
+    layout = payload.pop(_RESERVED, {})
+    faces: List[Any] = geometry.face_list()
+    payload["vertices"] = [list(vertex) for vertex in geometry.vertex_list()]
+    if "indices" in layout:
+        payload["indices"] = geometry.indices.tolist()
+    if "face_fields" in layout:
+        columns = layout["face_fields"]
+        dict_faces = []
+        for position, indices in enumerate(faces):
+            face: Dict[str, Any] = {key: values[position] for key, values in columns.items()}
+            face["vertices"] = indices
+            if layout.get("face_ids"):
+                face["id"] = position
+            if layout.get("face_edges"):
+                face["edges"] = len(indices)
+            dict_faces.append(face)
+        faces = dict_faces
+    payload["faces"] = faces
+    return payload
+
+
+__all__ = [
+    "BinaryGeometry",
+    "FLAG_INDEX_U32",
+    "FLAG_TRIANGLES",
+    "GEOMETRY_MEDIA_TYPE",
+    "decode_geometry",
+    "decode_geometry_payload",
+    "encode_geometry",
+    "encode_geometry_payload",
+]
@@ -0,0 +1,453 @@
+"""Quadric-error mesh decimation for polyhedron LOD levels.
+
+Implements Garland–Heckbert edge collapse: every vertex carries the
+area-weighted quadric of its incident triangle planes, edges are collapsed in
+order of the error of their optimal merged position, and collapses that would
+flip a triangle or make the mesh non-manifold are rejected. Each result records
+how far the original vertices lie from the simplified surface.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+Vec3 = Tuple[float, float, float]
+Triangle = Tuple[int, int, int]
+Budget = Union[int, float]
+
+LOD_LEVELS = ("full", "medium", "low", "thumbnail")
+DEFAULT_LOD_BUDGETS: Dict[str, Budget] = {"full": 1.0, "medium": 0.5, "low": 0.2, "thumbnail": 0.05}
+MIN_TRIANGLES = 4  # a tetrahedron is the smallest closed mesh
+
+
+@dataclass(slots=True)
+class DecimatedMesh:
+    """Triangle mesh for one LOD level with its approximation error."""
+
+    vertices: List[Vec3]
+    triangles: List[Triangle]
+    target_triangles: int
+    max_error: float = 0.0
+    mean_error: float = 0.0
+    relative_error: float = 0.0
+    collapses: int = 0
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.triangles)
+
+    def to_dict(self, *, precision: int = 6) -> Dict[str, Any]:
+        return {
+            "vertices": [[round(value, precision) for value in vertex] for vertex in self.vertices],
+            "triangles": [list(triangle) for triangle in self.triangles],
+            "target_triangles": self.target_triangles,
+            "max_error": round(self.max_error, precision + 3),
+            "mean_error": round(self.mean_error, precision + 3),
+            "relative_error": round(self.relative_error, precision + 3),
+            "collapses": self.collapses,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "DecimatedMesh":
+        return cls(
+            vertices=[tuple(vertex) for vertex in payload["vertices"]],
+            triangles=[tuple(triangle) for triangle in payload["triangles"]],
+            target_triangles=int(payload["target_triangles"]),
+            max_error=float(payload.get("max_error", 0.0)),
+            mean_error=float(payload.get("mean_error", 0.0)),
+            relative_error=float(payload.get("relative_error", 0.0)),
+            collapses=int(payload.get("collapses", 0)),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Vector helpers
+# ---------------------------------------------------------------------------
+def _sub(a: Sequence[float], b: Sequence[float]) -> Vec3:
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _cross(a: Sequence[float], b: Sequence[float]) -> Vec3:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _norm(a: Sequence[float]) -> float:
+    return math.sqrt(_dot(a, a))
+
+
+def _triangle_normal(p0: Sequence[float], p1: Sequence[float], p2: Sequence[float]) -> Vec3:
+    return _cross(_sub(p1, p0), _sub(p2, p0))
+
+
+# ---------------------------------------------------------------------------
+# Input handling
+# ---------------------------------------------------------------------------
+def triangulate_faces(faces: Iterable[Union[Sequence[int], Mapping[str, Any]]]) -> List[Triangle]:
+    """Fan-triangulate polygon faces (catalog dicts or index lists), keeping winding."""
+
+    triangles: List[Triangle] = []
+    for face in faces:
+        indices = face["vertices"] if isinstance(face, Mapping) else face
+        for offset in range(1, len(indices) - 1):
+            triangles.append((int(indices[0]), int(indices[offset]), int(indices[offset + 1])))
+    return triangles
+
+
+def rebase_face_indices(
+    vertex_count: int,
+    faces: Iterable[Union[Sequence[int], Mapping[str, Any]]],
+) -> List[List[int]]:
+    """Return face index lists that address ``vertices`` directly.
+
+    Netlib-derived catalogs number face corners against the file-wide vertex
+    list, so a solid's indices start at ``max_index + 1 - vertex_count``.
+    """
+
+    indexed = [list(face["vertices"] if isinstance(face, Mapping) else face) for face in faces]
+    used = [index for face in indexed for index in face]
+    if not used or (min(used) >= 0 and max(used) < vertex_count):
+        return indexed
+    base = max(used) + 1 - vertex_count
+    if min(used) < base:
+        raise ValueError(f"Face indices span {min(used)}..{max(used)} cannot address {vertex_count} vertices")
+    return [[index - base for index in face] for face in indexed]
+
+
+def compact_mesh(vertices: Sequence[Sequence[float]], triangles: Sequence[Triangle]) -> Tuple[List[Vec3], List[Triangle]]:
+    """Drop unreferenced vertices and renumber triangle indices."""
+
+    remap: Dict[int, int] = {}
+    compacted: List[Vec3] = []
+    renumbered: List[Triangle] = []
+    for triangle in triangles:
+        mapped = []
+        for index in triangle:
+            if index not in remap:
+                remap[index] = len(compacted)
+                vertex = vertices[index]
+                compacted.append((float(vertex[0]), float(vertex[1]), float(vertex[2])))
+            mapped.append(remap[index])
+        renumbered.append((mapped[0], mapped[1], mapped[2]))
+    return compacted, renumbered
+
+
+def resolve_budget(budget: Budget, full_triangles: int) -> int:
+    """Translate a ratio (``float`` ≤ 1) or absolute ``int`` budget into a triangle count."""
+
+    if isinstance(budget, bool) or budget <= 0:
+        raise ValueError(f"Invalid triangle budget: {budget!r}")
+    if isinstance(budget, float):
+        if budget > 1.0:
+            raise ValueError(f"Ratio budgets must be <= 1.0, got {budget}")
+        target = int(round(full_triangles * budget))
+    else:
+        target = int(budget)
+    return min(full_triangles, max(MIN_TRIANGLES, target))
+
+
+# ---------------------------------------------------------------------------
+# Quadrics
+# ---------------------------------------------------------------------------
+def _plane_quadric(p0: Vec3, p1: Vec3, p2: Vec3) -> List[float]:
+    normal = _triangle_normal(p0, p1, p2)
+    length = _norm(normal)
+    if length == 0.0:
+        return [0.0] * 10
+    a, b, c = normal[0] / length, normal[1] / length, normal[2] / length
+    d = -_dot((a, b, c), p0)
+    weight = 0.5 * length  # triangle area
+    return [
+        weight * a * a, weight * a * b, weight * a * c, weight * a * d,
+        weight * b * b, weight * b * c, weight * b * d,
+        weight * c * c, weight * c * d,
+        weight * d * d,
+    ]
+
+
+def _quadric_error(q: Sequence[float], p: Sequence[float]) -> float:
+    x, y, z = p
+    return (
+        q[0] * x * x + 2 * q[1] * x * y + 2 * q[2] * x * z + 2 * q[3] * x
+        + q[4] * y * y + 2 * q[5] * y * z + 2 * q[6] * y
+        + q[7] * z * z + 2 * q[8] * z
+        + q[9]
+    )
+
+
+def _optimal_position(q: Sequence[float], a: Vec3, b: Vec3) -> Tuple[Vec3, float]:
+    """Minimise the quadric; fall back to the endpoints/midpoint if singular."""
+
+    m00, m01, m02, m11, m12, m22 = q[0], q[1], q[2], q[4], q[5], q[7]
+    rhs = (-q[3], -q[6], -q[8])
+    det = m00 * (m11 * m22 - m12 * m12) - m01 * (m01 * m22 - m12 * m02) + m02 * (m01 * m12 - m11 * m02)
+    scale = max(abs(m00), abs(m11), abs(m22), 1e-30)
+    candidates: List[Vec3] = [a, b, ((a[0] + b[0]) / 2, (a[1] + b[1]) / 2, (a[2] + b[2]) / 2)]
+    if abs(det) > 1e-9 * scale ** 3:
+        x = (
+            rhs[0] * (m11 * m22 - m12 * m12) - m01 * (rhs[1] * m22 - m12 * rhs[2]) + m02 * (rhs[1] * m12 - m11 * rhs[2])
+        ) / det
+        y = (
+            m00 * (rhs[1] * m22 - m12 * rhs[2]) - rhs[0] * (m01 * m22 - m12 * m02) + m02 * (m01 * rhs[2] - rhs[1] * m02)
+        ) / det
+        z = (
+            m00 * (m11 * rhs[2] - rhs[1] * m12) - m01 * (m01 * rhs[2] - rhs[1] * m02) + rhs[0] * (m01 * m12 - m11 * m02)
+        ) / det
+        candidates.insert(0, (x, y, z))
+    best = min(candidates, key=lambda point: _quadric_error(q, point))
+    return best, max(0.0, _quadric_error(q, best))
+
+
+# ---------------------------------------------------------------------------
+# Decimation
+# ---------------------------------------------------------------------------
+class _EdgeCollapser:
+    def __init__(self, vertices: Sequence[Vec3], triangles: Sequence[Triangle]) -> None:
+        self.positions: List[Vec3] = list(vertices)
+        self.triangles: List[Optional[List[int]]] = [list(triangle) for triangle in triangles]
+        self.alive_triangles = sum(1 for triangle in triangles if len(set(triangle)) == 3)
+        self.vertex_triangles: List[Set[int]] = [set() for _ in vertices]
+        self.quadrics: List[List[float]] = [[0.0] * 10 for _ in vertices]
+        self.stamps: List[int] = [0] * len(vertices)
+        self.heap: List[Tuple[float, int, int, int, int, Vec3]] = []
+        self.collapses = 0
+        for index, triangle in enumerate(triangles):
+            if len(set(triangle)) != 3:
+                self.triangles[index] = None
+                continue
+            plane = _plane_quadric(*(self.positions[vertex] for vertex in triangle))
+            for vertex in triangle:
+                self.vertex_triangles[vertex].add(index)
+                quadric = self.quadrics[vertex]
+                for slot in range(10):
+                    quadric[slot] += plane[slot]
+
+    def _neighbors(self, vertex: int) -> Set[int]:
+        result: Set[int] = set()
+        for index in self.vertex_triangles[vertex]:
+            result.update(self.triangles[index])  # type: ignore[arg-type]
+        result.discard(vertex)
+        return result
+
+    def _push(self, u: int, v: int) -> None:
+        if u > v:
+            u, v = v, u
+        merged = [a + b for a, b in zip(self.quadrics[u], self.quadrics[v])]
+        position, cost = _optimal_position(merged, self.positions[u], self.positions[v])
+        heapq.heappush(self.heap, (cost, u, v, self.stamps[u], self.stamps[v], position))
+
+    def seed(self) -> None:
+        seen: Set[Tuple[int, int]] = set()
+        for triangle in self.triangles:
+            if triangle is None:
+                continue
+            for offset in range(3):
+                a, b = triangle[offset], triangle[(offset + 1) % 3]
+                edge = (a, b) if a < b else (b, a)
+                if edge not in seen:
+                    seen.add(edge)
+                    self._push(*edge)
+
+    def _collapse_is_valid(self, u: int, v: int, position: Vec3) -> bool:
+        shared = self.vertex_triangles[u] & self.vertex_triangles[v]
+        if self.alive_triangles - len(shared) < MIN_TRIANGLES:
+            return False
+        # Link condition: the only common neighbours are the opposite vertices of shared triangles.
+        opposite: Set[int] = set()
+        for index in shared:
+            opposite.update(self.triangles[index])  # type: ignore[arg-type]
+        opposite.difference_update((u, v))
+        if (self._neighbors(u) & self._neighbors(v)) != opposite:
+            return False
+        for vertex in (u, v):
+            for index in self.vertex_triangles[vertex] - shared:
+                triangle = self.triangles[index]
+                before = _triangle_normal(*(self.positions[corner] for corner in triangle))  # type: ignore[union-attr]
+                moved = [position if corner in (u, v) else self.positions[corner] for corner in triangle]  # type: ignore[union-attr]
+                after = _triangle_normal(*moved)
+                if _norm(after) <= 1e-12 * max(_norm(before), 1e-30) or _dot(before, after) <= 0.0:
+                    return False
+        return True
+
+    def collapse_to(self, target: int) -> float:
+        """Collapse edges until ``target`` triangles remain; return the largest cost used."""
+
+        worst = 0.0
+        while self.alive_triangles > target and self.heap:
+            cost, u, v, stamp_u, stamp_v, position = heapq.heappop(self.heap)
+            if stamp_u != self.stamps[u] or stamp_v != self.stamps[v]:
+                continue
+            if not self.vertex_triangles[u] or not self.vertex_triangles[v]:
+                continue
+            if not self._collapse_is_valid(u, v, position):
+                continue
+            self._apply(u, v, position)
+            worst = max(worst, cost)
+        return worst
+
+    def _apply(self, u: int, v: int, position: Vec3) -> None:
+        for index in list(self.vertex_triangles[v]):
+            triangle = self.triangles[index]
+            assert triangle is not None
+            if u in triangle:
+                for corner in triangle:
+                    self.vertex_triangles[corner].discard(index)
+                self.triangles[index] = None
+                self.alive_triangles -= 1
+                continue
+            triangle[triangle.index(v)] = u
+            self.vertex_triangles[u].add(index)
+        self.vertex_triangles[v].clear()
+        self.positions[u] = position
+        self.quadrics[u] = [a + b for a, b in zip(self.quadrics[u], self.quadrics[v])]
+        self.stamps[u] += 1
+        self.stamps[v] += 1
+        self.collapses += 1
+        for neighbor in self._neighbors(u):
+            self._push(u, neighbor)
+
+    def result(self) -> Tuple[List[Vec3], List[Triangle]]:
+        alive = [tuple(triangle) for triangle in self.triangles if triangle is not None]
+        return compact_mesh(self.positions, alive)  # type: ignore[arg-type]
+
+
+def _closest_point_distance(point: Vec3, a: Vec3, b: Vec3, c: Vec3) -> float:
+    """Distance from ``point`` to triangle ``abc`` (Ericson, Real-Time Collision Detection 5.1.5)."""
+
+    ab, ac, ap = _sub(b, a), _sub(c, a), _sub(point, a)
+    d1, d2 = _dot(ab, ap), _dot(ac, ap)
+    if d1 <= 0 and d2 <= 0:
+        return _norm(ap)
+    bp = _sub(point, b)
+    d3, d4 = _dot(ab, bp), _dot(ac, bp)
+    if d3 >= 0 and d4 <= d3:
+        return _norm(bp)
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        t = d1 / (d1 - d3)
+        return _norm(_sub(point, (a[0] + t * ab[0], a[1] + t * ab[1], a[2] + t * ab[2])))
+    cp = _sub(point, c)
+    d5, d6 = _dot(ab, cp), _dot(ac, cp)
+    if d6 >= 0 and d5 <= d6:
+        return _norm(cp)
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        t = d2 / (d2 - d6)
+        return _norm(_sub(point, (a[0] + t * ac[0], a[1] + t * ac[1], a[2] + t * ac[2])))
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and (d4 - d3) >= 0 and (d5 - d6) >= 0:
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        bc = _sub(c, b)
+        return _norm(_sub(point, (b[0] + t * bc[0], b[1] + t * bc[1], b[2] + t * bc[2])))
+    denom = 1.0 / (va + vb + vc)
+    v, w = vb * denom, vc * denom
+    closest = (
+        a[0] + ab[0] * v + ac[0] * w,
+        a[1] + ab[1] * v + ac[1] * w,
+        a[2] + ab[2] * v + ac[2] * w,
+    )
+    return _norm(_sub(point, closest))
+
+
+def surface_deviation(
+    original: Sequence[Vec3],
+    vertices: Sequence[Vec3],
+    triangles: Sequence[Triangle],
+) -> Tuple[float, float]:
+    """Max and mean distance from ``original`` points to the simplified surface."""
+
+    if not original or not triangles:
+        return 0.0, 0.0
+    corners = [(vertices[a], vertices[b], vertices[c]) for a, b, c in triangles]
+    distances = [min(_closest_point_distance(point, *corner) for corner in corners) for point in original]
+    return max(distances), sum(distances) / len(distances)
+
+
+def _diagonal(vertices: Sequence[Vec3]) -> float:
+    if not vertices:
+        return 0.0
+    lows = [min(vertex[axis] for vertex in vertices) for axis in range(3)]
+    highs = [max(vertex[axis] for vertex in vertices) for axis in range(3)]
+    return _norm(_sub(highs, lows))
+
+
+def decimate(vertices: Sequence[Sequence[float]], triangles: Sequence[Triangle], target_triangles: int) -> DecimatedMesh:
+    """Simplify a triangle mesh to at most ``target_triangles`` where topology allows."""
+
+    compacted, renumbered = compact_mesh(vertices, triangles)
+    target = max(MIN_TRIANGLES, int(target_triangles))
+    collapser = _EdgeCollapser(compacted, renumbered)
+    if collapser.alive_triangles > target:
+        collapser.seed()
+        worst_cost = collapser.collapse_to(target)
+    else:
+        worst_cost = 0.0
+    simplified, simplified_triangles = collapser.result()
+    max_error, mean_error = (0.0, 0.0) if collapser.collapses == 0 else surface_deviation(
+        compacted, simplified, simplified_triangles
+    )
+    diagonal = _diagonal(compacted)
+    return DecimatedMesh(
+        vertices=simplified,
+        triangles=simplified_triangles,
+        target_triangles=target,
+        max_error=max_error,
+        mean_error=mean_error,
+        relative_error=max_error / diagonal if diagonal else 0.0,
+        collapses=collapser.collapses,
+        metrics={"max_quadric_cost": worst_cost},
+    )
+
+
+def build_lod_levels(
+    vertices: Sequence[Sequence[float]],
+    faces: Iterable[Union[Sequence[int], Mapping[str, Any]]],
+    budgets: Optional[Mapping[str, Budget]] = None,
+) -> Dict[str, DecimatedMesh]:
+    """Decimate a polygon-faced polyhedron to every LOD level in ``budgets``.
+
+    Levels are produced from finest to coarsest, each starting from the previous
+    result, so coarser levels never cost a full re-simplification.
+    """
+
+    budgets = dict(budgets or DEFAULT_LOD_BUDGETS)
+    faces = rebase_face_indices(len(vertices), faces)
+    compacted, triangles = compact_mesh(vertices, triangulate_faces(faces))
+    full = len(triangles)
+    if not full:
+        return {name: DecimatedMesh(vertices=[], triangles=[], target_triangles=0) for name in budgets}
+
+    diagonal = _diagonal(compacted)
+    levels: Dict[str, DecimatedMesh] = {}
+    current_vertices, current_triangles = compacted, triangles
+    previous_collapses = 0
+    for name, budget in sorted(budgets.items(), key=lambda item: -resolve_budget(item[1], full)):
+        mesh = decimate(current_vertices, current_triangles, resolve_budget(budget, full))
+        if current_triangles is not triangles:
+            # Measure against the original surface, not the previous level.
+            mesh.max_error, mesh.mean_error = surface_deviation(compacted, mesh.vertices, mesh.triangles)
+            mesh.relative_error = mesh.max_error / diagonal if diagonal else 0.0
+            mesh.collapses += previous_collapses
+        levels[name] = mesh
+        previous_collapses = mesh.collapses
+        current_vertices, current_triangles = mesh.vertices, mesh.triangles
+    return {name: levels[name] for name in budgets}
+
+
+__all__ = [
+    "DEFAULT_LOD_BUDGETS",
+    "DecimatedMesh",
+    "LOD_LEVELS",
+    "build_lod_levels",
+    "decimate",
+    "rebase_face_indices",
+    "resolve_budget",
+    "surface_deviation",
+    "triangulate_faces",
+]
@@ -3,20 +3,133 @@ Unified Backend Geometry Structure
 
 Uses Netlib's precomputed polyhedra data as the single source of truth
 for all geometry operations. Integrates with all geometry engines.
+
+Primitive polygons, Tier 0 chains and polyhedron edge sets are built with
+NumPy kernels when NumPy is installed: unit polygons are computed once per
+side count, a whole chain is assembled with one batched index offset, and
+edges are deduplicated by sorting packed ``(low, high)`` vertex pairs. The
+pure-Python loops remain as the fallback and produce identical results.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Set
+from functools import lru_cache
+from itertools import chain as iter_chain
+from typing import Dict, Generic, Hashable, List, Optional, Sequence, Tuple, Set, TypeVar
 from pathlib import Path
 import json
 import math
+import threading
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback path for environments without NumPy
+    np = None  # type: ignore
 
 from polylog6.api.tier1_polyhedra import _load_polyhedra, _load_attachment_matrix
+from polylog6.geometry.binary_format import encode_geometry_payload
 from polylog6.storage.tier0_generator import decode_tier0_symbol
 
 
+V = TypeVar("V")
+
+DEFAULT_MAX_CACHED_GEOMETRIES = 512
+
+
+class _BoundedCache(Generic[V]):
+    """Thread-safe LRU mapping capped at ``max_entries`` items."""
+    
+    def __init__(self, max_entries: int) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=64)
+def _unit_polygon(sides: int) -> "np.ndarray":
+    """Read-only ``(sides, 3)`` vertices of the unit-edge polygon on the XZ plane."""
+    circumradius = 1.0 / (2 * math.sin(math.pi / sides))
+    angles = np.arange(sides) * 2 * math.pi / sides
+    vertices = np.zeros((sides, 3), dtype=np.float64)
+    vertices[:, 0] = circumradius * np.cos(angles)
+    vertices[:, 2] = circumradius * np.sin(angles)
+    vertices.setflags(write=False)
+    return vertices
+
+
+def _ring_successors(flat: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """Next vertex around each face for a flat array of concatenated faces."""
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    position = np.arange(flat.size) - starts
+    return flat[starts + (position + 1) % np.repeat(lengths, lengths)]
+
+
+def _assemble_chain(polygons: Sequence[int]) -> Tuple[List[Tuple[float, float, float]], List[List[int]], List[Tuple[int, int]]]:
+    """Vertices, faces and edges of a whole polygon chain in one batch.
+    
+    Every primitive keeps its unit placement; the per-polygon transform is the
+    vertex index offset, applied to all faces and edges at once.
+    """
+    lengths = np.asarray(polygons, dtype=np.int64)
+    vertices = np.concatenate([_unit_polygon(int(sides)) for sides in polygons])
+    indices = np.arange(vertices.shape[0], dtype=np.int64)
+    offsets = np.cumsum(lengths)[:-1]
+    successors = _ring_successors(indices, lengths)
+    faces = [face.tolist() for face in np.split(indices, offsets)]
+    edges = list(zip(indices.tolist(), successors.tolist()))
+    return list(map(tuple, vertices.tolist())), faces, edges
+
+
+def _unique_face_edges(faces: List[List[int]]) -> Optional[List[Tuple[int, int]]]:
+    """Sorted unique ``(low, high)`` edges of ``faces``; ``None`` if not vectorisable."""
+    try:
+        lengths = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+        flat = np.fromiter(iter_chain.from_iterable(faces), dtype=np.int64, count=int(lengths.sum()))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if flat.size == 0:
+        return []
+    if flat.min() < 0:
+        return None
+    successors = _ring_successors(flat, lengths)
+    low = np.minimum(flat, successors)
+    high = np.maximum(flat, successors)
+    # Pack each pair into one integer so a 1-D sort orders edges lexicographically.
+    stride = int(high.max()) + 1
+    if stride > 2**31:
+        return None
+    keys = np.unique(low * stride + high)
+    return list(zip((keys // stride).tolist(), (keys % stride).tolist()))
+
+
 @dataclass(slots=True)
 class GeometryData:
     """Unified geometry data structure from Netlib."""
@@ -43,6 +156,14 @@ class GeometryData:
             "classification": self.classification,
             "symmetry_group": self.symmetry_group
         }
+    
+    def to_binary(self) -> bytes:
+        """Pack into the binary geometry transport (see ``binary_format``).
+        
+        Vertices and faces travel as typed buffers; every other field of
+        :meth:`to_dict` travels in the JSON metadata block.
+        """
+        return encode_geometry_payload(self.to_dict())
 
 
 @dataclass(slots=True)
@@ -60,10 +181,13 @@ class AttachmentGeometry:
 class UnifiedBackendGeometry:
     """Unified backend geometry service using Netlib data."""
     
-    def __init__(self):
+    def __init__(self, *, max_cached_geometries: int = DEFAULT_MAX_CACHED_GEOMETRIES):
         self._polyhedra_cache: Optional[Dict[str, Dict[str, any]]] = None
         self._attachment_matrix_cache: Optional[Dict[str, any]] = None
-        self._geometry_cache: Dict[str, GeometryData] = {}
+        self._geometry_cache: _BoundedCache[GeometryData] = _BoundedCache(max_cached_geometries)
+        self._binary_cache: _BoundedCache[bytes] = _BoundedCache(max_cached_geometries)
+        self._primitive_cache: _BoundedCache[GeometryData] = _BoundedCache(max_cached_geometries)
+        self._tier0_cache: _BoundedCache[GeometryData] = _BoundedCache(max_cached_geometries)
         
     def load_netlib_data(self) -> None:
         """Load Netlib polyhedra data and attachment matrix."""
@@ -72,8 +196,9 @@ class UnifiedBackendGeometry:
         
     def get_polyhedron_geometry(self, symbol: str) -> Optional[GeometryData]:
         """Get geometry data for polyhedron from Netlib."""
-        if symbol in self._geometry_cache:
-            return self._geometry_cache[symbol]
+        cached = self._geometry_cache.get(symbol)
+        if cached is not None:
+            return cached
         
         if not self._polyhedra_cache:
             self.load_netlib_data()
@@ -120,23 +245,33 @@ class UnifiedBackendGeometry:
             symmetry_group=poly_data.get("symmetry_group")
         )
         
-        self._geometry_cache[symbol] = geometry
+        self._geometry_cache.put(symbol, geometry)
         return geometry
     
+    def get_polyhedron_binary(self, symbol: str) -> Optional[bytes]:
+        """Binary transport form of :meth:`get_polyhedron_geometry` (memoised)."""
+        cached = self._binary_cache.get(symbol)
+        if cached is not None:
+            return cached
+        
+        geometry = self.get_polyhedron_geometry(symbol)
+        if geometry is None:
+            return None
+        
+        payload = geometry.to_binary()
+        self._binary_cache.put(symbol, payload)
+        return payload
+    
     def get_primitive_geometry(self, sides: int) -> GeometryData:
         """Get geometry for primitive polygon (3-20 sides)."""
-        # Generate unit edge polygon geometry
-        unit_edge_length = 1.0
-        circumradius = unit_edge_length / (2 * math.sin(math.pi / sides))
-        internal_angle = ((sides - 2) * math.pi) / sides
+        cached = self._primitive_cache.get(sides)
+        if cached is not None:
+            return cached
         
-        # Generate vertices on XZ plane
-        vertices = []
-        for i in range(sides):
-            angle = (i * 2 * math.pi) / sides
-            x = circumradius * math.cos(angle)
-            z = circumradius * math.sin(angle)
-            vertices.append((x, 0.0, z))
+        if np is not None:
+            vertices = list(map(tuple, _unit_polygon(sides).tolist()))
+        else:
+            vertices = self._python_unit_polygon(sides)
         
         # Create single face (all vertices)
         faces = [list(range(sides))]
@@ -147,7 +282,7 @@ class UnifiedBackendGeometry:
         # No dihedral angles for single polygon
         dihedral_angles = []
         
-        return GeometryData(
+        geometry = GeometryData(
             symbol=f"primitive_{sides}",
             vertices=vertices,
             faces=faces,
@@ -155,6 +290,21 @@ class UnifiedBackendGeometry:
             dihedral_angles=dihedral_angles,
             face_types={sides: 1}
         )
+        self._primitive_cache.put(sides, geometry)
+        return geometry
+    
+    def _python_unit_polygon(self, sides: int) -> List[Tuple[float, float, float]]:
+        """Unit-edge polygon vertices on the XZ plane (fallback without NumPy)."""
+        unit_edge_length = 1.0
+        circumradius = unit_edge_length / (2 * math.sin(math.pi / sides))
+        
+        vertices = []
+        for i in range(sides):
+            angle = (i * 2 * math.pi) / sides
+            x = circumradius * math.cos(angle)
+            z = circumradius * math.sin(angle)
+            vertices.append((x, 0.0, z))
+        return vertices
     
     def get_attachment_geometry(
         self,
@@ -213,6 +363,10 @@ class UnifiedBackendGeometry:
     
     def get_tier0_geometry(self, tier0_symbol: str) -> Optional[GeometryData]:
         """Get geometry for Tier 0 symbol by decoding and combining primitives."""
+        cached = self._tier0_cache.get(tier0_symbol)
+        if cached is not None:
+            return cached
+        
         try:
             chain = decode_tier0_symbol(tier0_symbol)
         except (ValueError, AttributeError):
@@ -221,18 +375,36 @@ class UnifiedBackendGeometry:
         if not hasattr(chain, 'polygons') or not chain.polygons:
             return None
         
-        # Generate geometry for each polygon in chain
+        if np is not None:
+            all_vertices, all_faces, all_edges = _assemble_chain(chain.polygons)
+        else:
+            all_vertices, all_faces, all_edges = self._python_assemble_chain(chain.polygons)
+        
+        geometry = GeometryData(
+            symbol=tier0_symbol,
+            vertices=all_vertices,
+            faces=all_faces,
+            edges=all_edges,
+            dihedral_angles=[],  # Would be calculated from chain
+            face_types={sides: chain.polygons.count(sides) for sides in set(chain.polygons)}
+        )
+        self._tier0_cache.put(tier0_symbol, geometry)
+        return geometry
+    
+    def _python_assemble_chain(
+        self, polygons: Sequence[int]
+    ) -> Tuple[List[Tuple[float, float, float]], List[List[int]], List[Tuple[int, int]]]:
+        """Concatenate primitive geometries with vertex offsets (fallback without NumPy)."""
         all_vertices = []
         all_faces = []
         all_edges = []
         vertex_offset = 0
         
-        for polygon_sides in chain.polygons:
+        for polygon_sides in polygons:
             primitive = self.get_primitive_geometry(polygon_sides)
             
             # Add vertices with offset
-            for vertex in primitive.vertices:
-                all_vertices.append(vertex)
+            all_vertices.extend(primitive.vertices)
             
             # Add faces with vertex offset
             for face in primitive.faces:
@@ -244,17 +416,15 @@ class UnifiedBackendGeometry:
             
             vertex_offset += len(primitive.vertices)
         
-        return GeometryData(
-            symbol=tier0_symbol,
-            vertices=all_vertices,
-            faces=all_faces,
-            edges=all_edges,
-            dihedral_angles=[],  # Would be calculated from chain
-            face_types={sides: chain.polygons.count(sides) for sides in set(chain.polygons)}
-        )
+        return all_vertices, all_faces, all_edges
     
     def _extract_edges_from_faces(self, faces: List[List[int]]) -> List[Tuple[int, int]]:
         """Extract unique edges from faces."""
+        if np is not None:
+            edges = _unique_face_edges(faces)
+            if edges is not None:
+                return edges
+        
         edge_set: Set[Tuple[int, int]] = set()
         
         for face in faces:
@@ -5,17 +5,22 @@ from .analysis import OptimizationEngine, StabilityAnalyzer, StabilityMetrics
 from .config import DEFAULT_SCORE, SMOOTHING_WINDOWS
 from .core import SimulationEngine
 from .checkpointing.polyform_engine import CheckpointSummary, PolyformEngine
-from .checkpointing.workspace import PolyformWorkspace, WorkspacePolygon
+from .checkpointing.scheduler import AdaptiveCheckpointScheduler, SchedulerConfig, SchedulerDecision
+from .checkpointing.workspace import PolyformWorkspace, WorkspacePolygon, WorkspaceSnapshot
 
 __all__ = [
+    "AdaptiveCheckpointScheduler",
     "CheckpointSummary",
     "DEFAULT_SCORE",
     "OptimizationEngine",
     "PolyformEngine",
     "PolyformWorkspace",
+    "SchedulerConfig",
+    "SchedulerDecision",
     "SimulationEngine",
     "SMOOTHING_WINDOWS",
     "StabilityAnalyzer",
     "StabilityMetrics",
     "WorkspacePolygon",
+    "WorkspaceSnapshot",
 ]
@@ -3,14 +3,24 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from polylog6.storage.manager import PolyformStorageManager
+from polylog6.storage.manager import PolyformStorageManager, RegistryDiff
 
-from .workspace import PolyformWorkspace
+from .workspace import PolyformWorkspace, WorkspaceSnapshot
+
+CHECKPOINT_MODES = ("full", "delta")
+
+# Per registry category: the engine's append-only item list and the number of
+# entries it held when captured.
+RegistryMarks = Dict[str, Tuple[List[Tuple[str, str]], int]]
 
 
 @dataclass(slots=True)
@@ -24,10 +34,47 @@ class CheckpointSummary:
     module_refs: int
     registry_digest: str
     timestamp: float
+    mode: str = "full"
+    base_path: Optional[Path] = None
+
+
+@dataclass(slots=True)
+class _CheckpointJob:
+    """A checkpoint planned on the simulation thread, written by the writer."""
+
+    label: str
+    mode: str
+    snapshot: WorkspaceSnapshot
+    inbox_path: Optional[Path]
+    registry: RegistryMarks
+    chain: int
+    sequence: int = 0
+    _registry_state: Optional[Dict[str, Dict[str, str]]] = None
+
+    def registry_state(self) -> Dict[str, Dict[str, str]]:
+        if self._registry_state is None:
+            self._registry_state = {category: dict(items[:count]) for category, (items, count) in self.registry.items()}
+        return self._registry_state
 
 
 class PolyformEngine:
-    """Central coordinator between geometry workspace and storage manager."""
+    """Central coordinator between geometry workspace and storage manager.
+
+    ``checkpoint_mode="delta"`` writes only polygons appended or updated since
+    the previous checkpoint together with a registry diff. Every
+    ``full_checkpoint_every`` deltas (or whenever the workspace history was
+    reset) a full base checkpoint is written instead, which bounds replay cost
+    for :meth:`restore_from`.
+
+    With ``async_writes=True`` a checkpoint only takes a copy-on-write
+    :meth:`~PolyformWorkspace.snapshot` and an incremental capture of the
+    registry on the calling thread; encoding, compression, the optional
+    ``fsync`` and the inbox append run on a single background writer, so
+    checkpoints complete (and reach the inbox) in the order they were taken.
+    At most ``max_in_flight`` checkpoints are queued; further calls block
+    until one finishes. :meth:`restore_from` and :meth:`compact` wait for
+    pending writes first.
+    """
 
     def __init__(
         self,
@@ -38,7 +85,18 @@ class PolyformEngine:
         chunk_size: int = 10_000,
         snapshot_interval: int = 3,
         inbox_path: Optional[Path] = None,
+        checkpoint_mode: str = "full",
+        full_checkpoint_every: int = 10,
+        async_writes: bool = False,
+        max_in_flight: int = 2,
+        fsync: bool = False,
     ) -> None:
+        if checkpoint_mode not in CHECKPOINT_MODES:
+            raise ValueError(f"checkpoint_mode must be one of {CHECKPOINT_MODES}")
+        if full_checkpoint_every <= 0:
+            raise ValueError("full_checkpoint_every must be positive")
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
         self.workspace = workspace or PolyformWorkspace()
         base_path = Path(chunk_dir) if chunk_dir is not None else Path("storage/chunks")
         self.storage_manager = storage_manager or PolyformStorageManager(
@@ -47,39 +105,313 @@ class PolyformEngine:
             snapshot_interval=snapshot_interval,
         )
         self._inbox_path = Path(inbox_path) if inbox_path is not None else None
+        self.checkpoint_mode = checkpoint_mode
+        self.full_checkpoint_every = full_checkpoint_every
+        self.fsync = fsync
+
+        # Background writer; a single thread keeps checkpoints ordered.
+        self._writer: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="polyform-checkpoint") if async_writes else None
+        )
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._pending: List[Future] = []
+
+        # Delta chain bookkeeping. Chain shape is planned on the calling
+        # thread; paths and registry marks are updated by the writes. Each
+        # base starts a new chain id so deltas never follow a failed write.
+        self._chain = 0
+        self._written_chain = 0
+        self._failed_chain: Optional[int] = None
+        self._base_path: Optional[Path] = None
+        self._last_path: Optional[Path] = None
+        self._deltas_since_base = 0
+        self._chain_epoch = -1
+        self._chain_module_refs = 0
+        self._registry_marks: Optional[RegistryMarks] = None
+        # Append-only copies of the registry categories, keyed by category and
+        # holding the live dict they mirror. Growing a list never disturbs a
+        # writer reading an earlier prefix of it.
+        self._registry_items: Dict[str, Tuple[dict, List[Tuple[str, str]]]] = {}
+
+        # Registry digest cache keyed by (category, item list identity, size).
+        self._digest_key: Optional[List[Tuple[str, list, int]]] = None
+        self._digest_value = ""
 
     # ------------------------------------------------------------------
     # Checkpoint lifecycle
     # ------------------------------------------------------------------
     def checkpoint(self, label: str, *, inbox_path: Optional[Path] = None) -> CheckpointSummary:
-        """Persist the current workspace and emit coordination metadata."""
+        """Persist the current workspace and emit coordination metadata.
 
-        resolved_inbox = Path(inbox_path) if inbox_path is not None else self._inbox_path
+        Blocks until the checkpoint is written, also with ``async_writes``
+        (use :meth:`checkpoint_async` to return immediately).
+        """
 
-        checkpoint_path = self.storage_manager.save_workspace(label, self.workspace)
-        summary = CheckpointSummary(
-            label=label,
-            path=checkpoint_path,
-            polygons=self.workspace.polygon_count(),
-            chunk_count=self._chunk_count(),
-            module_refs=len(self.workspace.module_references()),
-            registry_digest=self._registry_digest(),
-            timestamp=time.time(),
-        )
-        if resolved_inbox is not None:
-            self._append_async_log(resolved_inbox, summary)
-        return summary
+        if self._writer is None:
+            return self._write(self._plan(label, inbox_path))
+        return self.checkpoint_async(label, inbox_path=inbox_path).result()
+
+    def checkpoint_async(self, label: str, *, inbox_path: Optional[Path] = None) -> "Future[CheckpointSummary]":
+        """Snapshot the workspace and queue the write on the background writer.
+
+        Without ``async_writes`` the write happens inline and the returned
+        future is already resolved.
+        """
+
+        if self._writer is None:
+            future: "Future[CheckpointSummary]" = Future()
+            try:
+                future.set_result(self.checkpoint(label, inbox_path=inbox_path))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+
+        self._in_flight.acquire()
+        try:
+            job = self._plan(label, inbox_path)
+            future = self._writer.submit(self._write, job)
+        except BaseException:
+            self._in_flight.release()
+            raise
+        future.add_done_callback(self._release)
+        # Keep failed writes until flush() reports them.
+        self._pending = [pending for pending in self._pending if not pending.done() or pending.exception()]
+        self._pending.append(future)
+        return future
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of checkpoints queued or being written."""
+
+        return sum(1 for future in self._pending if not future.done())
+
+    def flush(self) -> List[CheckpointSummary]:
+        """Wait for queued checkpoints; re-raises the first write failure."""
+
+        pending, self._pending = self._pending, []
+        wait(pending)
+        return [future.result() for future in pending]
+
+    def close(self) -> None:
+        """Flush queued checkpoints and stop the background writer."""
+
+        try:
+            self.flush()
+        finally:
+            if self._writer is not None:
+                self._writer.shutdown(wait=True)
+                self._writer = None
 
     def restore_from(self, checkpoint_path: Path) -> None:
-        """Replay a checkpoint into the managed workspace."""
+        """Replay a checkpoint (base plus any deltas) into the managed workspace."""
 
+        self.flush()
+        base, deltas = self.storage_manager.resolve_chain(checkpoint_path)
         self.workspace.clear()
-        for chunk_index, tokens in self.storage_manager.load_stream(checkpoint_path):
+        for chunk_index, tokens in self.storage_manager.load_stream(base):
             self.workspace.ingest_tokens(chunk_index, tokens)
 
+        for header in deltas:
+            if self.workspace.polygon_count() != header.start_index:
+                raise ValueError(
+                    f"Delta {header.path} expects {header.start_index} polygons, "
+                    f"workspace has {self.workspace.polygon_count()}"
+                )
+            for event, payload in self.storage_manager.load_delta(header.path):
+                if event == "patch":
+                    for index, polygon in payload:  # type: ignore[union-attr]
+                        self.workspace.update_polygon(
+                            index,
+                            sides=polygon.sides,
+                            orientation_index=polygon.orientation_index,
+                            rotation_count=polygon.rotation_count,
+                            delta=polygon.delta,
+                        )
+                elif event == "chunk":
+                    chunk_index, tokens = payload  # type: ignore[misc]
+                    self.workspace.ingest_tokens(chunk_index, tokens)
+            if self.workspace.polygon_count() != header.polygon_count:
+                raise ValueError(f"Delta {header.path} replay produced an inconsistent polygon count")
+
+        self.workspace.mark_checkpoint()
+        if self.checkpoint_mode == "delta":
+            # Continue the restored chain rather than forcing a new base.
+            self._chain += 1
+            self._written_chain = self._chain
+            self._base_path = base
+            self._last_path = Path(checkpoint_path)
+            self._deltas_since_base = len(deltas)
+            self._chain_epoch = self.workspace.epoch
+            self._chain_module_refs = len(self.workspace.module_references())
+            self._registry_marks = self._capture_registry()
+
+    def compact(self, checkpoint_path: Path, label: str, *, prune: bool = False) -> Path:
+        """Fold a base + delta chain into a new full checkpoint.
+
+        The chain is replayed into a scratch workspace so the live workspace is
+        untouched. With ``prune`` the superseded delta files are removed.
+        """
+
+        self.flush()
+        _, deltas = self.storage_manager.resolve_chain(checkpoint_path)
+        # A separate manager keeps the replayed registry state away from ours.
+        scratch_manager = PolyformStorageManager(
+            self.storage_manager.base_path,
+            chunk_size=self.storage_manager.chunk_size,
+            snapshot_interval=self.storage_manager.snapshot_interval,
+        )
+        scratch = PolyformEngine(workspace=PolyformWorkspace(), storage_manager=scratch_manager)
+        scratch.restore_from(checkpoint_path)
+        compacted = scratch_manager.save_workspace(label, scratch.workspace)
+        if prune:
+            for header in deltas:
+                header.path.unlink(missing_ok=True)
+        if self._last_path is not None and Path(checkpoint_path) == self._last_path:
+            self._base_path = compacted
+            self._last_path = compacted
+            self._deltas_since_base = 0
+        return compacted
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _plan(self, label: str, inbox_path: Optional[Path]) -> _CheckpointJob:
+        """Fix a checkpoint's mode and contents on the calling thread."""
+
+        mode = "delta" if self._delta_due() else "full"
+        snapshot = self.workspace.snapshot()
+        if self.checkpoint_mode == "delta":
+            if mode == "full":
+                self._chain += 1
+                self._deltas_since_base = 0
+                self._chain_epoch = snapshot.epoch
+                self._chain_module_refs = len(snapshot.module_references())
+            else:
+                self._deltas_since_base += 1
+            self.workspace.mark_checkpoint()
+        resolved_inbox = Path(inbox_path) if inbox_path is not None else self._inbox_path
+        return _CheckpointJob(
+            label=label,
+            mode=mode,
+            snapshot=snapshot,
+            inbox_path=resolved_inbox,
+            registry=self._capture_registry(),
+            chain=self._chain,
+            sequence=self._deltas_since_base,
+        )
+
+    def _write(self, job: _CheckpointJob) -> CheckpointSummary:
+        """Encode and persist a planned checkpoint (runs on the writer)."""
+
+        try:
+            if job.mode == "delta":
+                checkpoint_path = self._write_delta(job)
+            else:
+                checkpoint_path = self._write_base(job)
+        except BaseException:
+            # Later deltas in this chain would reference a missing parent.
+            self._failed_chain = job.chain
+            raise
+        if self.fsync:
+            _fsync_path(checkpoint_path)
+
+        snapshot = job.snapshot
+        summary = CheckpointSummary(
+            label=job.label,
+            path=checkpoint_path,
+            polygons=snapshot.polygon_count(),
+            chunk_count=self._chunk_count(snapshot.polygon_count()),
+            module_refs=len(snapshot.module_references()),
+            registry_digest=self._registry_digest(job.registry, job.registry_state),
+            timestamp=time.time(),
+            mode=job.mode,
+            base_path=self._base_path if job.mode == "delta" else None,
+        )
+        if job.inbox_path is not None:
+            self._append_async_log(job.inbox_path, summary)
+        return summary
+
+    def _release(self, _future: Future) -> None:
+        self._in_flight.release()
+
+    def _delta_due(self) -> bool:
+        if self.checkpoint_mode != "delta" or self._chain == 0 or self._failed_chain == self._chain:
+            return False
+        if self._deltas_since_base >= self.full_checkpoint_every:
+            return False
+        if self.workspace.epoch != self._chain_epoch:
+            return False
+        # Module references are only recorded in full checkpoints.
+        return len(self.workspace.module_references()) == self._chain_module_refs
+
+    def _write_base(self, job: _CheckpointJob) -> Path:
+        path = self.storage_manager.save_workspace(job.label, job.snapshot, registry_state=job.registry_state())
+        if self.checkpoint_mode == "delta":
+            self._base_path = path
+            self._last_path = path
+            self._written_chain = job.chain
+            # Empty bases carry no registry snapshot, so the next delta must.
+            self._registry_marks = job.registry if job.snapshot.polygon_count() else None
+        return path
+
+    def _write_delta(self, job: _CheckpointJob) -> Path:
+        if job.chain != self._written_chain or job.chain == self._failed_chain:
+            raise RuntimeError(f"Cannot write delta {job.label}: an earlier checkpoint in its chain failed")
+        assert self._base_path is not None and self._last_path is not None
+        snapshot = job.snapshot
+        start_index = snapshot.checkpoint_mark
+        path = self.storage_manager.save_delta(
+            job.label,
+            base=self._base_path,
+            parent=self._last_path,
+            sequence=job.sequence,
+            start_index=start_index,
+            appended=snapshot.iter_encoded_from(start_index),
+            changed=snapshot.changed_since_checkpoint(),
+            registry_diff=self._registry_diff(job.registry),
+            polygon_count=snapshot.polygon_count(),
+        )
+        self._last_path = path
+        self._registry_marks = job.registry
+        return path
+
+    def _capture_registry(self) -> RegistryMarks:
+        """Record the registry state in O(entries added since the last capture).
+
+        Registry allocations only ever append to insertion-ordered dicts, so
+        only the tail past the mirrored length is copied. A category whose dict
+        object was swapped (``load_state``) or shrank gets a fresh item list,
+        which :meth:`_registry_diff` emits in full.
+        """
+
+        state = self.storage_manager.encoder.registry.export_state()
+        marks: RegistryMarks = {}
+        for category, mapping in state.items():
+            mirrored = self._registry_items.get(category)
+            if mirrored is None or mirrored[0] is not mapping or len(mapping) < len(mirrored[1]):
+                mirrored = (mapping, list(mapping.items()))
+                self._registry_items[category] = mirrored
+            elif len(mapping) > len(mirrored[1]):
+                mirrored[1].extend(islice(mapping.items(), len(mirrored[1]), None))
+            marks[category] = (mirrored[1], len(mirrored[1]))
+        return marks
+
+    def _registry_diff(self, current: RegistryMarks) -> RegistryDiff:
+        """Diff captured registry state against the previous checkpoint in O(changes)."""
+
+        marks = self._registry_marks or {}
+        added: Dict[str, Dict[str, str]] = {}
+        replaced: List[str] = []
+        for category, (items, count) in current.items():
+            mark = marks.get(category)
+            if mark is None or mark[0] is not items or count < mark[1]:
+                replaced.append(category)
+                if count:
+                    added[category] = dict(items[:count])
+            elif count > mark[1]:
+                added[category] = dict(items[mark[1] : count])
+        return RegistryDiff(added=added, replaced=replaced)
+
     def _append_async_log(self, inbox_path: Path, summary: CheckpointSummary) -> None:
         inbox_path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
@@ -90,21 +422,38 @@ class PolyformEngine:
             "module_refs": summary.module_refs,
             "registry_digest": summary.registry_digest,
             "timestamp": summary.timestamp,
+            "mode": summary.mode,
         }
+        if summary.base_path is not None:
+            payload["base_path"] = str(summary.base_path)
         with inbox_path.open("a", encoding="utf-8") as handle:
             handle.write(json.dumps(payload) + "\n")
 
-    def _registry_digest(self) -> str:
-        state = self.storage_manager.encoder.registry.export_state()
-        serialized = json.dumps(state, sort_keys=True).encode("utf-8")
-        return hashlib.sha256(serialized).hexdigest()
+    def _registry_digest(self, marks: RegistryMarks, state: Callable[[], Dict[str, Dict[str, str]]]) -> str:
+        key = [(category, items, count) for category, (items, count) in sorted(marks.items())]
+        cached = self._digest_key
+        if cached is not None and len(cached) == len(key) and all(
+            a[0] == b[0] and a[1] is b[1] and a[2] == b[2] for a, b in zip(cached, key)
+        ):
+            return self._digest_value
+        serialized = json.dumps(state(), sort_keys=True).encode("utf-8")
+        self._digest_value = hashlib.sha256(serialized).hexdigest()
+        self._digest_key = key
+        return self._digest_value
 
-    def _chunk_count(self) -> int:
-        polygons = self.workspace.polygon_count()
+    def _chunk_count(self, polygons: int) -> int:
         size = self.storage_manager.chunk_size
         if polygons == 0:
             return 0
         return (polygons + size - 1) // size
 
 
-__all__ = ["CheckpointSummary", "PolyformEngine"]
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+__all__ = ["CHECKPOINT_MODES", "CheckpointSummary", "PolyformEngine"]
@@ -0,0 +1,290 @@
+"""Checkpoint cadence driven by measured checkpoint cost.
+
+:class:`AdaptiveCheckpointScheduler` replaces a fixed "every N ticks"
+interval. It measures the wall time of simulation work between ticks, the
+duration and size of each checkpoint and the polygon churn per tick, keeping
+exponentially weighted averages of each. After every checkpoint it picks the
+smallest interval whose projected overhead ``cost / (interval * tick + cost)``
+stays within ``overhead_budget``, then caps it so that no more than
+``max_loss_seconds`` of work or ``max_loss_polygons`` of churn can be lost
+between checkpoints. The loss window always wins over the budget. Those caps
+are also enforced between decisions, so a sudden slowdown or burst of churn
+triggers a checkpoint early instead of waiting out the interval.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SchedulerConfig:
+    """Targets for :class:`AdaptiveCheckpointScheduler`."""
+
+    overhead_budget: float = 0.05
+    max_loss_seconds: Optional[float] = 60.0
+    max_loss_polygons: Optional[int] = None
+    min_interval: int = 1
+    max_interval: int = 10_000
+    smoothing: float = 0.5
+    history: int = 256
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.overhead_budget < 1.0:
+            raise ValueError("overhead_budget must be between 0 and 1")
+        if self.max_loss_seconds is not None and self.max_loss_seconds <= 0:
+            raise ValueError("max_loss_seconds must be positive")
+        if self.max_loss_polygons is not None and self.max_loss_polygons <= 0:
+            raise ValueError("max_loss_polygons must be positive")
+        if self.min_interval <= 0 or self.max_interval < self.min_interval:
+            raise ValueError("require 0 < min_interval <= max_interval")
+        if not 0.0 < self.smoothing <= 1.0:
+            raise ValueError("smoothing must be in (0, 1]")
+
+
+@dataclass(slots=True)
+class SchedulerDecision:
+    """One checkpoint measurement and the interval chosen from it."""
+
+    label: str
+    trigger: str
+    interval: int
+    previous_interval: int
+    reason: str
+    checkpoint_seconds: float
+    bytes_written: int
+    churn: int
+    tick_seconds: float
+    projected_overhead: float
+    timestamp: float
+
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+class AdaptiveCheckpointScheduler:
+    """Decides when the simulation engine should checkpoint.
+
+    The engine calls :meth:`observe_tick` once per tick and, when it returns
+    ``True`` (or the tick is forced), checkpoints and reports the cost through
+    :meth:`record_checkpoint`. Each decision is kept in :attr:`decisions` and
+    passed to ``on_decision``; :meth:`telemetry` summarises the current state.
+    """
+
+    def __init__(
+        self,
+        config: Optional[SchedulerConfig] = None,
+        *,
+        initial_interval: Optional[int] = None,
+        on_decision: Optional[Callable[[SchedulerDecision], None]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.config = config or SchedulerConfig()
+        self._interval: Optional[int] = None
+        if initial_interval is not None:
+            self.seed(initial_interval)
+        self._on_decision = on_decision
+        self._clock = clock
+        self.decisions: Deque[SchedulerDecision] = deque(maxlen=self.config.history)
+
+        # Exponentially weighted averages; None until the first sample.
+        self._tick_seconds: Optional[float] = None
+        self._checkpoint_seconds: Optional[float] = None
+        self._churn_per_tick: Optional[float] = None
+
+        # Progress since the last checkpoint.
+        self._tick_end: Optional[float] = None
+        self._ticks = 0
+        self._work_seconds = 0.0
+        # Nothing is persisted before the first checkpoint.
+        self._mutation_mark = 0
+        self._trigger = "interval"
+
+        # Lifetime totals for the observed overhead ratio.
+        self._total_work = 0.0
+        self._total_checkpoint = 0.0
+        self._checkpoints = 0
+        self._skipped = 0
+
+    # ------------------------------------------------------------------
+    # Engine hooks
+    # ------------------------------------------------------------------
+    def seed(self, interval: int) -> None:
+        """Set the starting interval unless one has already been chosen."""
+
+        if self._interval is None:
+            config = self.config
+            self._interval = max(config.min_interval, min(int(interval), config.max_interval))
+
+    @property
+    def interval(self) -> int:
+        """Current checkpoint interval in ticks."""
+
+        return self._interval if self._interval is not None else self.config.min_interval
+
+    def observe_tick(self, mutations: int) -> bool:
+        """Record one tick of work; return whether a checkpoint is due.
+
+        ``mutations`` is the workspace's monotonic mutation counter. A due
+        checkpoint with no churn since the previous one is skipped.
+        """
+
+        now = self._clock()
+        if self._tick_end is not None:
+            work = max(now - self._tick_end, 0.0)
+            self._work_seconds += work
+            self._total_work += work
+            self._tick_seconds = self._smooth(self._tick_seconds, work)
+        self._tick_end = now
+        self._ticks += 1
+
+        config = self.config
+        churn = mutations - self._mutation_mark
+        if config.max_loss_polygons is not None and churn >= config.max_loss_polygons:
+            self._trigger = "loss_polygons"
+        elif config.max_loss_seconds is not None and self._work_seconds >= config.max_loss_seconds:
+            self._trigger = "loss_seconds"
+        elif self._ticks >= self.interval:
+            self._trigger = "interval"
+        else:
+            return False
+        if churn == 0:
+            self._skipped += 1
+            self._ticks = 0
+            self._work_seconds = 0.0
+            return False
+        return True
+
+    def record_checkpoint(
+        self,
+        *,
+        label: str,
+        seconds: float,
+        bytes_written: int,
+        mutations: int,
+        forced: bool = False,
+    ) -> SchedulerDecision:
+        """Fold in a checkpoint's measured cost and choose the next interval."""
+
+        churn = max(mutations - self._mutation_mark, 0)
+        ticks = max(self._ticks, 1)
+        self._checkpoint_seconds = self._smooth(self._checkpoint_seconds, max(seconds, 0.0))
+        self._churn_per_tick = self._smooth(self._churn_per_tick, churn / ticks)
+        self._total_checkpoint += max(seconds, 0.0)
+        self._checkpoints += 1
+
+        previous = self.interval
+        interval, reason = self._next_interval(previous)
+        self._interval = interval
+        decision = SchedulerDecision(
+            label=label,
+            trigger="forced" if forced else self._trigger,
+            interval=interval,
+            previous_interval=previous,
+            reason=reason,
+            checkpoint_seconds=seconds,
+            bytes_written=bytes_written,
+            churn=churn,
+            tick_seconds=self._tick_seconds or 0.0,
+            projected_overhead=self._projected_overhead(interval),
+            timestamp=time.time(),
+        )
+
+        self._ticks = 0
+        self._work_seconds = 0.0
+        self._mutation_mark = mutations
+        self._trigger = "interval"
+        # Checkpoint time is not simulation work for the next tick sample.
+        self._tick_end = self._clock()
+
+        self.decisions.append(decision)
+        logger.debug(
+            "Checkpoint %s took %.4fs (%d bytes); interval %d -> %d (%s)",
+            label,
+            seconds,
+            bytes_written,
+            previous,
+            interval,
+            reason,
+        )
+        if self._on_decision is not None:
+            self._on_decision(decision)
+        return decision
+
+    # ------------------------------------------------------------------
+    # Telemetry
+    # ------------------------------------------------------------------
+    def telemetry(self) -> Dict[str, object]:
+        """Snapshot of the scheduler's estimates and recent decision."""
+
+        elapsed = self._total_work + self._total_checkpoint
+        return {
+            "interval": self.interval,
+            "checkpoints": self._checkpoints,
+            "skipped": self._skipped,
+            "tick_seconds": self._tick_seconds,
+            "checkpoint_seconds": self._checkpoint_seconds,
+            "churn_per_tick": self._churn_per_tick,
+            "projected_overhead": self._projected_overhead(self.interval),
+            "observed_overhead": self._total_checkpoint / elapsed if elapsed > 0 else 0.0,
+            "overhead_budget": self.config.overhead_budget,
+            "last_decision": self.decisions[-1].as_dict() if self.decisions else None,
+        }
+
+    def history(self) -> List[Dict[str, object]]:
+        """Recorded decisions, oldest first."""
+
+        return [decision.as_dict() for decision in self.decisions]
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _smooth(self, current: Optional[float], sample: float) -> float:
+        if current is None:
+            return sample
+        alpha = self.config.smoothing
+        return alpha * sample + (1.0 - alpha) * current
+
+    def _next_interval(self, previous: int) -> tuple[int, str]:
+        config = self.config
+        tick = self._tick_seconds
+        cost = self._checkpoint_seconds or 0.0
+        if not tick:
+            # No work sample yet (or ticks too fast to time); hold steady.
+            return previous, "unmeasured"
+
+        budget = config.overhead_budget
+        wanted = max(math.ceil(cost * (1.0 - budget) / (budget * tick)), 1)
+        # Grow at most 2x per decision so one noisy sample cannot overshoot.
+        interval, reason = min(wanted, 2 * previous), "budget"
+        if interval < wanted:
+            reason = "ramp"
+
+        caps = []
+        if config.max_loss_seconds is not None:
+            caps.append(math.floor(config.max_loss_seconds / tick))
+        if config.max_loss_polygons is not None and self._churn_per_tick:
+            caps.append(math.floor(config.max_loss_polygons / self._churn_per_tick))
+        cap = max(min(caps), 1) if caps else None
+        if cap is not None and cap < interval:
+            interval, reason = cap, "loss_window"
+
+        if interval < config.min_interval:
+            interval, reason = config.min_interval, "min_interval"
+        elif interval > config.max_interval:
+            interval, reason = config.max_interval, "max_interval"
+        return interval, reason
+
+    def _projected_overhead(self, interval: int) -> float:
+        cost = self._checkpoint_seconds or 0.0
+        span = interval * (self._tick_seconds or 0.0) + cost
+        return cost / span if span > 0 else 0.0
+
+
+__all__ = ["AdaptiveCheckpointScheduler", "SchedulerConfig", "SchedulerDecision"]
@@ -0,0 +1,177 @@
+"""Running position statistics for guardrail evaluation.
+
+Guardrail stability is ``1 / (1 + Var(d))`` where ``d`` are the distances of
+polygon positions from their centroid ``c``. Writing
+``Var(d) = E[d²] - E[d]²``, the first term is exact from Welford-style
+per-axis moments of the positions. ``E[d]`` depends on ``c``, which moves
+with every append, so :class:`PositionStatistics` accumulates distances to a
+fixed *anchor* ``r`` (the centroid at the last rebase) and bounds the
+correction analytically. With ``x = p - r``, ``Δ = c - r`` and ``u = x/|x|``:
+
+* ``|x - Δ| >= |x| - u·Δ`` by convexity of the norm, and
+* ``|x - Δ| - |x| + u·Δ <= min(2|Δ|, 4|Δ|² / |x|)``.
+
+Both corrections only need running sums of ``|x|``, ``u`` and ``1/|x|``, so
+``E[d]`` is bracketed to second order in the drift. When the resulting score
+interval is wider than the tolerance, or contains a decision threshold, the
+anchor moves to ``c`` and the sums are rebuilt in one vectorised pass.
+Centroids of growing workspaces drift ever more slowly, so rebases become
+rare and evaluation is amortised O(appended) rather than O(total) per tick.
+"""
+from __future__ import annotations
+
+import math
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def stability_from_positions(positions: "np.ndarray") -> float:
+    """Vectorised guardrail stability for an ``(n, 3)`` position array."""
+
+    points = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    if points.shape[0] == 0:
+        return 1.0
+    distances = np.sqrt(((points - points.mean(axis=0)) ** 2).sum(axis=1))
+    variation = float(distances.var()) if distances.shape[0] > 1 else 0.0
+    return _score(variation)
+
+
+def _score(variation: float) -> float:
+    return max(0.0, min(1.0, 1.0 / (1.0 + variation)))
+
+
+class PositionStatistics:
+    """Incrementally maintained centroid and distance spread of positions."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.rebases = 0
+        self._reset_moments(np.zeros(3))
+
+    def _reset_moments(self, anchor: "np.ndarray") -> None:
+        self._mean = np.zeros(3)
+        self._m2 = np.zeros(3)
+        self._anchor = anchor
+        # Sums over x = p - anchor: |x|, x/|x| and 1/|x| (x != 0), zero count.
+        self._sum_distance = 0.0
+        self._sum_unit = np.zeros(3)
+        self._sum_inverse = 0.0
+        self._zeros = 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def sync(self, positions: "np.ndarray") -> None:
+        """Fold in rows of ``positions`` past those already counted."""
+
+        if positions.shape[0] > self.count:
+            self._merge(np.asarray(positions[self.count :], dtype=np.float64).reshape(-1, 3))
+
+    def _merge(self, points: "np.ndarray") -> None:
+        # Chan et al. pairwise combination of the running and batch moments.
+        count_b = points.shape[0]
+        mean_b = points.mean(axis=0)
+        m2_b = ((points - mean_b) ** 2).sum(axis=0)
+        total = self.count + count_b
+        gap = mean_b - self._mean
+        self._m2 = self._m2 + m2_b + gap * gap * (self.count * count_b / total)
+        self._mean = self._mean + gap * (count_b / total)
+        self.count = total
+        self._accumulate(points, 1.0)
+
+    def _accumulate(self, points: "np.ndarray", sign: float) -> None:
+        offsets = points - self._anchor
+        distances = np.sqrt((offsets**2).sum(axis=1))
+        nonzero = distances > 0
+        self._sum_distance += sign * float(distances.sum())
+        self._sum_unit = self._sum_unit + sign * (offsets[nonzero] / distances[nonzero, None]).sum(axis=0)
+        self._sum_inverse += sign * float((1.0 / distances[nonzero]).sum())
+        self._zeros += int(sign) * int((~nonzero).sum())
+
+    def remove(self, position: Sequence[float]) -> None:
+        """Drop one previously counted position (inverse Welford step)."""
+
+        if self.count <= 1:
+            self.count = 0
+            self._reset_moments(np.zeros(3))
+            return
+        point = np.asarray(position, dtype=np.float64).reshape(1, 3)
+        remaining = self.count - 1
+        previous = self._mean
+        self._mean = previous - (point[0] - previous) / remaining
+        self._m2 = np.maximum(self._m2 - (point[0] - previous) * (point[0] - self._mean), 0.0)
+        self.count = remaining
+        self._accumulate(point, -1.0)
+
+    def replace(self, old: Sequence[float], new: Sequence[float]) -> None:
+        """Account for an in-place update of one counted position."""
+
+        self.remove(old)
+        self._merge(np.asarray(new, dtype=np.float64).reshape(1, 3))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def centroid(self) -> "np.ndarray":
+        return self._mean.copy()
+
+    def score_bounds(self) -> Tuple[float, float]:
+        """Interval guaranteed (up to rounding) to contain the exact score."""
+
+        if self.count <= 1:
+            return 1.0, 1.0
+        count = self.count
+        second_moment = float(self._m2.sum()) / count
+        drift = self._mean - self._anchor
+        distance = math.sqrt(float((drift**2).sum()))
+        lower_mean = self._sum_distance / count - float(self._sum_unit @ drift) / count
+        remainder = min(
+            2.0 * distance,
+            4.0 * distance * distance * self._sum_inverse / count + distance * self._zeros / count,
+        )
+        ceiling = math.sqrt(second_moment)  # Jensen: E[d] <= sqrt(E[d²])
+        mean_low = min(max(lower_mean, 0.0), ceiling)
+        mean_high = min(max(lower_mean + remainder, 0.0), ceiling)
+        variance_low = max(second_moment - mean_high * mean_high, 0.0)
+        variance_high = max(second_moment - mean_low * mean_low, 0.0)
+        return _score(variance_high), _score(variance_low)
+
+    def stability_score(
+        self,
+        positions: "np.ndarray",
+        *,
+        tolerance: float = 1e-4,
+        thresholds: Sequence[float] = (),
+    ) -> float:
+        """Stability within ``tolerance`` of the exact value.
+
+        ``positions`` must be the array the statistics were synced against;
+        it is only read when the anchor has to be rebased. A score whose
+        bounds straddle one of ``thresholds`` is always made exact so
+        threshold decisions match a full recomputation.
+        """
+
+        self.sync(positions)
+        if self.count <= 1:
+            return 1.0
+        low, high = self.score_bounds()
+        if high - low > tolerance or any(low < threshold <= high for threshold in thresholds):
+            self.rebase(positions)
+            low, high = self.score_bounds()
+        return (low + high) / 2.0
+
+    def rebase(self, positions: "np.ndarray") -> None:
+        """Re-anchor at the centroid and rebuild every sum exactly."""
+
+        points = np.asarray(positions[: self.count], dtype=np.float64).reshape(-1, 3)
+        mean = points.mean(axis=0)
+        self._reset_moments(mean.copy())
+        self._mean = mean
+        self._m2 = ((points - mean) ** 2).sum(axis=0)
+        self._accumulate(points, 1.0)
+        self.rebases += 1
+
+
+__all__ = ["PositionStatistics", "stability_from_positions"]
@@ -2,10 +2,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback path for environments without NumPy
+    np = None  # type: ignore
+
+from polylog6.storage.bulk_codec import PolygonColumns
 from polylog6.storage.encoder import EncodedPolygon
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .statistics import PositionStatistics
+
+_INITIAL_CAPACITY = 1024
+# Rows materialised per step by the compatibility iterators.
+_ITER_BLOCK = 4096
+
+
+def _as_list(column) -> list:
+    return column if isinstance(column, list) else column.tolist()
+
 
 @dataclass(slots=True)
 class WorkspacePolygon:
@@ -27,12 +44,215 @@ class WorkspacePolygon:
         )
 
 
-class PolyformWorkspace:
-    """Acts as both producer and consumer for encoded polygon streams."""
+class _PolygonColumnStore:
+    """Read access shared by the live workspace and its snapshots.
+
+    Subclasses provide ``_sides``, ``_orientation``, ``_rotation``, ``_delta``
+    (NumPy columns or lists), the live row count ``_size`` and
+    ``_module_refs``.
+    """
+
+    _sides: "np.ndarray"
+    _orientation: "np.ndarray"
+    _rotation: "np.ndarray"
+    _delta: "np.ndarray"
+    _size: int
+    _module_refs: List[Tuple[int, int]]
+
+    def _polygons_between(self, start: int, stop: int) -> List[EncodedPolygon]:
+        if np is None:
+            deltas = self._delta[start:stop]
+        else:
+            dx, dy, dz = self._delta[start:stop].T.tolist()
+            deltas = zip(dx, dy, dz)
+        return list(
+            map(
+                EncodedPolygon,
+                _as_list(self._sides[start:stop]),
+                _as_list(self._orientation[start:stop]),
+                _as_list(self._rotation[start:stop]),
+                deltas,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Column views
+    # ------------------------------------------------------------------
+    @property
+    def sides(self) -> "np.ndarray":
+        """Sides column for the live polygons (a view)."""
+
+        return self._sides[: self._size]
+
+    @property
+    def orientation(self) -> "np.ndarray":
+        """Orientation-index column for the live polygons (a view)."""
+
+        return self._orientation[: self._size]
+
+    @property
+    def rotation(self) -> "np.ndarray":
+        """Rotation-count column for the live polygons (a view)."""
+
+        return self._rotation[: self._size]
+
+    @property
+    def deltas(self) -> "np.ndarray":
+        """``(n, 3)`` position deltas for the live polygons (a view)."""
+
+        return self._delta[: self._size]
+
+    # Guardrails and stability read the placement deltas as positions.
+    positions = deltas
+
+    def columns(self, start: int = 0, stop: Optional[int] = None) -> PolygonColumns:
+        """Zero-copy :class:`PolygonColumns` over polygons ``[start, stop)``."""
+
+        if np is None:
+            raise RuntimeError("NumPy is required for columnar workspace access")
+        stop = self._size if stop is None else min(stop, self._size)
+        start = min(max(start, 0), stop)
+        return PolygonColumns(
+            sides=self._sides[start:stop],
+            orientation=self._orientation[start:stop],
+            rotation=self._rotation[start:stop],
+            delta=self._delta[start:stop],
+        )
+
+    def iter_column_batches(self, size: int, *, start: int = 0) -> Iterator[PolygonColumns]:
+        """Yield column views of at most ``size`` polygons from ``start`` onwards."""
+
+        if size <= 0:
+            raise ValueError("size must be positive")
+        for offset in range(start, self._size, size):
+            yield self.columns(offset, offset + size)
+
+    # ------------------------------------------------------------------
+    # Producer interface
+    # ------------------------------------------------------------------
+    def iter_encoded_polygons(self) -> Iterable[EncodedPolygon]:
+        """Yield encoded polygons for the storage manager."""
+
+        return self.iter_encoded_from(0)
+
+    def iter_encoded_from(self, start: int) -> Iterable[EncodedPolygon]:
+        """Yield encoded polygons appended at or after ``start``."""
+
+        # Materialise in blocks so per-element NumPy scalar access is avoided.
+        for offset in range(max(start, 0), self._size, _ITER_BLOCK):
+            yield from self._polygons_between(offset, min(offset + _ITER_BLOCK, self._size))
+
+    def polygon(self, index: int) -> EncodedPolygon:
+        """Return the polygon stored at ``index``."""
+
+        if index < 0 or index >= self._size:
+            raise IndexError(f"Polygon index out of range: {index}")
+        return self._polygons_between(index, index + 1)[0]
+
+    # ------------------------------------------------------------------
+    # Introspection helpers
+    # ------------------------------------------------------------------
+    def polygon_count(self) -> int:
+        """Return the number of polygons held in memory."""
+
+        return self._size
+
+    def module_references(self) -> List[Tuple[int, int]]:
+        """Return recorded module references."""
+
+        return list(self._module_refs)
+
+
+class PolyformWorkspace(_PolygonColumnStore):
+    """Acts as both producer and consumer for encoded polygon streams.
+
+    Polygons are held struct-of-arrays: growable ``int64`` NumPy columns for
+    sides, orientation, rotation and the ``(n, 3)`` position deltas. Consumers
+    that can work on whole columns read them through :meth:`columns` (or the
+    per-column accessors), which return views rather than copies; views are
+    only valid until the next append, which may reallocate. Values outside
+    the ``int64`` range widen the columns to ``object`` dtype so nothing is
+    truncated. Without NumPy the columns are plain lists and the array
+    accessors are unavailable.
+
+    :meth:`snapshot` freezes the current state for a background checkpoint
+    writer without copying: appends land past the snapshot's rows, and the
+    first in-place update after a snapshot copies the column buffers first.
+    """
 
     def __init__(self) -> None:
-        self._polygons: List[WorkspacePolygon] = []
+        self._size = 0
+        self._allocate(_INITIAL_CAPACITY)
         self._module_refs: List[Tuple[int, int]] = []  # (chunk_index, module_id)
+        # Change tracking for delta checkpoints.
+        self._checkpoint_mark = 0
+        self._dirty: Set[int] = set()
+        self._epoch = 0
+        # Monotonic count of appends, updates, module references and clears.
+        self._mutations = 0
+        # Created on first use by guardrails; kept in step with updates.
+        self._position_stats: Optional["PositionStatistics"] = None
+
+    # ------------------------------------------------------------------
+    # Column storage
+    # ------------------------------------------------------------------
+    def _allocate(self, capacity: int) -> None:
+        # Fresh buffers are not referenced by any snapshot.
+        self._shared = False
+        if np is None:
+            self._sides: list = []
+            self._orientation: list = []
+            self._rotation: list = []
+            self._delta: list = []
+            return
+        self._sides = np.zeros(capacity, dtype=np.int64)
+        self._orientation = np.zeros(capacity, dtype=np.int64)
+        self._rotation = np.zeros(capacity, dtype=np.int64)
+        self._delta = np.zeros((capacity, 3), dtype=np.int64)
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = self._sides.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_sides", "_orientation", "_rotation", "_delta"):
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+        self._shared = False
+
+    def _widen(self) -> None:
+        for name in ("_sides", "_orientation", "_rotation", "_delta"):
+            setattr(self, name, getattr(self, name).astype(object))
+        self._shared = False
+
+    def _detach(self) -> None:
+        # Copy-on-write: give the workspace private buffers before an
+        # in-place write so outstanding snapshots keep their rows.
+        for name in ("_sides", "_orientation", "_rotation", "_delta"):
+            setattr(self, name, getattr(self, name).copy())
+        self._shared = False
+
+    def _write_row(self, index: int, sides: int, orientation: int, rotation: int, delta: Tuple[int, int, int]) -> None:
+        if np is None:
+            row = (sides, orientation, rotation, tuple(delta))
+            if index == len(self._sides):
+                for column, value in zip((self._sides, self._orientation, self._rotation, self._delta), row):
+                    column.append(value)
+            else:
+                self._sides[index], self._orientation[index], self._rotation[index], self._delta[index] = row
+            return
+        try:
+            self._sides[index] = sides
+            self._orientation[index] = orientation
+            self._rotation[index] = rotation
+            self._delta[index] = delta
+        except OverflowError:
+            self._widen()
+            self._write_row(index, sides, orientation, rotation, delta)
 
     # ------------------------------------------------------------------
     # Mutation helpers
@@ -47,14 +267,35 @@ class PolyformWorkspace:
     ) -> None:
         """Add a polygon emitted by the geometry runtime."""
 
-        self._polygons.append(
-            WorkspacePolygon(
-                sides=sides,
-                orientation_index=orientation_index,
-                rotation_count=rotation_count,
-                position_delta=delta,
-            )
-        )
+        if np is not None:
+            self._reserve(1)
+        self._write_row(self._size, sides, orientation_index, rotation_count, delta)
+        self._size += 1
+        self._mutations += 1
+
+    def update_polygon(
+        self,
+        index: int,
+        *,
+        sides: int,
+        orientation_index: int,
+        rotation_count: int,
+        delta: Tuple[int, int, int],
+    ) -> None:
+        """Replace the polygon stored at ``index``."""
+
+        if index < 0 or index >= self._size:
+            raise IndexError(f"Polygon index out of range: {index}")
+        stats = self._position_stats
+        previous = tuple(self._delta[index]) if stats is not None and index < stats.count else None
+        if self._shared:
+            self._detach()
+        self._write_row(index, sides, orientation_index, rotation_count, delta)
+        if previous is not None:
+            stats.replace(previous, delta)
+        self._mutations += 1
+        if index < self._checkpoint_mark:
+            self._dirty.add(index)
 
     def add_encoded(self, polygon: EncodedPolygon) -> None:
         """Insert an encoded polygon directly."""
@@ -69,17 +310,109 @@ class PolyformWorkspace:
     def extend(self, polygons: Iterable[EncodedPolygon]) -> None:
         """Append an iterable of encoded polygons."""
 
-        for polygon in polygons:
-            self.add_encoded(polygon)
+        if np is None:
+            for polygon in polygons:
+                self.add_encoded(polygon)
+            return
+        batch = polygons if isinstance(polygons, (list, tuple)) else list(polygons)
+        if not batch:
+            return
+        try:
+            columns = PolygonColumns.from_polygons(batch)
+        except OverflowError:
+            for polygon in batch:
+                self.add_encoded(polygon)
+            return
+        self.extend_columns(columns)
+
+    def extend_columns(self, columns: PolygonColumns) -> None:
+        """Append a struct-of-arrays batch without building polygon objects."""
+
+        count = len(columns)
+        if np is None:
+            self.extend(columns.polygons())
+            return
+        self._reserve(count)
+        stop = self._size + count
+        self._sides[self._size : stop] = columns.sides
+        self._orientation[self._size : stop] = columns.orientation
+        self._rotation[self._size : stop] = columns.rotation
+        self._delta[self._size : stop] = np.asarray(columns.delta).reshape(count, 3)
+        self._size = stop
+        self._mutations += count
 
     # ------------------------------------------------------------------
-    # Producer interface
+    # Statistics
     # ------------------------------------------------------------------
-    def iter_encoded_polygons(self) -> Iterable[EncodedPolygon]:
-        """Yield encoded polygons for the storage manager."""
+    def position_statistics(self) -> "PositionStatistics":
+        """Running centroid/spread statistics, synced with appended polygons.
+
+        Appends are folded in lazily on each call and in-place updates are
+        applied as they happen, so repeated evaluation costs O(new polygons).
+        Requires NumPy.
+        """
+
+        if np is None:
+            raise RuntimeError("NumPy is required for workspace position statistics")
+        if self._position_stats is None:
+            from .statistics import PositionStatistics
 
-        for polygon in self._polygons:
-            yield polygon.to_encoded()
+            self._position_stats = PositionStatistics()
+        self._position_stats.sync(self.deltas)
+        return self._position_stats
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+    @property
+    def epoch(self) -> int:
+        """Counter bumped whenever the workspace history is discarded."""
+
+        return self._epoch
+
+    @property
+    def mutation_count(self) -> int:
+        """Monotonic count of changes, not reset by :meth:`clear`."""
+
+        return self._mutations
+
+    @property
+    def checkpoint_mark(self) -> int:
+        """Number of polygons covered by the last checkpoint."""
+
+        return self._checkpoint_mark
+
+    def changed_since_checkpoint(self) -> Dict[int, EncodedPolygon]:
+        """Return polygons updated in place since the last checkpoint."""
+
+        return {index: self.polygon(index) for index in sorted(self._dirty)}
+
+    def mark_checkpoint(self) -> None:
+        """Record that the current state has been persisted."""
+
+        self._checkpoint_mark = self._size
+        self._dirty.clear()
+
+    def snapshot(self) -> "WorkspaceSnapshot":
+        """Freeze the current state for reading off the simulation thread.
+
+        With NumPy the snapshot shares the column buffers (O(1) apart from
+        the dirty set and module references); without it the lists are copied.
+        """
+
+        size = self._size
+        if np is None:
+            columns = tuple(list(column) for column in (self._sides, self._orientation, self._rotation, self._delta))
+        else:
+            columns = tuple(column[:size] for column in (self._sides, self._orientation, self._rotation, self._delta))
+            self._shared = True
+        return WorkspaceSnapshot(
+            columns,
+            module_refs=list(self._module_refs),
+            epoch=self._epoch,
+            checkpoint_mark=self._checkpoint_mark,
+            changed=self.changed_since_checkpoint(),
+        )
 
     # ------------------------------------------------------------------
     # Consumer interface
@@ -91,15 +424,20 @@ class PolyformWorkspace:
     ) -> None:
         """Apply decoded tokens during a restore sequence."""
 
+        run: List[EncodedPolygon] = []
         for token_type, payload in tokens:
             if token_type == "polygon":
                 assert isinstance(payload, EncodedPolygon)
-                self.add_encoded(payload)
+                run.append(payload)
             elif token_type == "module":
                 module_id = int(payload)
                 self._module_refs.append((chunk_index, module_id))
+                self._mutations += 1
             else:
+                self.extend(run)
                 raise ValueError(f"Unknown token type: {token_type}")
+        # Polygon runs are appended column-wise in one step.
+        self.extend(run)
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -107,15 +445,41 @@ class PolyformWorkspace:
     def clear(self) -> None:
         """Reset the workspace state."""
 
-        self._polygons.clear()
+        # Fresh columns, so views handed out earlier keep their contents.
+        self._size = 0
+        self._allocate(_INITIAL_CAPACITY)
         self._module_refs.clear()
+        self._checkpoint_mark = 0
+        self._dirty.clear()
+        self._position_stats = None
+        self._epoch += 1
+        self._mutations += 1
 
-    def polygon_count(self) -> int:
-        """Return the number of polygons held in memory."""
 
-        return len(self._polygons)
+class WorkspaceSnapshot(_PolygonColumnStore):
+    """Immutable point-in-time view of a :class:`PolyformWorkspace`.
 
-    def module_references(self) -> List[Tuple[int, int]]:
-        """Return recorded module references."""
+    Implements the producer interface the storage manager reads, so a
+    checkpoint can be encoded from it while the workspace keeps changing.
+    """
 
-        return list(self._module_refs)
+    def __init__(
+        self,
+        columns: Tuple[object, object, object, object],
+        *,
+        module_refs: List[Tuple[int, int]],
+        epoch: int,
+        checkpoint_mark: int,
+        changed: Dict[int, EncodedPolygon],
+    ) -> None:
+        self._sides, self._orientation, self._rotation, self._delta = columns  # type: ignore[assignment]
+        self._size = len(self._sides)
+        self._module_refs = module_refs
+        self.epoch = epoch
+        self.checkpoint_mark = checkpoint_mark
+        self._changed = changed
+
+    def changed_since_checkpoint(self) -> Dict[int, EncodedPolygon]:
+        """Polygons updated in place since the checkpoint before the snapshot."""
+
+        return dict(self._changed)
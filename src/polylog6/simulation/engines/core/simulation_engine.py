@@ -5,15 +5,17 @@ from __future__ import annotations
 import logging
 import time
 import uuid
+from concurrent.futures import Future
 from dataclasses import asdict
 from pathlib import Path
 from statistics import StatisticsError, mean, pstdev
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from polylog6.storage.encoder import EncodedPolygon
 from polylog6.storage.manager import PolyformStorageManager
 
 from ..checkpointing.polyform_engine import CheckpointSummary, PolyformEngine
+from ..checkpointing.scheduler import AdaptiveCheckpointScheduler, SchedulerDecision
 from ..checkpointing.workspace import PolyformWorkspace
 from ..guardrails import GuardrailConfig, GuardrailStatus, evaluate_guardrails
 from polylog6.hardware import HardwareProfile, detect_capability
@@ -34,7 +36,17 @@ logger = logging.getLogger(__name__)
 
 
 class SimulationEngine:
-    """Facade that feeds the polyform workspace and produces periodic checkpoints."""
+    """Facade that feeds the polyform workspace and produces periodic checkpoints.
+
+    By default a checkpoint is written every ``checkpoint_interval`` ticks,
+    capped by the hardware tier. Passing a ``checkpoint_scheduler`` instead
+    adapts the cadence to measured checkpoint cost; the capped interval only
+    seeds its first decision.
+
+    With ``async_checkpoints`` a due tick only snapshots the workspace and
+    returns ``None``; the checkpoint is written in the background and its
+    summary is processed on a later tick or by :meth:`collect_checkpoints`.
+    """
 
     def __init__(
         self,
@@ -51,6 +63,11 @@ class SimulationEngine:
         metrics_emitter: Optional[MetricsEmitter] = None,
         frequency_counter: Optional[FrequencyCounterPersistence] = None,
         session_id: Optional[str] = None,
+        checkpoint_mode: str = "full",
+        full_checkpoint_every: int = 10,
+        checkpoint_scheduler: Optional[AdaptiveCheckpointScheduler] = None,
+        async_checkpoints: bool = False,
+        max_in_flight_checkpoints: int = 2,
     ) -> None:
         if checkpoint_interval <= 0:
             raise ValueError("checkpoint_interval must be positive")
@@ -63,6 +80,9 @@ class SimulationEngine:
         self._checkpoint_prefix = checkpoint_prefix
         self._checkpoint_index = 0
         self._tick_count = 0
+        self._scheduler = checkpoint_scheduler
+        if checkpoint_scheduler is not None:
+            checkpoint_scheduler.seed(self._checkpoint_interval)
         self._guardrail_config = guardrail_config
         self._guardrail_alert = guardrail_alert
         self._last_guardrail_status: Optional[GuardrailStatus] = None
@@ -71,7 +91,14 @@ class SimulationEngine:
             workspace=workspace,
             storage_manager=storage_manager,
             inbox_path=inbox_path,
+            checkpoint_mode=checkpoint_mode,
+            full_checkpoint_every=full_checkpoint_every,
+            async_writes=async_checkpoints,
+            max_in_flight=max_in_flight_checkpoints,
         )
+        self._async_checkpoints = async_checkpoints
+        self._in_flight: List[Tuple[Future, Optional[SchedulerDecision]]] = []
+        self._completed: List[CheckpointSummary] = []
 
         self._metrics_emitter = metrics_emitter or MetricsEmitter()
         self._frequency_counter = frequency_counter or FrequencyCounterPersistence()
@@ -122,7 +149,15 @@ class SimulationEngine:
     def tick(self, *, force: bool = False, label: Optional[str] = None) -> Optional[CheckpointSummary]:
         """Advance the checkpoint cadence and emit a checkpoint when due."""
 
-        if not force:
+        if self._in_flight:
+            self._harvest(wait=False)
+        scheduler = self._scheduler
+        if scheduler is not None:
+            due = scheduler.observe_tick(self.workspace.mutation_count)
+            if not (due or force):
+                return None
+            started = time.perf_counter()
+        elif not force:
             self._tick_count += 1
             if self._tick_count < self._checkpoint_interval:
                 return None
@@ -138,13 +173,57 @@ class SimulationEngine:
         else:
             self._last_guardrail_status = None
 
+        if self._async_checkpoints:
+            future = self.polyform_engine.checkpoint_async(checkpoint_label)
+            decision = None
+            if scheduler is not None:
+                # Only the stall seen by the tick counts against the budget.
+                decision = scheduler.record_checkpoint(
+                    label=checkpoint_label,
+                    seconds=time.perf_counter() - started,
+                    bytes_written=0,
+                    mutations=self.workspace.mutation_count,
+                    forced=force and not due,
+                )
+            self._in_flight.append((future, decision))
+            return None
+
         summary = self.polyform_engine.checkpoint(checkpoint_label)
 
+        if scheduler is not None:
+            scheduler.record_checkpoint(
+                label=checkpoint_label,
+                seconds=time.perf_counter() - started,
+                bytes_written=self._bytes_written(summary),
+                mutations=self.workspace.mutation_count,
+                forced=force and not due,
+            )
+
         if summary is not None:
             self._handle_checkpoint(summary)
 
         return summary
 
+    def collect_checkpoints(self, *, wait: bool = True) -> List[CheckpointSummary]:
+        """Return background checkpoints finished since the previous call.
+
+        With ``wait`` every queued checkpoint is awaited first. A failed
+        background write is re-raised here (or from the next tick).
+        """
+
+        self._harvest(wait=wait)
+        completed, self._completed = self._completed, []
+        return completed
+
+    def _harvest(self, *, wait: bool) -> None:
+        while self._in_flight and (wait or self._in_flight[0][0].done()):
+            future, decision = self._in_flight.pop(0)
+            summary = future.result()
+            if decision is not None:
+                decision.bytes_written = self._bytes_written(summary)
+            self._handle_checkpoint(summary)
+            self._completed.append(summary)
+
     def _next_label(self) -> str:
         label = f"{self._checkpoint_prefix}-{self._checkpoint_index:04d}"
         self._checkpoint_index += 1
@@ -153,6 +232,7 @@ class SimulationEngine:
     def restore(self, checkpoint_path: Path) -> None:
         """Restore workspace from a checkpoint file."""
 
+        self._harvest(wait=True)
         self.polyform_engine.restore_from(checkpoint_path)
 
     def clear(self) -> None:
@@ -160,6 +240,21 @@ class SimulationEngine:
 
         self.workspace.clear()
 
+    @property
+    def checkpoint_scheduler(self) -> Optional[AdaptiveCheckpointScheduler]:
+        """Adaptive scheduler driving the cadence, if one was supplied."""
+
+        return self._scheduler
+
+    @staticmethod
+    def _bytes_written(summary: Optional[CheckpointSummary]) -> int:
+        if summary is None:
+            return 0
+        try:
+            return summary.path.stat().st_size
+        except OSError:
+            return 0
+
     @property
     def last_guardrail_status(self) -> Optional[GuardrailStatus]:
         """Return the evaluation result from the most recent tick."""
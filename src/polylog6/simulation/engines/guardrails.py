@@ -1,4 +1,11 @@
-"""Guardrail evaluation utilities for simulation checkpoints."""
+"""Guardrail evaluation utilities for simulation checkpoints.
+
+With NumPy, stability comes from the workspace's running
+:class:`~polylog6.simulation.engines.checkpointing.statistics.PositionStatistics`
+so a tick only folds in the polygons added since the previous one; the score
+is within ``GuardrailConfig.stability_tolerance`` of a full recomputation and
+is made exact whenever that tolerance could flip a threshold decision.
+"""
 
 from __future__ import annotations
 
@@ -6,7 +13,12 @@ import logging
 import math
 from dataclasses import dataclass, field
 from statistics import fmean, pvariance
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Sequence
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback path for environments without NumPy
+    np = None  # type: ignore
 
 from .checkpointing.workspace import PolyformWorkspace
 
@@ -20,6 +32,7 @@ class GuardrailConfig:
     stability_threshold: float = 0.85
     closure_threshold: float = 0.30
     raise_on_breach: bool = False
+    stability_tolerance: float = 1e-4
 
 
 @dataclass(slots=True)
@@ -51,11 +64,10 @@ def evaluate_guardrails(
 
     status = GuardrailStatus()
 
-    encoded_polygons = list(workspace.iter_encoded_polygons())
     module_refs = workspace.module_references()
     status.dimension = "3d" if module_refs else "2d"
-    status.stability_score = _estimate_stability(encoded_polygons)
-    status.closure_ratio = _estimate_closure_ratio(len(module_refs), len(encoded_polygons))
+    status.stability_score = _workspace_stability(workspace, config)
+    status.closure_ratio = _estimate_closure_ratio(len(module_refs), workspace.polygon_count())
 
     if config:
         if module_refs:
@@ -100,6 +112,18 @@ def evaluate_guardrails(
     return status
 
 
+def _workspace_stability(workspace: PolyformWorkspace, config: Optional[GuardrailConfig]) -> float:
+    if np is None or not hasattr(workspace, "position_statistics"):
+        return _estimate_stability(list(workspace.iter_encoded_polygons()))
+    tolerance = config.stability_tolerance if config else GuardrailConfig.stability_tolerance
+    thresholds: Sequence[float] = (config.stability_threshold,) if config else ()
+    return workspace.position_statistics().stability_score(
+        workspace.deltas,
+        tolerance=tolerance,
+        thresholds=thresholds,
+    )
+
+
 def _estimate_stability(encoded_polygons) -> float:
     """Heuristic stability estimate based on polygon dispersion."""
 
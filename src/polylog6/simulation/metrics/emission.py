@@ -1,45 +1,223 @@
 """Append-only metrics emission with file locking guarantees."""
 from __future__ import annotations
 
+import atexit
 import gzip
 import json
 import logging
+import os
+import queue
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 from .schema import CandidateEvent
 
 logger = logging.getLogger(__name__)
 
+FSYNC_POLICIES = ("never", "batch", "interval")
+OVERFLOW_POLICIES = ("block", "drop")
+
+_SHUTDOWN = object()
+_FLUSH = object()
+
 
 class MetricsEmitter:
-    """Emit and manage candidate events in an append-only JSONL stream."""
+    """Emit and manage candidate events in an append-only JSONL stream.
+
+    By default every :meth:`emit` appends synchronously under the file lock.
+    With ``buffered=True`` events are serialised by the caller and handed to a
+    bounded queue; a single writer thread group-commits them, taking the lock
+    and opening the file once per batch of up to ``batch_size`` events or
+    every ``flush_interval`` seconds. ``fsync`` selects durability: ``never``,
+    after every ``batch``, or at most once per ``fsync_interval`` seconds.
+    When the queue is full ``overflow="block"`` applies backpressure to the
+    caller and ``"drop"`` discards the event; both are counted in
+    :meth:`stats`. Buffered events are flushed before reads and rotation and
+    on interpreter shutdown.
+    """
 
-    def __init__(self, output_path: str = "storage/caches/tier_candidates.jsonl") -> None:
+    def __init__(
+        self,
+        output_path: str = "storage/caches/tier_candidates.jsonl",
+        *,
+        buffered: bool = False,
+        queue_size: int = 10_000,
+        batch_size: int = 512,
+        flush_interval: float = 0.25,
+        fsync: str = "never",
+        fsync_interval: float = 1.0,
+        overflow: str = "block",
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if queue_size <= 0 or batch_size <= 0:
+            raise ValueError("queue_size and batch_size must be positive")
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         self.lock_path = self.output_path.with_suffix(".lock")
 
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.overflow = overflow
+
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+        self._last_fsync = 0.0
+        self._stats_lock = threading.Lock()
+        self._counters = {
+            "emitted": 0,
+            "written": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "batches": 0,
+            "write_errors": 0,
+        }
+
     def emit(self, candidate: Dict) -> None:
         """Append ``candidate`` to the JSONL event stream atomically."""
         serialized = json.dumps(candidate)
 
+        if not self.buffered:
+            self._append_lines([serialized])
+            logger.debug("Emitted candidate event %s", candidate.get("event_id"))
+            return
+
+        if self._closed:
+            raise RuntimeError("MetricsEmitter is closed")
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(serialized)
+        except queue.Full:
+            if self.overflow == "drop":
+                self._count("dropped")
+                return
+            self._count("blocked")
+            self._queue.put(serialized)
+        self._count("emitted")
+
+    def flush(self) -> None:
+        """Block until every buffered event has been written."""
+        if self.buffered and self._writer is not None and self._writer.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush buffered events and stop the writer thread."""
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+        atexit.unregister(self.close)
+        if writer is not None:
+            self._queue.put(_SHUTDOWN)
+            writer.join()
+
+    def stats(self) -> Dict[str, int]:
+        """Return emission counters (``dropped``/``blocked`` track overflow)."""
+        with self._stats_lock:
+            counters = dict(self._counters)
+        counters["queued"] = self._queue.qsize()
+        return counters
+
+    # ------------------------------------------------------------------
+    # Writer internals
+    # ------------------------------------------------------------------
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is not None or self._closed:
+                return
+            self._writer = threading.Thread(
+                target=self._run_writer, name="metrics-emitter", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._counters[name] += amount
+
+    def _next_batch(self) -> tuple[List[str], int, bool]:
+        """Collect up to ``batch_size`` events, waiting at most ``flush_interval``.
+
+        Returns the batch, the number of control markers consumed and whether
+        shutdown was requested. A flush marker ends the batch immediately.
+        """
+        first = self._queue.get()
+        if first is _SHUTDOWN:
+            return [], 1, True
+        if first is _FLUSH:
+            return [], 1, False
+        batch: List[str] = [first]  # type: ignore[list-item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _SHUTDOWN:
+                return batch, 1, True
+            if item is _FLUSH:
+                return batch, 1, False
+            batch.append(item)  # type: ignore[arg-type]
+        return batch, 0, False
+
+    def _run_writer(self) -> None:
+        while True:
+            batch, markers, stop = self._next_batch()
+            if batch:
+                try:
+                    self._append_lines(batch)
+                    self._count("written", len(batch))
+                    self._count("batches")
+                except Exception:  # pragma: no cover - keep the writer alive
+                    self._count("write_errors")
+                    logger.exception("Failed to write %d metrics events", len(batch))
+            for _ in range(len(batch) + markers):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _append_lines(self, lines: List[str]) -> None:
         with open(self.lock_path, "w", encoding="utf-8") as lock_file:
             import fcntl
 
             fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
             try:
                 with open(self.output_path, "a", encoding="utf-8") as stream:
-                    stream.write(serialized + "\n")
+                    stream.write("".join(line + "\n" for line in lines))
                     stream.flush()
+                    if self._should_fsync():
+                        os.fsync(stream.fileno())
             finally:
                 fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
-        logger.debug("Emitted candidate event %s", candidate.get("event_id"))
+    def _should_fsync(self) -> bool:
+        if self.fsync == "never":
+            return False
+        if self.fsync == "batch":
+            return True
+        now = time.monotonic()
+        if now - self._last_fsync >= self.fsync_interval:
+            self._last_fsync = now
+            return True
+        return False
 
     def read_events_last_24h(self, now: float | None = None) -> List[Dict]:
         """Return events from the last 24 hours."""
+        self.flush()
         now = now or time.time()
         cutoff = now - 24 * 3600
         events: List[Dict] = []
@@ -72,6 +250,7 @@ class MetricsEmitter:
 
     def rotate(self, retention_days: int = 7) -> None:
         """Archive events older than ``retention_days`` into a gzip file."""
+        self.flush()
         cutoff = time.time() - retention_days * 24 * 3600
 
         with open(self.lock_path, "w", encoding="utf-8") as lock_file:
@@ -119,6 +298,7 @@ class MetricsEmitter:
 
     def read_all(self) -> Iterable[CandidateEvent]:
         """Yield every stored candidate event as :class:`CandidateEvent`."""
+        self.flush()
         if not self.output_path.exists():
             return []
 
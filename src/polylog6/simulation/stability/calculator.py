@@ -1,13 +1,34 @@
-"""Stability calculator used by Tier 3 ingestion and promotion pipelines."""
+"""Stability calculator used by Tier 3 ingestion and promotion pipelines.
+
+:meth:`StabilityCalculator.compute` scores one assembly in pure Python.
+:meth:`StabilityCalculator.compute_batch` scores many assemblies at once from
+a ragged struct-of-arrays layout (concatenated polygon columns plus
+``offsets`` delimiting each assembly) using NumPy segment reductions, and can
+fan very large batches out over a process pool. Both paths agree to within
+floating-point rounding.
+"""
 from __future__ import annotations
 
+import multiprocessing
+import os
 from collections import Counter
 from dataclasses import dataclass
 from statistics import fmean, pvariance
-from typing import Sequence
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback path for environments without NumPy
+    np = None  # type: ignore
 
+from polylog6.storage.bulk_codec import PolygonColumns
 from polylog6.storage.encoder import EncodedPolygon
 
+# Below this many polygons, pickling the slices costs more than it saves.
+PARALLEL_MIN_POLYGONS = 1_000_000
+
+Assembly = Union[Sequence[EncodedPolygon], PolygonColumns]
+
 
 def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(maximum, value))
@@ -39,6 +60,37 @@ class StabilityObservation:
         }
 
 
+@dataclass(slots=True)
+class StabilityBatch:
+    """Per-assembly stability components for a batch, as parallel arrays."""
+
+    symmetry: "np.ndarray"
+    fold_penalty: "np.ndarray"
+    edge_balance: "np.ndarray"
+
+    def __len__(self) -> int:
+        return int(self.symmetry.shape[0])
+
+    @property
+    def score(self) -> "np.ndarray":
+        return np.clip(self.symmetry * (1.0 - self.fold_penalty) * self.edge_balance, 0.0, 1.0)
+
+    def observation(self, index: int) -> StabilityObservation:
+        return StabilityObservation(
+            symmetry=float(self.symmetry[index]),
+            fold_penalty=float(self.fold_penalty[index]),
+            edge_balance=float(self.edge_balance[index]),
+        )
+
+    def observations(self) -> List[StabilityObservation]:
+        return [
+            StabilityObservation(symmetry=symmetry, fold_penalty=fold, edge_balance=edge)
+            for symmetry, fold, edge in zip(
+                self.symmetry.tolist(), self.fold_penalty.tolist(), self.edge_balance.tolist()
+            )
+        ]
+
+
 class StabilityCalculator:
     """Estimate stability from encoded polygons using heuristic measures."""
 
@@ -73,6 +125,84 @@ class StabilityCalculator:
             edge_balance=_clamp(edge_balance),
         )
 
+    def compute_batch(
+        self,
+        sides: "np.ndarray",
+        orientation: "np.ndarray",
+        rotation: "np.ndarray",
+        delta: "np.ndarray",
+        offsets: "np.ndarray",
+        *,
+        require_two_axes: Union[bool, Sequence[bool], "np.ndarray"] = False,
+        workers: Optional[int] = None,
+    ) -> StabilityBatch:
+        """Score ``len(offsets) - 1`` assemblies in one vectorised pass.
+
+        Assembly ``i`` consists of rows ``offsets[i]:offsets[i + 1]`` of the
+        polygon columns (``delta`` has shape ``(n, 3)``). ``require_two_axes``
+        may be given per assembly. With ``workers > 1`` (capped at the CPU
+        count) batches of at least :data:`PARALLEL_MIN_POLYGONS` polygons are
+        split into contiguous, polygon-balanced slices scored in a process
+        pool.
+        """
+
+        _require_numpy()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        columns = (
+            np.asarray(sides, dtype=np.int64),
+            np.asarray(orientation, dtype=np.int64),
+            np.asarray(rotation, dtype=np.int64),
+            np.asarray(delta, dtype=np.float64).reshape(-1, 3),
+        )
+        count = offsets.shape[0] - 1
+        total = columns[0].shape[0]
+        if count < 0 or offsets[0] != 0 or offsets[-1] != total or bool(np.any(np.diff(offsets) < 0)):
+            raise ValueError("offsets must rise monotonically from 0 to the number of polygons")
+        two_axes = np.broadcast_to(np.asarray(require_two_axes, dtype=bool), (count,))
+
+        workers = min(workers or 1, os.cpu_count() or 1)
+        if workers > 1 and total >= PARALLEL_MIN_POLYGONS and count > 1:
+            parts = _split_batch(columns, offsets, two_axes, workers)
+            with multiprocessing.Pool(processes=len(parts)) as pool:
+                results = pool.map(_score_segments_packed, parts)
+            return StabilityBatch(*(np.concatenate(component) for component in zip(*results)))
+        return StabilityBatch(*_score_segments(*columns, offsets, two_axes))
+
+    def compute_many(
+        self,
+        assemblies: Sequence[Assembly],
+        *,
+        require_two_axes: Union[bool, Sequence[bool]] = False,
+        workers: Optional[int] = None,
+    ) -> List[StabilityObservation]:
+        """Batch counterpart of :meth:`compute` for polygon lists or columns.
+
+        Falls back to per-assembly :meth:`compute` without NumPy or when a
+        value does not fit the ``int64`` kernels.
+        """
+
+        flags = [require_two_axes] * len(assemblies) if isinstance(require_two_axes, bool) else list(require_two_axes)
+        if np is not None:
+            try:
+                columns = [_as_columns(assembly) for assembly in assemblies]
+                lengths = [len(column) for column in columns]
+                offsets = np.zeros(len(columns) + 1, dtype=np.int64)
+                np.cumsum(lengths, out=offsets[1:])
+                batch = self.compute_batch(
+                    *_concatenate(columns),
+                    offsets,
+                    require_two_axes=np.asarray(flags, dtype=bool),
+                    workers=workers,
+                )
+            except OverflowError:
+                pass
+            else:
+                return batch.observations()
+        return [
+            self.compute(_as_polygons(assembly), require_two_axes=flag)
+            for assembly, flag in zip(assemblies, flags)
+        ]
+
     def _symmetry_score(
         self,
         polygons: Sequence[EncodedPolygon],
@@ -126,4 +256,125 @@ class StabilityCalculator:
         return min_count / max_count
 
 
-__all__ = ["StabilityCalculator", "StabilityObservation"]
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("NumPy is required for batched stability scoring")
+
+
+def _as_columns(assembly: Assembly) -> PolygonColumns:
+    if isinstance(assembly, PolygonColumns):
+        return assembly
+    return PolygonColumns.from_polygons(list(assembly))
+
+
+def _as_polygons(assembly: Assembly) -> List[EncodedPolygon]:
+    if isinstance(assembly, PolygonColumns):
+        return assembly.polygons()
+    return list(assembly)
+
+
+def _concatenate(columns: Sequence[PolygonColumns]) -> Tuple["np.ndarray", ...]:
+    if not columns:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, np.zeros((0, 3))
+    return (
+        np.concatenate([np.asarray(column.sides, dtype=np.int64) for column in columns]),
+        np.concatenate([np.asarray(column.orientation, dtype=np.int64) for column in columns]),
+        np.concatenate([np.asarray(column.rotation, dtype=np.int64) for column in columns]),
+        np.concatenate([np.asarray(column.delta, dtype=np.float64).reshape(-1, 3) for column in columns]),
+    )
+
+
+def _segment_reduce(ufunc, groups: "np.ndarray", values: "np.ndarray", count: int, fill) -> "np.ndarray":
+    """Apply ``ufunc.reduceat`` over runs of equal, sorted ``groups``."""
+
+    out = np.full(count, fill, dtype=values.dtype)
+    if groups.shape[0]:
+        starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+        out[groups[starts]] = ufunc.reduceat(values, starts)
+    return out
+
+
+def _run_lengths(groups: "np.ndarray", values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Group ids and sizes of each distinct ``(group, value)`` pair, group-sorted."""
+
+    order = np.lexsort((values, groups))
+    groups = groups[order]
+    values = values[order]
+    change = np.ones(groups.shape[0], dtype=bool)
+    change[1:] = (groups[1:] != groups[:-1]) | (values[1:] != values[:-1])
+    starts = np.flatnonzero(change)
+    return groups[starts], np.diff(np.append(starts, groups.shape[0]))
+
+
+def _score_segments(
+    sides: "np.ndarray",
+    orientation: "np.ndarray",
+    rotation: "np.ndarray",
+    delta: "np.ndarray",
+    offsets: "np.ndarray",
+    two_axes: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    count = offsets.shape[0] - 1
+    sizes = np.diff(offsets)
+    groups = np.repeat(np.arange(count), sizes)
+    safe_sizes = np.maximum(sizes, 1).astype(np.float64)
+
+    # Symmetry: population variance of distances from each centroid.
+    centroids = np.stack(
+        [np.bincount(groups, weights=delta[:, axis], minlength=count) for axis in range(3)], axis=1
+    ) / safe_sizes[:, None]
+    distances = np.sqrt(((delta - centroids[groups]) ** 2).sum(axis=1))
+    mean_distance = np.bincount(groups, weights=distances, minlength=count) / safe_sizes
+    dispersion = np.bincount(groups, weights=(distances - mean_distance[groups]) ** 2, minlength=count) / safe_sizes
+    planar = _segment_reduce(np.minimum, groups, delta[:, 2], count, 0.0) == _segment_reduce(
+        np.maximum, groups, delta[:, 2], count, 0.0
+    )
+    dispersion = np.where(two_axes & planar, dispersion * 1.25, dispersion)
+    symmetry = np.where(sizes == 1, 1.0, 1.0 / (1.0 + dispersion))
+
+    # Fold penalty: rotation spread plus orientation disagreement.
+    rotations = np.abs(rotation)
+    max_rotation = _segment_reduce(np.maximum, groups, rotations, count, 0)
+    mean_rotation = np.bincount(groups, weights=rotations.astype(np.float64), minlength=count) / safe_sizes
+    rotation_penalty = np.where(
+        max_rotation == 0, 0.0, np.clip(mean_rotation / np.maximum(max_rotation, 1), 0.0, 1.0)
+    )
+    run_groups, run_sizes = _run_lengths(groups, orientation)
+    dominant = _segment_reduce(np.maximum, run_groups, run_sizes, count, 0)
+    orientation_penalty = 1.0 - dominant / safe_sizes
+    fold_penalty = np.clip((rotation_penalty + orientation_penalty) / 2.0, 0.0, 1.0)
+
+    # Edge balance: rarest over most common side count.
+    run_groups, run_sizes = _run_lengths(groups, sides)
+    rarest = _segment_reduce(np.minimum, run_groups, run_sizes, count, 0)
+    commonest = _segment_reduce(np.maximum, run_groups, run_sizes, count, 0)
+    edge_balance = rarest / np.maximum(commonest, 1)
+
+    empty = sizes == 0
+    return (
+        np.where(empty, 0.0, np.clip(symmetry, 0.0, 1.0)),
+        np.where(empty, 1.0, fold_penalty),
+        np.where(empty, 0.0, np.clip(edge_balance, 0.0, 1.0)),
+    )
+
+
+def _score_segments_packed(args: tuple) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    return _score_segments(*args)
+
+
+def _split_batch(columns: tuple, offsets: "np.ndarray", two_axes: "np.ndarray", workers: int) -> List[tuple]:
+    """Cut the batch at assembly boundaries into polygon-balanced slices."""
+
+    count = offsets.shape[0] - 1
+    targets = np.linspace(0, offsets[-1], workers + 1)[1:-1]
+    cuts = np.unique(np.concatenate(([0], np.searchsorted(offsets, targets), [count])))
+    parts = []
+    for start, stop in zip(cuts[:-1].tolist(), cuts[1:].tolist()):
+        low, high = int(offsets[start]), int(offsets[stop])
+        sliced = tuple(column[low:high] for column in columns)
+        parts.append((*sliced, offsets[start : stop + 1] - low, two_axes[start:stop]))
+    return parts
+
+
+__all__ = ["PARALLEL_MIN_POLYGONS", "StabilityBatch", "StabilityCalculator", "StabilityObservation"]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from polylog6.simulation.engines import PolyformEngine
+from polylog6.storage.encoder import EncodedPolygon
+from polylog6.storage.manager import PolyformStorageManager
+
+
+def _polygons(start: int, count: int) -> List[EncodedPolygon]:
+    return [
+        EncodedPolygon(3 + (index % 4), index % 6, index % 5, (index, -index, index % 3))
+        for index in range(start, start + count)
+    ]
+
+
+def _delta_engine(base: Path, **kwargs) -> PolyformEngine:
+    manager = PolyformStorageManager(base, chunk_size=4, snapshot_interval=1)
+    return PolyformEngine(storage_manager=manager, checkpoint_mode="delta", **kwargs)
+
+
+@pytest.fixture
+def make_polygons() -> Callable[[int, int], List[EncodedPolygon]]:
+    """Deterministic polygons ``start .. start + count`` with varied columns."""
+
+    return _polygons
+
+
+@pytest.fixture
+def make_delta_engine() -> Callable[..., PolyformEngine]:
+    """Delta-checkpointing engine over a small-chunk storage manager at ``base``."""
+
+    return _delta_engine
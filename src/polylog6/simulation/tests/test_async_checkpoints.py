@@ -0,0 +1,151 @@
+"""Background checkpoint writes from copy-on-write workspace snapshots."""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from polylog6.simulation.engines import PolyformWorkspace, SimulationEngine
+from polylog6.storage.encoder import EncodedPolygon
+from polylog6.storage.manager import PolyformStorageManager
+
+
+def test_snapshot_is_isolated_from_later_changes(make_polygons: Callable) -> None:
+    workspace = PolyformWorkspace()
+    workspace.extend(make_polygons(0, 10))
+    workspace.mark_checkpoint()
+    workspace.update_polygon(2, sides=9, orientation_index=0, rotation_count=0, delta=(1, 1, 1))
+    snapshot = workspace.snapshot()
+    assert np.shares_memory(snapshot.deltas, workspace.deltas)
+
+    workspace.extend(make_polygons(10, 5000))
+    workspace.update_polygon(3, sides=7, orientation_index=1, rotation_count=1, delta=(2, 2, 2))
+    workspace.clear()
+
+    expected = make_polygons(0, 10)
+    expected[2] = EncodedPolygon(9, 0, 0, (1, 1, 1))
+    assert snapshot.polygon_count() == 10
+    assert list(snapshot.iter_encoded_polygons()) == expected
+    assert snapshot.changed_since_checkpoint() == {2: expected[2]}
+    assert snapshot.checkpoint_mark == 10
+
+
+def test_async_writes_match_sync_chain_and_keep_inbox_order(
+    tmp_path: Path,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engines = {
+        "sync": make_delta_engine(tmp_path / "sync", full_checkpoint_every=3, inbox_path=tmp_path / "sync.jsonl"),
+        "async": make_delta_engine(
+            tmp_path / "async", full_checkpoint_every=3, inbox_path=tmp_path / "async.jsonl", async_writes=True
+        ),
+    }
+    futures = []
+    for name, engine in engines.items():
+        registry = engine.storage_manager.encoder.registry
+        for step in range(8):
+            engine.workspace.extend(make_polygons(step * 5, 5))
+            if step % 3 == 1:
+                engine.workspace.update_polygon(step, sides=8, orientation_index=1, rotation_count=2, delta=(step, 0, 0))
+                registry.allocate_cluster(f"signature-{step}")
+            future = engine.checkpoint_async(f"cp-{step}")
+            if name == "async":
+                futures.append(future)
+        engine.close()
+
+    summaries = [future.result() for future in futures]
+    labels = [json.loads(line)["label"] for line in (tmp_path / "async.jsonl").read_text().splitlines()]
+    assert labels == [f"cp-{step}" for step in range(8)]
+    assert [summary.mode for summary in summaries] == ["full", "delta", "delta", "delta", "full", "delta", "delta", "delta"]
+
+    sync_digests = [json.loads(line)["registry_digest"] for line in (tmp_path / "sync.jsonl").read_text().splitlines()]
+    assert [summary.registry_digest for summary in summaries] == sync_digests
+
+    restored = make_delta_engine(tmp_path / "restore")
+    restored.restore_from(summaries[-1].path)
+    assert list(restored.workspace.iter_encoded_polygons()) == list(engines["sync"].workspace.iter_encoded_polygons())
+    assert restored.storage_manager.encoder.registry.get_cluster_signature("Ω₃") == "signature-7"
+
+
+def test_in_flight_checkpoints_are_bounded(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engine = make_delta_engine(tmp_path, async_writes=True, max_in_flight=1)
+    release = threading.Event()
+    save_workspace = engine.storage_manager.save_workspace
+
+    def blocking_save(*args, **kwargs):
+        release.wait(5)
+        return save_workspace(*args, **kwargs)
+
+    monkeypatch.setattr(engine.storage_manager, "save_workspace", blocking_save)
+    engine.workspace.extend(make_polygons(0, 3))
+    first = engine.checkpoint_async("cp-0")
+
+    second = threading.Thread(target=engine.checkpoint_async, args=("cp-1",))
+    second.start()
+    second.join(0.1)
+    assert second.is_alive() and engine.pending_writes == 1
+
+    release.set()
+    second.join(5)
+    assert not second.is_alive()
+    assert first.result().polygons == 3
+    engine.close()
+
+
+def test_failed_write_forces_a_new_base(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engine = make_delta_engine(tmp_path, async_writes=True, max_in_flight=4)
+    engine.workspace.extend(make_polygons(0, 4))
+    engine.checkpoint("cp-0")
+
+    save_delta = engine.storage_manager.save_delta
+    calls = []
+
+    def failing_delta(*args, **kwargs):
+        calls.append(kwargs["sequence"])
+        if len(calls) == 1:
+            raise OSError("disk full")
+        return save_delta(*args, **kwargs)
+
+    monkeypatch.setattr(engine.storage_manager, "save_delta", failing_delta)
+    engine.workspace.extend(make_polygons(4, 2))
+    failed = engine.checkpoint_async("cp-1")
+    with pytest.raises(OSError):
+        failed.result()
+    with pytest.raises(OSError):
+        engine.flush()
+
+    engine.workspace.extend(make_polygons(6, 2))
+    recovered = engine.checkpoint("cp-2")
+    assert recovered.mode == "full" and recovered.polygons == 8
+    engine.close()
+
+
+def test_simulation_engine_collects_background_checkpoints(tmp_path: Path) -> None:
+    engine = SimulationEngine(
+        storage_manager=PolyformStorageManager(tmp_path, chunk_size=8),
+        checkpoint_interval=1,
+        async_checkpoints=True,
+    )
+    for step in range(3):
+        engine.add_encoded(EncodedPolygon(4, 0, 0, (step, 0, 0)))
+        assert engine.tick() is None
+
+    summaries = engine.collect_checkpoints()
+    assert [summary.polygons for summary in summaries] == [1, 2, 3]
+    assert engine.collect_checkpoints() == []
+    engine.polyform_engine.close()
@@ -0,0 +1,102 @@
+"""Adaptive checkpoint cadence driven by measured cost."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from polylog6.hardware import HardwareProfile
+from polylog6.simulation.engines import (
+    AdaptiveCheckpointScheduler,
+    SchedulerConfig,
+    SimulationEngine,
+)
+from polylog6.storage.encoder import EncodedPolygon
+from polylog6.storage.manager import PolyformStorageManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _run(scheduler: AdaptiveCheckpointScheduler, clock: _Clock, ticks: int, *, work: float, cost: float, churn: int = 10):
+    mutations = 0
+    for _ in range(ticks):
+        clock.now += work
+        mutations += churn
+        if scheduler.observe_tick(mutations):
+            clock.now += cost
+            scheduler.record_checkpoint(label="cp", seconds=cost, bytes_written=100, mutations=mutations)
+
+
+def test_interval_ramps_to_the_overhead_budget() -> None:
+    clock = _Clock()
+    scheduler = AdaptiveCheckpointScheduler(
+        SchedulerConfig(overhead_budget=0.05, max_loss_seconds=None), initial_interval=1, clock=clock
+    )
+    _run(scheduler, clock, 200, work=1.0, cost=0.5)
+
+    intervals = [decision.interval for decision in scheduler.decisions]
+    # ceil(0.5 * 0.95 / (0.05 * 1.0)) = 10, reached by at most doubling.
+    assert intervals[:6] == [1, 2, 4, 8, 10, 10]
+    assert scheduler.decisions[0].reason == "unmeasured"
+    telemetry = scheduler.telemetry()
+    assert telemetry["projected_overhead"] <= 0.05
+    assert telemetry["observed_overhead"] == pytest.approx(0.05, abs=0.01)
+    assert telemetry["last_decision"]["reason"] == "budget"
+
+
+def test_loss_window_caps_the_interval_and_triggers_early() -> None:
+    clock = _Clock()
+    scheduler = AdaptiveCheckpointScheduler(
+        SchedulerConfig(overhead_budget=0.05, max_loss_seconds=5.0), initial_interval=1, clock=clock
+    )
+    _run(scheduler, clock, 100, work=1.0, cost=0.5)
+    assert scheduler.interval == 5 and scheduler.decisions[-1].reason == "loss_window"
+
+    # Work slows down: the time cap fires before the tick interval elapses.
+    _run(scheduler, clock, 3, work=3.0, cost=0.5)
+    assert scheduler.decisions[-1].trigger == "loss_seconds"
+
+    churn_capped = AdaptiveCheckpointScheduler(
+        SchedulerConfig(max_loss_seconds=None, max_loss_polygons=30), initial_interval=1, clock=clock
+    )
+    _run(churn_capped, clock, 50, work=1.0, cost=0.5)
+    assert churn_capped.interval == 3
+    _run(churn_capped, clock, 1, work=1.0, cost=0.5, churn=40)
+    assert churn_capped.decisions[-1].trigger == "loss_polygons"
+
+
+def test_idle_workspace_skips_checkpoints() -> None:
+    clock = _Clock()
+    scheduler = AdaptiveCheckpointScheduler(initial_interval=2, clock=clock)
+    _run(scheduler, clock, 10, work=1.0, cost=0.1, churn=0)
+    assert not scheduler.decisions and scheduler.telemetry()["skipped"] == 5
+
+
+def test_engine_reports_decisions(tmp_path: Path) -> None:
+    decisions = []
+    scheduler = AdaptiveCheckpointScheduler(SchedulerConfig(max_loss_seconds=None), on_decision=decisions.append)
+    engine = SimulationEngine(
+        storage_manager=PolyformStorageManager(tmp_path, chunk_size=16),
+        hardware_profile=HardwareProfile(cpu_cores=4, ram_gb=8.0, vram_gb=0.0, tier="mid"),
+        checkpoint_interval=3,
+        checkpoint_scheduler=scheduler,
+    )
+    assert scheduler.interval == 3
+
+    summaries = []
+    for step in range(6):
+        engine.add_encoded(EncodedPolygon(4, step % 4, 0, (step, 0, 0)))
+        summaries.append(engine.tick())
+    assert summaries[2] is not None and summaries[1] is None
+    assert decisions and decisions[0].bytes_written == summaries[2].path.stat().st_size
+    assert decisions[0].churn == 3 and decisions[0].trigger == "interval"
+
+    engine.tick(force=True)
+    assert decisions[-1].trigger == "forced"
+    assert engine.checkpoint_scheduler is scheduler
@@ -0,0 +1,74 @@
+"""Struct-of-arrays storage behind PolyformWorkspace."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+
+from polylog6.simulation.engines import PolyformWorkspace
+from polylog6.storage.encoder import EncodedPolygon
+from polylog6.storage.manager import PolyformStorageManager
+
+
+class _ListProducer:
+    def __init__(self, polygons: Iterable[EncodedPolygon]) -> None:
+        self._polygons = list(polygons)
+
+    def iter_encoded_polygons(self) -> Iterable[EncodedPolygon]:
+        yield from self._polygons
+
+
+def test_columns_grow_and_are_views(make_polygons: Callable) -> None:
+    workspace = PolyformWorkspace()
+    polygons = make_polygons(0, 2500)
+    workspace.extend(polygons[:1000])
+    for polygon in polygons[1000:1100]:
+        workspace.add_encoded(polygon)
+    workspace.ingest_tokens(0, [("polygon", polygon) for polygon in polygons[1100:]] + [("module", 7)])
+
+    assert workspace.polygon_count() == 2500
+    assert list(workspace.iter_encoded_polygons()) == polygons
+    assert list(workspace.iter_encoded_from(2498)) == polygons[2498:]
+    assert workspace.module_references() == [(0, 7)]
+    assert workspace.deltas.shape == (2500, 3) and workspace.positions is not None
+    assert workspace.sides.tolist() == [polygon.sides for polygon in polygons]
+
+    columns = workspace.columns(10, 20)
+    assert np.shares_memory(columns.delta, workspace.deltas)
+    workspace.mark_checkpoint()
+    workspace.update_polygon(12, sides=9, orientation_index=1, rotation_count=2, delta=(5, 5, 5))
+    assert columns.sides[2] == 9 and columns.delta[2].tolist() == [5, 5, 5]
+    assert workspace.changed_since_checkpoint() == {12: EncodedPolygon(9, 1, 2, (5, 5, 5))}
+    assert [len(batch) for batch in workspace.iter_column_batches(1000)] == [1000, 1000, 500]
+
+    old_view = workspace.sides
+    workspace.clear()
+    assert workspace.polygon_count() == 0 and list(workspace.iter_encoded_polygons()) == []
+    assert old_view[0] == 3
+
+
+def test_values_beyond_int64_widen_the_columns(make_polygons: Callable) -> None:
+    workspace = PolyformWorkspace()
+    huge = EncodedPolygon(6, 400, 70000, (-(2**70), 2**33, -1))
+    workspace.extend(make_polygons(0, 3) + [huge])
+    assert workspace.polygon(3) == huge
+    assert list(workspace.iter_encoded_polygons())[:3] == make_polygons(0, 3)
+
+
+def test_checkpoint_payloads_match_the_polygon_producer(tmp_path: Path, make_polygons: Callable) -> None:
+    polygons = make_polygons(0, 700) + [EncodedPolygon(5, 1, 3, (2**65, 0, 0))]
+    workspace = PolyformWorkspace()
+    workspace.extend(polygons)
+
+    columnar = PolyformStorageManager(tmp_path / "columnar", chunk_size=256)
+    listed = PolyformStorageManager(tmp_path / "listed", chunk_size=256)
+    columnar_path = columnar.save_workspace("ws", workspace)
+    listed_path = listed.save_workspace("ws", _ListProducer(polygons))
+    assert columnar_path.read_text() == listed_path.read_text()
+
+    restored = PolyformWorkspace()
+    for chunk_index, tokens in columnar.load_stream(columnar_path):
+        restored.ingest_tokens(chunk_index, tokens)
+    assert restored.polygon_count() == len(polygons)
+    assert list(restored.iter_encoded_polygons())[:700] == polygons[:700]
@@ -0,0 +1,91 @@
+"""Delta checkpoint chains for the polyform engine."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from polylog6.simulation.engines import PolyformEngine, PolyformWorkspace
+from polylog6.storage.encoder import EncodedPolygon
+
+
+def _snapshot(workspace: PolyformWorkspace) -> list[EncodedPolygon]:
+    return list(workspace.iter_encoded_polygons())
+
+
+def test_delta_chain_restores_appends_updates_and_registry(
+    tmp_path: Path,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engine = make_delta_engine(tmp_path, full_checkpoint_every=5)
+    registry = engine.storage_manager.encoder.registry
+
+    engine.workspace.extend(make_polygons(0, 6))
+    base = engine.checkpoint("cp-0")
+    assert base.mode == "full"
+
+    engine.workspace.extend(make_polygons(6, 3))
+    engine.workspace.update_polygon(1, sides=8, orientation_index=2, rotation_count=1, delta=(9, 9, 9))
+    symbol = registry.allocate_cluster("delta-signature")
+    first = engine.checkpoint("cp-1")
+    assert first.mode == "delta"
+    assert first.base_path == base.path
+
+    engine.workspace.extend(make_polygons(9, 2))
+    second = engine.checkpoint("cp-2")
+
+    records = [json.loads(line) for line in second.path.read_text(encoding="utf-8").splitlines()]
+    assert sum(record.get("count", 0) for record in records if record["type"] == "chunk") == 2
+    assert not any(record["type"] == "registry_diff" for record in records)
+
+    restored = make_delta_engine(tmp_path / "restore")
+    restored.restore_from(second.path)
+
+    assert _snapshot(restored.workspace) == _snapshot(engine.workspace)
+    assert restored.storage_manager.encoder.registry.get_cluster_signature(symbol) == "delta-signature"
+    assert second.registry_digest == first.registry_digest
+
+
+def test_full_base_written_periodically_and_after_clear(
+    tmp_path: Path,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engine = make_delta_engine(tmp_path, full_checkpoint_every=2)
+    modes = []
+    for index in range(4):
+        engine.workspace.extend(make_polygons(index, 1))
+        modes.append(engine.checkpoint(f"cp-{index}").mode)
+    assert modes == ["full", "delta", "delta", "full"]
+
+    engine.workspace.clear()
+    engine.workspace.extend(make_polygons(0, 2))
+    assert engine.checkpoint("cp-after-clear").mode == "full"
+
+
+def test_compact_folds_chain_into_full_checkpoint(
+    tmp_path: Path,
+    make_polygons: Callable,
+    make_delta_engine: Callable,
+) -> None:
+    engine = make_delta_engine(tmp_path)
+    engine.workspace.extend(make_polygons(0, 5))
+    engine.checkpoint("cp-0")
+    engine.workspace.extend(make_polygons(5, 5))
+    delta = engine.checkpoint("cp-1")
+
+    compacted = engine.compact(delta.path, "cp-compacted", prune=True)
+
+    assert not delta.path.exists()
+    assert engine.storage_manager.read_delta_header(compacted) is None
+    restored = make_delta_engine(tmp_path / "restore")
+    restored.restore_from(compacted)
+    assert _snapshot(restored.workspace) == _snapshot(engine.workspace)
+
+
+def test_invalid_checkpoint_mode_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        PolyformEngine(chunk_dir=tmp_path, checkpoint_mode="incremental")
@@ -59,3 +59,48 @@ def test_simulation_engine_guardrail_integration(tmp_path):
     assert status.dimension == "2d"
     assert status.warnings
 
+
+
+def test_incremental_stability_matches_full_recomputation():
+    import random
+
+    from polylog6.simulation.engines.checkpointing.statistics import stability_from_positions
+    from polylog6.simulation.engines.guardrails import _estimate_stability
+
+    rng = random.Random(7)
+    workspace = PolyformWorkspace()
+    config = GuardrailConfig(stability_threshold=0.02)
+    for tick in range(60):
+        workspace.extend(
+            EncodedPolygon(4, 0, 0, (rng.randint(-3, 3), rng.randint(-3, 3), rng.randint(-1, 1)))
+            for _ in range(rng.randint(1, 40))
+        )
+        if tick % 7 == 3:
+            index = rng.randrange(workspace.polygon_count())
+            workspace.update_polygon(index, sides=4, orientation_index=0, rotation_count=0, delta=(9, -9, 2))
+        expected = _estimate_stability(list(workspace.iter_encoded_polygons()))
+        status = evaluate_guardrails(workspace, config)
+        assert status.stability_score == pytest.approx(expected, abs=config.stability_tolerance)
+        assert stability_from_positions(workspace.deltas) == pytest.approx(expected, abs=1e-12)
+        assert (status.stability_score < config.stability_threshold) == (expected < config.stability_threshold)
+
+    workspace.clear()
+    assert evaluate_guardrails(workspace, config).stability_score == 1.0
+
+
+def test_large_workspace_ticks_rarely_need_a_full_pass():
+    import random
+
+    rng = random.Random(11)
+
+    def batch(count):
+        return [EncodedPolygon(4, 0, 0, (rng.randint(-5, 5), rng.randint(-5, 5), 0)) for _ in range(count)]
+
+    workspace = PolyformWorkspace()
+    workspace.extend(batch(20_000))
+    evaluate_guardrails(workspace, GuardrailConfig())
+    baseline = workspace.position_statistics().rebases
+    for _ in range(30):
+        workspace.extend(batch(50))
+        evaluate_guardrails(workspace, GuardrailConfig())
+    assert workspace.position_statistics().rebases - baseline <= 3
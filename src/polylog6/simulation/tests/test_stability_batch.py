@@ -0,0 +1,75 @@
+"""Batched stability scoring agrees with the per-assembly calculator."""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from polylog6.simulation.stability import calculator as calculator_module
+from polylog6.simulation.stability.calculator import StabilityCalculator
+from polylog6.storage.bulk_codec import PolygonColumns
+from polylog6.storage.encoder import EncodedPolygon
+
+
+def _assemblies(seed: int, count: int) -> list[list[EncodedPolygon]]:
+    rng = random.Random(seed)
+    return [
+        [
+            EncodedPolygon(
+                rng.choice([3, 4, 5, 6]),
+                rng.randint(0, 3),
+                rng.randint(-4, 4),
+                (rng.randint(-5, 5), rng.randint(-5, 5), rng.choice([0, 0, 2])),
+            )
+            for _ in range(rng.randint(0, 25))
+        ]
+        for _ in range(count)
+    ]
+
+
+def _components(observation) -> tuple[float, float, float]:
+    return observation.symmetry, observation.fold_penalty, observation.edge_balance
+
+
+def test_batch_matches_scalar_including_edge_cases() -> None:
+    calculator = StabilityCalculator()
+    assemblies = _assemblies(3, 400) + [[], [EncodedPolygon(4, 0, 0, (1, 1, 1))]]
+    flags = [index % 2 == 0 for index in range(len(assemblies))]
+    # Columns and polygon lists may be mixed.
+    mixed = [PolygonColumns.from_polygons(a) if index % 3 == 0 else a for index, a in enumerate(assemblies)]
+
+    batch = calculator.compute_many(mixed, require_two_axes=flags)
+    expected = [calculator.compute(a, require_two_axes=flag) for a, flag in zip(assemblies, flags)]
+    assert len(batch) == len(expected)
+    for got, want in zip(batch, expected):
+        assert _components(got) == pytest.approx(_components(want), abs=1e-12)
+        assert got.score == pytest.approx(want.score, abs=1e-12)
+
+
+def test_compute_batch_validates_offsets_and_splits_for_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    calculator = StabilityCalculator()
+    assemblies = _assemblies(5, 60)
+    columns = PolygonColumns.from_polygons([polygon for assembly in assemblies for polygon in assembly])
+    offsets = np.cumsum([0] + [len(assembly) for assembly in assemblies])
+    arrays = (columns.sides, columns.orientation, columns.rotation, columns.delta)
+
+    with pytest.raises(ValueError):
+        calculator.compute_batch(*arrays, offsets[:-1])
+
+    inline = calculator.compute_batch(*arrays, offsets)
+    parts = calculator_module._split_batch(
+        (columns.sides, columns.orientation, columns.rotation, columns.delta.astype(float)),
+        offsets,
+        np.zeros(len(assemblies), dtype=bool),
+        4,
+    )
+    assert len(parts) == 4 and sum(len(part[4]) - 1 for part in parts) == len(assemblies)
+    pieces = [calculator_module._score_segments_packed(part) for part in parts]
+    assert np.allclose(np.concatenate([piece[0] for piece in pieces]), inline.symmetry)
+
+    monkeypatch.setattr(calculator_module, "PARALLEL_MIN_POLYGONS", 1)
+    monkeypatch.setattr(calculator_module.os, "cpu_count", lambda: 2)
+    pooled = calculator.compute_batch(*arrays, offsets, workers=2)
+    assert np.allclose(pooled.score, inline.score)
+    assert inline.observation(0).score == pytest.approx(float(inline.score[0]))
@@ -11,6 +11,7 @@ from typing import Callable, Dict, Iterable, List, Mapping, Optional
 from polylog6.combinatorial import AssemblyView, CombinatorialCalculator
 from polylog6.hardware import HardwareProfile, detect_capability
 from polylog6.simulation.stability.calculator import StabilityCalculator, StabilityObservation
+from polylog6.storage.bulk_codec import numpy_available
 from polylog6.storage.tier3_catalog import Tier3Candidate, Tier3Catalog, now_iso
 from polylog6.simulation.engines.checkpointing.polyform_engine import CheckpointSummary
 from polylog6.simulation.engines.checkpointing.workspace import PolyformWorkspace
@@ -58,11 +59,9 @@ class Tier3CandidateIngestionPipeline:
     def ingest_checkpoint(self, summary: CheckpointSummary, workspace: PolyformWorkspace) -> None:
         """Extract, filter, and persist Tier 3 candidates for a checkpoint."""
 
-        seeds = self._extract_candidates(summary, workspace)
-        for seed in seeds:
-            if not self._passes_filters(seed):
-                continue
-            candidate = self._build_candidate(seed)
+        seeds = [seed for seed in self._extract_candidates(summary, workspace) if self._passes_filters(seed)]
+        for seed, observation in zip(seeds, self._score_seeds(seeds)):
+            candidate = self._build_candidate(seed, observation)
             self.catalog.upsert_candidate(candidate)
 
     # ------------------------------------------------------------------
@@ -105,7 +104,23 @@ class Tier3CandidateIngestionPipeline:
     # ------------------------------------------------------------------
     # Candidate construction
     # ------------------------------------------------------------------
-    def _build_candidate(self, seed: CandidateSeed) -> Tier3Candidate:
+    def _score_seeds(self, seeds: List[CandidateSeed]) -> List[StabilityObservation]:
+        """Stability for every seed in one batch, reading workspace columns directly."""
+
+        assemblies = [
+            seed.workspace.columns() if _has_columns(seed.workspace) else list(seed.workspace.iter_encoded_polygons())
+            for seed in seeds
+        ]
+        return self._stability_calculator.compute_many(
+            assemblies,
+            require_two_axes=[bool(seed.workspace.module_references()) for seed in seeds],
+        )
+
+    def _build_candidate(
+        self,
+        seed: CandidateSeed,
+        observation: Optional[StabilityObservation] = None,
+    ) -> Tier3Candidate:
         summary = seed.summary
         workspace = seed.workspace
 
@@ -119,10 +134,11 @@ class Tier3CandidateIngestionPipeline:
         core_components = self._derive_components(module_refs, polygon_count)
         assembly_graph = self._build_assembly_graph(module_refs)
 
-        observation = self._stability_calculator.compute(
-            encoded_polygons,
-            require_two_axes=bool(module_refs),
-        )
+        if observation is None:
+            observation = self._stability_calculator.compute(
+                encoded_polygons,
+                require_two_axes=bool(module_refs),
+            )
 
         raw_metrics = self._compute_metrics(summary, workspace, encoded_polygons, observation)
         raw_metrics.update(self._compute_combinatorial_metrics(encoded_polygons))
@@ -247,4 +263,8 @@ class Tier3CandidateIngestionPipeline:
             return {}
 
 
+def _has_columns(workspace: PolyformWorkspace) -> bool:
+    return numpy_available() and hasattr(workspace, "columns")
+
+
 __all__ = ["Tier3CandidateIngestionPipeline", "CandidateSeed"]
@@ -11,6 +11,7 @@ from .attachment_schemas import (
     ContextSchema,
     is_placeholder_context,
 )
+from .bulk_codec import PolygonColumns
 from .compression_tree import CompressionResult, CompressionTree
 from .descriptors import DihedralAngleSet, PolyformDescriptor, SymmetryDescriptor
 from .encoder import PolyformDecoder, PolyformEncoder
@@ -28,6 +29,7 @@ __all__ = [
     "PolyformDecoder",
     "PolyformDescriptor",
     "PolyformEncoder",
+    "PolygonColumns",
     "SCHEMA_PARTITIONS",
     "SymmetryDescriptor",
     "SymbolRegistry",
@@ -0,0 +1,321 @@
+"""Vectorised bulk codec for Unicode polygon payloads.
+
+The scalar :class:`~polylog6.storage.encoder.PolyformDecoder` walks a payload
+one character at a time. This module operates on the whole UTF-32 code-point
+buffer with NumPy instead:
+
+* VLQ digits live in a dedicated private-use range, so every number in the
+  payload is located by masking that range and splitting on terminator
+  digits; values are assembled with a single ``np.add.reduceat``.
+* Token markers (``P``/``M``), primitive symbols and orientation glyphs are
+  the only other characters, which lets the token layout be validated with a
+  handful of array comparisons.
+
+Results are bit-exact with the scalar codec. Payloads the vectorised path
+cannot represent exactly (values beyond 64 bits, malformed input) are handed
+to the scalar implementation, so error behaviour is unchanged. When NumPy is
+unavailable the helpers transparently fall back as well.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+try:  # pragma: no cover - optional dependency guard
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback path for environments without NumPy
+    np = None  # type: ignore
+
+from .encoder import (
+    _CIRCLED_DIGITS,
+    _CIRCLED_ZERO,
+    _PRIMITIVE_SYMBOL_WIDTH,
+    _VLQ_BASE,
+    _VLQ_CONTINUATION,
+    _VLQ_VALUE_MASK,
+    EncodedPolygon,
+)
+
+# Longest VLQ sequence whose value still fits in an unsigned 64-bit lane.
+_MAX_VLQ_DIGITS = 9
+_MARKER_POLYGON = ord("P")
+_MARKER_MODULE = ord("M")
+_ORIENTATION_ZERO = ord(_CIRCLED_ZERO)
+_ORIENTATION_FIRST = ord(_CIRCLED_DIGITS[0])
+_ORIENTATION_LAST = ord(_CIRCLED_DIGITS[-1])
+_ORIENTATION_VLQ = ord("∘")
+
+Token = Tuple[str, Union[int, EncodedPolygon]]
+
+
+def numpy_available() -> bool:
+    """Return True when the vectorised code paths can be used."""
+
+    return np is not None
+
+
+@dataclass(slots=True)
+class PolygonColumns:
+    """Struct-of-arrays view of a run of encoded polygons.
+
+    ``delta`` has shape ``(n, 3)``. ``modules`` lists ``(token_position,
+    module_index)`` pairs so the original token order can be reconstructed.
+    """
+
+    sides: "np.ndarray"
+    orientation: "np.ndarray"
+    rotation: "np.ndarray"
+    delta: "np.ndarray"
+    modules: List[Tuple[int, int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return int(self.sides.shape[0])
+
+    @classmethod
+    def from_polygons(cls, polygons: Sequence[EncodedPolygon]) -> "PolygonColumns":
+        _require_numpy()
+        count = len(polygons)
+        sides = np.fromiter((polygon.sides for polygon in polygons), dtype=np.int64, count=count)
+        orientation = np.fromiter((polygon.orientation_index for polygon in polygons), dtype=np.int64, count=count)
+        rotation = np.fromiter((polygon.rotation_count for polygon in polygons), dtype=np.int64, count=count)
+        delta = np.array([polygon.delta for polygon in polygons], dtype=np.int64).reshape(count, 3)
+        return cls(sides=sides, orientation=orientation, rotation=rotation, delta=delta)
+
+    def polygons(self) -> List[EncodedPolygon]:
+        """Materialise the columns as :class:`EncodedPolygon` objects."""
+
+        deltas = [tuple(row) for row in self.delta.tolist()]
+        return [
+            EncodedPolygon(sides, orientation, rotation, delta)
+            for sides, orientation, rotation, delta in zip(
+                self.sides.tolist(), self.orientation.tolist(), self.rotation.tolist(), deltas
+            )
+        ]
+
+    def tokens(self) -> List[Token]:
+        """Rebuild the ``PolyformDecoder.decode`` token list."""
+
+        polygons = self.polygons()
+        if not self.modules:
+            return [("polygon", polygon) for polygon in polygons]
+        tokens: List[Token] = []
+        polygon_iter = iter(polygons)
+        total = len(polygons) + len(self.modules)
+        modules = dict(self.modules)
+        for position in range(total):
+            if position in modules:
+                tokens.append(("module", modules[position]))
+            else:
+                tokens.append(("polygon", next(polygon_iter)))
+        return tokens
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("NumPy is required for the bulk polygon codec")
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+def _code_points(payload: str) -> "np.ndarray":
+    return np.frombuffer(payload.encode("utf-32-le"), dtype="<u4").astype(np.int64)
+
+
+def decode_columns(
+    payload: str,
+    sides_for_symbol: Callable[[str], int],
+) -> Optional[PolygonColumns]:
+    """Decode ``payload`` into columns, or ``None`` if the scalar path is needed.
+
+    ``sides_for_symbol`` resolves primitive symbols (normally
+    ``SymbolRegistry.primitive_sides``); it is called once per distinct symbol.
+    """
+
+    _require_numpy()
+    cps = _code_points(payload)
+    size = cps.shape[0]
+    if size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return PolygonColumns(empty, empty.copy(), empty.copy(), np.zeros((0, 3), dtype=np.int64))
+
+    digit = cps - _VLQ_BASE
+    is_vlq = (digit >= 0) & (digit <= 0xFF)
+    is_terminator = is_vlq & ((digit & _VLQ_CONTINUATION) == 0)
+
+    starts = np.flatnonzero((cps == _MARKER_POLYGON) | (cps == _MARKER_MODULE))
+    if starts.shape[0] == 0 or starts[0] != 0:
+        return None
+    is_polygon = cps[starts] == _MARKER_POLYGON
+    polygon_starts = starts[is_polygon]
+    if polygon_starts.shape[0] and polygon_starts[-1] + _PRIMITIVE_SYMBOL_WIDTH + 1 >= size:
+        return None
+
+    orientation_pos = polygon_starts + _PRIMITIVE_SYMBOL_WIDTH + 1
+    orientation_cp = cps[orientation_pos]
+    orientation_vlq = orientation_cp == _ORIENTATION_VLQ
+    orientation_glyph = (orientation_cp == _ORIENTATION_ZERO) | (
+        (orientation_cp >= _ORIENTATION_FIRST) & (orientation_cp <= _ORIENTATION_LAST)
+    )
+    if not bool(np.all(orientation_vlq | orientation_glyph)):
+        return None
+
+    # Every character that is not a VLQ digit must be a marker, a primitive
+    # symbol character or an orientation glyph.
+    expected_fixed = starts.shape[0] + polygon_starts.shape[0] * (_PRIMITIVE_SYMBOL_WIDTH + 1)
+    if int(size - np.count_nonzero(is_vlq)) != expected_fixed:
+        return None
+    symbol_pos = polygon_starts[:, None] + np.arange(1, _PRIMITIVE_SYMBOL_WIDTH + 1)
+    if bool(np.any(is_vlq[symbol_pos])):
+        return None
+
+    # Number assembly: group VLQ digits by terminator.
+    terminator_pos = np.flatnonzero(is_terminator)
+    if terminator_pos.shape[0] == 0 or not bool(is_terminator[np.flatnonzero(is_vlq)[-1]]):
+        return None
+    vlq_pos = np.flatnonzero(is_vlq)
+    group_ids = np.cumsum(is_terminator[vlq_pos]) - is_terminator[vlq_pos]
+    group_starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1]])
+    group_lengths = np.diff(np.r_[group_starts, vlq_pos.shape[0]])
+    if int(group_lengths.max()) > _MAX_VLQ_DIGITS:
+        return None
+    # VLQ groups must be contiguous runs of digits.
+    if not bool(np.all(vlq_pos[group_starts + group_lengths - 1] - vlq_pos[group_starts] == group_lengths - 1)):
+        return None
+    shifts = (np.arange(vlq_pos.shape[0]) - np.repeat(group_starts, group_lengths)) * 7
+    chunks = (digit[vlq_pos] & _VLQ_VALUE_MASK).astype(np.uint64) << shifts.astype(np.uint64)
+    values = np.add.reduceat(chunks, group_starts)
+
+    # Each token consumes a known number of VLQ values.
+    numbers_per_token = np.ones(starts.shape[0], dtype=np.int64)
+    numbers_per_token[is_polygon] = 4 + orientation_vlq.astype(np.int64)
+    if int(numbers_per_token.sum()) != values.shape[0]:
+        return None
+    first_number = np.cumsum(numbers_per_token) - numbers_per_token
+    last_number = first_number + numbers_per_token - 1
+    token_ends = terminator_pos[last_number] + 1
+    if not bool(np.all(token_ends == np.r_[starts[1:], size])):
+        return None
+
+    # Orientation glyph tokens must be immediately followed by the rotation VLQ;
+    # "∘" tokens by their orientation VLQ.
+    polygon_first = first_number[is_polygon]
+    if not bool(np.all(vlq_pos[group_starts[polygon_first]] == orientation_pos + 1)):
+        return None
+
+    # Primitive symbols -> sides, resolved once per distinct symbol.
+    symbol_keys = cps[symbol_pos[:, 0]] << 21 | cps[symbol_pos[:, 1]]
+    unique_keys, inverse = np.unique(symbol_keys, return_inverse=True)
+    lookup = np.array(
+        [sides_for_symbol(chr(int(key) >> 21) + chr(int(key) & 0x1FFFFF)) for key in unique_keys],
+        dtype=np.int64,
+    )
+    sides = lookup[inverse.reshape(-1)] if unique_keys.shape[0] else np.zeros(0, dtype=np.int64)
+
+    orientation = np.where(orientation_cp == _ORIENTATION_ZERO, 0, orientation_cp - _ORIENTATION_FIRST + 1)
+    orientation = orientation.astype(np.int64)
+    offset = polygon_first + orientation_vlq.astype(np.int64)
+    if bool(np.any(orientation_vlq)):
+        orientation[orientation_vlq] = values[polygon_first[orientation_vlq]].astype(np.int64)
+    rotation = values[offset].astype(np.int64)
+    zigzag = np.stack([values[offset + 1], values[offset + 2], values[offset + 3]], axis=1)
+    delta = (zigzag >> np.uint64(1)).astype(np.int64) ^ -((zigzag & np.uint64(1)).astype(np.int64))
+
+    module_positions = np.flatnonzero(~is_polygon)
+    modules = list(zip(module_positions.tolist(), values[first_number[~is_polygon]].astype(np.int64).tolist()))
+    return PolygonColumns(sides=sides, orientation=orientation, rotation=rotation, delta=delta, modules=modules)
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+def _vlq_lengths(values: "np.ndarray") -> "np.ndarray":
+    lengths = np.ones(values.shape, dtype=np.int64)
+    remaining = values >> np.uint64(7)
+    while bool(np.any(remaining)):
+        lengths += remaining > 0
+        remaining = remaining >> np.uint64(7)
+    return lengths
+
+
+def _scatter_vlq(out: "np.ndarray", positions: "np.ndarray", values: "np.ndarray", lengths: "np.ndarray") -> None:
+    for digit_index in range(int(lengths.max()) if lengths.shape[0] else 0):
+        active = lengths > digit_index
+        chunk = (values[active] >> np.uint64(7 * digit_index)) & np.uint64(_VLQ_VALUE_MASK)
+        chunk = chunk.astype(np.int64)
+        chunk[lengths[active] - 1 > digit_index] |= _VLQ_CONTINUATION
+        out[positions[active] + digit_index] = _VLQ_BASE + chunk
+
+
+def encode_columns(
+    columns: PolygonColumns,
+    symbol_for_sides: Callable[[int], str],
+) -> Optional[str]:
+    """Encode polygon columns into a Unicode payload, or ``None`` to fall back.
+
+    Module references in ``columns.modules`` are not emitted; use
+    :meth:`PolyformEncoder.encode_module_reference` for those.
+    """
+
+    _require_numpy()
+    count = len(columns)
+    if count == 0:
+        return ""
+
+    sides = np.asarray(columns.sides, dtype=np.int64)
+    orientation = np.asarray(columns.orientation, dtype=np.int64)
+    rotation = np.asarray(columns.rotation, dtype=np.int64)
+    delta = np.asarray(columns.delta, dtype=np.int64).reshape(count, 3)
+    if bool(np.any(orientation < 0)) or bool(np.any(rotation < 0)):
+        return None
+
+    unique_sides, inverse = np.unique(sides, return_inverse=True)
+    symbols = [symbol_for_sides(int(value)) for value in unique_sides]
+    if any(len(symbol) != _PRIMITIVE_SYMBOL_WIDTH for symbol in symbols):
+        return None
+    symbol_table = np.array([[ord(char) for char in symbol] for symbol in symbols], dtype=np.int64)
+    symbol_cps = symbol_table[inverse.reshape(-1)]
+
+    glyph = orientation <= len(_CIRCLED_DIGITS)
+    orientation_u = orientation.astype(np.uint64)
+    rotation_u = rotation.astype(np.uint64)
+    zigzag = ((delta << 1) ^ (delta >> 63)).astype(np.uint64)
+
+    orientation_vlq_len = np.where(glyph, 0, _vlq_lengths(orientation_u))
+    rotation_len = _vlq_lengths(rotation_u)
+    delta_len = _vlq_lengths(zigzag)
+
+    polygon_len = 1 + _PRIMITIVE_SYMBOL_WIDTH + 1 + orientation_vlq_len + rotation_len + delta_len.sum(axis=1)
+    starts = np.cumsum(polygon_len) - polygon_len
+    out = np.empty(int(polygon_len.sum()), dtype=np.int64)
+
+    out[starts] = _MARKER_POLYGON
+    out[starts + 1] = symbol_cps[:, 0]
+    out[starts + 2] = symbol_cps[:, 1]
+    orientation_pos = starts + _PRIMITIVE_SYMBOL_WIDTH + 1
+    out[orientation_pos] = np.where(
+        orientation == 0,
+        _ORIENTATION_ZERO,
+        np.where(glyph, _ORIENTATION_FIRST + orientation - 1, _ORIENTATION_VLQ),
+    )
+
+    cursor = orientation_pos + 1
+    if bool(np.any(~glyph)):
+        wide = ~glyph
+        _scatter_vlq(out, cursor[wide], orientation_u[wide], orientation_vlq_len[wide])
+    cursor = cursor + orientation_vlq_len
+    _scatter_vlq(out, cursor, rotation_u, rotation_len)
+    cursor = cursor + rotation_len
+    for axis in range(3):
+        _scatter_vlq(out, cursor, zigzag[:, axis], delta_len[:, axis])
+        cursor = cursor + delta_len[:, axis]
+
+    return out.astype("<u4").tobytes().decode("utf-32-le")
+
+
+__all__ = [
+    "PolygonColumns",
+    "decode_columns",
+    "encode_columns",
+    "numpy_available",
+]
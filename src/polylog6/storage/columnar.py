@@ -0,0 +1,270 @@
+"""Binary columnar container for encoded polygon chunks.
+
+The JSONL checkpoint format stores every chunk as a VLQ string inside a JSON
+object, which makes loading dominated by ``json.loads`` and per-character
+decoding. This container keeps the same chunk semantics but stores each field
+as a packed little-endian integer column::
+
+    header   magic, version, chunk_size, snapshot_interval
+    chunk*   u32 length + chunk payload (optionally zlib/lzma compressed)
+    index    per chunk: absolute offset, payload length, polygon count
+    footer   index offset, chunk count, total polygons, footer magic
+
+Chunk payloads hold a small descriptor (chunk index, polygon count, codec,
+per-column integer width) followed by the ``sides``, ``orientation``,
+``rotation``, ``dx``, ``dy`` and ``dz`` columns and an optional JSON registry
+snapshot. The footer makes chunk *N* addressable without scanning.
+"""
+from __future__ import annotations
+
+import json
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .encoder import EncodedPolygon
+
+COLUMNAR_MAGIC = b"PLGCOL\x00\x01"
+COLUMNAR_FOOTER_MAGIC = b"PLGCOLIX"
+COLUMNAR_VERSION = 1
+COLUMNAR_SUFFIX = ".pcol"
+
+COMPRESSION_CODECS: Dict[Optional[str], int] = {None: 0, "zlib": 1, "lzma": 2}
+
+COLUMN_NAMES: Tuple[str, ...] = ("sides", "orientation", "rotation", "dx", "dy", "dz")
+
+_HEADER = struct.Struct("<8sHII")
+_LENGTH = struct.Struct("<I")
+# chunk index, polygon count, codec, has registry snapshot, raw body length
+_CHUNK_DESCRIPTOR = struct.Struct("<IIBBI")
+_INDEX_ENTRY = struct.Struct("<QII")
+_FOOTER = struct.Struct("<QIQ8s")
+
+# Signed typecodes ordered by width; ``array`` sizes are platform dependent so
+# the first code of each width is resolved at import time.
+_WIDTH_CODES: Dict[int, str] = {}
+for _code in ("b", "h", "i", "l", "q"):
+    _WIDTH_CODES.setdefault(array(_code).itemsize, _code)
+_COLUMN_WIDTHS: Tuple[int, ...] = tuple(sorted(width for width in _WIDTH_CODES if width in (1, 2, 4, 8)))
+_SWAP = sys.byteorder != "little"
+
+
+def _column_width(values: Sequence[int]) -> int:
+    if not values:
+        return 1
+    low, high = min(values), max(values)
+    for width in _COLUMN_WIDTHS:
+        bound = 1 << (width * 8 - 1)
+        if -bound <= low and high < bound:
+            return width
+    raise ValueError("Column value exceeds 64-bit range")
+
+
+def _pack_column(values: Sequence[int], width: int) -> bytes:
+    column = array(_WIDTH_CODES[width], values)
+    if _SWAP:
+        column.byteswap()
+    return column.tobytes()
+
+
+def _unpack_column(raw: memoryview, width: int) -> array:
+    column = array(_WIDTH_CODES[width])
+    column.frombytes(raw)
+    if _SWAP:
+        column.byteswap()
+    return column
+
+
+def _compress(body: bytes, codec: Optional[str]) -> bytes:
+    if codec is None:
+        return body
+    if codec == "zlib":
+        return zlib.compress(body, 6)
+    if codec == "lzma":
+        return lzma.compress(body)
+    raise ValueError(f"Unsupported compression codec: {codec!r}")
+
+
+def _decompress(payload: memoryview, codec_id: int) -> bytes:
+    if codec_id == 0:
+        return bytes(payload)
+    if codec_id == 1:
+        return zlib.decompress(payload)
+    if codec_id == 2:
+        return lzma.decompress(payload)
+    raise ValueError(f"Unknown compression codec id: {codec_id}")
+
+
+def encode_chunk(
+    index: int,
+    polygons: Sequence[EncodedPolygon],
+    *,
+    registry_state: Optional[dict] = None,
+    compression: Optional[str] = None,
+) -> bytes:
+    """Serialise a chunk of polygons into a columnar payload."""
+
+    if compression not in COMPRESSION_CODECS:
+        raise ValueError(f"Unsupported compression codec: {compression!r}")
+
+    columns: List[List[int]] = [
+        [polygon.sides for polygon in polygons],
+        [polygon.orientation_index for polygon in polygons],
+        [polygon.rotation_count for polygon in polygons],
+        [polygon.delta[0] for polygon in polygons],
+        [polygon.delta[1] for polygon in polygons],
+        [polygon.delta[2] for polygon in polygons],
+    ]
+    widths = [_column_width(values) for values in columns]
+    body = bytearray(bytes(widths))
+    for values, width in zip(columns, widths):
+        body += _pack_column(values, width)
+    if registry_state is not None:
+        body += json.dumps(registry_state).encode("utf-8")
+
+    descriptor = _CHUNK_DESCRIPTOR.pack(
+        index,
+        len(polygons),
+        COMPRESSION_CODECS[compression],
+        1 if registry_state is not None else 0,
+        len(body),
+    )
+    return descriptor + _compress(bytes(body), compression)
+
+
+@dataclass(slots=True)
+class ColumnarChunk:
+    """Decoded chunk in struct-of-arrays form."""
+
+    index: int
+    count: int
+    columns: Dict[str, array]
+    registry_state: Optional[dict] = None
+
+    def polygons(self) -> List[EncodedPolygon]:
+        columns = self.columns
+        return [
+            EncodedPolygon(sides, orientation, rotation, (dx, dy, dz))
+            for sides, orientation, rotation, dx, dy, dz in zip(
+                columns["sides"],
+                columns["orientation"],
+                columns["rotation"],
+                columns["dx"],
+                columns["dy"],
+                columns["dz"],
+            )
+        ]
+
+    def tokens(self) -> List[Tuple[str, EncodedPolygon]]:
+        return [("polygon", polygon) for polygon in self.polygons()]
+
+
+def decode_chunk(payload: Union[bytes, memoryview]) -> ColumnarChunk:
+    """Inverse of :func:`encode_chunk`."""
+
+    view = memoryview(payload)
+    index, count, codec_id, has_registry, raw_length = _CHUNK_DESCRIPTOR.unpack_from(view, 0)
+    body = memoryview(_decompress(view[_CHUNK_DESCRIPTOR.size :], codec_id))
+    if len(body) != raw_length:
+        raise ValueError(f"Chunk {index} is corrupt (expected {raw_length} bytes, got {len(body)})")
+
+    widths = list(body[: len(COLUMN_NAMES)])
+    offset = len(COLUMN_NAMES)
+    columns: Dict[str, array] = {}
+    for name, width in zip(COLUMN_NAMES, widths):
+        end = offset + count * width
+        columns[name] = _unpack_column(body[offset:end], width)
+        offset = end
+
+    registry_state = json.loads(bytes(body[offset:]).decode("utf-8")) if has_registry else None
+    return ColumnarChunk(index=index, count=count, columns=columns, registry_state=registry_state)
+
+
+class ColumnarWriter:
+    """Append chunks to a columnar container and finalise its index."""
+
+    def __init__(self, handle: BinaryIO, *, chunk_size: int, snapshot_interval: int) -> None:
+        self._handle = handle
+        self._index: List[Tuple[int, int, int]] = []
+        self._total = 0
+        handle.write(_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, chunk_size, snapshot_interval))
+
+    def write_chunk(self, payload: bytes, count: int) -> None:
+        offset = self._handle.tell()
+        self._handle.write(_LENGTH.pack(len(payload)))
+        self._handle.write(payload)
+        self._index.append((offset, len(payload), count))
+        self._total += count
+
+    def close(self) -> None:
+        index_offset = self._handle.tell()
+        for entry in self._index:
+            self._handle.write(_INDEX_ENTRY.pack(*entry))
+        self._handle.write(_FOOTER.pack(index_offset, len(self._index), self._total, COLUMNAR_FOOTER_MAGIC))
+
+
+class ColumnarReader:
+    """Random-access reader over a columnar container."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            magic, version, self.chunk_size, self.snapshot_interval = _HEADER.unpack(handle.read(_HEADER.size))
+            if magic != COLUMNAR_MAGIC:
+                raise ValueError(f"{self.path} is not a columnar polygon container")
+            if version != COLUMNAR_VERSION:
+                raise ValueError(f"Unsupported columnar version: {version}")
+            handle.seek(-_FOOTER.size, 2)
+            index_offset, chunk_count, self.total_polygons, footer_magic = _FOOTER.unpack(handle.read(_FOOTER.size))
+            if footer_magic != COLUMNAR_FOOTER_MAGIC:
+                raise ValueError(f"{self.path} is truncated (missing footer)")
+            handle.seek(index_offset)
+            raw_index = handle.read(chunk_count * _INDEX_ENTRY.size)
+        self._index: List[Tuple[int, int, int]] = list(_INDEX_ENTRY.iter_unpack(raw_index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def chunk_counts(self) -> List[int]:
+        return [count for _, _, count in self._index]
+
+    def read_chunk(self, position: int, *, handle: Optional[BinaryIO] = None) -> ColumnarChunk:
+        """Decode chunk ``position`` directly via the footer index."""
+
+        offset, length, _ = self._index[position]
+        if handle is None:
+            with self.path.open("rb") as owned:
+                return self.read_chunk(position, handle=owned)
+        handle.seek(offset + _LENGTH.size)
+        return decode_chunk(handle.read(length))
+
+    def iter_chunks(self) -> Iterator[ColumnarChunk]:
+        with self.path.open("rb") as handle:
+            for position in range(len(self._index)):
+                yield self.read_chunk(position, handle=handle)
+
+
+def is_columnar(path: Union[str, Path]) -> bool:
+    """Return True when ``path`` starts with the columnar magic bytes."""
+
+    with Path(path).open("rb") as handle:
+        return handle.read(len(COLUMNAR_MAGIC)) == COLUMNAR_MAGIC
+
+
+__all__ = [
+    "COLUMNAR_MAGIC",
+    "COLUMNAR_SUFFIX",
+    "COLUMN_NAMES",
+    "COMPRESSION_CODECS",
+    "ColumnarChunk",
+    "ColumnarReader",
+    "ColumnarWriter",
+    "decode_chunk",
+    "encode_chunk",
+    "is_columnar",
+]
@@ -1,12 +1,17 @@
 """Unicode-based encoder/decoder for hierarchical polyform storage."""
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .compression_tree import CompressionTree
 from .symbol_registry import SymbolRegistry
 import multiprocessing
+import threading
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from .bulk_codec import PolygonColumns
 
 # ---------------------------------------------------------------------------
 # VLQ helpers (private-use Unicode block to keep payload printable)
@@ -106,6 +111,13 @@ def _decode_orientation(data: Sequence[str], start: int = 0) -> tuple[int, int]:
     return value, index
 
 
+_PRIMITIVE_SYMBOL_WIDTH = 2
+
+# Batches at least this large go through the vectorised bulk codec when NumPy
+# is installed; smaller ones are cheaper on the scalar path.
+_BULK_THRESHOLD = 64
+
+
 # ---------------------------------------------------------------------------
 # Polygon entry representation
 # ---------------------------------------------------------------------------
@@ -128,9 +140,24 @@ class PolyformEncoder:
         self.tree = tree or CompressionTree(self.registry)
 
     def encode_polygons(self, polygons: Iterable[EncodedPolygon]) -> str:
+        polygons = list(polygons)
+        if len(polygons) >= _BULK_THRESHOLD:
+            payload = self._encode_bulk(polygons)
+            if payload is not None:
+                return payload
         entries = [self._encode_polygon(entry) for entry in polygons]
         return "".join(entries)
 
+    def encode_columns(self, columns: "PolygonColumns") -> str:
+        """Encode a struct-of-arrays batch; output matches :meth:`encode_polygons`."""
+
+        from . import bulk_codec
+
+        payload = bulk_codec.encode_columns(columns, self.registry.primitive_symbol)
+        if payload is None:
+            return "".join(self._encode_polygon(entry) for entry in columns.polygons())
+        return payload
+
     def encode_module_reference(self, module_index: int) -> str:
         if module_index < 0:
             raise ValueError("Module index must be non-negative")
@@ -139,6 +166,17 @@ class PolyformEncoder:
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _encode_bulk(self, polygons: List[EncodedPolygon]) -> Optional[str]:
+        from . import bulk_codec
+
+        if not bulk_codec.numpy_available():
+            return None
+        try:
+            columns = bulk_codec.PolygonColumns.from_polygons(polygons)
+        except OverflowError:
+            return None
+        return bulk_codec.encode_columns(columns, self.registry.primitive_symbol)
+
     def _encode_polygon(self, polygon: EncodedPolygon) -> str:
         primitive_symbol = self.registry.primitive_symbol(polygon.sides)
         orientation = _encode_orientation(polygon.orientation_index)
@@ -164,6 +202,42 @@ class PolyformDecoder:
         self.tree = tree or CompressionTree(self.registry)
 
     def decode(self, payload: str) -> List[Tuple[str, Union[int, EncodedPolygon]]]:
+        if len(payload) >= _BULK_THRESHOLD * 8:
+            columns = self._decode_bulk(payload)
+            if columns is not None:
+                return columns.tokens()
+        return self._decode_scalar(payload)
+
+    def decode_columns(self, payload: str) -> "PolygonColumns":
+        """Decode ``payload`` into a struct-of-arrays :class:`PolygonColumns`.
+
+        Module references are reported in ``columns.modules`` alongside their
+        token positions. Requires NumPy.
+        """
+
+        from . import bulk_codec
+
+        columns = self._decode_bulk(payload)
+        if columns is not None:
+            return columns
+        tokens = self._decode_scalar(payload)
+        columns = bulk_codec.PolygonColumns.from_polygons(
+            [value for kind, value in tokens if kind == "polygon"]  # type: ignore[misc]
+        )
+        columns.modules = [(position, value) for position, (kind, value) in enumerate(tokens) if kind == "module"]  # type: ignore[misc]
+        return columns
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _decode_bulk(self, payload: str) -> Optional["PolygonColumns"]:
+        from . import bulk_codec
+
+        if not bulk_codec.numpy_available():
+            return None
+        return bulk_codec.decode_columns(payload, self.registry.primitive_sides)
+
+    def _decode_scalar(self, payload: str) -> List[Tuple[str, Union[int, EncodedPolygon]]]:
         index = 0
         tokens: List[Tuple[str, Union[int, EncodedPolygon]]] = []
         data = list(payload)
@@ -179,13 +253,11 @@ class PolyformDecoder:
             tokens.append(("polygon", entry))
         return tokens
 
-    # ------------------------------------------------------------------
-    # Helpers
-    # ------------------------------------------------------------------
     def _decode_polygon(self, data: Sequence[str], start: int) -> tuple[EncodedPolygon, int]:
-        primitive_symbol = data[start]
+        # Primitive symbols are a series letter plus a single position digit.
+        primitive_symbol = "".join(data[start : start + _PRIMITIVE_SYMBOL_WIDTH])
         sides = self.registry.primitive_sides(primitive_symbol)
-        orientation_index, index = _decode_orientation(data, start + 1)
+        orientation_index, index = _decode_orientation(data, start + _PRIMITIVE_SYMBOL_WIDTH)
         rotation_count, index = _decode_vlq(data, index)
         dx, index = _decode_signed_vlq(data, index)
         dy, index = _decode_signed_vlq(data, index)
@@ -218,27 +290,57 @@ class TieredUnicodeEncoder:
         self.next_tier1 = self.tier1_start
         self.next_tier2 = self.tier2_start
         self.overflow_map = {}
+        # Request threads share encoders; each code point must be handed out once.
+        self._lock = threading.Lock()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def reserve(self, symbols: Iterable[str]) -> None:
+        """Skip past tier symbols already handed out (e.g. by a persisted store).
+
+        Allocation resumes after the highest reserved code point of each tier,
+        so reopening a store never reissues a symbol that names a saved record.
+        """
+        with self._lock:
+            for symbol in symbols:
+                if len(symbol) != 1:
+                    continue
+                code = ord(symbol)
+                if self.tier1_start <= code <= self.tier1_end:
+                    self.next_tier1 = max(self.next_tier1, code + 1)
+                elif self.tier2_start <= code <= self.tier2_end:
+                    self.next_tier2 = max(self.next_tier2, code + 1)
     
     def allocate(self, polyform_id: str, frequency: int) -> str:
         """Allocate Unicode symbol based on frequency tier."""
-        # Tier 1: High-frequency
-        if frequency > 1000 and self.next_tier1 <= self.tier1_end:
-            char = chr(self.next_tier1)
-            self.next_tier1 += 1
-            return char
-        
-        # Tier 2: Medium-frequency
-        if frequency > 100 and self.next_tier2 <= self.tier2_end:
-            char = chr(self.next_tier2)
-            self.next_tier2 += 1
-            return char
-        
-        # Overflow: Use hash-based encoding
-        if polyform_id not in self.overflow_map:
-            hash_val = hash(polyform_id) & 0xFFFFFF
-            char = f"U+{hash_val:06X}"
-            self.overflow_map[polyform_id] = char
-        return self.overflow_map[polyform_id]
+        with self._lock:
+            # Tier 1: High-frequency
+            if frequency > 1000 and self.next_tier1 <= self.tier1_end:
+                char = chr(self.next_tier1)
+                self.next_tier1 += 1
+                return char
+            
+            # Tier 2: Medium-frequency
+            if frequency > 100 and self.next_tier2 <= self.tier2_end:
+                char = chr(self.next_tier2)
+                self.next_tier2 += 1
+                return char
+            
+            # Overflow: Use hash-based encoding (a stable digest, unlike
+            # hash(), so symbols survive across processes)
+            if polyform_id not in self.overflow_map:
+                digest = hashlib.blake2b(polyform_id.encode("utf-8"), digest_size=3).digest()
+                hash_val = int.from_bytes(digest, "big")
+                char = f"U+{hash_val:06X}"
+                self.overflow_map[polyform_id] = char
+            return self.overflow_map[polyform_id]
 
     def allocate_parallel(self, polyform_ids: list[str], frequencies: list[int]) -> list[str]:
         """Allocate symbols in parallel."""
@@ -4,10 +4,14 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Protocol, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Protocol, Tuple, Union
 
+from . import bulk_codec
+from .columnar import COLUMNAR_SUFFIX, COMPRESSION_CODECS, ColumnarReader, ColumnarWriter, encode_chunk, is_columnar
 from .encoder import EncodedPolygon, PolyformDecoder, PolyformEncoder
 
+STORAGE_FORMATS = ("jsonl", "columnar")
+
 
 class EncodedPolygonProducer(Protocol):
     """Provides an iterator over encoded polygon entries."""
@@ -33,6 +37,43 @@ class StorageChunk:
     registry_state: Optional[dict] = None
 
 
+@dataclass(slots=True)
+class RegistryDiff:
+    """Registry entries added since the previous checkpoint.
+
+    Categories listed in ``replaced`` carry their complete mapping because the
+    registry swapped the underlying dictionary (for example via ``load_state``).
+    """
+
+    added: Dict[str, Dict[str, str]]
+    replaced: List[str]
+
+    def is_empty(self) -> bool:
+        return not self.added and not self.replaced
+
+    def apply(self, state: Mapping[str, Mapping[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Return a new registry state with this diff applied."""
+
+        merged = {category: dict(mapping) for category, mapping in state.items()}
+        for category in self.replaced:
+            merged[category] = {}
+        for category, entries in self.added.items():
+            merged.setdefault(category, {}).update(entries)
+        return merged
+
+
+@dataclass(slots=True)
+class DeltaHeader:
+    """Metadata stored at the head of a delta checkpoint."""
+
+    path: Path
+    base: Path
+    parent: Path
+    sequence: int
+    start_index: int
+    polygon_count: int
+
+
 def _chunk_iterable(iterable: Iterable[EncodedPolygon], size: int) -> Iterator[List[EncodedPolygon]]:
     batch: List[EncodedPolygon] = []
     for item in iterable:
@@ -55,23 +96,47 @@ class PolyformStorageManager:
         snapshot_interval: int = 1,
         encoder: Optional[PolyformEncoder] = None,
         decoder: Optional[PolyformDecoder] = None,
+        storage_format: str = "jsonl",
+        compression: Optional[str] = None,
     ) -> None:
         if chunk_size <= 0:
             raise ValueError("chunk_size must be positive")
         if snapshot_interval <= 0:
             raise ValueError("snapshot_interval must be positive")
+        if storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"storage_format must be one of {STORAGE_FORMATS}")
+        if compression not in COMPRESSION_CODECS:
+            raise ValueError(f"Unsupported compression codec: {compression!r}")
+        if compression is not None and storage_format != "columnar":
+            raise ValueError("compression requires storage_format='columnar'")
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.chunk_size = chunk_size
         self.snapshot_interval = snapshot_interval
         self.encoder = encoder or PolyformEncoder()
         self.decoder = decoder or PolyformDecoder(registry=self.encoder.registry)
+        self.storage_format = storage_format
+        self.compression = compression
 
     # ------------------------------------------------------------------
     # Save API
     # ------------------------------------------------------------------
-    def save_workspace(self, name: str, producer: EncodedPolygonProducer) -> Path:
-        """Stream encoded polygons to disk in chunked JSON lines format."""
+    def save_workspace(
+        self,
+        name: str,
+        producer: EncodedPolygonProducer,
+        *,
+        registry_state: Optional[Mapping[str, Mapping[str, str]]] = None,
+    ) -> Path:
+        """Stream encoded polygons to disk in the configured storage format.
+
+        ``registry_state`` overrides the live encoder registry in the chunk
+        snapshots, for callers writing a previously captured state.
+        """
+        if registry_state is None:
+            registry_state = self.encoder.registry.export_state()
+        if self.storage_format == "columnar":
+            return self._save_columnar(name, producer, registry_state)
         target = self.base_path / f"{name}.jsonl"
         total_polygons = 0
         with target.open("w", encoding="utf-8") as handle:
@@ -82,17 +147,16 @@ class PolyformStorageManager:
             }
             handle.write(json.dumps(metadata) + "\n")
 
-            for index, batch in enumerate(_chunk_iterable(producer.iter_encoded_polygons(), self.chunk_size)):
-                payload = self.encoder.encode_polygons(batch)
-                total_polygons += len(batch)
+            for index, (count, payload) in enumerate(self._encoded_batches(producer)):
+                total_polygons += count
                 record: dict = {
                     "type": "chunk",
                     "index": index,
-                    "count": len(batch),
+                    "count": count,
                     "payload": payload,
                 }
                 if index % self.snapshot_interval == 0:
-                    record["registry_state"] = self.encoder.registry.export_state()
+                    record["registry_state"] = registry_state
                 handle.write(json.dumps(record) + "\n")
 
             summary = {
@@ -103,12 +167,199 @@ class PolyformStorageManager:
             handle.write(json.dumps(summary) + "\n")
         return target
 
+    def _encoded_batches(self, producer: EncodedPolygonProducer) -> Iterator[Tuple[int, str]]:
+        """Yield ``(count, payload)`` per chunk.
+
+        Producers exposing ``iter_column_batches`` (the columnar workspace) are
+        encoded straight from their column views without building polygons.
+        """
+
+        column_batches = getattr(producer, "iter_column_batches", None)
+        if column_batches is not None and bulk_codec.numpy_available():
+            for columns in column_batches(self.chunk_size):
+                try:
+                    payload = self.encoder.encode_columns(columns)
+                except OverflowError:
+                    payload = self.encoder.encode_polygons(columns.polygons())
+                yield len(columns), payload
+            return
+        for batch in _chunk_iterable(producer.iter_encoded_polygons(), self.chunk_size):
+            yield len(batch), self.encoder.encode_polygons(batch)
+
+    def _save_columnar(
+        self, name: str, producer: EncodedPolygonProducer, registry_state: Mapping[str, Mapping[str, str]]
+    ) -> Path:
+        """Write polygons as packed integer columns with a footer chunk index."""
+        target = self.base_path / f"{name}{COLUMNAR_SUFFIX}"
+        with target.open("wb") as handle:
+            writer = ColumnarWriter(handle, chunk_size=self.chunk_size, snapshot_interval=self.snapshot_interval)
+            for index, batch in enumerate(_chunk_iterable(producer.iter_encoded_polygons(), self.chunk_size)):
+                chunk_registry = registry_state if index % self.snapshot_interval == 0 else None
+                payload = encode_chunk(index, batch, registry_state=chunk_registry, compression=self.compression)
+                writer.write_chunk(payload, len(batch))
+            writer.close()
+        return target
+
+    def save_delta(
+        self,
+        name: str,
+        *,
+        base: Path,
+        parent: Path,
+        sequence: int,
+        start_index: int,
+        appended: Iterable[EncodedPolygon],
+        changed: Mapping[int, EncodedPolygon],
+        registry_diff: RegistryDiff,
+        polygon_count: int,
+    ) -> Path:
+        """Write only the polygons appended/changed since ``parent``.
+
+        Appended polygons are stored as regular chunk records whose indices
+        continue from ``start_index // chunk_size``; in-place updates become
+        ``patch`` records keyed by workspace index.
+        """
+
+        target = self.base_path / f"{name}.delta.jsonl"
+        appended_count = 0
+        with target.open("w", encoding="utf-8") as handle:
+            metadata = {
+                "type": "meta",
+                "mode": "delta",
+                "base": str(base),
+                "parent": str(parent),
+                "sequence": sequence,
+                "start_index": start_index,
+                "polygon_count": polygon_count,
+                "chunk_size": self.chunk_size,
+            }
+            handle.write(json.dumps(metadata) + "\n")
+
+            if not registry_diff.is_empty():
+                record = {
+                    "type": "registry_diff",
+                    "added": registry_diff.added,
+                    "replaced": registry_diff.replaced,
+                }
+                handle.write(json.dumps(record) + "\n")
+
+            indices = list(changed)
+            for offset in range(0, len(indices), self.chunk_size):
+                batch = indices[offset : offset + self.chunk_size]
+                record = {
+                    "type": "patch",
+                    "indices": batch,
+                    "payload": self.encoder.encode_polygons(changed[index] for index in batch),
+                }
+                handle.write(json.dumps(record) + "\n")
+
+            first_chunk = start_index // self.chunk_size
+            for offset, batch in enumerate(_chunk_iterable(appended, self.chunk_size)):
+                appended_count += len(batch)
+                record = {
+                    "type": "chunk",
+                    "index": first_chunk + offset,
+                    "count": len(batch),
+                    "payload": self.encoder.encode_polygons(batch),
+                }
+                handle.write(json.dumps(record) + "\n")
+
+            summary = {
+                "type": "summary",
+                "appended_polygons": appended_count,
+                "patched_polygons": len(indices),
+            }
+            handle.write(json.dumps(summary) + "\n")
+        return target
+
     # ------------------------------------------------------------------
     # Load API
     # ------------------------------------------------------------------
+    def read_meta(self, path: Union[str, Path]) -> dict:
+        """Return the leading ``meta`` record of a checkpoint file."""
+
+        if is_columnar(path):
+            reader = ColumnarReader(path)
+            return {
+                "type": "meta",
+                "format": "columnar",
+                "chunk_size": reader.chunk_size,
+                "snapshot_interval": reader.snapshot_interval,
+            }
+        with Path(path).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    record = json.loads(line)
+                    if record.get("type") != "meta":
+                        raise ValueError(f"Checkpoint {path} does not start with a meta record")
+                    return record
+        raise ValueError(f"Checkpoint {path} is empty")
+
+    def read_delta_header(self, path: Union[str, Path]) -> Optional[DeltaHeader]:
+        """Return the delta header for ``path`` or ``None`` for full checkpoints."""
+
+        meta = self.read_meta(path)
+        if meta.get("mode") != "delta":
+            return None
+        return DeltaHeader(
+            path=Path(path),
+            base=Path(meta["base"]),
+            parent=Path(meta["parent"]),
+            sequence=int(meta["sequence"]),
+            start_index=int(meta["start_index"]),
+            polygon_count=int(meta["polygon_count"]),
+        )
+
+    def resolve_chain(self, path: Union[str, Path]) -> Tuple[Path, List[DeltaHeader]]:
+        """Return the base checkpoint and ordered deltas needed to rebuild ``path``."""
+
+        deltas: List[DeltaHeader] = []
+        current = Path(path)
+        while True:
+            header = self.read_delta_header(current)
+            if header is None:
+                break
+            deltas.append(header)
+            current = header.parent
+        deltas.reverse()
+        return current, deltas
+
+    def load_delta(
+        self, path: Union[str, Path]
+    ) -> Iterator[Tuple[str, object]]:
+        """Yield ``registry``, ``patch`` and ``chunk`` events from a delta file.
+
+        ``patch`` events carry ``[(index, EncodedPolygon), ...]`` and ``chunk``
+        events carry ``(chunk_index, tokens)`` like :meth:`load_stream`.
+        """
+
+        with Path(path).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                record_type = record.get("type")
+                if record_type == "meta" or record_type == "summary":
+                    continue
+                if record_type == "registry_diff":
+                    diff = RegistryDiff(added=record.get("added", {}), replaced=record.get("replaced", []))
+                    self.encoder.registry.load_state(diff.apply(self.encoder.registry.export_state()))
+                    yield "registry", diff
+                elif record_type == "patch":
+                    tokens = self.decoder.decode(record["payload"])
+                    polygons = [payload for token, payload in tokens if token == "polygon"]
+                    yield "patch", list(zip(record["indices"], polygons))
+                elif record_type == "chunk":
+                    yield "chunk", (record["index"], self.decoder.decode(record["payload"]))
+                else:
+                    raise ValueError(f"Unknown record type: {record_type}")
+
     def load_stream(self, path: Union[str, Path]) -> Iterator[Tuple[int, List[Tuple[str, Union[int, EncodedPolygon]]]]]:
-        """Yield decoded chunk payloads from storage."""
+        """Yield decoded chunk payloads from storage (JSONL or columnar)."""
         source = Path(path)
+        if is_columnar(source):
+            yield from self._load_columnar(source)
+            return
         registry_loaded = False
         with source.open("r", encoding="utf-8") as handle:
             for line in handle:
@@ -128,6 +379,19 @@ class PolyformStorageManager:
                 tokens = self.decoder.decode(payload)
                 yield record["index"], tokens
 
+    def _load_columnar(self, source: Path) -> Iterator[Tuple[int, List[Tuple[str, Union[int, EncodedPolygon]]]]]:
+        registry_loaded = False
+        for chunk in ColumnarReader(source).iter_chunks():
+            if chunk.registry_state is not None or not registry_loaded:
+                self.encoder.registry.load_state(chunk.registry_state or {})
+                registry_loaded = True
+            yield chunk.index, chunk.tokens()
+
+    def load_chunk(self, path: Union[str, Path], position: int) -> Tuple[int, List[Tuple[str, Union[int, EncodedPolygon]]]]:
+        """Decode a single chunk of a columnar checkpoint without scanning."""
+        chunk = ColumnarReader(path).read_chunk(position)
+        return chunk.index, chunk.tokens()
+
     def restore_to_workspace(self, path: Union[str, Path], consumer: EncodedPolygonConsumer) -> None:
         """Stream decoded chunks directly into a workspace consumer."""
         for chunk_index, tokens in self.load_stream(path):
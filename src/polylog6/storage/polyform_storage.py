@@ -1,131 +1,205 @@
 """Storage system for polyforms using tiered Unicode compression."""
 from .encoder import TieredUnicodeEncoder
+from .segment_store import SegmentStore
 import json
-import mmap
+import os
+import threading
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+MMAP_PREFIX = "mmap:"
+# Environment variable naming the segment-store directory behind the API routes.
+STORE_ENV = "POLYLOG_POLYFORM_STORE"
+
+
 class PolyformStorage:
-    """Stores polyforms with efficient Unicode-based compression."""
+    """Stores polyforms with efficient Unicode-based compression.
+
+    With ``use_mmap=True`` records live in a :class:`SegmentStore` directory at
+    ``storage_path``: payloads stay in memory-mapped segment files, lookups by
+    symbol and composition go through persistent indexes, and reopening the
+    directory restores the catalog without rebuilding it. ``readonly=True``
+    opens an existing directory as an additional reader next to the writer.
+    Instances may be shared between threads; symbol allocation, writes and
+    catalog scans are serialised by an internal lock.
+    """
     
-    def __init__(self, use_mmap=False, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        use_mmap=False,
+        storage_path: Optional[Path] = None,
+        *,
+        readonly: bool = False,
+        segment_bytes: int = 64 << 20,
+    ):
         self.encoder = TieredUnicodeEncoder()
         self.store = {}
         self.metadata = {}
         self.use_mmap = use_mmap
-        self._mmap_data = {}  # Track mmap data positions and sizes
+        self.segments: Optional[SegmentStore] = None
+        self._lock = threading.RLock()
         
         if storage_path is None:
             storage_path = Path("polyform_store.dat")
-        self.storage_path = storage_path
+        self.storage_path = Path(storage_path)
         
         if use_mmap:
-            self.file = open(storage_path, "w+b")
-            # Initialize file with some data to allow mmap
-            self.file.write(b'\x00' * 1024)  # Write 1KB of null bytes
-            self.file.flush()
-            self.file.seek(0)
-            self.mmap = mmap.mmap(self.file.fileno(), 0)
+            self.segments = SegmentStore(self.storage_path, readonly=readonly, segment_bytes=segment_bytes)
+            # Saved records are keyed by their symbols; never hand those out again.
+            self.encoder.reserve(self.segments.keys())
+    
+    def close(self) -> None:
+        """Release memory maps and the writer lock of the mmap backend."""
+        if self.segments is not None:
+            self.segments.close()
     
     def add(self, polyform_id: str, data: dict, frequency: int) -> str:
         """Add a polyform to storage."""
-        symbol = self.encoder.allocate(polyform_id, frequency)
-        
-        # Store metadata
-        self.metadata[symbol] = {
+        metadata = {
             "polyform_id": polyform_id,
             "frequency": frequency,
             "created_at": json.dumps({"timestamp": "now"}),  # Simplified
             "compression_ratio": data.get("compression_ratio", 0)
         }
         
-        if self.use_mmap:
-            # Store in memory-mapped file
-            pos = self.mmap.tell()
-            json_data = json.dumps(data).encode('utf-8')
-            self.mmap.write(json_data)
-            
-            # Track data position and size for retrieval
-            self._mmap_data[symbol] = {
-                "pos": pos,
-                "size": len(json_data)
-            }
-            
-            return f"mmap:{pos}"
-        else:
+        with self._lock:
+            symbol = self.encoder.allocate(polyform_id, frequency)
+            if self.segments is not None:
+                self._put_record(symbol, polyform_id, data, metadata)
+                return f"{MMAP_PREFIX}{symbol}"
+            self.metadata[symbol] = metadata
             self.store[symbol] = data
             return symbol
     
     def get(self, symbol: str) -> Optional[dict]:
         """Retrieve polyform data by symbol."""
-        if symbol.startswith("mmap:"):
-            pos = int(symbol[5:])
-            # Find the corresponding symbol to get size
-            data_size = None
-            for sym, info in self._mmap_data.items():
-                if info["pos"] == pos:
-                    data_size = info["size"]
-                    break
-            
-            if data_size is None:
-                return None
-                
-            self.mmap.seek(pos)
-            data = self.mmap.read(data_size)
-            return json.loads(data.decode('utf-8'))
-        else:
-            return self.store.get(symbol)
+        if self.segments is not None:
+            record = self._get_record(_strip_mmap_prefix(symbol))
+            return record["data"] if record is not None else None
+        return self.store.get(symbol)
     
     def get_metadata(self, symbol: str) -> Optional[dict]:
         """Get metadata for a stored polyform."""
+        if self.segments is not None:
+            record = self._get_record(_strip_mmap_prefix(symbol))
+            return record["metadata"] if record is not None else None
         return self.metadata.get(symbol)
     
     def list_all(self) -> List[Dict[str, Any]]:
         """List all stored polyforms with metadata."""
-        results = []
-        for symbol, data in self.store.items():
-            metadata = self.metadata.get(symbol, {})
-            results.append({
-                "symbol": symbol,
-                "metadata": metadata,
-                "geometry": data.get("geometry", {}),
-                "composition": data.get("composition", "")
-            })
-        return results
+        with self._lock:
+            results = []
+            for symbol, data, metadata in self._iter_records():
+                results.append({
+                    "symbol": symbol,
+                    "metadata": metadata,
+                    "geometry": data.get("geometry", {}),
+                    "composition": data.get("composition", "")
+                })
+            return results
     
     def get_by_composition(self, composition: str) -> Optional[dict]:
         """Find polyform by composition string."""
-        for symbol, metadata in self.metadata.items():
-            if metadata.get("polyform_id") == composition:
-                return self.get(symbol)
-        return None
+        with self._lock:
+            if self.segments is not None:
+                symbols = self.segments.keys_for_composition(composition)
+                return self.get(symbols[0]) if symbols else None
+            for symbol, metadata in self.metadata.items():
+                if metadata.get("polyform_id") == composition:
+                    return self.get(symbol)
+            return None
     
     def update_frequency(self, symbol: str, new_frequency: int) -> bool:
         """Update frequency for a stored polyform."""
-        if symbol in self.metadata:
-            self.metadata[symbol]["frequency"] = new_frequency
-            return True
-        return False
+        with self._lock:
+            if self.segments is not None:
+                symbol = _strip_mmap_prefix(symbol)
+                record = self._get_record(symbol)
+                if record is None:
+                    return False
+                record["metadata"]["frequency"] = new_frequency
+                self._put_record(symbol, record["metadata"].get("polyform_id", ""), record["data"], record["metadata"])
+                return True
+            if symbol in self.metadata:
+                self.metadata[symbol]["frequency"] = new_frequency
+                return True
+            return False
     
     def delete(self, symbol: str) -> bool:
         """Delete a polyform from storage."""
-        if symbol in self.store:
-            del self.store[symbol]
-            if symbol in self.metadata:
-                del self.metadata[symbol]
-            return True
-        return False
+        with self._lock:
+            if self.segments is not None:
+                return self.segments.delete(_strip_mmap_prefix(symbol))
+            if symbol in self.store:
+                del self.store[symbol]
+                if symbol in self.metadata:
+                    del self.metadata[symbol]
+                return True
+            return False
     
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
-        total_polyforms = len(self.store)
-        avg_compression = 0
-        if self.metadata:
-            ratios = [m.get("compression_ratio", 0) for m in self.metadata.values()]
-            avg_compression = sum(ratios) / len(ratios) if ratios else 0
+        with self._lock:
+            if self.segments is not None:
+                total_polyforms = len(self.segments)
+                ratios = [metadata.get("compression_ratio", 0) for _, _, metadata in self._iter_records()]
+            else:
+                total_polyforms = len(self.store)
+                ratios = [m.get("compression_ratio", 0) for m in self.metadata.values()]
+        avg_compression = sum(ratios) / len(ratios) if ratios else 0
         
         return {
             "total_polyforms": total_polyforms,
             "average_compression_ratio": avg_compression,
             "storage_type": "mmap" if self.use_mmap else "memory"
-        }
\ No newline at end of file
+        }
+    
+    # ------------------------------------------------------------------
+    # mmap backend helpers
+    # ------------------------------------------------------------------
+    def _put_record(self, symbol: str, composition: str, data: dict, metadata: dict) -> None:
+        payload = json.dumps({"data": data, "metadata": metadata}).encode("utf-8")
+        self.segments.put(symbol, payload, composition=composition)
+    
+    def _get_record(self, symbol: str) -> Optional[dict]:
+        payload = self.segments.get(symbol)
+        if payload is None:
+            return None
+        return json.loads(payload)
+    
+    def _iter_records(self):
+        if self.segments is None:
+            for symbol, data in self.store.items():
+                yield symbol, data, self.metadata.get(symbol, {})
+            return
+        for symbol in self.segments.keys():
+            record = self._get_record(symbol)
+            if record is not None:
+                yield symbol, record["data"], record["metadata"]
+
+
+def _strip_mmap_prefix(symbol: str) -> str:
+    return symbol[len(MMAP_PREFIX):] if symbol.startswith(MMAP_PREFIX) else symbol
+
+
+_shared_storage: Optional[PolyformStorage] = None
+_shared_storage_lock = threading.Lock()
+
+
+def shared_polyform_storage() -> PolyformStorage:
+    """Return the process-wide store used by the API routes.
+
+    ``POLYLOG_POLYFORM_STORE`` selects a segment-store directory for the mmap
+    backend; otherwise an in-memory store is used. The store is opened on first
+    call, so importing the API modules never takes the segment-store writer lock.
+    """
+    global _shared_storage
+    if _shared_storage is None:
+        with _shared_storage_lock:
+            if _shared_storage is None:
+                path = os.environ.get(STORE_ENV)
+                if path:
+                    _shared_storage = PolyformStorage(use_mmap=True, storage_path=Path(path))
+                else:
+                    _shared_storage = PolyformStorage()
+    return _shared_storage
\ No newline at end of file
@@ -0,0 +1,381 @@
+"""Memory-mapped segment store for large polyform payload collections.
+
+Values are appended to segment files (``segment-00000.seg``, ...) that grow
+until ``segment_bytes`` and then roll over to a new segment. Every write also
+appends a fixed-layout entry to ``index.log``::
+
+    header   magic, version
+    entry*   flags, key length, composition length, segment, offset, length,
+             key bytes, composition bytes
+
+The index log is replayed on open, so reopening a store never rescans segment
+data; lookups by key and by composition are dictionary hits that resolve to a
+``(segment, offset, length)`` slice of a read-only memory map. Payload bytes
+therefore stay in the page cache rather than the Python heap.
+
+A single writer is enforced with an exclusive ``flock``; any number of
+``readonly=True`` instances may open the same directory and pick up newly
+committed records with :meth:`SegmentStore.refresh`. Within a process the
+store is safe to share between threads: appends, refreshes and reads are
+serialised by an internal lock. Data is written before
+its index entry, so readers never observe an entry whose payload is missing,
+and a torn trailing index entry is ignored by readers and truncated by the
+next writer.
+"""
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+SEGMENT_INDEX_MAGIC = b"PLGSEGIX"
+SEGMENT_INDEX_VERSION = 1
+
+_INDEX_HEADER = struct.Struct("<8sI")
+# flags, key length, composition length, segment, offset, length
+_INDEX_ENTRY = struct.Struct("<BHHIQI")
+_FLAG_PUT = 0
+_FLAG_DELETE = 1
+
+_SEGMENT_PATTERN = "segment-{:05d}.seg"
+
+
+@dataclass(frozen=True, slots=True)
+class RecordLocation:
+    """Position of a stored value inside the segment files."""
+
+    segment: int
+    offset: int
+    length: int
+
+
+class SegmentStore:
+    """Append-only key/value store over growable memory-mapped segments."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        *,
+        segment_bytes: int = 64 << 20,
+        readonly: bool = False,
+        sync: bool = False,
+    ) -> None:
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be positive")
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.readonly = readonly
+        self.sync = sync
+
+        self._index: Dict[str, RecordLocation] = {}
+        self._compositions: Dict[str, Dict[str, None]] = {}
+        self._composition_of: Dict[str, str] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._index_position = _INDEX_HEADER.size
+        self._lock_fd: Optional[int] = None
+        self._index_fd: Optional[int] = None
+        self._segment_fd: Optional[int] = None
+        self._segment_id = 0
+        self._segment_size = 0
+        self._closed = False
+        # Serialises appends (offset allocation), index updates and remaps.
+        self._mutex = threading.RLock()
+
+        if readonly:
+            if not self.index_path.exists():
+                raise FileNotFoundError(f"No segment store at {self.directory}")
+            self.refresh()
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._acquire_writer_lock()
+            self._open_writer()
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+    @property
+    def index_path(self) -> Path:
+        return self.directory / "index.log"
+
+    def segment_path(self, segment: int) -> Path:
+        return self.directory / _SEGMENT_PATTERN.format(segment)
+
+    # ------------------------------------------------------------------
+    # Mapping-style API
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def keys(self) -> Iterator[str]:
+        with self._mutex:
+            return iter(list(self._index))
+
+    def location(self, key: str) -> Optional[RecordLocation]:
+        return self._index.get(key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the latest value stored for ``key`` (``None`` if absent)."""
+
+        with self._mutex:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            return self._read(location)
+
+    def keys_for_composition(self, composition: str) -> List[str]:
+        with self._mutex:
+            return list(self._compositions.get(composition, ()))
+
+    def composition_of(self, key: str) -> Optional[str]:
+        return self._composition_of.get(key)
+
+    # ------------------------------------------------------------------
+    # Writer API
+    # ------------------------------------------------------------------
+    def put(self, key: str, value: bytes, *, composition: Optional[str] = None) -> RecordLocation:
+        """Append ``value`` under ``key``; later puts supersede earlier ones."""
+
+        with self._mutex:
+            self._require_writer()
+            if self._segment_size and self._segment_size + len(value) > self.segment_bytes:
+                self._roll_segment()
+            assert self._segment_fd is not None
+            offset = self._segment_size
+            _write_all(self._segment_fd, value)
+            self._segment_size += len(value)
+            location = RecordLocation(self._segment_id, offset, len(value))
+            if self.sync:
+                os.fsync(self._segment_fd)
+            self._append_entry(_FLAG_PUT, key, composition or "", location)
+            self._apply(_FLAG_PUT, key, composition or "", location)
+            return location
+
+    def delete(self, key: str) -> bool:
+        with self._mutex:
+            self._require_writer()
+            if key not in self._index:
+                return False
+            location = RecordLocation(0, 0, 0)
+            self._append_entry(_FLAG_DELETE, key, "", location)
+            self._apply(_FLAG_DELETE, key, "", location)
+            return True
+
+    def flush(self) -> None:
+        """Force segment data and index entries to stable storage."""
+
+        for fd in (self._segment_fd, self._index_fd):
+            if fd is not None:
+                os.fsync(fd)
+
+    # ------------------------------------------------------------------
+    # Reader API
+    # ------------------------------------------------------------------
+    def refresh(self) -> int:
+        """Apply index entries committed since the last refresh.
+
+        Returns the number of entries applied. Writers never need to call
+        this; readers call it to observe new records.
+        """
+
+        with self._mutex:
+            try:
+                with self.index_path.open("rb") as handle:
+                    if self._index_position == _INDEX_HEADER.size:
+                        self._check_header(handle.read(_INDEX_HEADER.size))
+                    handle.seek(self._index_position)
+                    data = handle.read()
+            except FileNotFoundError:
+                return 0
+            applied, consumed = self._replay(data)
+            self._index_position += consumed
+            return applied
+
+    def close(self) -> None:
+        with self._mutex:
+            if self._closed:
+                return
+            self._closed = True
+            for mapping in self._maps.values():
+                mapping.close()
+            self._maps.clear()
+            for fd in (self._segment_fd, self._index_fd):
+                if fd is not None:
+                    os.close(fd)
+            self._segment_fd = self._index_fd = None
+            if self._lock_fd is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def __enter__(self) -> "SegmentStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        segments = sorted(self.directory.glob("segment-*.seg"))
+        return {
+            "records": len(self._index),
+            "compositions": len(self._compositions),
+            "segments": len(segments),
+            "segment_bytes": sum(path.stat().st_size for path in segments),
+            "index_bytes": self.index_path.stat().st_size if self.index_path.exists() else 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _require_writer(self) -> None:
+        if self.readonly:
+            raise PermissionError("SegmentStore opened read-only")
+        if self._closed:
+            raise ValueError("SegmentStore is closed")
+
+    def _acquire_writer_lock(self) -> None:
+        fd = os.open(self.directory / "writer.lock", os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(f"Another writer holds {self.directory}") from None
+        self._lock_fd = fd
+
+    def _open_writer(self) -> None:
+        fd = os.open(self.index_path, os.O_CREAT | os.O_RDWR, 0o644)
+        size = os.fstat(fd).st_size
+        if size == 0:
+            _write_all(fd, _INDEX_HEADER.pack(SEGMENT_INDEX_MAGIC, SEGMENT_INDEX_VERSION))
+        else:
+            header = os.pread(fd, _INDEX_HEADER.size, 0)
+            self._check_header(header)
+            data = os.pread(fd, size - _INDEX_HEADER.size, _INDEX_HEADER.size)
+            _, consumed = self._replay(data)
+            self._index_position += consumed
+            if self._index_position < size:
+                # Drop a torn or dangling tail left by an interrupted writer.
+                os.ftruncate(fd, self._index_position)
+        os.close(fd)
+        self._index_fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND)
+
+        existing = sorted(int(path.stem.split("-")[1]) for path in self.directory.glob("segment-*.seg"))
+        self._segment_id = existing[-1] if existing else 0
+        self._open_segment(self._segment_id)
+
+    def _open_segment(self, segment: int) -> None:
+        if self._segment_fd is not None:
+            os.close(self._segment_fd)
+        self._segment_fd = os.open(self.segment_path(segment), os.O_CREAT | os.O_WRONLY | os.O_APPEND, 0o644)
+        self._segment_id = segment
+        self._segment_size = os.fstat(self._segment_fd).st_size
+
+    def _roll_segment(self) -> None:
+        if self.sync and self._segment_fd is not None:
+            os.fsync(self._segment_fd)
+        self._open_segment(self._segment_id + 1)
+
+    def _check_header(self, header: bytes) -> None:
+        if len(header) < _INDEX_HEADER.size:
+            raise ValueError(f"{self.index_path} is truncated")
+        magic, version = _INDEX_HEADER.unpack(header)
+        if magic != SEGMENT_INDEX_MAGIC:
+            raise ValueError(f"{self.index_path} is not a segment store index")
+        if version != SEGMENT_INDEX_VERSION:
+            raise ValueError(f"Unsupported segment index version: {version}")
+
+    def _append_entry(self, flags: int, key: str, composition: str, location: RecordLocation) -> None:
+        key_bytes = key.encode("utf-8")
+        composition_bytes = composition.encode("utf-8")
+        entry = (
+            _INDEX_ENTRY.pack(
+                flags,
+                len(key_bytes),
+                len(composition_bytes),
+                location.segment,
+                location.offset,
+                location.length,
+            )
+            + key_bytes
+            + composition_bytes
+        )
+        assert self._index_fd is not None
+        _write_all(self._index_fd, entry)
+        if self.sync:
+            os.fsync(self._index_fd)
+        self._index_position += len(entry)
+
+    def _replay(self, data: bytes) -> Tuple[int, int]:
+        view = memoryview(data)
+        position = 0
+        applied = 0
+        segment_sizes: Dict[int, int] = {}
+        while position + _INDEX_ENTRY.size <= len(view):
+            flags, key_len, composition_len, segment, offset, length = _INDEX_ENTRY.unpack_from(view, position)
+            end = position + _INDEX_ENTRY.size + key_len + composition_len
+            if end > len(view):
+                break
+            if flags == _FLAG_PUT:
+                if segment not in segment_sizes:
+                    path = self.segment_path(segment)
+                    segment_sizes[segment] = path.stat().st_size if path.exists() else 0
+                if offset + length > segment_sizes[segment]:
+                    break  # entry outlived its data (unsynced crash); stop here
+            key_start = position + _INDEX_ENTRY.size
+            key = bytes(view[key_start : key_start + key_len]).decode("utf-8")
+            composition = bytes(view[key_start + key_len : end]).decode("utf-8")
+            self._apply(flags, key, composition, RecordLocation(segment, offset, length))
+            applied += 1
+            position = end
+        return applied, position
+
+    def _apply(self, flags: int, key: str, composition: str, location: RecordLocation) -> None:
+        previous = self._composition_of.pop(key, None)
+        if previous is not None:
+            keys = self._compositions.get(previous)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._compositions[previous]
+        if flags == _FLAG_DELETE:
+            self._index.pop(key, None)
+            return
+        self._index[key] = location
+        if composition:
+            self._compositions.setdefault(composition, {})[key] = None
+            self._composition_of[key] = composition
+
+    def _read(self, location: RecordLocation) -> bytes:
+        if location.length == 0:
+            return b""
+        end = location.offset + location.length
+        mapping = self._maps.get(location.segment)
+        if mapping is None or len(mapping) < end:
+            mapping = self._remap(location.segment)
+        return mapping[location.offset : end]
+
+    def _remap(self, segment: int) -> mmap.mmap:
+        previous = self._maps.pop(segment, None)
+        if previous is not None:
+            previous.close()
+        with self.segment_path(segment).open("rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[segment] = mapping
+        return mapping
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+__all__ = ["RecordLocation", "SEGMENT_INDEX_MAGIC", "SegmentStore"]
@@ -17,6 +17,12 @@ from typing import Dict, Iterable, List, Optional, Tuple
 
 from .descriptors import to_subscript
 from .tier0_generator import ConnectivityChain, Tier0Generator
+from .tier0_index import (
+    MappedCatalogView,
+    MappedFirstPolygonView,
+    MappedTier0Index,
+    load_shared_tier0_index,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -43,7 +49,13 @@ _PRIMARY_SYMBOL_ORDER: List[Tuple[str, int]] = [
 ]
 
 class EdgeConnectivityIndex:
-    """Tier 0 lookup index backed by the hierarchical generator."""
+    """Tier 0 lookup index backed by the hierarchical generator.
+
+    By default the index is served from the shared memory-mapped Tier 0 file
+    (see :mod:`polylog6.storage.tier0_index`) so that every registry in every
+    process reads the same pages. Passing an explicit ``generator`` keeps the
+    previous fully in-memory behaviour.
+    """
 
     __slots__ = (
         "generator",
@@ -52,36 +64,51 @@ class EdgeConnectivityIndex:
         "by_chain_length",
         "by_series_pair",
         "primary_by_edges",
+        "edges_by_primary",
         "symbol_to_edges",
     )
 
-    def __init__(self, generator: Tier0Generator | None = None) -> None:
-        self.generator = generator or Tier0Generator()
-        self.catalog = self.generator.generate_all()
-        self.by_edges = self.generator.by_edges
-        self.by_chain_length = self.generator.by_chain_length
-        self.by_series_pair = self.generator.by_series_pair
+    def __init__(
+        self,
+        generator: Tier0Generator | None = None,
+        *,
+        mapped: MappedTier0Index | None = None,
+    ) -> None:
+        self.generator = generator
+        if generator is None:
+            mapped = mapped or load_shared_tier0_index()
+            self.catalog = MappedCatalogView(mapped)
+            self.by_edges = mapped.section("by_edges")
+            self.by_chain_length = mapped.section("by_chain_length")
+            self.by_series_pair = mapped.section("by_series_pair")
+            self.symbol_to_edges = MappedFirstPolygonView(mapped)
+        else:
+            self.catalog = generator.generate_all()
+            self.by_edges = generator.by_edges
+            self.by_chain_length = generator.by_chain_length
+            self.by_series_pair = generator.by_series_pair
+            self.symbol_to_edges = {symbol: chain.polygons[0] for symbol, chain in self.catalog.items()}
 
         # Maintain primitive ordering for compatibility with prior Tier 0 table.
         self.primary_by_edges: Dict[int, str] = {}
-        self.symbol_to_edges: Dict[str, int] = {}
-
-        for symbol, chain in self.catalog.items():
-            for edges in chain.polygons:
-                self.symbol_to_edges[symbol] = chain.polygons[0]
-
-            if len(chain.polygons) == 1:
-                edges = chain.polygons[0]
-                if edges not in self.primary_by_edges:
-                    self.primary_by_edges[edges] = symbol
+        for symbol in self.by_chain_length.get(1, ()):
+            edges = self.symbol_to_edges[symbol]
+            if edges not in self.primary_by_edges:
+                self.primary_by_edges[edges] = symbol
 
         # Override ordering with legacy canonical sequence to avoid churn.
         for raw_symbol, edges in _PRIMARY_SYMBOL_ORDER:
             self.primary_by_edges[edges] = raw_symbol
+        self.edges_by_primary: Dict[str, int] = {symbol: edges for edges, symbol in self.primary_by_edges.items()}
 
     @staticmethod
     def default() -> "EdgeConnectivityIndex":
-        return EdgeConnectivityIndex()
+        """Return the process-wide index shared by default registries."""
+
+        global _SHARED_EDGE_INDEX
+        if _SHARED_EDGE_INDEX is None:
+            _SHARED_EDGE_INDEX = EdgeConnectivityIndex()
+        return _SHARED_EDGE_INDEX
 
     def lookup_by_edges(self, edge_count: int) -> List[str]:
         return list(self.by_edges.get(edge_count, ()))
@@ -99,11 +126,18 @@ class EdgeConnectivityIndex:
         return self.primary_by_edges[edge_count]
 
     def edges_for_symbol(self, symbol: str) -> int:
-        key = symbol.lower()
-        chain = self.catalog.get(key)
-        if not chain:
+        edges = self.symbol_to_edges.get(symbol.lower())
+        if edges is None:
             raise ValueError(f"Unknown Tier 0 symbol: {symbol}")
-        return chain.polygons[0]
+        return edges
+
+    def primitive_edges(self, symbol: str) -> int:
+        """Invert :meth:`primary_symbol`, falling back to the catalog chain."""
+
+        edges = self.edges_by_primary.get(symbol.lower())
+        if edges is None:
+            return self.edges_for_symbol(symbol)
+        return edges
 
     def get_chain(self, symbol: str) -> Optional[ConnectivityChain]:
         return self.catalog.get(symbol.lower())
@@ -113,6 +147,9 @@ class EdgeConnectivityIndex:
             yield edges, self.primary_by_edges[edges]
 
 
+_SHARED_EDGE_INDEX: Optional[EdgeConnectivityIndex] = None
+
+
 def _new_edge_index() -> EdgeConnectivityIndex:
     return EdgeConnectivityIndex.default()
 
@@ -303,7 +340,7 @@ class SymbolRegistry:
 
     def primitive_sides(self, symbol: str) -> int:
         """Resolve the number of sides from a Tier 0 symbol."""
-        return self.tier0_index.edges_for_symbol(symbol)
+        return self.tier0_index.primitive_edges(symbol)
 
     def pair_symbol(self, first: str, second: str) -> Optional[str]:
         """Return the predefined symbol for a primitive pair."""
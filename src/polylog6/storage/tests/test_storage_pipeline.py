@@ -137,6 +137,47 @@ def test_decoder_handles_module_references() -> None:
     assert tokens[1] == ("polygon", polygon)
 
 
+def test_bulk_codec_is_bit_exact_with_scalar_codec() -> None:
+    pytest.importorskip("numpy")
+    encoder = PolyformEncoder()
+    decoder = PolyformDecoder(registry=encoder.registry)
+    module = encoder.encode_module_reference(7)
+
+    # Normal-range values stay on the vectorised path.
+    normal = encoder.encode_polygons(_generate_polygons(2_000)) + module
+    bulk = decoder._decode_bulk(normal)
+    assert bulk is not None
+    assert bulk.tokens() == decoder._decode_scalar(normal)
+
+    # Zigzag values wider than the bulk digit budget fall back to scalar.
+    polygons = _generate_polygons(2_000) + [
+        EncodedPolygon(8, 300, 2**20, (-(2**40), 2**63 - 1, -(2**63))),
+    ]
+    payload = encoder.encode_polygons(polygons)
+    assert payload == "".join(encoder._encode_polygon(polygon) for polygon in polygons)
+
+    payload += module
+    assert decoder.decode(payload) == decoder._decode_scalar(payload)
+
+    columns = decoder.decode_columns(payload)
+    assert len(columns) == len(polygons)
+    assert columns.modules == [(len(polygons), 7)]
+    assert columns.polygons() == polygons
+    assert encoder.encode_columns(columns) == payload[: -len(module)]
+
+
+def test_bulk_decoder_reports_scalar_errors() -> None:
+    pytest.importorskip("numpy")
+    encoder = PolyformEncoder()
+    decoder = PolyformDecoder(registry=encoder.registry)
+    payload = encoder.encode_polygons(_generate_polygons(200))
+
+    with pytest.raises(ValueError, match="Invalid VLQ sequence"):
+        decoder.decode(payload[:-1])
+    with pytest.raises(ValueError, match="Unexpected token"):
+        decoder.decode(payload + "X")
+
+
 class _Producer(EncodedPolygonProducer):
     def __init__(self, polygons: Iterable[EncodedPolygon]):
         self._polygons = list(polygons)
@@ -325,3 +366,47 @@ def test_storage_compression_efficiency(
     original_state = manager.encoder.registry.export_state()
     restored_state = restore.encoder.registry.export_state()
     assert original_state == restored_state
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma"])
+def test_columnar_format_roundtrip(tmp_path: pytest.TempPathFactory, compression) -> None:
+    base = tmp_path / f"columnar-{compression}"
+    polygons = _generate_polygons(1000) + [EncodedPolygon(6, 400, 70000, (-(2**40), 2**33, -1))]
+
+    manager = PolyformStorageManager(
+        base, chunk_size=128, snapshot_interval=2, storage_format="columnar", compression=compression
+    )
+    cluster_symbol = manager.encoder.registry.allocate_cluster("columnar-signature")
+    path = manager.save_workspace("workspace", _Producer(polygons))
+    assert path.suffix == ".pcol"
+
+    restore = PolyformStorageManager(base, chunk_size=128)
+    consumer = _ChunkCapture()
+    restore.restore_to_workspace(path, consumer)
+
+    assert consumer.received is not None
+    assert [index for index, _ in consumer.received] == list(range(math.ceil(len(polygons) / 128)))
+    replayed = [payload for _, tokens in consumer.received for token, payload in tokens if token == "polygon"]
+    assert replayed == polygons
+    assert restore.encoder.registry.get_cluster_signature(cluster_symbol) == "columnar-signature"
+
+
+def test_columnar_random_chunk_access(tmp_path: pytest.TempPathFactory) -> None:
+    polygons = _generate_polygons(300)
+    manager = PolyformStorageManager(tmp_path, chunk_size=64, storage_format="columnar", compression="zlib")
+    path = manager.save_workspace("workspace", _Producer(polygons))
+
+    chunk_index, tokens = manager.load_chunk(path, 3)
+
+    assert chunk_index == 3
+    assert [payload for _, payload in tokens] == polygons[192:256]
+
+
+def test_jsonl_format_still_default(tmp_path: pytest.TempPathFactory) -> None:
+    manager = PolyformStorageManager(tmp_path, chunk_size=4)
+    path = manager.save_workspace("workspace", _Producer(_sample_polygons()))
+
+    assert path.suffix == ".jsonl"
+    assert manager.read_meta(path)["type"] == "meta"
+    with pytest.raises(ValueError):
+        PolyformStorageManager(tmp_path, compression="zlib")
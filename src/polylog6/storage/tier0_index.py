@@ -0,0 +1,420 @@
+"""Prebuilt, memory-mapped Tier 0 catalog index.
+
+The Tier 0 vocabulary is fully determined by ``SERIES_TABLE``, so rather than
+regenerating it in every process we serialise it once into a compact binary
+file and map it read-only. All registries (and all forked API workers) then
+share one physical copy of the catalog through the page cache.
+
+File layout (little endian)::
+
+    header      magic, version, record size, record count, table fingerprint,
+                section descriptors
+    records     fixed-width chain records in generation order
+    symbols     (symbol, record id) pairs sorted by symbol for bisection
+    sections    one directory per secondary index: (key, start, count)
+    postings    uint16 record ids referenced by the section directories
+
+Secondary indexes mirror the dictionaries exposed by :class:`Tier0Generator`:
+``by_edges``, ``by_chain_length``, ``by_series_pair`` and ``by_third_series``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .tier0_generator import SERIES_TABLE, ConnectivityChain, Tier0Generator
+
+LOGGER = logging.getLogger(__name__)
+
+TIER0_INDEX_MAGIC = b"PLT0IDX\x00"
+TIER0_INDEX_VERSION = 1
+DEFAULT_TIER0_INDEX_PATH = Path(__file__).resolve().parents[3] / "storage" / "caches" / "tier0_index.bin"
+
+SECTION_NAMES: Tuple[str, ...] = ("by_edges", "by_chain_length", "by_series_pair", "by_third_series")
+
+# magic, version, record_size, record_count, fingerprint, then per-section
+# (directory offset, directory entries) followed by symbol/postings offsets.
+_HEADER = struct.Struct("<8sHHI16s" + "II" * len(SECTION_NAMES) + "II")
+# symbol, chain length, polygons[3], positions[3], series[3], padding.
+_RECORD = struct.Struct("<4sB3B3B3s2x")
+_SYMBOL_ENTRY = struct.Struct("<4sH2x")
+_DIRECTORY_ENTRY = struct.Struct("<4sII")
+_POSTING = struct.Struct("<H")
+
+SectionKey = Union[int, str, Tuple[str, str]]
+
+
+def series_table_fingerprint() -> bytes:
+    """Return a digest of ``SERIES_TABLE`` used to detect stale index files."""
+
+    serialized = json.dumps(SERIES_TABLE, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(serialized, digest_size=16).digest()
+
+
+def _encode_key(section: str, key: SectionKey) -> bytes:
+    if section in ("by_edges", "by_chain_length"):
+        return struct.pack("<I", int(key))
+    if section == "by_series_pair":
+        first, second = key  # type: ignore[misc]
+        return f"{first}{second}".upper().encode("ascii")
+    return str(key).upper().encode("ascii")
+
+
+def _decode_key(section: str, raw: bytes) -> SectionKey:
+    if section in ("by_edges", "by_chain_length"):
+        return struct.unpack("<I", raw)[0]
+    text = raw.rstrip(b"\x00").decode("ascii")
+    if section == "by_series_pair":
+        return (text[0], text[1])
+    return text
+
+
+def build_tier0_index_bytes(generator: Optional[Tier0Generator] = None) -> bytes:
+    """Serialise the Tier 0 catalog into the binary index format."""
+
+    generator = generator or Tier0Generator()
+    catalog = generator.generate_all()
+
+    record_ids: Dict[str, int] = {}
+    records = bytearray()
+    for record_id, (symbol, chain) in enumerate(catalog.items()):
+        record_ids[symbol] = record_id
+        length = len(chain.polygons)
+        padding = 3 - length
+        records += _RECORD.pack(
+            symbol.encode("ascii"),
+            length,
+            *chain.polygons,
+            *([0] * padding),
+            *chain.positions,
+            *([0] * padding),
+            "".join(chain.series).ljust(3, "\x00").encode("ascii"),
+        )
+
+    symbols = bytearray()
+    for symbol in sorted(record_ids):
+        symbols += _SYMBOL_ENTRY.pack(symbol.encode("ascii"), record_ids[symbol])
+
+    sources: Dict[str, Mapping[SectionKey, List[str]]] = {
+        "by_edges": generator.by_edges,
+        "by_chain_length": generator.by_chain_length,
+        "by_series_pair": generator.by_series_pair,
+        "by_third_series": generator.by_third_series,
+    }
+
+    directories: List[bytes] = []
+    directory_counts: List[int] = []
+    postings = bytearray()
+    posting_count = 0
+    for section in SECTION_NAMES:
+        directory = bytearray()
+        entries = sorted(sources[section].items(), key=lambda item: _encode_key(section, item[0]))
+        for key, bucket in entries:
+            directory += _DIRECTORY_ENTRY.pack(_encode_key(section, key), posting_count, len(bucket))
+            for symbol in bucket:
+                postings += _POSTING.pack(record_ids[symbol])
+            posting_count += len(bucket)
+        directories.append(bytes(directory))
+        directory_counts.append(len(entries))
+
+    offset = _HEADER.size + len(records)
+    symbols_offset = offset
+    offset += len(symbols)
+    section_fields: List[int] = []
+    for directory, count in zip(directories, directory_counts):
+        section_fields.extend((offset, count))
+        offset += len(directory)
+    postings_offset = offset
+
+    header = _HEADER.pack(
+        TIER0_INDEX_MAGIC,
+        TIER0_INDEX_VERSION,
+        _RECORD.size,
+        len(record_ids),
+        series_table_fingerprint(),
+        *section_fields,
+        symbols_offset,
+        postings_offset,
+    )
+    return b"".join((header, bytes(records), bytes(symbols), *directories, bytes(postings)))
+
+
+def build_tier0_index(path: Union[str, Path] = DEFAULT_TIER0_INDEX_PATH) -> Path:
+    """Write the Tier 0 index to ``path`` atomically and return the path."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = build_tier0_index_bytes()
+    fd, tmp_name = tempfile.mkstemp(prefix=target.name, suffix=".tmp", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return target
+
+
+class MappedTier0Index:
+    """Read-only view over a serialised Tier 0 index buffer."""
+
+    __slots__ = (
+        "path",
+        "record_count",
+        "_buffer",
+        "_mmap",
+        "_sections",
+        "_symbols_offset",
+        "_postings_offset",
+    )
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap], *, path: Optional[Path] = None) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Tier 0 index is truncated")
+        fields = _HEADER.unpack_from(buffer, 0)
+        magic, version, record_size, record_count, fingerprint = fields[:5]
+        if magic != TIER0_INDEX_MAGIC:
+            raise ValueError("Not a Tier 0 index file")
+        if version != TIER0_INDEX_VERSION or record_size != _RECORD.size:
+            raise ValueError(f"Unsupported Tier 0 index version: {version}")
+        if fingerprint != series_table_fingerprint():
+            raise ValueError("Tier 0 index was built from a different SERIES_TABLE")
+
+        section_fields = fields[5 : 5 + 2 * len(SECTION_NAMES)]
+        self._sections: Dict[str, Tuple[int, int]] = {
+            name: (section_fields[2 * i], section_fields[2 * i + 1]) for i, name in enumerate(SECTION_NAMES)
+        }
+        self._symbols_offset, self._postings_offset = fields[-2:]
+        self.record_count = record_count
+        self.path = path
+        self._buffer = memoryview(buffer)
+        self._mmap = buffer if isinstance(buffer, mmap.mmap) else None
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "MappedTier0Index":
+        """Map an index file read-only."""
+
+        source = Path(path)
+        with source.open("rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped, path=source)
+        except ValueError:
+            mapped.close()
+            raise
+
+    # ------------------------------------------------------------------
+    # Record access
+    # ------------------------------------------------------------------
+    def chain_at(self, record_id: int) -> ConnectivityChain:
+        raw_symbol, length, *rest = _RECORD.unpack_from(self._buffer, _HEADER.size + record_id * _RECORD.size)
+        polygons = list(rest[0:length])
+        positions = list(rest[3 : 3 + length])
+        series = list(rest[6][:length].decode("ascii"))
+        symbol = raw_symbol.rstrip(b"\x00").decode("ascii")
+        return ConnectivityChain(symbol=symbol.upper(), polygons=polygons, positions=positions, series=series)
+
+    def symbol_at(self, record_id: int) -> str:
+        offset = _HEADER.size + record_id * _RECORD.size
+        return bytes(self._buffer[offset : offset + 4]).rstrip(b"\x00").decode("ascii")
+
+    def first_polygon_at(self, record_id: int) -> int:
+        return self._buffer[_HEADER.size + record_id * _RECORD.size + 5]
+
+    def record_id(self, symbol: str) -> Optional[int]:
+        """Binary-search the sorted symbol table for ``symbol``."""
+
+        try:
+            needle = symbol.lower().encode("ascii").ljust(4, b"\x00")
+        except UnicodeEncodeError:
+            return None
+        if len(needle) != 4:
+            return None
+        lo, hi = 0, self.record_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = self._symbols_offset + mid * _SYMBOL_ENTRY.size
+            candidate = bytes(self._buffer[offset : offset + 4])
+            if candidate < needle:
+                lo = mid + 1
+            elif candidate > needle:
+                hi = mid
+            else:
+                return _SYMBOL_ENTRY.unpack_from(self._buffer, offset)[1]
+        return None
+
+    def get_chain(self, symbol: str) -> Optional[ConnectivityChain]:
+        record_id = self.record_id(symbol)
+        return None if record_id is None else self.chain_at(record_id)
+
+    def iter_symbols(self) -> Iterator[str]:
+        for record_id in range(self.record_count):
+            yield self.symbol_at(record_id)
+
+    # ------------------------------------------------------------------
+    # Secondary indexes
+    # ------------------------------------------------------------------
+    def _directory(self, section: str) -> Iterator[Tuple[bytes, int, int]]:
+        offset, count = self._sections[section]
+        return _DIRECTORY_ENTRY.iter_unpack(self._buffer[offset : offset + count * _DIRECTORY_ENTRY.size])
+
+    def _find(self, section: str, key: SectionKey) -> Optional[Tuple[int, int]]:
+        try:
+            needle = _encode_key(section, key).ljust(4, b"\x00")
+        except (TypeError, ValueError, UnicodeEncodeError):
+            return None
+        for raw_key, start, count in self._directory(section):
+            if raw_key == needle:
+                return start, count
+        return None
+
+    def _postings(self, start: int, count: int) -> List[str]:
+        base = self._postings_offset + start * _POSTING.size
+        window = self._buffer[base : base + count * _POSTING.size]
+        return [self.symbol_at(record_id) for (record_id,) in _POSTING.iter_unpack(window)]
+
+    def lookup(self, section: str, key: SectionKey) -> List[str]:
+        """Return the symbols listed under ``key`` in the given section."""
+
+        span = self._find(section, key)
+        return [] if span is None else self._postings(*span)
+
+    def section_keys(self, section: str) -> List[SectionKey]:
+        return [_decode_key(section, raw_key) for raw_key, _, _ in self._directory(section)]
+
+    def section(self, section: str) -> "_SectionView":
+        if section not in self._sections:
+            raise KeyError(section)
+        return _SectionView(self, section)
+
+
+class _SectionView(Mapping):
+    """Dictionary-like adapter exposing an index section as ``key -> [symbols]``."""
+
+    __slots__ = ("_index", "_section")
+
+    def __init__(self, index: MappedTier0Index, section: str) -> None:
+        self._index = index
+        self._section = section
+
+    def __getitem__(self, key: SectionKey) -> List[str]:
+        span = self._index._find(self._section, key)
+        if span is None:
+            raise KeyError(key)
+        return self._index._postings(*span)
+
+    def __contains__(self, key: object) -> bool:
+        return self._index._find(self._section, key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[SectionKey]:
+        return iter(self._index.section_keys(self._section))
+
+    def __len__(self) -> int:
+        return self._index._sections[self._section][1]
+
+
+class MappedCatalogView(Mapping):
+    """Dictionary-like adapter decoding ``symbol -> ConnectivityChain`` lazily."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: MappedTier0Index) -> None:
+        self._index = index
+
+    def __getitem__(self, symbol: str) -> ConnectivityChain:
+        record_id = self._index.record_id(symbol) if isinstance(symbol, str) and symbol == symbol.lower() else None
+        if record_id is None:
+            raise KeyError(symbol)
+        return self._index.chain_at(record_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._index.iter_symbols()
+
+    def __len__(self) -> int:
+        return self._index.record_count
+
+
+class MappedFirstPolygonView(Mapping):
+    """Dictionary-like adapter resolving ``symbol -> first polygon edge count``."""
+
+    __slots__ = ("_index",)
+
+    def __init__(self, index: MappedTier0Index) -> None:
+        self._index = index
+
+    def __getitem__(self, symbol: str) -> int:
+        record_id = self._index.record_id(symbol) if isinstance(symbol, str) and symbol == symbol.lower() else None
+        if record_id is None:
+            raise KeyError(symbol)
+        return self._index.first_polygon_at(record_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._index.iter_symbols()
+
+    def __len__(self) -> int:
+        return self._index.record_count
+
+
+_SHARED_LOCK = threading.Lock()
+_SHARED_INDEX: Optional[MappedTier0Index] = None
+
+
+def _resolve_index_path() -> Path:
+    override = os.getenv("POLYLOG_TIER0_INDEX_PATH")
+    return Path(override) if override else DEFAULT_TIER0_INDEX_PATH
+
+
+def _open_or_build(path: Path, builder: Callable[[Path], Path]) -> MappedTier0Index:
+    if path.exists():
+        try:
+            return MappedTier0Index.open(path)
+        except (OSError, ValueError) as exc:
+            LOGGER.info("Rebuilding Tier 0 index at %s: %s", path, exc)
+    try:
+        return MappedTier0Index.open(builder(path))
+    except OSError as exc:
+        LOGGER.warning("Tier 0 index unavailable at %s (%s); using in-memory copy", path, exc)
+        return MappedTier0Index(build_tier0_index_bytes())
+
+
+def load_shared_tier0_index() -> MappedTier0Index:
+    """Return the process-wide mapped Tier 0 index, building it on first use.
+
+    ``POLYLOG_TIER0_INDEX_PATH`` overrides the default location under
+    ``storage/caches``. When the file cannot be written (read-only deploys)
+    the index is built in memory instead.
+    """
+
+    global _SHARED_INDEX
+    if _SHARED_INDEX is None:
+        with _SHARED_LOCK:
+            if _SHARED_INDEX is None:
+                _SHARED_INDEX = _open_or_build(_resolve_index_path(), build_tier0_index)
+    return _SHARED_INDEX
+
+
+__all__ = [
+    "DEFAULT_TIER0_INDEX_PATH",
+    "MappedCatalogView",
+    "MappedFirstPolygonView",
+    "MappedTier0Index",
+    "SECTION_NAMES",
+    "TIER0_INDEX_MAGIC",
+    "TIER0_INDEX_VERSION",
+    "build_tier0_index",
+    "build_tier0_index_bytes",
+    "load_shared_tier0_index",
+    "series_table_fingerprint",
+]
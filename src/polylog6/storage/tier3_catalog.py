@@ -5,7 +5,7 @@ upcoming Tier 3 promotion pipeline. It focuses on:
 
 * Normalised candidate metadata (assembly graphs, stability metrics, status).
 * Deterministic Tier 3 symbol derivation shared by automation and tooling.
-* JSONL-backed storage for pending candidates and promoted symbols.
+* JSONL snapshots plus an append-only event log for candidates and symbols.
 * Hooks for probation tracking and promotion/demotion decision logging.
 
 Higher-level promotion workflows and registry integration will build on top of
@@ -16,10 +16,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
 
 import hashlib
+import heapq
 import json
+import os
+import tempfile
 
 __all__ = [
     "Tier3Candidate",
@@ -240,11 +243,25 @@ def candidate_to_symbol(candidate: Tier3Candidate, prefix: str = "Ω") -> str:
 
 
 # ---------------------------------------------------------------------------
-# JSONL-backed catalog
+# Event-log backed catalog
 # ---------------------------------------------------------------------------
 
 class Tier3Catalog:
-    """Persistent store for Tier 3 candidates and promoted symbols."""
+    """Persistent store for Tier 3 candidates and promoted symbols.
+
+    Mutations are appended to a write-ahead log (``tier3_catalog.wal.jsonl``)
+    as full-state upsert events, so every promote, demote or status change
+    costs time proportional to the affected candidate rather than the catalog.
+    The candidate and promoted JSONL files act as the snapshot; once
+    ``snapshot_interval`` events accumulate they are rewritten atomically and
+    the log is truncated. On start-up the snapshot is loaded and the log tail
+    after the snapshot sequence recorded in the manifest is replayed. Because
+    events carry full records, replaying an event twice is harmless, which
+    keeps recovery correct if a crash interrupts compaction.
+
+    Lookups by candidate id, by symbol and by candidate status are served from
+    in-memory indexes.
+    """
 
     def __init__(
         self,
@@ -252,49 +269,108 @@ class Tier3Catalog:
         base_path: Path,
         candidates_file: str = "tier3_candidates.jsonl",
         promoted_file: str = "tier3_promoted.jsonl",
+        log_file: str = "tier3_catalog.wal.jsonl",
+        manifest_file: str = "tier3_catalog.snapshot.json",
         candidate_flush_threshold: int = 16,
+        snapshot_interval: int = 4096,
+        sync_writes: bool = True,
     ) -> None:
         self.base_path = Path(base_path)
         self.candidates_path = self.base_path / candidates_file
         self.promoted_path = self.base_path / promoted_file
+        self.log_path = self.base_path / log_file
+        self.manifest_path = self.base_path / manifest_file
 
         self.base_path.mkdir(parents=True, exist_ok=True)
 
         self._candidates: Dict[str, Tier3Candidate] = {}
         self._promoted: Dict[str, Tier3Symbol] = {}
+        self._symbol_by_candidate: Dict[str, str] = {}
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._status_of: Dict[str, str] = {}
+        self._probation_heap: List[Tuple[datetime, str, str]] = []
+        self._probation_deadline: Dict[str, str] = {}
+
         self._candidate_flush_threshold = max(1, candidate_flush_threshold)
+        self._snapshot_interval = max(1, snapshot_interval)
+        self._sync_writes = sync_writes
+        self._pending: List[Dict[str, Any]] = []
         self._dirty_candidate_count = 0
+        self._sequence = 0
+        self._snapshot_sequence = 0
+        self._events_since_snapshot = 0
 
         self._load_candidates()
         self._load_promoted()
+        self._load_manifest()
+        self._replay_log()
 
     # ------------------------------------------------------------------
     # Public accessors
     # ------------------------------------------------------------------
     def upsert_candidate(self, candidate: Tier3Candidate) -> None:
-        self._candidates[candidate.candidate_id] = candidate
+        self._index_candidate(candidate)
+        self._queue_event({"op": "candidate", "candidate": candidate.to_dict()})
         self._dirty_candidate_count += 1
         if self._dirty_candidate_count >= self._candidate_flush_threshold:
-            self._write_candidates()
+            self._commit()
 
     def get_candidate(self, candidate_id: str) -> Optional[Tier3Candidate]:
         return self._candidates.get(candidate_id)
 
     def iter_candidates(self, *, statuses: Optional[Iterable[str]] = None) -> Iterator[Tier3Candidate]:
+        """Iterate candidates, optionally restricted to ``statuses``.
+
+        Status filtering uses the status index maintained by the catalog's own
+        mutators; candidates whose ``status`` is edited in place should be
+        passed back through :meth:`upsert_candidate`.
+        """
+
         if statuses is None:
             yield from self._candidates.values()
-        else:
-            allowed = set(statuses)
-            yield from (candidate for candidate in self._candidates.values() if candidate.status in allowed)
+            return
+        for status in dict.fromkeys(statuses):
+            # Materialise ids so callers may mutate the catalog while iterating.
+            for candidate_id in list(self._by_status.get(status, ())):
+                candidate = self._candidates.get(candidate_id)
+                if candidate is not None and candidate.status == status:
+                    yield candidate
 
     def iter_promoted(self) -> Iterator[Tier3Symbol]:
         yield from self._promoted.values()
 
     def get_promoted_symbol(self, candidate_id: str) -> Optional[Tier3Symbol]:
-        for symbol in self._promoted.values():
-            if symbol.candidate_id == candidate_id:
-                return symbol
-        return None
+        symbol = self._symbol_by_candidate.get(candidate_id)
+        if symbol is None:
+            return None
+        return self._promoted.get(symbol)
+
+    def get_symbol(self, symbol: str) -> Optional[Tier3Symbol]:
+        return self._promoted.get(symbol)
+
+    def expired_probation(self, current_time: Optional[datetime] = None) -> List[Tier3Candidate]:
+        """Return probation candidates whose window ended by ``current_time``.
+
+        Backed by a deadline heap, so the cost is proportional to the number
+        of expired candidates rather than the number on probation.
+        """
+
+        current_time = current_time or datetime.now(timezone.utc)
+        expired: List[Tier3Candidate] = []
+        entries: List[Tuple[datetime, str, str]] = []
+        heap = self._probation_heap
+        while heap and heap[0][0] <= current_time:
+            entry = heapq.heappop(heap)
+            candidate = self._candidates.get(entry[1])
+            if candidate is None or candidate.status != "probation" or candidate.probation_until != entry[2]:
+                continue  # stale entry superseded by a later mutation
+            if entries and entries[-1][1:] == entry[1:]:
+                continue
+            entries.append(entry)
+            expired.append(candidate)
+        for entry in entries:
+            heapq.heappush(heap, entry)
+        return expired
 
     def promote_candidate(
         self,
@@ -336,10 +412,12 @@ class Tier3Catalog:
             status="probation",
             metadata=metadata or {},
         )
-        self._promoted[symbol] = symbol_entry
+        self._index_candidate(candidate)
+        self._index_symbol(symbol_entry)
 
-        self._write_candidates()
-        self._write_promoted()
+        self._queue_event({"op": "candidate", "candidate": candidate.to_dict()})
+        self._queue_event({"op": "symbol", "symbol": symbol_entry.to_dict()})
+        self._commit()
         return symbol_entry
 
     def demote_candidate(
@@ -358,14 +436,14 @@ class Tier3Catalog:
             justification=justification or {},
             notes=notes,
         )
+        self._index_candidate(candidate)
+        self._queue_event({"op": "candidate", "candidate": candidate.to_dict()})
 
         # Remove any promoted entry tied to this candidate.
-        to_remove: List[str] = [symbol for symbol, entry in self._promoted.items() if entry.candidate_id == candidate_id]
-        for symbol in to_remove:
-            self._promoted.pop(symbol, None)
-
-        self._write_candidates()
-        self._write_promoted()
+        symbol = self._drop_symbol_for(candidate_id)
+        if symbol is not None:
+            self._queue_event({"op": "drop_symbol", "symbol": symbol})
+        self._commit()
 
     def mark_candidate_status(
         self,
@@ -380,13 +458,41 @@ class Tier3Catalog:
         if eligible_for_unicode is not None:
             candidate.eligible_for_unicode = eligible_for_unicode
         candidate.probation_until = probation_until
-        self._write_candidates()
+        self._index_candidate(candidate)
+        self._queue_event({"op": "candidate", "candidate": candidate.to_dict()})
+        self._commit()
 
     def flush(self) -> None:
-        """Persist in-memory catalog state to disk."""
+        """Persist any buffered events to the write-ahead log."""
 
-        self._write_candidates()
-        self._write_promoted()
+        self._commit()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot files from memory and truncate the log."""
+
+        self._write_log(self._pending)
+        self._pending = []
+        self._dirty_candidate_count = 0
+        _atomic_write_lines(
+            self.candidates_path,
+            (json.dumps(candidate.to_dict()) for candidate in self._candidates.values()),
+            sync=self._sync_writes,
+        )
+        _atomic_write_lines(
+            self.promoted_path,
+            (json.dumps(symbol.to_dict()) for symbol in self._promoted.values()),
+            sync=self._sync_writes,
+        )
+        _atomic_write_lines(
+            self.manifest_path,
+            [json.dumps({"sequence": self._sequence, "timestamp": now_iso()})],
+            sync=self._sync_writes,
+        )
+        # Events up to ``_sequence`` are now in the snapshot; a crash before
+        # truncation only means they are replayed (idempotently) next time.
+        _atomic_write_lines(self.log_path, [], sync=self._sync_writes)
+        self._snapshot_sequence = self._sequence
+        self._events_since_snapshot = 0
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -397,6 +503,80 @@ class Tier3Catalog:
             raise KeyError(f"Unknown Tier 3 candidate: {candidate_id}")
         return candidate
 
+    def _index_candidate(self, candidate: Tier3Candidate) -> None:
+        candidate_id = candidate.candidate_id
+        self._candidates[candidate_id] = candidate
+        previous = self._status_of.get(candidate_id)
+        if previous != candidate.status:
+            if previous is not None:
+                self._by_status.get(previous, {}).pop(candidate_id, None)
+            self._by_status.setdefault(candidate.status, {})[candidate_id] = None
+            self._status_of[candidate_id] = candidate.status
+        until = candidate.probation_until
+        if candidate.status != "probation" or not until:
+            self._probation_deadline.pop(candidate_id, None)
+            return
+        if self._probation_deadline.get(candidate_id) == until:
+            return
+        try:
+            deadline = parse_iso8601(until)
+        except ValueError:
+            return
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=timezone.utc)
+        self._probation_deadline[candidate_id] = until
+        heapq.heappush(self._probation_heap, (deadline, candidate_id, until))
+
+    def _index_symbol(self, symbol: Tier3Symbol) -> None:
+        previous = self._symbol_by_candidate.get(symbol.candidate_id)
+        if previous is not None and previous != symbol.symbol:
+            self._promoted.pop(previous, None)
+        self._promoted[symbol.symbol] = symbol
+        self._symbol_by_candidate[symbol.candidate_id] = symbol.symbol
+
+    def _drop_symbol_for(self, candidate_id: str) -> Optional[str]:
+        symbol = self._symbol_by_candidate.pop(candidate_id, None)
+        if symbol is not None:
+            self._promoted.pop(symbol, None)
+        return symbol
+
+    def _apply_event(self, event: MutableMapping[str, Any]) -> None:
+        op = event.get("op")
+        if op == "candidate":
+            self._index_candidate(Tier3Candidate.from_dict(event["candidate"]))
+        elif op == "symbol":
+            self._index_symbol(Tier3Symbol.from_dict(event["symbol"]))
+        elif op == "drop_symbol":
+            entry = self._promoted.get(str(event["symbol"]))
+            if entry is not None:
+                self._drop_symbol_for(entry.candidate_id)
+        else:
+            raise ValueError(f"Unknown Tier 3 catalog event: {op!r}")
+
+    def _queue_event(self, event: Dict[str, Any]) -> None:
+        self._sequence += 1
+        event["seq"] = self._sequence
+        self._pending.append(event)
+
+    def _commit(self) -> None:
+        if not self._pending:
+            return
+        self._write_log(self._pending)
+        self._events_since_snapshot += len(self._pending)
+        self._pending = []
+        self._dirty_candidate_count = 0
+        if self._events_since_snapshot >= self._snapshot_interval:
+            self.compact()
+
+    def _write_log(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        with self.log_path.open("a", encoding="utf-8") as stream:
+            stream.write("".join(json.dumps(event) + "\n" for event in events))
+            if self._sync_writes:
+                stream.flush()
+                os.fsync(stream.fileno())
+
     def _load_candidates(self) -> None:
         if not self.candidates_path.exists():
             return
@@ -406,8 +586,7 @@ class Tier3Catalog:
                 if not line:
                     continue
                 payload = json.loads(line)
-                candidate = Tier3Candidate.from_dict(payload)
-                self._candidates[candidate.candidate_id] = candidate
+                self._index_candidate(Tier3Candidate.from_dict(payload))
 
     def _load_promoted(self) -> None:
         if not self.promoted_path.exists():
@@ -418,18 +597,59 @@ class Tier3Catalog:
                 if not line:
                     continue
                 payload = json.loads(line)
-                symbol = Tier3Symbol.from_dict(payload)
-                self._promoted[symbol.symbol] = symbol
+                self._index_symbol(Tier3Symbol.from_dict(payload))
 
-    def _write_candidates(self) -> None:
-        with self.candidates_path.open("w", encoding="utf-8") as stream:
-            for candidate in self._candidates.values():
-                stream.write(json.dumps(candidate.to_dict()))
-                stream.write("\n")
-        self._dirty_candidate_count = 0
+    def _load_manifest(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        with self.manifest_path.open("r", encoding="utf-8") as stream:
+            manifest = json.load(stream)
+        self._snapshot_sequence = int(manifest.get("sequence", 0))
+        self._sequence = self._snapshot_sequence
 
-    def _write_promoted(self) -> None:
-        with self.promoted_path.open("w", encoding="utf-8") as stream:
-            for symbol in self._promoted.values():
-                stream.write(json.dumps(symbol.to_dict()))
+    def _replay_log(self) -> None:
+        if not self.log_path.exists():
+            return
+        with self.log_path.open("r", encoding="utf-8") as stream:
+            lines = stream.readlines()
+        valid_bytes = 0
+        for position, line in enumerate(lines):
+            if not line.strip():
+                valid_bytes += len(line.encode("utf-8"))
+                continue
+            try:
+                if not line.endswith("\n"):
+                    raise ValueError("unterminated record")
+                event = json.loads(line)
+            except ValueError:
+                if position == len(lines) - 1:
+                    # Torn final write from a crash: drop it and keep going.
+                    with self.log_path.open("r+b") as raw:
+                        raw.truncate(valid_bytes)
+                    break
+                raise ValueError(f"Corrupt Tier 3 catalog log entry at line {position + 1}")
+            valid_bytes += len(line.encode("utf-8"))
+            sequence = int(event.get("seq", 0))
+            self._sequence = max(self._sequence, sequence)
+            if sequence <= self._snapshot_sequence:
+                continue
+            self._apply_event(event)
+            self._events_since_snapshot += 1
+
+
+def _atomic_write_lines(path: Path, lines: Iterable[str], *, sync: bool) -> None:
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", delete=False
+    )
+    try:
+        with handle as stream:
+            for line in lines:
+                stream.write(line)
                 stream.write("\n")
+            if sync:
+                stream.flush()
+                os.fsync(stream.fileno())
+        os.replace(handle.name, path)
+    except BaseException:
+        Path(handle.name).unlink(missing_ok=True)
+        raise
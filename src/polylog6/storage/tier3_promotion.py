@@ -208,7 +208,7 @@ class Tier3PromotionService:
 
         current_time = current_time or datetime.now(timezone.utc)
         demoted: list[str] = []
-        for candidate in self.catalog.iter_candidates(statuses=("probation",)):
+        for candidate in self.catalog.expired_probation(current_time):
             if candidate.is_in_probation(current_time) and self.should_demote(candidate):
                 self.demote(
                     candidate.candidate_id,
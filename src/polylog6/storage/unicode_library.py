@@ -8,13 +8,19 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, MutableMapping, Optional, Tuple
 
+from .segment_store import SegmentStore
+
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TIER2_PATH = Path(__file__).resolve().parents[3] / "storage" / "caches" / "unicode_tier2"
+
 
 @dataclass(slots=True)
 class UnicodeLibraryEntry:
@@ -32,13 +38,129 @@ class UnicodeLibraryEntry:
     access_count: int = 0
     last_accessed: float = field(default_factory=time.time)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "char": self.char,
+            "uuid": self.uuid,
+            "semantic_id": self.semantic_id,
+            "composition": self.composition,
+            "attachment_schemas": list(self.attachment_schemas),
+            "symmetry_char": self.symmetry_char,
+            "scaler_table": self.scaler_table,
+            "cgal_boundary": self.cgal_boundary,
+            "metadata": self.metadata,
+            "access_count": self.access_count,
+            "last_accessed": self.last_accessed,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: MutableMapping[str, Any]) -> "UnicodeLibraryEntry":
+        return cls(
+            char=str(payload["char"]),
+            uuid=str(payload["uuid"]),
+            semantic_id=str(payload.get("semantic_id", "")),
+            composition=str(payload.get("composition", "")),
+            attachment_schemas=tuple(payload.get("attachment_schemas", [])),
+            symmetry_char=str(payload.get("symmetry_char", "")),
+            scaler_table=dict(payload.get("scaler_table", {})),
+            cgal_boundary=dict(payload.get("cgal_boundary", {})),
+            metadata=dict(payload.get("metadata", {})),
+            access_count=int(payload.get("access_count", 0)),
+            last_accessed=float(payload.get("last_accessed", time.time())),
+        )
+
+    def encode(self) -> bytes:
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+
+
+class Tier2Store:
+    """Tier 2 entries, optionally persisted in a :class:`SegmentStore`.
+
+    On open only the segment index is read; entries are decoded on first
+    access. Without a path (or when another process owns the writer lock and
+    no store exists yet) spilled entries are kept in memory.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._segments: Optional[SegmentStore] = None
+        self._loaded: Dict[str, UnicodeLibraryEntry] = {}
+        if self.path is not None:
+            try:
+                self._segments = SegmentStore(self.path)
+            except RuntimeError:
+                LOGGER.warning("Tier 2 store %s is locked by another writer; opening read-only", self.path)
+                if (self.path / "index.log").exists():
+                    self._segments = SegmentStore(self.path, readonly=True)
+
+    @property
+    def persistent(self) -> bool:
+        return self._segments is not None and not self._segments.readonly
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self._loaded or (self._segments is not None and uuid in self._segments)
+
+    def __len__(self) -> int:
+        if self._segments is None:
+            return len(self._loaded)
+        extra = sum(1 for uuid in self._loaded if uuid not in self._segments)
+        return len(self._segments) + extra
+
+    def get(self, uuid: str) -> Optional[UnicodeLibraryEntry]:
+        entry = self._loaded.get(uuid)
+        if entry is not None or self._segments is None:
+            return entry
+        payload = self._segments.get(uuid)
+        if payload is None:
+            return None
+        entry = UnicodeLibraryEntry.from_dict(json.loads(payload))
+        self._loaded[uuid] = entry
+        return entry
+
+    def put(self, entry: UnicodeLibraryEntry, payload: Optional[bytes] = None) -> None:
+        self._loaded[entry.uuid] = entry
+        if self.persistent:
+            assert self._segments is not None
+            self._segments.put(entry.uuid, payload or entry.encode(), composition=entry.char)
+
+    def discard(self, uuid: str) -> None:
+        self._loaded.pop(uuid, None)
+        if self.persistent and uuid in self._segments:  # type: ignore[operator]
+            self._segments.delete(uuid)  # type: ignore[union-attr]
+
+    def release(self, uuid: str) -> None:
+        """Drop the decoded copy of ``uuid`` while keeping it on disk."""
+
+        if self.persistent:
+            self._loaded.pop(uuid, None)
+
+    def uuid_for_char(self, char: str) -> Optional[str]:
+        if self._segments is None:
+            return None
+        uuids = self._segments.keys_for_composition(char)
+        return uuids[-1] if uuids else None
+
+    def flush(self) -> None:
+        if self.persistent:
+            self._segments.flush()  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        if self._segments is not None:
+            self._segments.close()
+            self._segments = None
+
 
 class UnicodeLibraryManager:
     """Tiered cache for Unicode topology library.
 
     Tier 0: Embedded bundle (immutable, eagerly loaded when present)
-    Tier 1: Working LRU cache (bounded by entry count and approximate size)
-    Tier 2: Persistent cache (disk-backed, promoted from Tier 1)
+    Tier 1: Working LRU cache (bounded by entry count and encoded size)
+    Tier 2: Persistent cache (disk-backed, receives Tier 1 evictions)
+
+    Tier 1 is an ordered dict maintained in recency order, so hits and
+    evictions are O(1). Each entry is charged its encoded JSON size against
+    ``max_tier1_size_mb``. With ``tier2_path`` evicted entries are appended
+    to a segment store that survives restarts and is read back lazily.
     """
 
     _DEFAULT_TIER1_LIMIT = 5000
@@ -51,14 +173,18 @@ class UnicodeLibraryManager:
         tier0_path: Optional[Path] = None,
         max_tier1_entries: int = _DEFAULT_TIER1_LIMIT,
         max_tier1_size_mb: int = _DEFAULT_TIER1_SIZE_MB,
+        tier2_path: Optional[Path] = None,
     ) -> None:
         self._tier0_path = tier0_path or Path("data/unicode_library_tier0.json")
         self.max_tier1_entries = max_tier1_entries
         self.max_tier1_size_mb = max_tier1_size_mb
+        self.max_tier1_bytes = int(max_tier1_size_mb * 1024 * 1024)
 
         self.tier0_embedded: Dict[str, UnicodeLibraryEntry] = {}
-        self.tier1_working: Dict[str, UnicodeLibraryEntry] = {}
-        self.tier2_persistent: Dict[str, UnicodeLibraryEntry] = {}
+        self.tier1_working: "OrderedDict[str, UnicodeLibraryEntry]" = OrderedDict()
+        self.tier2_persistent = Tier2Store(tier2_path)
+        self._tier1_sizes: Dict[str, int] = {}
+        self.tier1_bytes = 0
 
         self.char_to_entry: Dict[str, UnicodeLibraryEntry] = {}
         self.uuid_to_char: Dict[str, str] = {}
@@ -69,6 +195,8 @@ class UnicodeLibraryManager:
             "tier2_hits": 0,
             "misses": 0,
             "total_lookups": 0,
+            "tier1_evictions": 0,
+            "tier2_spills": 0,
         }
 
         if preload_embedded:
@@ -138,18 +266,20 @@ class UnicodeLibraryManager:
             self.statistics["tier0_hits"] += 1
             return entry.char, entry.scaler_table, entry.cgal_boundary
 
-        if uuid in self.tier1_working:
-            entry = self.tier1_working[uuid]
+        entry = self.tier1_working.get(uuid)
+        if entry is not None:
+            self.tier1_working.move_to_end(uuid)
             self._touch_entry(entry)
             self.statistics["tier1_hits"] += 1
             return entry.char, entry.scaler_table, entry.cgal_boundary
 
         if uuid in self.tier2_persistent:
-            entry = self.tier2_persistent[uuid]
-            self._touch_entry(entry)
-            self.statistics["tier2_hits"] += 1
-            self._promote_to_tier1(uuid, entry)
-            return entry.char, entry.scaler_table, entry.cgal_boundary
+            entry = self.tier2_persistent.get(uuid)
+            if entry is not None:
+                self._touch_entry(entry)
+                self.statistics["tier2_hits"] += 1
+                self._promote_to_tier1(uuid, entry)
+                return entry.char, entry.scaler_table, entry.cgal_boundary
 
         self.statistics["misses"] += 1
         return None, None, None
@@ -190,28 +320,61 @@ class UnicodeLibraryManager:
         entry.last_accessed = time.time()
 
     def _insert_into_tier1(self, entry: UnicodeLibraryEntry) -> None:
-        self.tier1_working[entry.uuid] = entry
+        # A re-cached uuid supersedes whatever was spilled for it earlier.
+        self.tier2_persistent.discard(entry.uuid)
+        self._store_tier1(entry)
         self.char_to_entry[entry.char] = entry
         self.uuid_to_char[entry.uuid] = entry.char
         self._enforce_tier1_limits()
 
     def _promote_to_tier1(self, uuid: str, entry: UnicodeLibraryEntry) -> None:
-        self.tier1_working[uuid] = entry
+        self._store_tier1(entry)
+        self.char_to_entry[entry.char] = entry
+        self.uuid_to_char[uuid] = entry.char
+        self.tier2_persistent.release(uuid)
         self._enforce_tier1_limits()
 
-    def _enforce_tier1_limits(self) -> None:
-        """Evict least-recently-used entries when limits are exceeded."""
-
-        if len(self.tier1_working) <= self.max_tier1_entries:
-            return
+    def _store_tier1(self, entry: UnicodeLibraryEntry) -> None:
+        uuid = entry.uuid
+        self.tier1_bytes -= self._tier1_sizes.pop(uuid, 0)
+        size = len(entry.encode())
+        self.tier1_working[uuid] = entry
+        self.tier1_working.move_to_end(uuid)
+        self._tier1_sizes[uuid] = size
+        self.tier1_bytes += size
 
-        # Evict 10% oldest entries by last_accessed timestamp.
-        eviction_count = max(1, len(self.tier1_working) // 10)
-        sorted_entries = sorted(self.tier1_working.items(), key=lambda item: item[1].last_accessed)
-        for uuid, entry in sorted_entries[:eviction_count]:
-            self.tier1_working.pop(uuid, None)
-            self.char_to_entry.pop(entry.char, None)
+    def _enforce_tier1_limits(self) -> None:
+        """Evict least-recently-used entries into Tier 2 while over budget."""
+
+        working = self.tier1_working
+        while working and (len(working) > self.max_tier1_entries or self.tier1_bytes > self.max_tier1_bytes):
+            if len(working) == 1 and len(working) <= self.max_tier1_entries:
+                break  # always keep the most recent entry, even if oversized
+            uuid, entry = working.popitem(last=False)
+            self.tier1_bytes -= self._tier1_sizes.pop(uuid, 0)
+            if self.char_to_entry.get(entry.char) is entry:
+                del self.char_to_entry[entry.char]
             # Keep uuid_to_char for Tier 2 awareness.
+            if uuid not in self.tier2_persistent:
+                self.tier2_persistent.put(entry)
+                self.statistics["tier2_spills"] += 1
+            else:
+                self.tier2_persistent.release(uuid)
+            self.statistics["tier1_evictions"] += 1
+
+    def flush(self) -> None:
+        """Persist the Tier 1 working set into Tier 2 (e.g. before shutdown)."""
+
+        for uuid, entry in self.tier1_working.items():
+            if uuid not in self.tier2_persistent:
+                self.tier2_persistent.put(entry)
+                self.tier2_persistent.release(uuid)
+                self.statistics["tier2_spills"] += 1
+        self.tier2_persistent.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self.tier2_persistent.close()
 
     # ------------------------------------------------------------------
     # Statistics / diagnostics
@@ -227,6 +390,7 @@ class UnicodeLibraryManager:
                 "tier2_hit_rate": 0.0,
                 "miss_rate_pct": 0.0,
                 "tier1_size": len(self.tier1_working),
+                "tier1_bytes": self.tier1_bytes,
                 "tier2_size": len(self.tier2_persistent),
             }
 
@@ -239,6 +403,7 @@ class UnicodeLibraryManager:
             "tier2_hit_rate": self.statistics["tier2_hits"] / total * 100,
             "miss_rate_pct": self.statistics["misses"] / total * 100,
             "tier1_size": len(self.tier1_working),
+            "tier1_bytes": self.tier1_bytes,
             "tier2_size": len(self.tier2_persistent),
         }
 
@@ -247,12 +412,17 @@ _unicode_library_singleton: Optional[UnicodeLibraryManager] = None
 
 
 def get_unicode_library(**kwargs: Any) -> UnicodeLibraryManager:
-    """Return the process-wide Unicode library manager singleton."""
+    """Return the process-wide Unicode library manager singleton.
+
+    The singleton persists Tier 2 under ``POLYLOG_UNICODE_TIER2_PATH`` (or
+    :data:`DEFAULT_TIER2_PATH`) unless ``tier2_path`` is given explicitly.
+    """
 
     global _unicode_library_singleton
     if _unicode_library_singleton is None:
+        kwargs.setdefault("tier2_path", Path(os.environ.get("POLYLOG_UNICODE_TIER2_PATH", DEFAULT_TIER2_PATH)))
         _unicode_library_singleton = UnicodeLibraryManager(**kwargs)
     return _unicode_library_singleton
 
 
-__all__ = ["UnicodeLibraryEntry", "UnicodeLibraryManager", "get_unicode_library"]
+__all__ = ["Tier2Store", "UnicodeLibraryEntry", "UnicodeLibraryManager", "get_unicode_library"]
@@ -205,3 +205,56 @@ def test_should_demote_considers_recent_history(tmp_path):
     service = Tier3PromotionService(catalog=catalog, config=config)
 
     assert service.should_demote(candidate) is True
+
+
+def test_catalog_replays_log_without_rewriting_snapshot(tmp_path):
+    catalog = Tier3Catalog(base_path=tmp_path, candidate_flush_threshold=1)
+    for index in range(3):
+        catalog.upsert_candidate(_make_candidate(candidate_id=f"cand-{index}"))
+    symbol_entry = catalog.promote_candidate("cand-1", promotion_type="system")
+    catalog.demote_candidate("cand-2", justification={"reason": "manual"})
+
+    assert not catalog.candidates_path.exists()
+    assert len(catalog.log_path.read_text(encoding="utf-8").splitlines()) == 6
+
+    reopened = Tier3Catalog(base_path=tmp_path)
+    assert reopened.get_promoted_symbol("cand-1").symbol == symbol_entry.symbol
+    assert reopened.get_symbol(symbol_entry.symbol).candidate_id == "cand-1"
+    assert reopened.get_candidate("cand-2").status == "demoted"
+    assert [c.candidate_id for c in reopened.iter_candidates(statuses=("probation",))] == ["cand-1"]
+
+
+def test_catalog_compaction_and_torn_tail_recovery(tmp_path):
+    catalog = Tier3Catalog(base_path=tmp_path, candidate_flush_threshold=1, snapshot_interval=4)
+    for index in range(4):
+        catalog.upsert_candidate(_make_candidate(candidate_id=f"cand-{index}"))
+
+    # The fourth event triggers compaction into the snapshot files.
+    assert catalog.log_path.read_text(encoding="utf-8") == ""
+    assert len(catalog.candidates_path.read_text(encoding="utf-8").splitlines()) == 4
+
+    catalog.promote_candidate("cand-0", promotion_type="system")
+    with catalog.log_path.open("a", encoding="utf-8") as stream:
+        stream.write('{"op": "candidate", "seq": 99, "candi')
+
+    reopened = Tier3Catalog(base_path=tmp_path)
+    assert reopened.get_candidate("cand-0").status == "probation"
+    assert reopened.get_promoted_symbol("cand-0") is not None
+    assert reopened.log_path.read_text(encoding="utf-8").endswith("\n")
+    assert len(list(reopened.iter_candidates())) == 4
+
+
+def test_expired_probation_uses_deadline_index(tmp_path):
+    catalog = Tier3Catalog(base_path=tmp_path)
+    now = datetime.now(timezone.utc)
+    catalog.upsert_candidate(
+        _make_candidate(candidate_id="late", status="probation", probation_until=(now + timedelta(days=3)).isoformat())
+    )
+    expired = _make_candidate(candidate_id="due", status="probation", probation_until=(now - timedelta(hours=1)).isoformat())
+    catalog.upsert_candidate(expired)
+    catalog.upsert_candidate(expired)
+
+    assert [c.candidate_id for c in catalog.expired_probation(now)] == ["due"]
+    catalog.mark_candidate_status("due", status="pending")
+    assert catalog.expired_probation(now) == []
+    assert [c.candidate_id for c in catalog.expired_probation(now + timedelta(days=4))] == ["late"]
@@ -0,0 +1,85 @@
+"""Bounded executors, admission control and metrics for CPU-heavy endpoints."""
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from polylog6.api import admission, tier0
+from polylog6.api.admission import AdmissionPool, PoolLimits
+from polylog6.api.metrics import Histogram, render_metrics
+from polylog6.api.metrics import router as metrics_router
+
+
+def test_full_pool_rejects_with_retry_after_and_times_out_slow_calls() -> None:
+    pool = AdmissionPool("test", PoolLimits(max_workers=1, max_queue=1, timeout=0.2))
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+        assert (pool.outstanding, pool.queued) == (2, 1)
+        with pytest.raises(HTTPException) as rejected:
+            await pool.run(lambda: "never")
+        assert rejected.value.status_code == 429
+        assert int(rejected.value.headers["Retry-After"]) >= 1
+        with pytest.raises(HTTPException) as timed_out:
+            await blocked
+        assert timed_out.value.status_code == 504
+        # The queued call was cancelled by its own timeout or runs once the worker frees up.
+        release.set()
+        await asyncio.gather(queued, return_exceptions=True)
+        return await pool.run(lambda: 42)
+
+    try:
+        assert asyncio.run(scenario()) == 42
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+    stats = pool.stats()
+    assert stats["rejected"] == 1 and stats["timeout"] >= 1 and stats["completed"] >= 1
+    assert pool.outstanding == 0
+    assert pool.run_seconds.count >= 2 and pool.queue_seconds.count >= 2
+
+
+def test_endpoints_run_on_their_pool_and_export_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(admission, "_pools", {})
+    app = FastAPI()
+    app.include_router(tier0.router)
+    app.include_router(metrics_router)
+    client = TestClient(app)
+
+    callers = []
+    original = tier0._detect_atomic_chain
+
+    def detect(request):
+        callers.append(threading.current_thread().name)
+        return original(request)
+
+    monkeypatch.setattr(tier0, "_detect_atomic_chain", detect)
+    client.post("/tier0/atomic-chains/detect", json={"symbol": "A11"})
+    assert callers and callers[0].startswith("polylog-detect")
+
+    text = client.get("/metrics").text
+    assert 'polylog_admission_run_seconds_count{pool="detect"} 1' in text
+    assert 'polylog_admission_queue_seconds_bucket{pool="detect",le="+Inf"} 1' in text
+    assert "# TYPE polylog_admission_requests_total counter" in text
+    assert render_metrics().count("# TYPE polylog_admission_run_seconds histogram") == 1
+
+
+def test_histogram_buckets_and_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(0.1, 1), (1.0, 3), (float("inf"), 4)]
+    assert histogram.quantile(0.5) == 1.0
+    with pytest.raises(ValueError):
+        PoolLimits(max_workers=0)
+    monkeypatch.setenv("POLYLOG_DETECT_WORKERS", "3")
+    monkeypatch.setenv("POLYLOG_DETECT_TIMEOUT", "2.5")
+    limits = PoolLimits.from_env("detect", admission.DEFAULT_LIMITS["detect"])
+    assert (limits.max_workers, limits.max_queue, limits.timeout) == (3, 8, 2.5)
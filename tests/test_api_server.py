@@ -0,0 +1,44 @@
+"""Preload-then-fork server entry point."""
+from __future__ import annotations
+
+import gc
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from polylog6.api import server, tier1_polyhedra
+
+
+def test_preload_populates_module_catalogs() -> None:
+    tier1_polyhedra._reset_catalogs()
+    counts = server.preload_catalogs()
+    assert tier1_polyhedra._polyhedra_cache is not None
+    assert counts["polyhedra"] == len(tier1_polyhedra._polyhedra_cache)
+    assert counts["polyhedra_index"] == counts["polyhedra"]
+    assert {"attachment_matrix", "lod_metadata", "tier0_index", "symbol_index", "netlib"} <= set(counts)
+
+
+def test_freeze_moves_objects_to_permanent_generation() -> None:
+    try:
+        server.freeze_shared_state()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/<pid>/smaps_rollup")
+def test_unique_rss_reports_private_pages() -> None:
+    own = server.unique_rss()
+    assert own is not None and own > 0
+    assert server.unique_rss(os.getpid()) is not None
+    assert server.unique_rss(2**22 + 1) is None
+    with pytest.raises(ValueError):
+        server.serve(workers=0)
+
+
+def test_writer_store_requires_a_single_worker(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("POLYLOG_POLYFORM_STORE", str(tmp_path))
+    with pytest.raises(ValueError, match="--workers 1"):
+        server.serve(workers=2)
@@ -0,0 +1,64 @@
+"""Tests for the benchmark suite harness and baseline gate."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from scripts.benchmark_suite import (
+    WORKLOADS,
+    WorkloadContext,
+    compare_to_baseline,
+    main,
+    run_suite,
+    seeded_polygons,
+)
+
+
+def _report(**medians: float) -> dict:
+    return {
+        "results": {
+            name: {"status": "ok" if median else "skipped", "median": median}
+            for name, median in medians.items()
+        }
+    }
+
+
+def test_seeded_workloads_are_reproducible(tmp_path: Path) -> None:
+    first = WorkloadContext(seed=7, scale=0.01, workdir=tmp_path)
+    second = WorkloadContext(seed=7, scale=0.01, workdir=tmp_path)
+    assert seeded_polygons(first.rng("polygons"), 50) == seeded_polygons(second.rng("polygons"), 50)
+
+    results = run_suite(["encode", "load_stream"], seed=7, scale=0.01, repeat=2, warmup=0, workdir=tmp_path)
+    assert [result.name for result in results] == ["encode", "load_stream"]
+    for result in results:
+        assert result.status == "ok"
+        assert len(result.samples) == 2
+        assert result.ops == WORKLOADS[result.name].ops(first)
+        assert result.ops_per_second > 0
+
+
+def test_compare_to_baseline_applies_tolerances() -> None:
+    baseline = _report(encode=1.0, decode=1.0, tier0_build=1.0, api_endpoints=0.0)
+    baseline["tolerances"] = {"tier0_build": 1.0}
+    current = _report(encode=1.1, decode=1.5, tier0_build=1.9, api_endpoints=5.0)
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+
+    assert [regression.name for regression in regressions] == ["decode"]
+    assert regressions[0].ratio == 1.5
+    assert compare_to_baseline(current, baseline, tolerance=0.6) == []
+
+
+def test_main_records_baseline_and_flags_regressions(tmp_path: Path) -> None:
+    output = tmp_path / "latest.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["--only", "encode", "--quick", "--repeat", "1", "--warmup", "0", "--output", str(output)]
+
+    assert main([*args, "--baseline", str(baseline), "--update-baseline"]) == 0
+    recorded = json.loads(baseline.read_text(encoding="utf-8"))
+    assert recorded["environment"]["python"]
+    assert recorded["results"]["encode"]["status"] == "ok"
+
+    recorded["results"]["encode"]["median"] = 1e-9
+    baseline.write_text(json.dumps(recorded), encoding="utf-8")
+    assert main([*args, "--baseline", str(baseline)]) == 1
@@ -0,0 +1,104 @@
+"""Binary geometry transport: codec and negotiated endpoints."""
+from __future__ import annotations
+
+import json
+import struct
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from polylog6.api import geometry as geometry_api
+from polylog6.api import tier1_polyhedra
+from polylog6.api.response_cache import ResponseCache, prefers_media_type
+from polylog6.geometry.binary_format import (
+    FLAG_INDEX_U32,
+    FLAG_TRIANGLES,
+    GEOMETRY_MEDIA_TYPE,
+    decode_geometry,
+    decode_geometry_payload,
+    encode_geometry,
+    encode_geometry_payload,
+)
+
+BINARY = {"Accept": GEOMETRY_MEDIA_TYPE, "Accept-Encoding": "identity"}
+
+
+def _assert_same_geometry(binary: dict, reference: dict) -> None:
+    assert set(binary) == set(reference)
+    assert {key for key in reference if key != "vertices" and binary[key] != reference[key]} == set()
+    assert len(binary["vertices"]) == len(reference["vertices"])
+    for decoded, original in zip(binary["vertices"], reference["vertices"]):
+        assert decoded == pytest.approx(original, rel=1e-6, abs=1e-6)
+
+
+@pytest.fixture()
+def client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setattr(
+        tier1_polyhedra,
+        "_response_cache",
+        ResponseCache(lambda: None, max_entries=64, on_invalidate=tier1_polyhedra._reset_catalogs),
+    )
+    app = FastAPI()
+    app.include_router(tier1_polyhedra.router)
+    app.include_router(geometry_api.router)
+    return TestClient(app)
+
+
+def test_codec_layout_and_round_trip() -> None:
+    quad = encode_geometry([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [[0, 1, 2, 3]], {"symbol": "Q"})
+    magic, version, flags, vertices, faces, indices, meta_len = struct.unpack_from("<4sHHIIII", quad)
+    assert (magic, version, flags, vertices, faces, indices) == (b"PLGB", 1, 0, 4, 1, 4)
+    assert len(quad) % 4 == 0
+    decoded = decode_geometry(quad)
+    assert decoded.face_list() == [[0, 1, 2, 3]]
+    assert decoded.metadata == {"symbol": "Q"}
+
+    wide = decode_geometry(encode_geometry([(0.5, 0.25, 0.125)] * 3, [[0, 1, 70_000]]))
+    assert decoded.indices.typecode == "H" and wide.indices.typecode == "I"
+    assert wide.vertex_list()[2] == (0.5, 0.25, 0.125)
+    flags = struct.unpack_from("<4sHH", encode_geometry([(0, 0, 0)] * 3, [[0, 1, 70_000]]))[2]
+    assert flags == FLAG_INDEX_U32 | FLAG_TRIANGLES
+
+    with pytest.raises(ValueError):
+        decode_geometry(quad[:-4])
+    with pytest.raises(ValueError):
+        decode_geometry(b"JSON" + quad[4:])
+
+    payload = {
+        "symbol": "X",
+        "vertices": [[0.1, 0.2, 0.3], [1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]],
+        "faces": [{"id": 0, "vertices": [0, 1, 2], "edges": 3, "type": "triangle"},
+                  {"id": 1, "vertices": [0, 2, 3, 1], "edges": 4, "type": "square"}],
+    }
+    _assert_same_geometry(decode_geometry_payload(encode_geometry_payload(payload)), payload)
+
+
+def test_endpoints_negotiate_binary_matching_json(client: TestClient) -> None:
+    symbol = next(iter(tier1_polyhedra._load_polyhedra()))
+    for path in (
+        f"/tier1/polyhedra/{symbol}",
+        f"/tier1/polyhedra/{symbol}/lod/medium",
+        f"/geometry/polyhedron/{symbol}",
+    ):
+        as_json = client.get(path, headers={"Accept": "application/json", "Accept-Encoding": "identity"})
+        as_binary = client.get(path, headers=BINARY)
+        assert as_json.headers["content-type"].startswith("application/json")
+        assert as_binary.headers["content-type"] == GEOMETRY_MEDIA_TYPE
+        assert "Accept" in as_binary.headers["vary"]
+        assert len(as_binary.content) < len(as_json.content)
+        _assert_same_geometry(decode_geometry_payload(as_binary.content), json.loads(as_json.content))
+        if path.startswith("/tier1"):
+            assert as_binary.headers["etag"] != as_json.headers["etag"]
+
+    # Wildcards keep JSON: binary is strictly opt-in.
+    wildcard = client.get(f"/tier1/polyhedra/{symbol}", headers={"Accept": "*/*"})
+    assert wildcard.headers["content-type"].startswith("application/json")
+
+
+def test_accept_header_preference() -> None:
+    assert prefers_media_type(GEOMETRY_MEDIA_TYPE, GEOMETRY_MEDIA_TYPE)
+    assert prefers_media_type(f"application/json;q=0.5, {GEOMETRY_MEDIA_TYPE}", GEOMETRY_MEDIA_TYPE)
+    assert not prefers_media_type(f"application/json, {GEOMETRY_MEDIA_TYPE};q=0.5", GEOMETRY_MEDIA_TYPE)
+    assert not prefers_media_type("*/*", GEOMETRY_MEDIA_TYPE)
+    assert not prefers_media_type(None, GEOMETRY_MEDIA_TYPE)
@@ -0,0 +1,84 @@
+"""Tests for the sharded, resumable attachment matrix builder."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import scripts.compute_attachment_matrix as builder
+
+
+def _write_catalog(path: Path, symbols, *, extra: str = "") -> Path:
+    lines = [json.dumps({"symbol": symbol, "name": f"{symbol}{extra if symbol == 'C1' else ''}"}) for symbol in symbols]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+_SYMBOLS = ["A1", "B1", "C1", "D1", "B2", "E1", "A2", "F1", "C2"]
+
+
+def _build(tmp_path: Path, name: str, **kwargs) -> bytes:
+    output = tmp_path / name
+    builder.compute_attachment_matrix(
+        polyhedra_file=tmp_path / "polyhedra.jsonl",
+        output_file=output,
+        **kwargs,
+    )
+    return output.read_bytes()
+
+
+def test_sharded_build_matches_serial_output(tmp_path: Path) -> None:
+    _write_catalog(tmp_path / "polyhedra.jsonl", _SYMBOLS)
+
+    serial = _build(tmp_path, "serial.json", workers=1, shards=1)
+    sharded = _build(tmp_path, "sharded.json", workers=1, shards=4)
+    parallel = _build(tmp_path, "parallel.json", workers=2, shards=5)
+
+    assert serial == sharded == parallel
+    assert builder.plan_shards(len(_SYMBOLS), 4)[-1][1] == len(_SYMBOLS)
+
+
+def test_interrupted_build_resumes_from_checkpoints(tmp_path: Path, monkeypatch) -> None:
+    _write_catalog(tmp_path / "polyhedra.jsonl", _SYMBOLS)
+    expected = _build(tmp_path, "expected.json", workers=1, shards=1)
+
+    calls = {"count": 0}
+    original = builder.compute_pair
+
+    def flaky(symbol_a: str, symbol_b: str):
+        calls["count"] += 1
+        if calls["count"] > 20:
+            raise KeyboardInterrupt
+        return original(symbol_a, symbol_b)
+
+    monkeypatch.setattr(builder, "compute_pair", flaky)
+    with pytest.raises(KeyboardInterrupt):
+        _build(tmp_path, "resumed.json", workers=1, shards=4)
+    checkpoints = sorted((tmp_path / ".resumed.shards").glob("shard-*.json"))
+    assert checkpoints
+
+    monkeypatch.setattr(builder, "compute_pair", original)
+    assert _build(tmp_path, "resumed.json", workers=1, shards=4) == expected
+    assert not (tmp_path / ".resumed.shards").exists()
+
+
+def test_incremental_build_recomputes_only_changed_pairs(tmp_path: Path, monkeypatch) -> None:
+    catalog = _write_catalog(tmp_path / "polyhedra.jsonl", _SYMBOLS)
+    _build(tmp_path, "matrix.json", workers=1, shards=2)
+
+    _write_catalog(catalog, _SYMBOLS, extra=" (revised)")
+    computed = []
+    original = builder.compute_pair
+
+    def tracking(symbol_a: str, symbol_b: str):
+        computed.append((symbol_a, symbol_b))
+        return original(symbol_a, symbol_b)
+
+    monkeypatch.setattr(builder, "compute_pair", tracking)
+    incremental = _build(tmp_path, "matrix.json", workers=1, shards=2, incremental=True)
+    assert computed and all("C1" in pair for pair in computed)
+    assert len(computed) == len(_SYMBOLS)
+
+    monkeypatch.setattr(builder, "compute_pair", original)
+    assert incremental == _build(tmp_path, "full.json", workers=1, shards=1)
@@ -0,0 +1,52 @@
+"""Shared in-memory geometry catalog service."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from polylog6.api.geometry_catalog import GeometryCatalogService
+
+
+def _write(path: Path, primitives: dict, *, bump_ns: int = 0) -> None:
+    path.write_text(json.dumps({"type": "geometry_library", "primitives": primitives, "polyhedra": {}}))
+    if bump_ns:
+        info = path.stat()
+        os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + bump_ns))
+
+
+def _primitive(symbol: str, sides: int) -> dict:
+    return {"symbol": symbol, "sides": sides, "vertices": [[0.0, 0.0, 0.0]] * sides, "bounding_box": {}}
+
+
+def test_indexes_and_hot_reload(tmp_path: Path) -> None:
+    catalog_file = tmp_path / "geometry_catalog.json"
+    _write(catalog_file, {"triangle": _primitive("A", 3), "square": _primitive("B", 4)})
+    service = GeometryCatalogService([tmp_path / "missing.json", catalog_file], check_interval=0.0)
+
+    assert service.available
+    name, data = service.primitive_by_symbol("b")
+    assert (name, data["sides"]) == ("square", 4)
+    assert service.primitive("triangle")["symbol"] == "A"
+    assert service.primitive_by_symbol("Z") is None
+    assert service.snapshot() is service.snapshot()
+
+    _write(catalog_file, {"triangle": _primitive("A", 3), "pentagon": _primitive("C", 5)}, bump_ns=10**9)
+    assert service.primitive_by_symbol("B") is None
+    assert service.primitive_by_symbol("C")[0] == "pentagon"
+
+    good = service.snapshot()
+    catalog_file.write_text("{not json")
+    assert service.snapshot() is good
+    assert service.stats()["loads"] == 2
+    assert service.stats()["load_errors"] == 1
+
+
+def test_check_interval_limits_stat_calls_and_missing_catalog(tmp_path: Path) -> None:
+    service = GeometryCatalogService([tmp_path / "geometry_catalog.json"], check_interval=3600.0)
+    assert not service.available
+    assert service.catalog() == {}
+
+    _write(tmp_path / "geometry_catalog.json", {"triangle": _primitive("A", 3)})
+    assert not service.available  # not re-checked until the interval elapses
+    assert service.reload().primitives["triangle"]["sides"] == 3
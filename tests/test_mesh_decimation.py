@@ -0,0 +1,127 @@
+"""Quadric-error decimation and the Tier 1 LOD endpoint."""
+from __future__ import annotations
+
+import json
+import math
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from polylog6.api import tier1_polyhedra
+from polylog6.api.response_cache import ResponseCache
+from polylog6.geometry.decimation import (
+    build_lod_levels,
+    decimate,
+    rebase_face_indices,
+    resolve_budget,
+    triangulate_faces,
+)
+
+
+def _uv_sphere(rings: int = 8, segments: int = 12):
+    vertices = [(0.0, 0.0, 1.0)]
+    for ring in range(1, rings):
+        theta = math.pi * ring / rings
+        for segment in range(segments):
+            phi = 2 * math.pi * segment / segments
+            vertices.append((math.sin(theta) * math.cos(phi), math.sin(theta) * math.sin(phi), math.cos(theta)))
+    vertices.append((0.0, 0.0, -1.0))
+    bottom = len(vertices) - 1
+
+    def ring_index(ring: int, segment: int) -> int:
+        return 1 + (ring - 1) * segments + segment % segments
+
+    faces = []
+    for segment in range(segments):
+        faces.append([0, ring_index(1, segment), ring_index(1, segment + 1)])
+        faces.append([bottom, ring_index(rings - 1, segment + 1), ring_index(rings - 1, segment)])
+    for ring in range(1, rings - 1):
+        for segment in range(segments):
+            faces.append(
+                [
+                    ring_index(ring, segment),
+                    ring_index(ring + 1, segment),
+                    ring_index(ring + 1, segment + 1),
+                    ring_index(ring, segment + 1),
+                ]
+            )
+    return vertices, faces
+
+
+def _is_closed_manifold(triangles) -> bool:
+    edges = Counter()
+    for a, b, c in triangles:
+        for u, v in ((a, b), (b, c), (c, a)):
+            edges[(min(u, v), max(u, v))] += 1
+    return all(count == 2 for count in edges.values())
+
+
+def test_decimation_hits_budgets_and_keeps_a_closed_surface() -> None:
+    vertices, faces = _uv_sphere()
+    triangles = triangulate_faces(faces)
+    assert len(triangles) == 168 and _is_closed_manifold(triangles)
+
+    levels = build_lod_levels(vertices, faces, {"full": 1.0, "medium": 0.5, "low": 0.2, "thumbnail": 12})
+
+    assert list(levels) == ["full", "medium", "low", "thumbnail"]
+    assert levels["full"].triangle_count == 168 and levels["full"].max_error == 0.0
+    for name, expected in (("medium", 84), ("low", 34), ("thumbnail", 12)):
+        mesh = levels[name]
+        assert mesh.triangle_count <= expected + 1
+        assert len(mesh.vertices) < len(vertices)
+        assert _is_closed_manifold(mesh.triangles)
+    errors = [levels[name].max_error for name in ("medium", "low", "thumbnail")]
+    assert errors == sorted(errors) and errors[0] > 0.0
+    assert levels["medium"].relative_error < 0.1
+
+    single = decimate(vertices, triangles, 84)
+    assert single.triangle_count == levels["medium"].triangle_count
+
+
+def test_budget_resolution_and_netlib_index_rebase() -> None:
+    assert resolve_budget(0.5, 100) == 50
+    assert resolve_budget(0.01, 100) == 4
+    assert resolve_budget(500, 100) == 100
+    with pytest.raises(ValueError):
+        resolve_budget(1.5, 100)
+
+    faces = [{"vertices": [14, 15, 16]}, {"vertices": [15, 17, 16]}]
+    assert rebase_face_indices(4, faces) == [[0, 1, 2], [1, 3, 2]]
+    assert rebase_face_indices(4, [[0, 1, 2]]) == [[0, 1, 2]]
+    with pytest.raises(ValueError):
+        rebase_face_indices(2, [[0, 1, 5]])
+
+
+def test_lod_endpoint_serves_decimated_meshes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    vertices, faces = _uv_sphere()
+    tier1 = tmp_path / "tier1"
+    tier1.mkdir()
+    poly = {"symbol": "S1", "name": "sphere", "vertices": vertices, "faces": [{"vertices": face} for face in faces]}
+    (tier1 / "polyhedra.jsonl").write_text(json.dumps(poly) + "\n")
+    (tier1 / "lod_meshes.json").write_text(json.dumps({"source_fingerprint": "stale", "meshes": {"S1": {}}}))
+    monkeypatch.setattr(tier1_polyhedra, "_TIER1_DIR", tier1)
+    monkeypatch.setattr(tier1_polyhedra, "_ATTACHMENTS_DIR", tmp_path / "attachments")
+    monkeypatch.setattr(
+        tier1_polyhedra,
+        "_response_cache",
+        ResponseCache(lambda: None, on_invalidate=tier1_polyhedra._reset_catalogs),
+    )
+    tier1_polyhedra._reset_catalogs()
+    app = FastAPI()
+    app.include_router(tier1_polyhedra.router)
+    client = TestClient(app)
+
+    full = client.get("/tier1/polyhedra/S1/lod/full").json()
+    low = client.get("/tier1/polyhedra/S1/lod/low").json()
+    tier1_polyhedra._reset_catalogs()
+
+    assert full["decimation"]["triangles"] == 168
+    assert low["decimation"]["triangles"] < 40
+    assert len(low["vertices"]) < len(vertices)
+    assert len(low["indices"]) == 3 * len(low["faces"])
+    assert max(low["indices"]) < len(low["vertices"])
+    assert low["decimation"]["relative_error"] > 0.0
+    assert client.get("/tier1/polyhedra/missing/lod/low").status_code == 404
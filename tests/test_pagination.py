@@ -0,0 +1,127 @@
+"""Cursor pagination and field projection on catalog list endpoints."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from polylog6.api import storage, tier1_polyhedra
+from polylog6.api.pagination import IndexCache, KeysetIndex, decode_cursor, encode_cursor
+from polylog6.api.response_cache import ResponseCache, file_fingerprint
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    library = [{"symbol": f"Ξ{index}", "base_composition": f"a{index}", "frequency": index} for index in range(7)]
+    (tmp_path / "tier3_library.json").write_text(json.dumps({"entries": library}))
+    monkeypatch.setattr(storage, "_CATALOG_ROOT", tmp_path)
+    monkeypatch.setattr(storage, "_CANDIDATE_LOG", tmp_path / "tier_candidates.jsonl")
+    monkeypatch.setattr(
+        storage,
+        "_symbol_index",
+        IndexCache(storage._build_symbol_index, lambda: file_fingerprint(storage._library_files()), check_interval=0.0),
+    )
+    monkeypatch.setattr(storage, "_candidate_log", storage._CandidateLog())
+
+    tier1 = tmp_path / "tier1"
+    tier1.mkdir()
+    polyhedra = [{"symbol": f"P{index:02d}", "name": f"poly-{index}", "faces": [[0, 1, 2]]} for index in range(25)]
+    (tier1 / "polyhedra.jsonl").write_text("\n".join(json.dumps(poly) for poly in polyhedra) + "\n")
+    monkeypatch.setattr(tier1_polyhedra, "_TIER1_DIR", tier1)
+    monkeypatch.setattr(tier1_polyhedra, "_ATTACHMENTS_DIR", tmp_path / "attachments")
+    monkeypatch.setattr(
+        tier1_polyhedra, "_response_cache", ResponseCache(lambda: None, on_invalidate=tier1_polyhedra._reset_catalogs)
+    )
+    tier1_polyhedra._reset_catalogs()
+
+    app = FastAPI()
+    app.include_router(storage.router)
+    app.include_router(tier1_polyhedra.router)
+    yield TestClient(app)
+    tier1_polyhedra._reset_catalogs()
+
+
+def _walk(client: TestClient, path: str, items_key: str, **params) -> list:
+    rows, cursor = [], None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        body = client.get(path, params=query).json()
+        rows.extend(body[items_key])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return rows
+
+
+def test_symbol_cursor_walk_matches_offset_pages_and_projects_fields(client: TestClient) -> None:
+    everything = client.get("/storage/symbols", params={"limit": 500}).json()
+    assert everything["next_cursor"] is None
+    assert _walk(client, "/storage/symbols", "symbols", limit=6) == everything["symbols"]
+
+    tier3 = _walk(client, "/storage/symbols", "symbols", tier=3, limit=3, fields="composition")
+    assert tier3 == [{"symbol": f"Ξ{index}", "composition": f"a{index}"} for index in range(7)]
+
+    second = client.get("/storage/symbols", params={"tier": 3, "limit": 3, "page": 1}).json()
+    assert [row["symbol"] for row in second["symbols"]] == ["Ξ3", "Ξ4", "Ξ5"]
+    assert (second["total"], second["pages"]) == (7, 3)
+
+    assert client.get("/storage/symbols", params={"fields": "nope"}).status_code == 400
+    assert client.get("/storage/symbols", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/storage/symbols", params={"cursor": encode_cursor(["x", "y"])}).status_code == 400
+    assert client.get("/storage/stats").json()["tiers"]["3"]["count"] == 7
+    assert client.get("/storage/polyform/Ξ2").json()["composition"] == "a2"
+
+
+def test_symbol_cursor_survives_library_inserts(client: TestClient, tmp_path: Path) -> None:
+    first = client.get("/storage/symbols", params={"tier": 3, "limit": 3}).json()
+    assert [row["symbol"] for row in first["symbols"]] == ["Ξ0", "Ξ1", "Ξ2"]
+
+    library = [{"symbol": symbol, "base_composition": symbol} for symbol in ("Ξ00", "Ξ0", "Ξ1", "Ξ2", "Ξ3", "Ξ4")]
+    (tmp_path / "tier3_library.json").write_text(json.dumps({"entries": library}))
+    rest = client.get("/storage/symbols", params={"tier": 3, "limit": 3, "cursor": first["next_cursor"]}).json()
+    assert [row["symbol"] for row in rest["symbols"]] == ["Ξ3", "Ξ4"]
+
+
+def test_candidate_log_is_read_incrementally_and_paged_per_tier(client: TestClient, tmp_path: Path) -> None:
+    log = tmp_path / "tier_candidates.jsonl"
+    assert client.get("/storage/tier3-tier4/candidates").json() == {"tier3": [], "tier4": [], "next_cursor": None}
+
+    def append(start: int, stop: int, *, newline: bool = True) -> None:
+        lines = [json.dumps({"event_id": f"e{i}", "tier": 3 if i % 3 else 4, "frequency": i}) for i in range(start, stop)]
+        with log.open("a", encoding="utf-8") as stream:
+            stream.write("\n".join(lines) + ("\n" if newline else ""))
+
+    append(0, 10)
+    first = client.get("/storage/tier3-tier4/candidates", params={"limit": 4, "fields": "event_id"}).json()
+    assert [row["event_id"] for row in first["tier3"]] == ["e1", "e2", "e4", "e5"]
+    assert first["tier4"] == [{"event_id": "e0"}, {"event_id": "e3"}, {"event_id": "e6"}, {"event_id": "e9"}]
+
+    append(10, 13, newline=False)  # unterminated final line is visible but re-read later
+    rest = client.get("/storage/tier3-tier4/candidates", params={"limit": 4, "cursor": first["next_cursor"]}).json()
+    assert [row["event_id"] for row in rest["tier3"]] == ["e7", "e8", "e10", "e11"]
+    assert [row["event_id"] for row in rest["tier4"]] == ["e12"]
+
+    with log.open("a", encoding="utf-8") as stream:
+        stream.write("\n")  # terminates the "e12" line, which must not be ingested twice
+    append(13, 14)
+    full = client.get("/storage/tier3-tier4/candidates").json()
+    assert [row["event_id"] for row in full["tier4"]] == ["e0", "e3", "e6", "e9", "e12"]
+    assert len(full["tier3"]) + len(full["tier4"]) == 14
+
+    log.write_text(json.dumps({"event_id": "rotated", "tier": 4}) + "\n")
+    assert client.get("/storage/tier3-tier4/candidates").json()["tier4"] == [{"event_id": "rotated", "tier": 4}]
+
+
+def test_tier1_polyhedra_cursor_and_projection(client: TestClient) -> None:
+    rows = _walk(client, "/tier1/polyhedra", "polyhedra", limit=10, fields="face_count")
+    assert rows == [{"symbol": f"P{index:02d}", "face_count": 1} for index in range(25)]
+    legacy = client.get("/tier1/polyhedra", params={"page": 2, "limit": 10}).json()
+    assert [row["symbol"] for row in legacy["polyhedra"]] == [f"P{index}" for index in range(20, 25)]
+    assert legacy["next_cursor"] is None and legacy["pages"] == 3
+
+    index = KeysetIndex(((tier, position), (tier, position)) for tier in (4, 0) for position in range(3))
+    page = index.page(2, prefix=(4,), cursor=encode_cursor([4, 0]))
+    assert page.rows == [(4, 1), (4, 2)] and page.next_cursor is None and page.offset == 1
+    assert decode_cursor(encode_cursor(["Ξ", 1])) == ("Ξ", 1)
@@ -0,0 +1,88 @@
+"""Per-route request metrics, slow-request sampling and profiling."""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from polylog6.api import admission, request_metrics
+from polylog6.api.admission import run_admitted
+from polylog6.api.metrics import render_metrics
+from polylog6.api.request_metrics import RequestMetrics, RequestMetricsMiddleware
+from polylog6.api.response_cache import CACHE_STATUS_HEADER
+
+
+def _pool_hotspot() -> int:
+    time.sleep(0.06)
+    return sum(range(1000))
+
+
+def _build(metrics: RequestMetrics) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware, metrics=metrics)
+    app.include_router(request_metrics.router)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int, response: Response):
+        response.headers[CACHE_STATUS_HEADER] = "HIT" if item_id % 2 else "MISS"
+        return {"id": item_id, "payload": "x" * 100}
+
+    @app.post("/slow")
+    async def slow():
+        return {"value": await run_admitted("detect", _pool_hotspot)}
+
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pools(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(admission, "_pools", {})
+
+
+def test_routes_are_grouped_by_template_with_sizes_and_cache_outcomes(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = RequestMetrics(slow_threshold=10.0)
+    monkeypatch.setattr(request_metrics, "_request_metrics", metrics)
+    client = _build(metrics)
+    for item_id in range(5):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    client.get("/missing")
+
+    summary = client.get("/metrics/requests").json()
+    routes = {(route["method"], route["route"]): route for route in summary["routes"]}
+    items = routes[("GET", "/items/{item_id}")]
+    assert items["count"] == 5 and items["statuses"] == {"2xx": 5}
+    assert items["cache"] == {"HIT": 2, "MISS": 3} and items["cache_hit_rate"] == pytest.approx(0.4)
+    assert items["bytes_total"] > 5 * 100
+    assert routes[("GET", "<unmatched>")]["statuses"] == {"4xx": 1}
+    assert summary["slow_requests"] == []
+
+    text = render_metrics()
+    assert 'polylog_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 5' in text
+    assert 'polylog_http_cache_total{method="GET",route="/items/{item_id}",outcome="hit"} 2' in text
+    assert "# TYPE polylog_http_response_size_bytes histogram" in text
+
+
+def test_slow_route_is_profiled_on_its_next_request_including_pool_work(tmp_path: Path) -> None:
+    metrics = RequestMetrics(slow_threshold=0.05)
+    client = _build(metrics)
+
+    client.post("/slow")
+    first = metrics.summary()["slow_requests"]
+    assert len(first) == 1 and "profile" not in first[0]
+    assert metrics.has_armed_routes
+
+    client.post("/slow")
+    sample = metrics.summary()["slow_requests"][-1]
+    assert sample["route"] == "/slow" and sample["duration_ms"] >= 50
+    assert "_pool_hotspot" in sample["profile"]
+    assert not metrics.has_armed_routes
+
+    log = tmp_path / "request_metrics.jsonl"
+    assert metrics.dump_jsonl(log) == 3
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [record["event"] for record in records] == ["http_route_summary", "http_slow_request", "http_slow_request"]
+    assert records[0]["route"] == "/slow" and records[0]["count"] == 2
@@ -172,3 +172,44 @@ def test_metrics_emitter_is_process_safe(tmp_path) -> None:
     lines = (tmp_path / "metrics.jsonl").read_text(encoding="utf-8").strip().splitlines()
     assert len(lines) == len(payloads)
     assert all(json.loads(line)["event_id"].startswith("evt") for line in lines)
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="fcntl unavailable on Windows")
+def test_buffered_metrics_emitter_group_commits(tmp_path) -> None:
+    output_path = tmp_path / "metrics.jsonl"
+    emitter = MetricsEmitter(str(output_path), buffered=True, batch_size=64, flush_interval=5.0, fsync="batch")
+    payloads = [asdict(_make_candidate_event(timestamp=time.time() + idx)) for idx in range(200)]
+
+    for payload in payloads:
+        emitter.emit(payload)
+
+    # Readers flush pending events first, so the stream is immediately visible.
+    assert len(emitter.read_events_last_24h(now=time.time() + 1)) == len(payloads)
+    stats = emitter.stats()
+    assert stats["written"] == stats["emitted"] == len(payloads)
+    assert stats["batches"] < len(payloads)
+
+    emitter.rotate(retention_days=7)
+    emitter.close()
+    lines = output_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == len(payloads)
+    with pytest.raises(RuntimeError):
+        emitter.emit(payloads[0])
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="fcntl unavailable on Windows")
+def test_buffered_metrics_emitter_drop_policy_counts_overflow(tmp_path, monkeypatch) -> None:
+    output_path = tmp_path / "metrics.jsonl"
+    emitter = MetricsEmitter(str(output_path), buffered=True, queue_size=1, overflow="drop")
+    with monkeypatch.context() as patch:
+        # Hold the writer back so the bounded queue fills up.
+        patch.setattr(emitter, "_ensure_writer", lambda: None)
+        emitter.emit({"event_id": "evt-1", "timestamp": time.time()})
+        emitter.emit({"event_id": "evt-2", "timestamp": time.time()})
+    emitter._ensure_writer()
+    emitter.close()
+
+    stats = emitter.stats()
+    assert stats["dropped"] == 1
+    assert stats["written"] == 1
+    assert len(output_path.read_text(encoding="utf-8").splitlines()) == 1
@@ -1,8 +1,11 @@
 """Test storage integration for generated polyforms"""
 import pytest
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from polylog6.storage import polyform_storage
 from polylog6.storage.polyform_storage import PolyformStorage
 from polylog6.storage.encoder import TieredUnicodeEncoder
 
@@ -208,4 +211,111 @@ def test_encoder_integration():
     
     # Symbols should be related (not necessarily identical due to internal state)
     assert len(symbol) > 0, "Storage should allocate valid symbol"
-    assert len(direct_symbol) > 0, "Direct allocation should work"
\ No newline at end of file
+    assert len(direct_symbol) > 0, "Direct allocation should work"
+
+
+def test_mmap_storage_reopens_without_rebuild(tmp_path, sample_polyform_data):
+    """Segment-backed storage keeps its indexes across reopen"""
+    storage_path = tmp_path / "segments"
+    storage = PolyformStorage(use_mmap=True, storage_path=storage_path, segment_bytes=512)
+    references = {}
+    for index in range(20):
+        composition = f"A+B{index}"
+        data = dict(sample_polyform_data, composition=composition)
+        references[composition] = storage.add(composition, data, 50 + index)
+    assert storage.update_frequency(references["A+B3"], 999)
+    assert storage.delete(references["A+B4"])
+    storage.close()
+
+    # Small segments force rollover across several files.
+    assert len(list(storage_path.glob("segment-*.seg"))) > 1
+
+    reopened = PolyformStorage(use_mmap=True, storage_path=storage_path)
+    try:
+        assert reopened.get(references["A+B7"])["composition"] == "A+B7"
+        assert reopened.get_by_composition("A+B9")["composition"] == "A+B9"
+        assert reopened.get_by_composition("A+B4") is None
+        assert reopened.get_metadata(references["A+B3"])["frequency"] == 999
+        assert reopened.get_stats()["total_polyforms"] == 19
+        assert len(reopened.list_all()) == 19
+    finally:
+        reopened.close()
+
+
+def test_mmap_storage_readers_follow_single_writer(tmp_path, sample_polyform_data):
+    """Read-only instances observe new records after refresh"""
+    storage_path = tmp_path / "segments"
+    writer = PolyformStorage(use_mmap=True, storage_path=storage_path)
+    reader = PolyformStorage(use_mmap=True, storage_path=storage_path, readonly=True)
+    try:
+        with pytest.raises(RuntimeError):
+            PolyformStorage(use_mmap=True, storage_path=storage_path)
+
+        reference = writer.add("A+B", sample_polyform_data, 100)
+        assert reader.get(reference) is None
+        assert reader.segments.refresh() == 1
+        assert reader.get(reference)["composition"] == sample_polyform_data["composition"]
+        with pytest.raises(PermissionError):
+            reader.add("C+D", sample_polyform_data, 100)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_mmap_storage_concurrent_adds(tmp_path, sample_polyform_data):
+    """Threads sharing one store get distinct symbols and intact records"""
+    storage = PolyformStorage(use_mmap=True, storage_path=tmp_path / "segments", segment_bytes=4096)
+    compositions = [f"A+B{index}" for index in range(200)]
+
+    def add(composition):
+        return storage.add(composition, dict(sample_polyform_data, composition=composition), 500)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            references = list(pool.map(add, compositions))
+        assert len(set(references)) == len(compositions)
+        for composition, reference in zip(compositions, references):
+            assert storage.get(reference)["composition"] == composition
+        assert storage.get_stats()["total_polyforms"] == len(compositions)
+    finally:
+        storage.close()
+
+
+def test_mmap_storage_reopen_keeps_allocating_new_symbols(tmp_path, sample_polyform_data):
+    """Adds after a reopen never reuse the symbol of a saved record"""
+    storage_path = tmp_path / "segments"
+    storage = PolyformStorage(use_mmap=True, storage_path=storage_path)
+    first = storage.add("A+B", dict(sample_polyform_data, composition="A+B"), 5000)
+    rare = storage.add("Q+R", dict(sample_polyform_data, composition="Q+R"), 1)
+    storage.close()
+
+    reopened = PolyformStorage(use_mmap=True, storage_path=storage_path)
+    try:
+        second = reopened.add("C+D", dict(sample_polyform_data, composition="C+D"), 5000)
+        assert second != first
+        assert len(reopened.segments) == 3
+        assert reopened.get(first)["composition"] == "A+B"
+        assert reopened.get(second)["composition"] == "C+D"
+        # Overflow symbols are a stable digest of the composition.
+        assert reopened.encoder.allocate("Q+R", 1) == rare[len("mmap:"):]
+    finally:
+        reopened.close()
+
+
+def test_shared_storage_opens_one_writer_under_concurrency(tmp_path, monkeypatch):
+    """Concurrent first calls share a single segment-store writer"""
+    monkeypatch.setenv(polyform_storage.STORE_ENV, str(tmp_path / "shared"))
+    monkeypatch.setattr(polyform_storage, "_shared_storage", None)
+    barrier = threading.Barrier(8)
+
+    def open_shared(_):
+        barrier.wait()
+        return polyform_storage.shared_polyform_storage()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        stores = list(pool.map(open_shared, range(8)))
+    try:
+        assert all(store is stores[0] for store in stores)
+    finally:
+        stores[0].close()
+
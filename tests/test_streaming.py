@@ -0,0 +1,157 @@
+"""NDJSON streaming variants of the bulk endpoints."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from polylog6.api import admission, multi_generator, storage
+from polylog6.api.streaming import NDJSON_MEDIA_TYPE, iter_ndjson
+
+
+class _RecordingStorage:
+    def __init__(self) -> None:
+        self.compositions: List[str] = []
+
+    def add(self, composition: str, data: Dict[str, Any], frequency: int) -> None:
+        self.compositions.append(composition)
+
+
+@pytest.fixture()
+def recording() -> _RecordingStorage:
+    return _RecordingStorage()
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, recording: _RecordingStorage) -> TestClient:
+    log = tmp_path / "tier_candidates.jsonl"
+    log.write_text("".join(json.dumps({"event_id": f"e{i}", "tier": 3 if i % 2 else 4}) + "\n" for i in range(6)))
+    monkeypatch.setattr(storage, "_CANDIDATE_LOG", log)
+    monkeypatch.setattr(storage, "_candidate_log", storage._CandidateLog())
+    monkeypatch.setattr(multi_generator, "shared_polyform_storage", lambda: recording)
+
+    app = FastAPI()
+    app.include_router(storage.router)
+    app.include_router(multi_generator.router)
+    return TestClient(app)
+
+
+def _lines(response) -> List[Dict[str, Any]]:
+    assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_candidate_stream_matches_listing(client: TestClient) -> None:
+    listing = client.get("/storage/tier3-tier4/candidates").json()
+    streamed = _lines(client.get("/storage/tier3-tier4/candidates/stream"))
+    assert streamed == listing["tier3"] + listing["tier4"]
+
+    tier4 = _lines(client.get("/storage/tier3-tier4/candidates/stream", params={"tier": 4, "fields": "event_id"}))
+    assert tier4 == [{"event_id": "e0"}, {"event_id": "e2"}, {"event_id": "e4"}]
+    assert client.get("/storage/tier3-tier4/candidates/stream", params={"tier": 1}).status_code == 400
+
+
+def test_generate_multi_stream_yields_one_record_per_request(client: TestClient, recording: _RecordingStorage) -> None:
+    batch = {"requests": [{"polygons": ["A", "B", "C"]}, {"polygons": ["A"]}, {"polygons": ["D", "D", "D", "D"]}]}
+    with client.stream("POST", "/api/polyform/generate-multi/stream", json=batch) as response:
+        records = [json.loads(line) for line in response.iter_lines() if line]
+    assert [record["index"] for record in records] == [0, 1, 2]
+    assert [record["success"] for record in records] == [True, False, True]
+    assert records[2]["composition"] == "D+D+D+D"
+    assert recording.compositions == ["A+B+C", "D+D+D+D"]
+
+
+def test_disconnect_stops_the_producer() -> None:
+    produced: List[int] = []
+    closed: List[bool] = []
+
+    def records():
+        try:
+            for index in range(1000):
+                produced.append(index)
+                yield {"index": index}
+        finally:
+            closed.append(True)
+
+    class _Request:
+        def __init__(self) -> None:
+            self.polls = 0
+
+        async def is_disconnected(self) -> bool:
+            self.polls += 1
+            return self.polls > 3
+
+    async def consume() -> List[bytes]:
+        return [chunk async for chunk in iter_ndjson(records(), _Request())]
+
+    chunks = asyncio.run(consume())
+    assert chunks == [b'{"index":0}\n', b'{"index":1}\n', b'{"index":2}\n']
+    assert produced == [0, 1, 2] and closed == [True]
+
+
+def test_sync_producers_run_off_the_event_loop() -> None:
+    threads: List[str] = []
+
+    def records():
+        for index in range(3):
+            threads.append(threading.current_thread().name)
+            yield {"index": index}
+
+    async def consume() -> List[bytes]:
+        return [chunk async for chunk in iter_ndjson(records(), check_every=2)]
+
+    assert asyncio.run(consume()) == [b'{"index":0}\n{"index":1}\n', b'{"index":2}\n']
+    assert threads and threading.main_thread().name not in threads
+
+
+def test_generate_multi_stream_is_admitted_per_entry(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = admission.AdmissionPool("generate", admission.PoolLimits(max_workers=1, max_queue=0))
+    monkeypatch.setitem(admission._pools, "generate", pool)
+    batch = {"requests": [{"polygons": ["A", "B", "C"]}, {"polygons": ["D", "D", "D"]}]}
+    with client.stream("POST", "/api/polyform/generate-multi/stream", json=batch) as response:
+        records = [json.loads(line) for line in response.iter_lines() if line]
+    assert [record["success"] for record in records] == [True, True]
+    assert pool.stats()["completed"] == 2
+    pool.shutdown()
+
+
+
+def test_cancel_during_a_hop_closes_the_producer_afterwards() -> None:
+    inside = threading.Event()
+    closed: List[bool] = []
+
+    def records():
+        try:
+            yield {"index": 0}
+            inside.set()
+            time.sleep(0.2)
+            yield {"index": 1}
+        finally:
+            closed.append(True)
+
+    async def run() -> None:
+        async def consume() -> None:
+            async for _ in iter_ndjson(records()):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        while not inside.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed == []
+        for _ in range(100):
+            if closed:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert closed == [True]
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from polylog6.storage.symbol_registry import EdgeConnectivityIndex, SymbolRegistry
+from polylog6.storage.tier0_generator import Tier0Generator
+from polylog6.storage import tier0_index
+from polylog6.storage.tier0_index import MappedTier0Index, build_tier0_index
+
+
+@pytest.fixture
+def mapped_index(tmp_path: Path) -> MappedTier0Index:
+    return MappedTier0Index.open(build_tier0_index(tmp_path / "tier0_index.bin"))
+
+
+def test_mapped_index_matches_generator(mapped_index: MappedTier0Index) -> None:
+    generator = Tier0Generator()
+    catalog = generator.generate_all()
+
+    assert mapped_index.record_count == len(catalog)
+    for symbol in ("a1", "b45", "c318", "d999"):
+        assert mapped_index.get_chain(symbol) == catalog[symbol]
+    assert mapped_index.get_chain("e1") is None
+
+    for section in tier0_index.SECTION_NAMES:
+        expected = dict(getattr(generator, section))
+        view = mapped_index.section(section)
+        assert {key: view[key] for key in view} == expected
+
+
+def test_edge_index_parity_with_in_memory_generator(mapped_index: MappedTier0Index) -> None:
+    mapped = EdgeConnectivityIndex(mapped=mapped_index)
+    in_memory = EdgeConnectivityIndex(Tier0Generator())
+
+    assert mapped.primary_by_edges == in_memory.primary_by_edges
+    assert mapped.lookup_by_edges(4) == in_memory.lookup_by_edges(4)
+    assert mapped.lookup_by_series_pair("a", "c") == in_memory.lookup_by_series_pair("a", "c")
+    assert mapped.edges_for_symbol("A219") == in_memory.edges_for_symbol("A219")
+    with pytest.raises(ValueError):
+        mapped.edges_for_symbol("Z1")
+
+
+def test_default_registries_share_one_index() -> None:
+    first = SymbolRegistry()
+    second = SymbolRegistry()
+
+    assert first.tier0_index is second.tier0_index
+    assert first.primitive_sides(first.primitive_symbol(6)) == 6
+
+
+def test_stale_index_is_rejected(tmp_path: Path) -> None:
+    path = build_tier0_index(tmp_path / "tier0_index.bin")
+    raw = bytearray(path.read_bytes())
+    raw[16:32] = b"\x00" * 16  # corrupt the SERIES_TABLE fingerprint
+    path.write_bytes(bytes(raw))
+
+    with pytest.raises(ValueError):
+        MappedTier0Index.open(path)
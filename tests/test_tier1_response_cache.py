@@ -0,0 +1,127 @@
+"""Precompressed Tier 1 response cache."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from polylog6.api import tier1_polyhedra
+from polylog6.api.response_cache import ResponseCache, etag_matches, negotiate_encoding
+
+
+def _write_catalog(root: Path, options: int) -> None:
+    tier1 = root / "tier1"
+    attachments = root / "attachments"
+    tier1.mkdir(parents=True, exist_ok=True)
+    attachments.mkdir(parents=True, exist_ok=True)
+    polyhedra = [
+        {"symbol": f"P{index}", "name": f"poly-{index}", "classification": "platonic", "faces": [[0, 1, 2]] * 4}
+        for index in range(30)
+    ]
+    (tier1 / "polyhedra.jsonl").write_text("\n".join(json.dumps(item) for item in polyhedra) + "\n")
+    matrix = {"a": {"b": [{"stability": 0.9, "fold_angle": float(angle)} for angle in range(options)]}}
+    (attachments / "attachment_matrix.json").write_text(json.dumps(matrix))
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _write_catalog(tmp_path, options=40)
+    monkeypatch.setattr(tier1_polyhedra, "_TIER1_DIR", tmp_path / "tier1")
+    monkeypatch.setattr(tier1_polyhedra, "_ATTACHMENTS_DIR", tmp_path / "attachments")
+    cache = ResponseCache(
+        lambda: tier1_polyhedra.file_fingerprint(tier1_polyhedra._catalog_files()),
+        check_interval=0.0,
+        on_invalidate=tier1_polyhedra._reset_catalogs,
+    )
+    monkeypatch.setattr(tier1_polyhedra, "_response_cache", cache)
+    tier1_polyhedra._reset_catalogs()
+    app = FastAPI()
+    app.include_router(tier1_polyhedra.router)
+    yield TestClient(app), tmp_path
+    tier1_polyhedra._reset_catalogs()
+
+
+def test_matrix_served_from_cache_with_conditional_and_compressed_variants(client) -> None:
+    test_client, _ = client
+
+    first = test_client.get("/tier1/attachments/matrix", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200
+    assert "Content-Encoding" not in first.headers
+    assert first.json()["statistics"]["total_options"] == 40
+
+    gzipped = test_client.get("/tier1/attachments/matrix", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.json() == first.json()
+    assert gzipped.headers["ETag"] != first.headers["ETag"]
+
+    revalidated = test_client.get(
+        "/tier1/attachments/matrix",
+        headers={"If-None-Match": gzipped.headers["ETag"], "Accept-Encoding": "gzip"},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    stats = test_client.get("/tier1/cache/stats").json()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["not_modified"] == 1
+    assert stats["encodings"]["gzip"] == 1
+
+
+def test_catalog_change_invalidates_cached_responses(client) -> None:
+    test_client, root = client
+
+    before = test_client.get("/tier1/stats")
+    assert before.json()["attachments"]["total_options"] == 40
+
+    _write_catalog(root, options=3)
+    matrix_file = root / "attachments" / "attachment_matrix.json"
+    stat = matrix_file.stat()
+    os.utime(matrix_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    stale = test_client.get("/tier1/stats", headers={"If-None-Match": before.headers["ETag"]})
+    assert stale.status_code == 200
+    assert stale.json()["attachments"]["total_options"] == 3
+    assert test_client.get("/tier1/cache/stats").json()["invalidations"] == 1
+
+
+def test_negotiation_and_etag_parsing() -> None:
+    assert negotiate_encoding("gzip;q=0.5, deflate", ["gzip", "deflate"]) == "deflate"
+    assert negotiate_encoding("*;q=0.1, gzip;q=0", ["gzip", "deflate"]) == "deflate"
+    assert negotiate_encoding("br", ["gzip", "deflate"]) is None
+    assert negotiate_encoding(None, ["gzip"]) is None
+    assert etag_matches('W/"abc-gzip", "zzz"', "abc")
+    assert etag_matches("*", "abc")
+    assert not etag_matches('"abd"', "abc")
+
+
+def test_slow_miss_builds_once_without_blocking_other_keys() -> None:
+    cache = ResponseCache(lambda: "v1", check_interval=60.0)
+    cache.get("fast", lambda: {"value": 1})
+    started, release = threading.Event(), threading.Event()
+    builds = []
+
+    def slow_builder():
+        builds.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 2}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("slow", slow_builder))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    # A hit on another key is served while the slow build is in flight.
+    assert json.loads(cache.get("fast", lambda: pytest.fail("rebuilt")).body) == {"value": 1}
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(builds) == 1 and len(results) == 3
+    assert len({id(entry) for entry in results}) == 1
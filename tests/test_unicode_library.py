@@ -42,3 +42,49 @@ def test_cache_entry_roundtrip() -> None:
     stats = manager.get_statistics()
     assert stats["tier1_hits"] == 1
     assert stats["hit_rate_pct"] == 50.0
+
+
+def _cache(manager: UnicodeLibraryManager, index: int) -> None:
+    manager.cache_entry(
+        f"uuid-{index}",
+        char=f"⬚{index}",
+        scaler_table={"fold_angles": [float(index)] * 8},
+        cgal_boundary={"aabb": [0, 0, index, index]},
+        composition=f"A{index}",
+    )
+
+
+def test_tier1_lru_spills_to_tier2_by_count_and_bytes(tmp_path) -> None:
+    manager = UnicodeLibraryManager(preload_embedded=False, max_tier1_entries=3, tier2_path=tmp_path / "tier2")
+    for index in range(5):
+        _cache(manager, index)
+        manager.lookup("uuid-0")  # keep uuid-0 hot
+
+    assert list(manager.tier1_working) == ["uuid-3", "uuid-4", "uuid-0"]
+    stats = manager.get_statistics()
+    assert stats["tier1_evictions"] == 2
+    assert stats["tier2_size"] == 2
+
+    manager.max_tier1_bytes = manager.tier1_bytes - 1
+    _cache(manager, 5)
+    assert manager.tier1_bytes <= manager.max_tier1_bytes
+    assert "uuid-3" not in manager.tier1_working
+
+
+def test_tier2_survives_restart_and_reloads_lazily(tmp_path) -> None:
+    manager = UnicodeLibraryManager(preload_embedded=False, max_tier1_entries=2, tier2_path=tmp_path / "tier2")
+    for index in range(4):
+        _cache(manager, index)
+    manager.close()
+
+    restarted = UnicodeLibraryManager(preload_embedded=False, tier2_path=tmp_path / "tier2")
+    assert restarted.get_statistics()["tier2_size"] == 4
+    assert restarted.tier2_persistent.uuid_for_char("⬚1") == "uuid-1"
+
+    char, scaler, boundary = restarted.lookup("uuid-1")
+    assert char == "⬚1"
+    assert scaler == {"fold_angles": [1.0] * 8}
+    assert boundary == {"aabb": [0, 0, 1, 1]}
+    assert "uuid-1" in restarted.tier1_working
+    assert restarted.get_statistics()["tier2_hits"] == 1
+    restarted.close()
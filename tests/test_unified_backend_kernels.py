@@ -0,0 +1,50 @@
+"""NumPy geometry kernels in UnifiedBackendGeometry match the Python fallback."""
+from __future__ import annotations
+
+import pytest
+
+from polylog6.geometry import unified_backend
+from polylog6.geometry.unified_backend import UnifiedBackendGeometry
+
+pytest.importorskip("numpy")
+
+
+def _fallback(monkeypatch: pytest.MonkeyPatch) -> UnifiedBackendGeometry:
+    monkeypatch.setattr(unified_backend, "np", None)
+    return UnifiedBackendGeometry()
+
+
+def test_kernels_match_python_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    vectorised = UnifiedBackendGeometry()
+    faces = [[0, 1, 2], [0, 2, 3], [3, 2, 5, 4], [], [7]]
+    primitives = {sides: vectorised.get_primitive_geometry(sides) for sides in (3, 7, 20)}
+    chains = {symbol: vectorised.get_tier0_geometry(symbol) for symbol in ("A5", "A324", "A615", "D219")}
+    edges = vectorised._extract_edges_from_faces(faces)
+
+    fallback = _fallback(monkeypatch)
+    assert edges == fallback._extract_edges_from_faces(faces)
+    assert edges == [(0, 1), (0, 2), (0, 3), (1, 2), (2, 3), (2, 5), (3, 4), (4, 5), (7, 7)]
+    for sides, geometry in primitives.items():
+        expected = fallback.get_primitive_geometry(sides)
+        assert geometry.edges == expected.edges and geometry.faces == expected.faces
+        for vertex, reference in zip(geometry.vertices, expected.vertices):
+            assert vertex == pytest.approx(reference, abs=1e-12)
+    for symbol, geometry in chains.items():
+        expected = fallback.get_tier0_geometry(symbol)
+        assert geometry is not None and expected is not None
+        assert (geometry.faces, geometry.edges, geometry.face_types) == (expected.faces, expected.edges, expected.face_types)
+        assert len(geometry.vertices) == len(expected.vertices) == sum(len(face) for face in expected.faces)
+
+
+def test_geometry_caches_are_bounded() -> None:
+    backend = UnifiedBackendGeometry(max_cached_geometries=2)
+    first = backend.get_primitive_geometry(3)
+    assert backend.get_primitive_geometry(3) is first
+    backend.get_primitive_geometry(4)
+    backend.get_primitive_geometry(5)
+    assert len(backend._primitive_cache) == 2
+    assert backend.get_primitive_geometry(3) is not first
+
+    assert backend.get_tier0_geometry("A900") is None
+    with pytest.raises(ValueError):
+        UnifiedBackendGeometry(max_cached_geometries=0)